@@ -9,14 +9,6 @@ class AddDnsResolvesToHostEdgeUseCase:
         self._repository = repository
 
     def execute(self, domain_name: str, ip_address: str) -> NetworkTopologyEdge:
-        dns_record = self._repository.get_dns_record(domain_name)
-        if not dns_record:
-            raise ValueError(f"DNS record '{domain_name}' not found")
-
-        host = self._repository.get_host(ip_address)
-        if not host:
-            raise ValueError(f"Host with IP '{ip_address}' not found")
-
         edge = NetworkTopologyEdge(
             source_id=domain_name,
             target_id=ip_address,
@@ -25,4 +17,4 @@ class AddDnsResolvesToHostEdgeUseCase:
             created_at=datetime.now(),
         )
 
-        return self._repository.create_edge(edge)
+        return self._repository.create_edge_between_existing_vertices(edge)
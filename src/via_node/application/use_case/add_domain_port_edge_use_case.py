@@ -1,6 +1,8 @@
 from datetime import datetime
+from typing import List
 
 from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.domain_port_link import DomainPortLink
 from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
 from via_node.domain.model.port import Port
 from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
@@ -11,21 +13,18 @@ class AddDomainPortEdgeUseCase:
         self._repository = repository
 
     def execute(self, domain_name: str, port_number: int, protocol: str = "TCP") -> NetworkTopologyEdge:
-        current_time = datetime.now()
-
-        dns_record = self._create_or_update_dns_record(domain_name, current_time)
-        port = self._create_or_update_port(port_number, protocol, current_time)
-        edge = self._create_edge(dns_record, port, current_time)
+        return self.execute_many(domain_name, [port_number], protocol)[0]
 
-        return edge
+    def execute_many(
+        self, domain_name: str, port_numbers: List[int], protocol: str = "TCP"
+    ) -> List[NetworkTopologyEdge]:
+        current_time = datetime.now()
 
-    def _create_or_update_dns_record(self, domain_name: str, current_time: datetime) -> DnsRecord:
-        existing_record = self._repository.get_dns_record(domain_name)
+        links = [self._create_link(domain_name, port_number, protocol, current_time) for port_number in port_numbers]
 
-        if existing_record:
-            existing_record.updated_at = current_time
-            return self._repository.create_or_update_dns_record(existing_record)
+        return self._repository.link_domain_ports(links)
 
+    def _create_link(self, domain_name: str, port_number: int, protocol: str, current_time: datetime) -> DomainPortLink:
         dns_record = DnsRecord(
             domain_name=domain_name,
             record_type="A",
@@ -33,16 +32,6 @@ class AddDomainPortEdgeUseCase:
             created_at=current_time,
             updated_at=current_time,
         )
-
-        return self._repository.create_or_update_dns_record(dns_record)
-
-    def _create_or_update_port(self, port_number: int, protocol: str, current_time: datetime) -> Port:
-        existing_port = self._repository.get_port(port_number, protocol)
-
-        if existing_port:
-            existing_port.updated_at = current_time
-            return self._repository.create_or_update_port(existing_port)
-
         port = Port(
             port_number=port_number,
             protocol=protocol,
@@ -50,10 +39,6 @@ class AddDomainPortEdgeUseCase:
             created_at=current_time,
             updated_at=current_time,
         )
-
-        return self._repository.create_or_update_port(port)
-
-    def _create_edge(self, dns_record: DnsRecord, port: Port, current_time: datetime) -> NetworkTopologyEdge:
         edge = NetworkTopologyEdge(
             source_id=dns_record.domain_name,
             target_id=f"{port.port_number}_{port.protocol}",
@@ -62,4 +47,4 @@ class AddDomainPortEdgeUseCase:
             created_at=current_time,
         )
 
-        return self._repository.create_edge(edge)
+        return DomainPortLink(dns_record=dns_record, port=port, edge=edge)
@@ -137,14 +137,15 @@ class DiscoverSubdomainsUseCase:
             try:
                 discovery = self._discover_subdomain(full_domain)
                 if discovery:
-                    stored = self._repository.create_or_update_dns_record_discovery(discovery)
-                    subdomains_found.append(stored)
+                    subdomains_found.append(discovery)
             except ValueError:
                 pass
 
         if not subdomains_found:
             raise ValueError(f"No subdomains found for domain: {domain_name}")
 
+        self._repository.bulk_upsert_dns_record_discoveries(subdomains_found).raise_for_errors(len(subdomains_found))
+
         return subdomains_found
 
     def _validate_domain_name(self, domain_name: str) -> None:
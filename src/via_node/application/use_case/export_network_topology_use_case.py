@@ -0,0 +1,54 @@
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.domain.service.topology_snapshot_writer import TopologySnapshotWriter
+
+PageReader = Callable[[int, Optional[str]], Page]
+
+
+class ExportNetworkTopologyUseCase:
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    def execute(self, writer: TopologySnapshotWriter, page_size: int = 1000) -> Dict[str, int]:
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1")
+
+        counts = {
+            name: writer.write_collection(name, model_class, self._stream(read_page, page_size))
+            for name, model_class, read_page in self._collections()
+        }
+        writer.finish()
+
+        return counts
+
+    def _collections(self) -> List[Tuple[str, Type[BaseModel], PageReader]]:
+        return [
+            ("dns_records", DnsRecord, self._repository.list_dns_records),
+            ("ports", Port, self._repository.list_ports),
+            ("hosts", Host, self._repository.list_hosts),
+            ("dns_discoveries", DnsRecordDiscovery, self._repository.list_dns_record_discoveries),
+            ("port_scan_results", PortScanResult, self._repository.list_port_scan_results),
+            ("domain_port_edges", NetworkTopologyEdge, self._edge_reader("domain_to_port")),
+            ("dns_resolves_to_host_edges", NetworkTopologyEdge, self._edge_reader("dns_resolves_to_host")),
+        ]
+
+    def _edge_reader(self, edge_type: str) -> PageReader:
+        return lambda page_size, page_token: self._repository.list_edges(edge_type, page_size, page_token)
+
+    def _stream(self, read_page: PageReader, page_size: int) -> Iterator[BaseModel]:
+        page = read_page(page_size, None)
+        yield from page.items
+
+        while page.next_page_token is not None:
+            page = read_page(page_size, page.next_page_token)
+            yield from page.items
@@ -0,0 +1,38 @@
+import asyncio
+
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    ExposureStatistics,
+    validate_statistics_limit,
+)
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+
+class ExposureStatisticsUseCase:
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    def statistics(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> ExposureStatistics:
+        limit = validate_statistics_limit(limit)
+
+        return ExposureStatistics(
+            services=self._repository.open_ports_per_service(limit),
+            ports=self._repository.hosts_per_open_port(limit),
+            domains=self._repository.record_types_per_domain(limit),
+        )
+
+
+class AsyncExposureStatisticsUseCase:
+    def __init__(self, repository: AsyncNetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    async def statistics(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> ExposureStatistics:
+        limit = validate_statistics_limit(limit)
+        services, ports, domains = await asyncio.gather(
+            self._repository.open_ports_per_service(limit),
+            self._repository.hosts_per_open_port(limit),
+            self._repository.record_types_per_domain(limit),
+        )
+
+        return ExposureStatistics(services=services, ports=ports, domains=domains)
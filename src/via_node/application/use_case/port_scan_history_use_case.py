@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import List, Optional
+
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+
+class PortScanHistoryUseCase:
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    def history(self, target_ip: str, at: Optional[datetime] = None) -> List[PortScanObservation]:
+        if not target_ip or not target_ip.strip():
+            raise ValueError("Target IP cannot be empty")
+
+        if at is None:
+            return self._repository.get_port_scan_history(target_ip.strip())
+
+        return self._repository.get_port_scan_state_at(target_ip.strip(), at)
+
+    def compact(self) -> ScanHistoryCompactionResult:
+        return self._repository.compact_port_scan_history()
@@ -0,0 +1,65 @@
+from typing import List, Optional, Type
+
+from pydantic import BaseModel
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+
+def _required(name: str, value: str) -> str:
+    if not value or not value.strip():
+        raise ValueError(f"{name} cannot be empty")
+
+    return value.strip()
+
+
+def _fields(model_class: Type[BaseModel], fields: Optional[List[str]]) -> Optional[List[str]]:
+    selected = _selected(fields or [])
+    unknown = _unknown(model_class, selected)
+
+    if unknown:
+        raise ValueError(f"Unknown field(s) {unknown}, must be one of {list(model_class.model_fields)}")
+
+    return selected or None
+
+
+def _unknown(model_class: Type[BaseModel], fields: List[str]) -> List[str]:
+    return [field for field in fields if field not in model_class.model_fields]
+
+
+def _selected(fields: List[str]) -> List[str]:
+    return list(dict.fromkeys(field.strip() for field in fields if field.strip()))
+
+
+class QueryNetworkTopologyUseCase:
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    def port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        return self._repository.get_port_scan_results(
+            _required("Target IP", target_ip), _fields(PortScanResult, fields)
+        )
+
+    def dns_record_discoveries(self, domain_name: str, fields: Optional[List[str]] = None) -> List[DnsRecordDiscovery]:
+        return self._repository.get_dns_record_discoveries(
+            _required("Domain name", domain_name).lower(), _fields(DnsRecordDiscovery, fields)
+        )
+
+
+class AsyncQueryNetworkTopologyUseCase:
+    def __init__(self, repository: AsyncNetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    async def port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        return await self._repository.get_port_scan_results(
+            _required("Target IP", target_ip), _fields(PortScanResult, fields)
+        )
+
+    async def dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        return await self._repository.get_dns_record_discoveries(
+            _required("Domain name", domain_name).lower(), _fields(DnsRecordDiscovery, fields)
+        )
@@ -27,8 +27,7 @@ class ScanPortsUseCase:
 
         results = self._extract_scan_results(scanner, target_ip)
 
-        for result in results:
-            self._repository.create_or_update_port_scan_result(result)
+        self._repository.bulk_upsert_port_scan_results(results).raise_for_errors(len(results))
 
         return results
 
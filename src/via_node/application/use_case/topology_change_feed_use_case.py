@@ -0,0 +1,34 @@
+import asyncio
+from typing import List
+
+from via_node.domain.model.topology_change import (
+    DEFAULT_CHANGE_LIMIT,
+    TopologyChange,
+    validate_after_sequence,
+    validate_change_limit,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeReader
+
+
+class TopologyChangeFeedUseCase:
+    def __init__(self, reader: TopologyChangeReader) -> None:
+        self._reader = reader
+
+    def latest_sequence(self) -> int:
+        return self._reader.last_sequence()
+
+    def changes_after(self, after_sequence: int, limit: int = DEFAULT_CHANGE_LIMIT) -> List[TopologyChange]:
+        return self._reader.read_after(validate_after_sequence(after_sequence), validate_change_limit(limit))
+
+
+class AsyncTopologyChangeFeedUseCase:
+    def __init__(self, reader: TopologyChangeReader) -> None:
+        self._reader = reader
+
+    async def latest_sequence(self) -> int:
+        return await asyncio.to_thread(self._reader.last_sequence)
+
+    async def changes_after(self, after_sequence: int, limit: int = DEFAULT_CHANGE_LIMIT) -> List[TopologyChange]:
+        return await asyncio.to_thread(
+            self._reader.read_after, validate_after_sequence(after_sequence), validate_change_limit(limit)
+        )
@@ -0,0 +1,84 @@
+from typing import List, Optional
+
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+
+def _direction(direction: str) -> TraversalDirection:
+    try:
+        return TraversalDirection(direction.lower())
+    except ValueError:
+        raise ValueError(f"Direction must be one of {[member.value for member in TraversalDirection]}") from None
+
+
+class TraverseNetworkTopologyUseCase:
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    def neighbors(
+        self,
+        vertex: str,
+        depth: int = 1,
+        direction: str = "outbound",
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        return self._repository.neighbors(
+            VertexReference.parse(vertex), depth, _direction(direction), edge_types or None, limit
+        )
+
+    def shortest_path(
+        self,
+        source: str,
+        target: str,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: str = "any",
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        return self._repository.shortest_path(
+            VertexReference.parse(source),
+            VertexReference.parse(target),
+            max_depth,
+            _direction(direction),
+            edge_types or None,
+        )
+
+
+class AsyncTraverseNetworkTopologyUseCase:
+    def __init__(self, repository: AsyncNetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    async def neighbors(
+        self,
+        vertex: str,
+        depth: int = 1,
+        direction: str = "outbound",
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        return await self._repository.neighbors(
+            VertexReference.parse(vertex), depth, _direction(direction), edge_types or None, limit
+        )
+
+    async def shortest_path(
+        self,
+        source: str,
+        target: str,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: str = "any",
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        return await self._repository.shortest_path(
+            VertexReference.parse(source),
+            VertexReference.parse(target),
+            max_depth,
+            _direction(direction),
+            edge_types or None,
+        )
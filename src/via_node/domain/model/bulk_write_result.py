@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkWriteError(BaseModel):
+    index: int
+    key: Optional[str] = None
+    error_message: str
+
+
+class BulkWriteResult(BaseModel):
+    written: int = 0
+    errors: List[BulkWriteError] = Field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return len(self.errors) > 0
+
+    def raise_for_errors(self, total: int) -> None:
+        if self.has_errors:
+            raise BulkWriteFailedError.for_result(self, total)
+
+
+class BulkWriteFailedError(Exception):
+    @classmethod
+    def for_result(cls, result: BulkWriteResult, total: int) -> "BulkWriteFailedError":
+        failures = "; ".join(f"{error.key or error.index}: {error.error_message}" for error in result.errors)
+
+        return cls(f"Stored {result.written} of {total} document(s), failed {failures}")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Optional
 
@@ -42,3 +42,8 @@ class DnsRecordDiscovery(BaseModel):
         if ttl is not None and ttl < 0:
             raise ValueError("TTL cannot be negative")
         return ttl
+
+    def expires_at(self, ttl_multiplier: float) -> Optional[datetime]:
+        if self.ttl is None:
+            return None
+        return self.discovered_at + timedelta(seconds=self.ttl * ttl_multiplier)
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+
+
+class DomainPortLink(BaseModel):
+    dns_record: DnsRecord
+    port: Port
+    edge: NetworkTopologyEdge
@@ -0,0 +1,93 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+
+DEFAULT_STATISTICS_LIMIT = 100
+
+
+class ServiceExposure(BaseModel):
+    service_name: Optional[str] = None
+    open_ports: int
+    hosts: int
+
+
+class PortExposure(BaseModel):
+    port_number: int
+    protocol: str
+    hosts: int
+
+
+class DomainRecordTypes(BaseModel):
+    domain_name: str
+    record_types: List[DnsRecordType]
+
+
+class ExposureStatistics(BaseModel):
+    services: List[ServiceExposure] = Field(default_factory=list)
+    ports: List[PortExposure] = Field(default_factory=list)
+    domains: List[DomainRecordTypes] = Field(default_factory=list)
+
+
+def validate_statistics_limit(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("Statistics limit must be at least 1")
+
+    return limit
+
+
+def service_exposures(port_scan_results: Iterable[PortScanResult], limit: int) -> List[ServiceExposure]:
+    hosts: Dict[Optional[str], Set[str]] = defaultdict(set)
+    open_ports: Dict[Optional[str], int] = defaultdict(int)
+
+    for result in _open(port_scan_results):
+        hosts[result.service_name].add(result.target_ip)
+        open_ports[result.service_name] += 1
+
+    exposures = [
+        ServiceExposure(service_name=service_name, open_ports=count, hosts=len(hosts[service_name]))
+        for service_name, count in open_ports.items()
+    ]
+
+    return sorted(exposures, key=_service_order)[:limit]
+
+
+def port_exposures(port_scan_results: Iterable[PortScanResult], limit: int) -> List[PortExposure]:
+    hosts: Dict[Tuple[int, str], int] = defaultdict(int)
+
+    for result in _open(port_scan_results):
+        hosts[(result.port_number, result.protocol)] += 1
+
+    exposures = [
+        PortExposure(port_number=port_number, protocol=protocol, hosts=count)
+        for (port_number, protocol), count in hosts.items()
+    ]
+
+    return sorted(exposures, key=lambda exposure: (-exposure.hosts, exposure.port_number, exposure.protocol))[:limit]
+
+
+def domain_record_types(dns_record_discoveries: Iterable[DnsRecordDiscovery], limit: int) -> List[DomainRecordTypes]:
+    record_types: Dict[str, Set[DnsRecordType]] = defaultdict(set)
+
+    for discovery in dns_record_discoveries:
+        record_types[discovery.domain_name].add(discovery.record_type)
+
+    return [
+        DomainRecordTypes(domain_name=domain_name, record_types=sorted(record_types[domain_name], key=_value))
+        for domain_name in sorted(record_types)[:limit]
+    ]
+
+
+def _value(record_type: DnsRecordType) -> str:
+    return record_type.value
+
+
+def _open(port_scan_results: Iterable[PortScanResult]) -> Iterable[PortScanResult]:
+    return (result for result in port_scan_results if result.state == PortState.OPEN)
+
+
+def _service_order(exposure: ServiceExposure) -> Tuple[int, bool, str]:
+    return -exposure.open_ports, exposure.service_name is not None, exposure.service_name or ""
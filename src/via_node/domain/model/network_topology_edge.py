@@ -1,8 +1,26 @@
+import hashlib
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, field_validator
 
+EDGE_TYPES = ("domain_to_port", "dns_resolves_to_host")
+
+
+def edge_key(edge_type: str, source_id: str, target_id: str) -> str:
+    identity = "|".join([edge_type, source_id, target_id])
+
+    return hashlib.sha1(identity.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def validate_edge_type(edge_type: str) -> str:
+    edge_type_lower = edge_type.lower()
+
+    if edge_type_lower not in EDGE_TYPES:
+        raise ValueError(f"Edge type must be one of {set(EDGE_TYPES)}")
+
+    return edge_type_lower
+
 
 class NetworkTopologyEdge(BaseModel):
     source_id: str
@@ -10,6 +28,11 @@ class NetworkTopologyEdge(BaseModel):
     edge_type: str
     metadata: Dict[str, Any]
     created_at: datetime
+    last_seen_at: Optional[datetime] = None
+
+    @property
+    def key(self) -> str:
+        return edge_key(self.edge_type, self.source_id, self.target_id)
 
     @field_validator("source_id")
     @classmethod
@@ -30,10 +53,19 @@ class NetworkTopologyEdge(BaseModel):
     @field_validator("edge_type")
     @classmethod
     def validate_edge_type(cls, edge_type: str) -> str:
-        valid_types = {"domain_to_port", "dns_resolves_to_host"}
-        edge_type_lower = edge_type.lower()
+        return validate_edge_type(edge_type)
+
 
-        if edge_type_lower not in valid_types:
-            raise ValueError(f"Edge type must be one of {valid_types}")
+TARGET_VERTEX_DESCRIPTIONS = {
+    "domain_to_port": "Port '{}'",
+    "dns_resolves_to_host": "Host with IP '{}'",
+}
+
+
+class VertexNotFoundError(ValueError):
+    @classmethod
+    def for_edge(cls, edge: NetworkTopologyEdge, source_found: bool) -> "VertexNotFoundError":
+        if not source_found:
+            return cls(f"DNS record '{edge.source_id}' not found")
 
-        return edge_type_lower
+        return cls(f"{TARGET_VERTEX_DESCRIPTIONS[edge.edge_type].format(edge.target_id)} not found")
@@ -0,0 +1,18 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+ItemType = TypeVar("ItemType")
+
+
+class InvalidPageTokenError(ValueError):
+    pass
+
+
+class Page(BaseModel, Generic[ItemType]):
+    items: List[ItemType] = Field(default_factory=list)
+    next_page_token: Optional[str] = None
+
+    @property
+    def has_next_page(self) -> bool:
+        return self.next_page_token is not None
@@ -0,0 +1,89 @@
+import hashlib
+from datetime import datetime
+from itertools import groupby
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+
+
+def observation_key(target_ip: str, protocol: str, port_number: int, first_observed_at: datetime) -> str:
+    identity = "|".join([target_ip, protocol, str(port_number), first_observed_at.isoformat()])
+
+    return hashlib.sha1(identity.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+class PortScanObservation(BaseModel):
+    target_ip: str
+    port_number: int
+    protocol: str
+    state: PortState
+    service_name: Optional[str] = None
+    service_version: Optional[str] = None
+    first_observed_at: datetime
+    last_observed_at: datetime
+    observations: int = 1
+
+    @classmethod
+    def from_result(cls, port_scan_result: PortScanResult) -> "PortScanObservation":
+        return cls(
+            target_ip=port_scan_result.target_ip,
+            port_number=port_scan_result.port_number,
+            protocol=port_scan_result.protocol,
+            state=port_scan_result.state,
+            service_name=port_scan_result.service_name,
+            service_version=port_scan_result.service_version,
+            first_observed_at=port_scan_result.scanned_at,
+            last_observed_at=port_scan_result.scanned_at,
+        )
+
+    @property
+    def key(self) -> str:
+        return observation_key(self.target_ip, self.protocol, self.port_number, self.first_observed_at)
+
+    @property
+    def series(self) -> Tuple[str, int, str]:
+        return self.target_ip, self.port_number, self.protocol
+
+    def same_state(self, other: "PortScanObservation") -> bool:
+        return (self.series, self.state, self.service_name, self.service_version) == (
+            other.series,
+            other.state,
+            other.service_name,
+            other.service_version,
+        )
+
+    def extend(self, later: "PortScanObservation") -> "PortScanObservation":
+        return self.model_copy(
+            update={
+                "last_observed_at": max(self.last_observed_at, later.last_observed_at),
+                "observations": self.observations + later.observations,
+            }
+        )
+
+
+class ScanHistoryCompactionResult(BaseModel):
+    rewritten: int = 0
+    removed: int = 0
+
+
+Interval = Tuple[PortScanObservation, List[PortScanObservation]]
+
+
+def compact_series(observations: Iterable[PortScanObservation]) -> List[Interval]:
+    intervals: List[Interval] = []
+
+    for observation in sorted(observations, key=lambda candidate: candidate.first_observed_at):
+        if intervals and intervals[-1][0].same_state(observation):
+            interval, absorbed = intervals[-1]
+            intervals[-1] = (interval.extend(observation), [*absorbed, observation])
+        else:
+            intervals.append((observation, []))
+
+    return intervals
+
+
+def compact_history(observations: Iterable[PortScanObservation]) -> Iterator[Interval]:
+    for _, series in groupby(observations, key=lambda observation: observation.series):
+        yield from ((interval, absorbed) for interval, absorbed in compact_series(series) if absorbed)
@@ -0,0 +1,8 @@
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_microseconds(value: datetime) -> int:
+    return (value.astimezone(timezone.utc) - EPOCH) // MICROSECOND
@@ -0,0 +1,130 @@
+import hashlib
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult
+
+DEFAULT_CHANGE_LIMIT = 1000
+VOLATILE_FIELDS = frozenset({"created_at", "updated_at", "scanned_at", "discovered_at", "last_seen_at", "ttl"})
+
+
+class TopologyChangeKind(Enum):
+    DNS_RECORD = "dns_record"
+    PORT = "port"
+    HOST = "host"
+    EDGE = "edge"
+    DNS_RECORD_DISCOVERY = "dns_record_discovery"
+    PORT_SCAN_RESULT = "port_scan_result"
+
+
+class TopologyChangeOperation(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+
+
+class TopologyChange(BaseModel):
+    sequence: int = 0
+    kind: TopologyChangeKind
+    key: str
+    operation: TopologyChangeOperation = TopologyChangeOperation.CREATED
+    fingerprint: str = ""
+    occurred_at: datetime
+    document: Dict[str, Any]
+
+
+class TopologyChangeFingerprints:
+    def __init__(self) -> None:
+        self._latest: Dict[Tuple[str, str], str] = {}
+
+    def record(self, kind: str, key: str, fingerprint: str) -> None:
+        self._latest[(kind, key)] = fingerprint
+
+    def changed(self, changes: Iterable[TopologyChange]) -> List[TopologyChange]:
+        return [delta for delta in map(self._delta, changes) if delta is not None]
+
+    def _delta(self, change: TopologyChange) -> Optional[TopologyChange]:
+        latest = self._latest.get((change.kind.value, change.key))
+
+        if latest == change.fingerprint:
+            return None
+
+        self.record(change.kind.value, change.key, change.fingerprint)
+        operation = TopologyChangeOperation.CREATED if latest is None else TopologyChangeOperation.UPDATED
+
+        return change.model_copy(update={"operation": operation})
+
+
+class ChangeSequenceExpiredError(ValueError):
+    @classmethod
+    def for_sequence(cls, after_sequence: int, oldest_sequence: int) -> "ChangeSequenceExpiredError":
+        return cls(f"Changes after sequence {after_sequence} are no longer retained, oldest is {oldest_sequence}")
+
+
+def validate_after_sequence(after_sequence: int) -> int:
+    if after_sequence < 0:
+        raise ValueError("Sequence must not be negative")
+
+    return after_sequence
+
+
+def validate_change_limit(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("Change limit must be at least 1")
+
+    return limit
+
+
+def dns_record_change(dns_record: DnsRecord) -> TopologyChange:
+    return _change(TopologyChangeKind.DNS_RECORD, dns_record.domain_name, dns_record)
+
+
+def port_change(port: Port) -> TopologyChange:
+    return _change(TopologyChangeKind.PORT, f"{port.port_number}_{port.protocol}", port)
+
+
+def host_change(host: Host) -> TopologyChange:
+    return _change(TopologyChangeKind.HOST, host.ip_address, host)
+
+
+def edge_change(edge: NetworkTopologyEdge) -> TopologyChange:
+    return _change(TopologyChangeKind.EDGE, edge.key, edge)
+
+
+def dns_record_discovery_change(dns_record_discovery: DnsRecordDiscovery) -> TopologyChange:
+    key = f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}"
+
+    return _change(TopologyChangeKind.DNS_RECORD_DISCOVERY, key, dns_record_discovery)
+
+
+def port_scan_result_change(port_scan_result: PortScanResult) -> TopologyChange:
+    key = f"{port_scan_result.target_ip}_{port_scan_result.protocol}_{port_scan_result.port_number}"
+
+    return _change(TopologyChangeKind.PORT_SCAN_RESULT, key, port_scan_result)
+
+
+def document_fingerprint(document: Dict[str, Any]) -> str:
+    significant = {field: value for field, value in document.items() if field not in VOLATILE_FIELDS}
+    encoded = json.dumps(significant, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    return hashlib.sha1(encoded, usedforsecurity=False).hexdigest()
+
+
+def _change(kind: TopologyChangeKind, key: str, model: BaseModel) -> TopologyChange:
+    document = model.model_dump(mode="json")
+
+    return TopologyChange(
+        kind=kind,
+        key=key,
+        fingerprint=document_fingerprint(document),
+        occurred_at=datetime.now(),
+        document=document,
+    )
@@ -0,0 +1,95 @@
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, field_validator
+
+from via_node.domain.model.network_topology_edge import EDGE_TYPES, NetworkTopologyEdge, validate_edge_type
+
+VERTEX_KINDS = ("dns_record", "host", "port")
+MAX_TRAVERSAL_DEPTH = 10
+EDGE_TARGET_KINDS = {"domain_to_port": "port", "dns_resolves_to_host": "host"}
+
+
+class TraversalDirection(Enum):
+    OUTBOUND = "outbound"
+    INBOUND = "inbound"
+    ANY = "any"
+
+
+class VertexReference(BaseModel):
+    kind: str
+    key: str
+
+    @classmethod
+    def parse(cls, reference: str) -> "VertexReference":
+        kind, separator, key = reference.partition(":")
+
+        if not separator:
+            raise ValueError(f"Vertex reference must look like '<kind>:<key>', got '{reference}'")
+
+        return cls(kind=kind, key=key)
+
+    @field_validator("kind")
+    @classmethod
+    def validate_kind(cls, kind: str) -> str:
+        kind_lower = kind.strip().lower()
+
+        if kind_lower not in VERTEX_KINDS:
+            raise ValueError(f"Vertex kind must be one of {set(VERTEX_KINDS)}")
+
+        return kind_lower
+
+    @field_validator("key")
+    @classmethod
+    def validate_key(cls, key: str) -> str:
+        if not key or len(key.strip()) == 0:
+            raise ValueError("Vertex key cannot be empty")
+
+        return key.strip()
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.key}"
+
+
+class TraversalVertex(BaseModel):
+    vertex: VertexReference
+    depth: int
+    attributes: Dict[str, Any]
+
+
+class TraversalPath(BaseModel):
+    vertices: List[VertexReference]
+    edges: List[NetworkTopologyEdge]
+
+    @property
+    def length(self) -> int:
+        return len(self.edges)
+
+
+def validate_traversal_depth(depth: int) -> int:
+    if depth < 1 or depth > MAX_TRAVERSAL_DEPTH:
+        raise ValueError(f"Traversal depth must be between 1 and {MAX_TRAVERSAL_DEPTH}")
+
+    return depth
+
+
+def validate_edge_types(edge_types: List[str]) -> List[str]:
+    return [validate_edge_type(edge_type) for edge_type in edge_types]
+
+
+def selected_edge_types(edge_types: Optional[List[str]]) -> List[str]:
+    return validate_edge_types(edge_types) if edge_types else list(EDGE_TYPES)
+
+
+def validate_traversal_limit(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("Traversal limit must be at least 1")
+
+    return limit
+
+
+def edge_endpoints(edge: NetworkTopologyEdge) -> Tuple[VertexReference, VertexReference]:
+    return (
+        VertexReference(kind="dns_record", key=edge.source_id),
+        VertexReference(kind=EDGE_TARGET_KINDS[edge.edge_type], key=edge.target_id),
+    )
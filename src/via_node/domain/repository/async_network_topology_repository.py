@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+
+
+class AsyncNetworkTopologyRepository(ABC):
+    @abstractmethod
+    async def aclose(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_or_update_port(self, port: Port) -> Port:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_or_update_host(self, host: Host) -> Host:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_host(self, ip_address: str) -> Optional[Host]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_or_update_dns_record_discovery(
+        self, dns_record_discovery: DnsRecordDiscovery
+    ) -> DnsRecordDiscovery:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[DnsRecordDiscovery]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_upsert_dns_record_discoveries(
+        self, dns_record_discoveries: List[DnsRecordDiscovery]
+    ) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_port_scan_results(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        raise NotImplementedError()
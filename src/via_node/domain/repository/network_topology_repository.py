@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
 
+from via_node.domain.model.bulk_write_result import BulkWriteResult
 from via_node.domain.model.dns_record import DnsRecord
 from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
 from via_node.domain.model.host import Host
 from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
 from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
 from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
 
 
 class NetworkTopologyRepository(ABC):
@@ -22,6 +40,14 @@ class NetworkTopologyRepository(ABC):
     def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
         raise NotImplementedError()
 
+    @abstractmethod
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
         raise NotImplementedError()
@@ -43,7 +69,19 @@ class NetworkTopologyRepository(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_dns_record_discoveries(self, domain_name: str) -> List[DnsRecordDiscovery]:
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -51,5 +89,113 @@ class NetworkTopologyRepository(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_port_scan_results(self, target_ip: str) -> List[PortScanResult]:
+    def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
         raise NotImplementedError()
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from via_node.domain.model.topology_change import TopologyChange
+
+
+class TopologyChangeSink(ABC):
+    @abstractmethod
+    def publish(self, changes: List[TopologyChange]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError()
+
+
+class TopologyChangeJournal(ABC):
+    @abstractmethod
+    def append(self, changes: List[TopologyChange]) -> List[TopologyChange]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError()
+
+
+class TopologyChangeReader(ABC):
+    @abstractmethod
+    def last_sequence(self) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def read_after(self, after_sequence: int, limit: int) -> List[TopologyChange]:
+        raise NotImplementedError()
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Type
+
+from pydantic import BaseModel
+
+
+class TopologySnapshotWriter(ABC):
+    @abstractmethod
+    def write_collection(self, name: str, model_class: Type[BaseModel], models: Iterable[BaseModel]) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def finish(self) -> None:
+        raise NotImplementedError()
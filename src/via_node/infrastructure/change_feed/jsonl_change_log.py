@@ -0,0 +1,235 @@
+import fcntl
+import json
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from via_node.domain.model.topology_change import (
+    TopologyChange,
+    TopologyChangeFingerprints,
+    validate_after_sequence,
+    validate_change_limit,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeJournal, TopologyChangeReader
+
+TAIL_BLOCK_SIZE = 65_536
+DEFAULT_MAX_LOG_BYTES = 64 * 1024 * 1024
+INDEXED_FIELDS = frozenset({"sequence", "kind", "key", "fingerprint"})
+
+
+def encode_changes(changes: List[TopologyChange]) -> bytes:
+    return b"".join(change.model_dump_json().encode() + b"\n" for change in changes)
+
+
+def last_complete_line(path: Path, block_size: int = TAIL_BLOCK_SIZE) -> bytes:
+    with path.open("rb") as file:
+        end = file.seek(0, os.SEEK_END)
+        tail = b""
+
+        while end > 0 and b"\n" not in _complete_lines(tail):
+            start = max(0, end - block_size)
+            file.seek(start)
+            tail = file.read(end - start) + tail
+            end = start
+
+    return _complete_lines(tail).rsplit(b"\n", 1)[-1]
+
+
+def _complete_lines(tail: bytes) -> bytes:
+    return tail[: max(tail.rfind(b"\n"), 0)]
+
+
+class JsonlChangeLog(TopologyChangeJournal, TopologyChangeReader):
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_LOG_BYTES) -> None:
+        self._path = Path(path).expanduser()
+        self._max_bytes = max_bytes
+        self._compacted_size = 0
+        self._lock = threading.Lock()
+        self._writer: Optional[BinaryIO] = None
+        self._reset_index()
+
+    def append(self, changes: List[TopologyChange]) -> List[TopologyChange]:
+        with self._lock:
+            writer = self._locked_writer()
+
+            try:
+                recorded = self._append(writer, changes)
+                self._compact_when_oversized(writer)
+
+                return recorded
+            finally:
+                fcntl.flock(writer, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_writer()
+
+    def last_sequence(self) -> int:
+        line = last_complete_line(self._path) if self._path.exists() else b""
+
+        return TopologyChange.model_validate_json(line).sequence if line else 0
+
+    def read_after(self, after_sequence: int, limit: int) -> List[TopologyChange]:
+        validate_after_sequence(after_sequence)
+        validate_change_limit(limit)
+
+        with self._lock:
+            try:
+                file = self._path.open("rb")
+            except FileNotFoundError:
+                return []
+
+            with file:
+                self._index(file)
+                first = bisect_right(self._sequences, after_sequence)
+
+                return self._read(file, first, min(limit, len(self._sequences) - first))
+
+    def _append(self, writer: BinaryIO, changes: List[TopologyChange]) -> List[TopologyChange]:
+        with self._path.open("rb") as file:
+            self._index(file)
+
+        recorded = self._sequenced(self._fingerprints.changed(changes))
+
+        try:
+            self._write(writer, recorded)
+        except Exception:
+            self._reset_index()
+            raise
+
+        return recorded
+
+    def _sequenced(self, changes: List[TopologyChange]) -> List[TopologyChange]:
+        last_sequence = self._sequences[-1] if self._sequences else 0
+
+        return [
+            change.model_copy(update={"sequence": sequence})
+            for sequence, change in enumerate(changes, start=last_sequence + 1)
+        ]
+
+    def _write(self, writer: BinaryIO, changes: List[TopologyChange]) -> None:
+        if not changes:
+            return
+
+        torn = os.fstat(writer.fileno()).st_size > self._indexed_offset
+        writer.write((b"\n" if torn else b"") + encode_changes(changes))
+        writer.flush()
+
+    def _locked_writer(self) -> BinaryIO:
+        while True:
+            writer = self._open_writer()
+            fcntl.flock(writer, fcntl.LOCK_EX)
+
+            if not self._replaced(writer):
+                return writer
+
+            fcntl.flock(writer, fcntl.LOCK_UN)
+            self._close_writer()
+
+    def _replaced(self, writer: BinaryIO) -> bool:
+        try:
+            return self._path.stat().st_ino != os.fstat(writer.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    def _open_writer(self) -> BinaryIO:
+        if self._writer is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = self._path.open("ab")
+
+        return self._writer
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _compact_when_oversized(self, writer: BinaryIO) -> None:
+        size = os.fstat(writer.fileno()).st_size
+
+        if size > self._max_bytes and size > 2 * self._compacted_size:
+            self._compact()
+
+    def _compact(self) -> None:
+        compacted = self._path.with_name(f"{self._path.name}.compacting")
+
+        with self._path.open("rb") as source, compacted.open("wb") as target:
+            latest = _latest_sequences(source)
+            source.seek(0)
+            target.writelines(line for line in iter(source.readline, b"") if _is_latest(line, latest))
+            target.flush()
+            os.fsync(target.fileno())
+
+        os.replace(compacted, self._path)
+        self._compacted_size = self._path.stat().st_size
+
+    def _index(self, file: BinaryIO) -> None:
+        status = os.fstat(file.fileno())
+
+        if status.st_ino != self._indexed_inode or status.st_size < self._indexed_offset:
+            self._reset_index(status.st_ino)
+
+        file.seek(self._indexed_offset)
+
+        for line in iter(file.readline, b""):
+            self._index_line(line)
+
+    def _index_line(self, line: bytes) -> None:
+        if not line.endswith(b"\n"):
+            return
+
+        record = _parse(line)
+
+        if record is not None:
+            self._index_change(record)
+
+        self._indexed_offset += len(line)
+
+    def _index_change(self, record: Dict[str, Any]) -> None:
+        self._sequences.append(record["sequence"])
+        self._offsets.append(self._indexed_offset)
+        self._fingerprints.record(record["kind"], record["key"], record["fingerprint"])
+
+    def _read(self, file: BinaryIO, first: int, count: int) -> List[TopologyChange]:
+        return [_read_line(file, offset) for offset in self._offsets[first : first + max(count, 0)]]
+
+    def _reset_index(self, inode: int = 0) -> None:
+        self._sequences = array("q")
+        self._offsets = array("q")
+        self._fingerprints = TopologyChangeFingerprints()
+        self._indexed_offset = 0
+        self._indexed_inode = inode
+
+
+def _parse(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+
+    return record if isinstance(record, dict) and INDEXED_FIELDS <= record.keys() else None
+
+
+def _identity(record: Dict[str, Any]) -> Tuple[str, str]:
+    return record["kind"], record["key"]
+
+
+def _latest_sequences(file: BinaryIO) -> Dict[Tuple[str, str], int]:
+    records = (_parse(line) for line in iter(file.readline, b"") if line.endswith(b"\n"))
+
+    return {_identity(record): record["sequence"] for record in records if record is not None}
+
+
+def _is_latest(line: bytes, latest: Dict[Tuple[str, str], int]) -> bool:
+    record = _parse(line) if line.endswith(b"\n") else None
+
+    return record is not None and latest.get(_identity(record)) == record["sequence"]
+
+
+def _read_line(file: BinaryIO, offset: int) -> TopologyChange:
+    file.seek(offset)
+
+    return TopologyChange.model_validate_json(file.readline())
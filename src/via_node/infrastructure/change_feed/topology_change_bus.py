@@ -0,0 +1,138 @@
+import queue
+import threading
+from collections import deque
+from typing import Deque, Iterable, List, Optional
+
+from via_node.domain.model.topology_change import (
+    ChangeSequenceExpiredError,
+    TopologyChange,
+    TopologyChangeFingerprints,
+    validate_after_sequence,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeJournal, TopologyChangeSink
+
+DEFAULT_HISTORY_SIZE = 10_000
+DEFAULT_MAX_PENDING = 10_000
+
+
+class ChangeSubscriptionOverflowError(Exception):
+    @classmethod
+    def after(cls, last_sequence: int) -> "ChangeSubscriptionOverflowError":
+        return cls(f"Subscriber fell behind, resume after sequence {last_sequence}")
+
+
+class TopologyChangeSubscription(TopologyChangeSink):
+    def __init__(self, bus: "TopologyChangeBus", last_sequence: int, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self._bus = bus
+        self._pending: "queue.Queue[TopologyChange]" = queue.Queue(max_pending)
+        self._overflowed = False
+        self.last_sequence = last_sequence
+
+    def publish(self, changes: List[TopologyChange]) -> None:
+        for change in changes:
+            self._offer(change)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[TopologyChange]:
+        try:
+            change = self._pending.get(not self._overflowed, timeout)
+        except queue.Empty:
+            self._raise_if_overflowed()
+            return None
+
+        self.last_sequence = change.sequence
+
+        return change
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+    def _offer(self, change: TopologyChange) -> None:
+        try:
+            self._pending.put_nowait(change)
+        except queue.Full:
+            self._overflowed = True
+
+    def _raise_if_overflowed(self) -> None:
+        if self._overflowed:
+            raise ChangeSubscriptionOverflowError.after(self.last_sequence)
+
+
+class TopologyChangeBus(TopologyChangeSink):
+    def __init__(
+        self,
+        sinks: Optional[Iterable[TopologyChangeSink]] = None,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        last_sequence: int = 0,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        journal: Optional[TopologyChangeJournal] = None,
+    ) -> None:
+        self._sinks = list(sinks or [])
+        self._journal = journal
+        self._fingerprints = TopologyChangeFingerprints()
+        self._history: Deque[TopologyChange] = deque(maxlen=history_size)
+        self._subscriptions: List[TopologyChangeSubscription] = []
+        self._last_sequence = last_sequence
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+
+    @property
+    def last_sequence(self) -> int:
+        with self._lock:
+            return self._last_sequence
+
+    def publish(self, changes: List[TopologyChange]) -> None:
+        with self._lock:
+            recorded = self._record(changes)
+
+            if recorded:
+                self._fan_out(recorded)
+
+    def subscribe(self, after_sequence: Optional[int] = None) -> TopologyChangeSubscription:
+        with self._lock:
+            start = self._last_sequence if after_sequence is None else validate_after_sequence(after_sequence)
+            subscription = TopologyChangeSubscription(self, start, self._max_pending)
+            subscription.publish(self._retained_after(start))
+            self._subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: TopologyChangeSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def close(self) -> None:
+        with self._lock:
+            self._subscriptions.clear()
+
+            for sink in self._sinks:
+                sink.close()
+
+            if self._journal is not None:
+                self._journal.close()
+
+    def _record(self, changes: List[TopologyChange]) -> List[TopologyChange]:
+        if self._journal is not None:
+            return self._journal.append(changes)
+
+        return [self._sequenced(change) for change in self._fingerprints.changed(changes)]
+
+    def _fan_out(self, recorded: List[TopologyChange]) -> None:
+        self._last_sequence = recorded[-1].sequence
+        self._history.extend(recorded)
+
+        for sink in [*self._sinks, *self._subscriptions]:
+            sink.publish(recorded)
+
+    def _sequenced(self, change: TopologyChange) -> TopologyChange:
+        self._last_sequence += 1
+
+        return change.model_copy(update={"sequence": self._last_sequence})
+
+    def _retained_after(self, after_sequence: int) -> List[TopologyChange]:
+        oldest_sequence = self._history[0].sequence if self._history else self._last_sequence + 1
+
+        if after_sequence + 1 < oldest_sequence:
+            raise ChangeSequenceExpiredError.for_sequence(after_sequence, oldest_sequence)
+
+        return [change for change in self._history if change.sequence > after_sequence]
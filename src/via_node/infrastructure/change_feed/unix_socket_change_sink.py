@@ -0,0 +1,44 @@
+import socket
+import threading
+from typing import List, Optional
+
+from via_node.domain.model.topology_change import TopologyChange
+from via_node.domain.service.topology_change_feed import TopologyChangeSink
+from via_node.infrastructure.change_feed.jsonl_change_log import encode_changes
+
+
+class UnixSocketChangeSink(TopologyChangeSink):
+    def __init__(self, path: str, timeout: float = 1.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def publish(self, changes: List[TopologyChange]) -> None:
+        payload = encode_changes(changes)
+
+        with self._lock:
+            try:
+                self._connected().sendall(payload)
+            except OSError:
+                self._disconnect()
+                self.dropped += len(changes)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _connected(self) -> socket.socket:
+        if self._socket is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+            self._socket = connection
+            connection.connect(self._path)
+
+        return self._socket
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
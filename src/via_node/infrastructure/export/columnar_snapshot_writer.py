@@ -0,0 +1,162 @@
+import json
+import sys
+from array import array
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.domain.service.topology_snapshot_writer import TopologySnapshotWriter
+
+FORMAT_NAME = "via-node-columnar"
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+SCALAR_KINDS: Dict[Any, str] = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    datetime: "timestamp[us]",
+    str: "string",
+}
+TYPECODES = {"bool": "B", "int64": "q", "float64": "d", "timestamp[us]": "q", "string": "i", "json": "i"}
+DTYPES = {"bool": "|u1", "int64": "i8", "float64": "f8", "timestamp[us]": "i8", "string": "i4", "json": "i4"}
+DICTIONARY_KINDS = ("string", "json")
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+    nullable = get_origin(annotation) is Union and len(arguments) < len(get_args(annotation))
+
+    return (arguments[0] if nullable else annotation), nullable
+
+
+def column_kind(annotation: Any) -> Tuple[str, bool]:
+    base, nullable = _unwrap_optional(annotation)
+
+    if isinstance(base, type) and issubclass(base, Enum):
+        return "string", nullable
+
+    return SCALAR_KINDS.get(base, "json"), nullable
+
+
+def _text(kind: str, value: Any) -> str:
+    if kind == "json":
+        return json.dumps(value, sort_keys=True, default=str)
+
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def _dtype(kind: str) -> str:
+    dtype = DTYPES[kind]
+
+    return dtype if dtype.startswith("|") else f"{BYTE_ORDER}{dtype}"
+
+
+class ColumnFile:
+    def __init__(self, directory: Path, name: str, kind: str, nullable: bool) -> None:
+        self.name = name
+        self.kind = kind
+        self.nullable = nullable and kind not in DICTIONARY_KINDS
+        self._values: "array[Any]" = array(TYPECODES[kind])
+        self._validity = array("B")
+        self._dictionary: Dict[str, int] = {}
+        self._directory = directory
+        self._data_file: BinaryIO = open(directory / f"{name}.bin", "wb")
+        self._validity_file: Optional[BinaryIO] = open(directory / f"{name}.valid.bin", "wb") if self.nullable else None
+
+    def append(self, value: Any) -> None:
+        if self.nullable:
+            self._validity.append(value is not None)
+
+        self._values.append(self._encode(value))
+
+    def flush(self) -> None:
+        self._values.tofile(self._data_file)
+        self._values = array(self._values.typecode)
+
+        if self._validity_file is not None:
+            self._validity.tofile(self._validity_file)
+            self._validity = array("B")
+
+    def close(self) -> None:
+        self.flush()
+        self._data_file.close()
+
+        if self._validity_file is not None:
+            self._validity_file.close()
+
+        if self.kind in DICTIONARY_KINDS:
+            (self._directory / f"{self.name}.dictionary.json").write_text(json.dumps(list(self._dictionary)))
+
+    def describe(self) -> Dict[str, Any]:
+        description: Dict[str, Any] = {"type": self.kind, "dtype": _dtype(self.kind), "data": f"{self.name}.bin"}
+
+        if self.nullable:
+            description["validity"] = f"{self.name}.valid.bin"
+
+        if self.kind in DICTIONARY_KINDS:
+            description["dictionary"] = f"{self.name}.dictionary.json"
+
+        return description
+
+    def _encode(self, value: Any) -> Union[int, float]:
+        if value is None:
+            return -1 if self.kind in DICTIONARY_KINDS else 0
+
+        if self.kind in DICTIONARY_KINDS:
+            return self._dictionary.setdefault(_text(self.kind, value), len(self._dictionary))
+
+        return epoch_microseconds(value) if self.kind == "timestamp[us]" else value
+
+
+class ColumnarSnapshotWriter(TopologySnapshotWriter):
+    def __init__(self, output_directory: str, flush_rows: int = 65_536) -> None:
+        self._root = Path(output_directory)
+        self._flush_rows = flush_rows
+        self._collections: Dict[str, Dict[str, Any]] = {}
+
+    def write_collection(self, name: str, model_class: Type[BaseModel], models: Iterable[BaseModel]) -> int:
+        directory = self._root / name
+        directory.mkdir(parents=True, exist_ok=True)
+        columns = [
+            ColumnFile(directory, field, *column_kind(info.annotation))
+            for field, info in model_class.model_fields.items()
+        ]
+
+        try:
+            rows = self._write_rows(columns, models)
+        finally:
+            for column in columns:
+                column.close()
+
+        self._collections[name] = {"rows": rows, "columns": {column.name: column.describe() for column in columns}}
+
+        return rows
+
+    def finish(self) -> None:
+        manifest = {"format": FORMAT_NAME, "version": FORMAT_VERSION, "collections": self._collections}
+
+        (self._root / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+    def _write_rows(self, columns: List[ColumnFile], models: Iterable[BaseModel]) -> int:
+        rows = 0
+
+        for model in models:
+            for column in columns:
+                column.append(getattr(model, column.name))
+
+            rows += 1
+
+            if rows % self._flush_rows == 0:
+                self._flush(columns)
+
+        return rows
+
+    def _flush(self, columns: List[ColumnFile]) -> None:
+        for column in columns:
+            column.flush()
@@ -0,0 +1,28 @@
+from arango.collection import StandardCollection
+
+
+class ArangoCollectionHandles:
+    def __init__(
+        self,
+        dns_records: StandardCollection,
+        ports: StandardCollection,
+        hosts: StandardCollection,
+        dns_discoveries: StandardCollection,
+        port_scan_results: StandardCollection,
+        port_scan_history: StandardCollection,
+        domain_port_edges: StandardCollection,
+        dns_resolves_to_host_edges: StandardCollection,
+    ) -> None:
+        self.dns_records = dns_records
+        self.ports = ports
+        self.hosts = hosts
+        self.dns_discoveries = dns_discoveries
+        self.port_scan_results = port_scan_results
+        self.port_scan_history = port_scan_history
+        self.domain_port_edges = domain_port_edges
+        self.dns_resolves_to_host_edges = dns_resolves_to_host_edges
+
+    def edge_collection(self, edge_type: str) -> StandardCollection:
+        if edge_type == "dns_resolves_to_host":
+            return self.dns_resolves_to_host_edges
+        return self.domain_port_edges
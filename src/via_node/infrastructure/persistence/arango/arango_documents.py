@@ -0,0 +1,395 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.infrastructure.persistence.page_token import decode_page_token, encode_page_token, validate_page_size
+from via_node.infrastructure.persistence.projection import projected_fields
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+ItemType = TypeVar("ItemType")
+
+DNS_RECORDS_COLLECTION = "dns_records"
+PORTS_COLLECTION = "ports"
+HOSTS_COLLECTION = "hosts"
+DNS_DISCOVERIES_COLLECTION = "dns_discoveries"
+PORT_SCAN_RESULTS_COLLECTION = "port_scan_results"
+PORT_SCAN_HISTORY_COLLECTION = "port_scan_history"
+DOMAIN_PORT_EDGES_COLLECTION = "domain_port_edges"
+DNS_RESOLVES_TO_HOST_EDGES_COLLECTION = "dns_resolves_to_host_edges"
+DEFAULT_DISCOVERY_TTL_MULTIPLIER = 2.0
+LIVE_DISCOVERY_FILTER = "AND (doc.expires_at == null OR doc.expires_at > DATE_NOW() / 1000)"
+
+
+def trusted_model(model: Type[ModelType], values: Dict[str, Any]) -> ModelType:
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+    return instance
+
+
+def edge_collection_name(edge_type: str) -> str:
+    if edge_type == "dns_resolves_to_host":
+        return DNS_RESOLVES_TO_HOST_EDGES_COLLECTION
+    return DOMAIN_PORT_EDGES_COLLECTION
+
+
+def port_key(port_number: int, protocol: str) -> str:
+    return f"{port_number}_{protocol}"
+
+
+def dns_record_document(dns_record: DnsRecord) -> Dict[str, Any]:
+    return {
+        "_key": dns_record.domain_name,
+        "domain_name": dns_record.domain_name,
+        "record_type": dns_record.record_type,
+        "ip_addresses": dns_record.ip_addresses,
+        "created_at": dns_record.created_at.isoformat(),
+        "updated_at": dns_record.updated_at.isoformat(),
+    }
+
+
+def port_document(port: Port) -> Dict[str, Any]:
+    return {
+        "_key": port_key(port.port_number, port.protocol),
+        "port_number": port.port_number,
+        "protocol": port.protocol,
+        "service_name": port.service_name,
+        "created_at": port.created_at.isoformat(),
+        "updated_at": port.updated_at.isoformat(),
+    }
+
+
+def host_document(host: Host) -> Dict[str, Any]:
+    return {
+        "_key": host.ip_address,
+        "ip_address": host.ip_address,
+        "hostname": host.hostname,
+        "os_type": host.os_type,
+        "metadata": host.metadata,
+        "created_at": host.created_at.isoformat(),
+        "updated_at": host.updated_at.isoformat(),
+    }
+
+
+def validate_discovery_ttl_multiplier(ttl_multiplier: float) -> float:
+    if ttl_multiplier <= 0:
+        raise ValueError("Discovery TTL multiplier must be positive")
+
+    return ttl_multiplier
+
+
+def live_discovery_filter(hide_expired: bool) -> str:
+    return LIVE_DISCOVERY_FILTER if hide_expired else ""
+
+
+def dns_record_discovery_document(
+    dns_record_discovery: DnsRecordDiscovery, ttl_multiplier: float = DEFAULT_DISCOVERY_TTL_MULTIPLIER
+) -> Dict[str, Any]:
+    expires_at = dns_record_discovery.expires_at(ttl_multiplier)
+
+    return {
+        "_key": f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}",
+        "domain_name": dns_record_discovery.domain_name,
+        "record_type": dns_record_discovery.record_type.value,
+        "values": dns_record_discovery.values,
+        "ttl": dns_record_discovery.ttl,
+        "discovered_at": dns_record_discovery.discovered_at.isoformat(),
+        "expires_at": None if expires_at is None else expires_at.timestamp(),
+    }
+
+
+def port_scan_result_document(port_scan_result: PortScanResult) -> Dict[str, Any]:
+    return {
+        "_key": f"{port_scan_result.target_ip}_{port_scan_result.protocol}_{port_scan_result.port_number}",
+        "target_ip": port_scan_result.target_ip,
+        "port_number": port_scan_result.port_number,
+        "protocol": port_scan_result.protocol,
+        "state": port_scan_result.state.value,
+        "service_name": port_scan_result.service_name,
+        "service_version": port_scan_result.service_version,
+        "scanned_at": port_scan_result.scanned_at.isoformat(),
+    }
+
+
+def port_scan_observation_document(observation: PortScanObservation) -> Dict[str, Any]:
+    return {
+        "_key": observation.key,
+        "target_ip": observation.target_ip,
+        "port_number": observation.port_number,
+        "protocol": observation.protocol,
+        "state": observation.state.value,
+        "service_name": observation.service_name,
+        "service_version": observation.service_version,
+        "first_observed_at": observation.first_observed_at.isoformat(),
+        "first_observed_us": epoch_microseconds(observation.first_observed_at),
+        "last_observed_at": observation.last_observed_at.isoformat(),
+        "observations": observation.observations,
+    }
+
+
+def edge_document(edge: NetworkTopologyEdge) -> Dict[str, Any]:
+    if edge.edge_type == "dns_resolves_to_host":
+        to_vertex = f"{HOSTS_COLLECTION}/{edge.target_id}"
+    else:
+        to_vertex = f"{PORTS_COLLECTION}/{edge.target_id}"
+
+    return {
+        "_key": edge.key,
+        "_from": f"{DNS_RECORDS_COLLECTION}/{edge.source_id}",
+        "_to": to_vertex,
+        "source_id": edge.source_id,
+        "target_id": edge.target_id,
+        "edge_type": edge.edge_type,
+        "metadata": edge.metadata,
+        "created_at": edge.created_at.isoformat(),
+        "last_seen_at": (edge.last_seen_at or edge.created_at).isoformat(),
+    }
+
+
+def edge_documents_by_collection(edges: List[NetworkTopologyEdge]) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+    documents_by_collection: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+
+    for index, edge in enumerate(edges):
+        documents_by_collection.setdefault(edge_collection_name(edge.edge_type), []).append(
+            (index, edge_document(edge))
+        )
+
+    return documents_by_collection
+
+
+def edge_upsert_clause(variable: str, collection_name: str) -> str:
+    return (
+        f"UPSERT {{ _key: {variable}._key }} INSERT {variable} "
+        f"UPDATE {{ last_seen_at: {variable}.last_seen_at, metadata: {variable}.metadata }} "
+        f"IN {collection_name} OPTIONS {{ ignoreErrors: true }}"
+    )
+
+
+def edge_upsert_query(collection_name: str) -> str:
+    return f"FOR edge IN @edges {edge_upsert_clause('edge', collection_name)} RETURN NEW._key"
+
+
+LINK_DOMAIN_PORTS_QUERY = f"""
+    FOR link IN @links
+    UPSERT {{ _key: link.dns_record._key }}
+    INSERT link.dns_record
+    UPDATE {{ updated_at: link.dns_record.updated_at }}
+    IN {DNS_RECORDS_COLLECTION}
+    UPSERT {{ _key: link.port._key }}
+    INSERT link.port
+    UPDATE {{ updated_at: link.port.updated_at }}
+    IN {PORTS_COLLECTION}
+    {edge_upsert_clause("link.edge", DOMAIN_PORT_EDGES_COLLECTION)}
+"""
+
+
+def existing_vertices_edge_query(collection_name: str) -> str:
+    return f"""
+        LET source = DOCUMENT(@edge._from)
+        LET target = DOCUMENT(@edge._to)
+        LET inserted = (
+            FILTER source != null AND target != null
+            {edge_upsert_clause("@edge", collection_name)}
+            RETURN NEW._key
+        )
+        RETURN {{ source_found: source != null, target_found: target != null }}
+    """
+
+
+def edge_upsert_result(
+    indexed_documents: List[Tuple[int, Dict[str, Any]]], written_keys: List[str], result: BulkWriteResult
+) -> BulkWriteResult:
+    written = set(written_keys)
+
+    for index, document in indexed_documents:
+        if document["_key"] in written:
+            result.written += 1
+        else:
+            result.errors.append(
+                BulkWriteError(index=index, key=document["_key"], error_message="Edge was not written")
+            )
+
+    return result
+
+
+def domain_port_link_document(link: DomainPortLink) -> Dict[str, Any]:
+    return {
+        "dns_record": dns_record_document(link.dns_record),
+        "port": port_document(link.port),
+        "edge": edge_document(link.edge),
+    }
+
+
+def dns_record_from_document(document: Dict[str, Any]) -> DnsRecord:
+    return trusted_model(
+        DnsRecord,
+        {
+            "domain_name": document["domain_name"],
+            "record_type": document["record_type"],
+            "ip_addresses": document["ip_addresses"],
+            "created_at": datetime.fromisoformat(document["created_at"]),
+            "updated_at": datetime.fromisoformat(document["updated_at"]),
+        },
+    )
+
+
+def port_from_document(document: Dict[str, Any]) -> Port:
+    return trusted_model(
+        Port,
+        {
+            "port_number": document["port_number"],
+            "protocol": document["protocol"],
+            "service_name": document.get("service_name"),
+            "created_at": datetime.fromisoformat(document["created_at"]),
+            "updated_at": datetime.fromisoformat(document["updated_at"]),
+        },
+    )
+
+
+def host_from_document(document: Dict[str, Any]) -> Host:
+    return trusted_model(
+        Host,
+        {
+            "ip_address": document["ip_address"],
+            "hostname": document["hostname"],
+            "os_type": document["os_type"],
+            "metadata": document.get("metadata"),
+            "created_at": datetime.fromisoformat(document["created_at"]),
+            "updated_at": datetime.fromisoformat(document["updated_at"]),
+        },
+    )
+
+
+def dns_record_discovery_from_document(document: Dict[str, Any]) -> DnsRecordDiscovery:
+    return trusted_model(
+        DnsRecordDiscovery,
+        {
+            "domain_name": document["domain_name"],
+            "record_type": DnsRecordType(document["record_type"]),
+            "values": document["values"],
+            "ttl": document.get("ttl"),
+            "discovered_at": datetime.fromisoformat(document["discovered_at"]),
+        },
+    )
+
+
+def port_scan_result_from_document(document: Dict[str, Any]) -> PortScanResult:
+    return trusted_model(
+        PortScanResult,
+        {
+            "target_ip": document["target_ip"],
+            "port_number": document["port_number"],
+            "protocol": document["protocol"],
+            "state": PortState(document["state"]),
+            "service_name": document.get("service_name"),
+            "service_version": document.get("service_version"),
+            "scanned_at": datetime.fromisoformat(document["scanned_at"]),
+        },
+    )
+
+
+def port_scan_observation_from_document(document: Dict[str, Any]) -> PortScanObservation:
+    return trusted_model(
+        PortScanObservation,
+        {
+            "target_ip": document["target_ip"],
+            "port_number": document["port_number"],
+            "protocol": document["protocol"],
+            "state": PortState(document["state"]),
+            "service_name": document.get("service_name"),
+            "service_version": document.get("service_version"),
+            "first_observed_at": datetime.fromisoformat(document["first_observed_at"]),
+            "last_observed_at": datetime.fromisoformat(document["last_observed_at"]),
+            "observations": document.get("observations", 1),
+        },
+    )
+
+
+def edge_from_document(document: Dict[str, Any]) -> NetworkTopologyEdge:
+    last_seen_at = document.get("last_seen_at")
+
+    return trusted_model(
+        NetworkTopologyEdge,
+        {
+            "source_id": document["source_id"],
+            "target_id": document["target_id"],
+            "edge_type": document["edge_type"],
+            "metadata": document.get("metadata") or {},
+            "created_at": datetime.fromisoformat(document["created_at"]),
+            "last_seen_at": datetime.fromisoformat(last_seen_at) if last_seen_at else None,
+        },
+    )
+
+
+def keyset_page_query(collection_name: str, page_size: int, page_token: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+    validate_page_size(page_size)
+    bind_vars: Dict[str, Any] = {"limit": page_size + 1}
+    key_filter = ""
+
+    if page_token:
+        bind_vars["after"] = decode_page_token(collection_name, page_token)
+        key_filter = "FILTER doc._key > @after"
+
+    return f"FOR doc IN {collection_name} {key_filter} SORT doc._key LIMIT @limit RETURN doc", bind_vars
+
+
+def keyset_page(
+    collection_name: str,
+    documents: List[Dict[str, Any]],
+    page_size: int,
+    from_document: Callable[[Dict[str, Any]], ItemType],
+) -> Page[ItemType]:
+    page_documents = documents[:page_size]
+    next_page_token = None
+
+    if len(documents) > page_size:
+        next_page_token = encode_page_token(collection_name, page_documents[-1]["_key"])
+
+    return Page(items=[from_document(document) for document in page_documents], next_page_token=next_page_token)
+
+
+def partial_model_from_document(model_class: Type[ModelType], document: Dict[str, Any]) -> ModelType:
+    return model_class.model_construct(
+        **{
+            name: _field_adapter(model_class, name).validate_python(value)
+            for name, value in document.items()
+            if name in model_class.model_fields
+        }
+    )
+
+
+def projected_model_from_document(
+    model_class: Type[ModelType],
+    document: Dict[str, Any],
+    fields: Optional[List[str]],
+    from_document: Callable[[Dict[str, Any]], ModelType],
+) -> ModelType:
+    return partial_model_from_document(model_class, document) if fields else from_document(document)
+
+
+def projection_clause(model_class: Type[BaseModel], fields: Optional[List[str]]) -> str:
+    if not fields:
+        return "doc"
+
+    return "{ " + ", ".join(f'"{field}": doc.`{field}`' for field in projected_fields(model_class, fields)) + " }"
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model_class: Type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(model_class.model_fields[name].annotation)  # type: ignore[arg-type]
@@ -0,0 +1,78 @@
+from typing import Any, Dict, List
+
+from arango.database import StandardDatabase
+from pydantic import BaseModel
+
+
+class EdgeCompactionResult(BaseModel):
+    collection_name: str
+    rewritten: int = 0
+    removed: int = 0
+
+
+def _stale_documents(groups: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    return [{"_key": key} for group in groups for key in group["stale_keys"]]
+
+
+class ArangoEdgeCompactor:
+    def __init__(self, db: StandardDatabase, chunk_size: int = 1000) -> None:
+        self._db = db
+        self._chunk_size = chunk_size
+
+    def compact(self, collection_names: List[str]) -> List[EdgeCompactionResult]:
+        return [self._compact_collection(collection_name) for collection_name in collection_names]
+
+    def _compact_collection(self, collection_name: str) -> EdgeCompactionResult:
+        result = EdgeCompactionResult(collection_name=collection_name)
+        groups = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            self._duplicate_groups_query(collection_name), batch_size=self._chunk_size, stream=True
+        )
+        chunk: List[Dict[str, Any]] = []
+
+        for group in groups:  # type: ignore[union-attr]
+            chunk.append(group)
+
+            if len(chunk) >= self._chunk_size:
+                self._rewrite(collection_name, chunk, result)
+                chunk = []
+
+        if chunk:
+            self._rewrite(collection_name, chunk, result)
+
+        return result
+
+    def _rewrite(self, collection_name: str, groups: List[Dict[str, Any]], result: EdgeCompactionResult) -> None:
+        collection = self._db.collection(collection_name)
+        stale_documents = _stale_documents(groups)
+
+        collection.insert_many([group["edge"] for group in groups], overwrite_mode="replace", silent=True)
+
+        if stale_documents:
+            collection.delete_many(stale_documents, silent=True)
+
+        result.rewritten += len(groups)
+        result.removed += sum(group["duplicates"] for group in groups)
+
+    def _duplicate_groups_query(self, collection_name: str) -> str:
+        return f"""
+            FOR edge IN {collection_name}
+            COLLECT source_id = edge.source_id, target_id = edge.target_id, edge_type = edge.edge_type
+                INTO group = edge
+            LET key = SHA1(CONCAT_SEPARATOR("|", edge_type, source_id, target_id))
+            FILTER LENGTH(group) > 1 OR group[0]._key != key
+            LET earliest = FIRST(FOR candidate IN group SORT candidate.created_at RETURN candidate)
+            LET latest = FIRST(
+                FOR candidate IN group
+                SORT NOT_NULL(candidate.last_seen_at, candidate.created_at) DESC
+                RETURN candidate
+            )
+            RETURN {{
+                edge: MERGE(UNSET(earliest, "_id", "_rev"), {{
+                    _key: key,
+                    metadata: latest.metadata,
+                    last_seen_at: NOT_NULL(latest.last_seen_at, latest.created_at)
+                }}),
+                stale_keys: group[* FILTER CURRENT._key != key RETURN CURRENT._key],
+                duplicates: LENGTH(group) - 1
+            }}
+        """
@@ -0,0 +1,44 @@
+from typing import Any, Dict
+
+from via_node.domain.model.exposure_statistics import validate_statistics_limit
+from via_node.domain.model.port_scan_result import PortState
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    DNS_DISCOVERIES_COLLECTION,
+    PORT_SCAN_RESULTS_COLLECTION,
+)
+
+OPEN_PORTS_PER_SERVICE_QUERY = f"""
+    FOR doc IN {PORT_SCAN_RESULTS_COLLECTION}
+    FILTER doc.state == @state
+    COLLECT service_name = doc.service_name AGGREGATE open_ports = LENGTH(1), hosts = COUNT_DISTINCT(doc.target_ip)
+    SORT open_ports DESC, service_name
+    LIMIT @limit
+    RETURN {{ service_name, open_ports, hosts }}
+"""
+
+HOSTS_PER_OPEN_PORT_QUERY = f"""
+    FOR doc IN {PORT_SCAN_RESULTS_COLLECTION}
+    FILTER doc.state == @state
+    COLLECT port_number = doc.port_number, protocol = doc.protocol WITH COUNT INTO hosts
+    SORT hosts DESC, port_number, protocol
+    LIMIT @limit
+    RETURN {{ port_number, protocol, hosts }}
+"""
+
+
+def record_types_per_domain_query(live_discovery_filter: str) -> str:
+    return f"""
+        FOR doc IN {DNS_DISCOVERIES_COLLECTION}
+        FILTER doc.domain_name != null {live_discovery_filter}
+        COLLECT domain_name = doc.domain_name AGGREGATE record_types = SORTED_UNIQUE(doc.record_type)
+        LIMIT @limit
+        RETURN {{ domain_name, record_types }}
+    """
+
+
+def open_port_statistics_bind_vars(limit: int) -> Dict[str, Any]:
+    return {"state": PortState.OPEN.value, "limit": validate_statistics_limit(limit)}
+
+
+def statistics_bind_vars(limit: int) -> Dict[str, Any]:
+    return {"limit": validate_statistics_limit(limit)}
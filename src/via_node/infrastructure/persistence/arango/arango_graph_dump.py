@@ -0,0 +1,216 @@
+import gzip
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List
+
+from arango.database import StandardDatabase
+from pydantic import BaseModel, Field
+
+DUMP_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+COMPRESSION_EXTENSIONS = {"gzip": "gz", "zstd": "zst"}
+SYSTEM_INDEX_TYPES = ("primary", "edge")
+INDEX_ATTRIBUTES = {
+    "type": "type",
+    "fields": "fields",
+    "name": "name",
+    "unique": "unique",
+    "sparse": "sparse",
+    "deduplicate": "deduplicate",
+    "expiry_time": "expireAfter",
+    "geo_json": "geoJson",
+    "min_length": "minLength",
+    "storedValues": "storedValues",
+    "cacheEnabled": "cacheEnabled",
+    "estimates": "estimates",
+}
+DUMP_QUERY = 'FOR doc IN @@collection RETURN UNSET(doc, "_id", "_rev")'
+
+
+class DumpedCollection(BaseModel):
+    name: str
+    edge: bool
+    file: str
+    count: int
+    sha256: str
+    indexes: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class GraphDumpManifest(BaseModel):
+    version: int = DUMP_FORMAT_VERSION
+    graph_name: str
+    compression: str
+    created_at: datetime
+    edge_definitions: List[Dict[str, Any]] = Field(default_factory=list)
+    collections: List[DumpedCollection]
+
+
+class RestoreResult(BaseModel):
+    collection_name: str
+    expected: int = 0
+    imported: int = 0
+    errors: int = 0
+
+
+def validate_compression(compression: str) -> str:
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"Compression must be one of {set(COMPRESSION_EXTENSIONS)}")
+
+    return compression
+
+
+def open_compressed(path: Path, mode: str, compression: str) -> IO[bytes]:
+    if validate_compression(compression) == "zstd":
+        return _open_zstd(path, mode)
+
+    return gzip.open(path, mode)  # type: ignore[return-value]
+
+
+def _open_zstd(path: Path, mode: str) -> IO[bytes]:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise ValueError("zstd compression requires the 'zstandard' package") from None
+
+    return zstandard.open(path, mode)  # type: ignore[no-any-return]  # pragma: no cover
+
+
+def index_data(index: Dict[str, Any]) -> Dict[str, Any]:
+    return {attribute: index[key] for key, attribute in INDEX_ATTRIBUTES.items() if key in index}
+
+
+def _chunks(documents: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(documents)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _digested(lines: Iterable[bytes], digest: Any) -> Iterator[bytes]:
+    for line in lines:
+        digest.update(line)
+        yield line
+
+
+class ArangoGraphDumper:
+    def __init__(self, db: StandardDatabase, graph_name: str, batch_size: int = 1000) -> None:
+        self._db = db
+        self._graph_name = graph_name
+        self._batch_size = batch_size
+
+    def dump(self, collection_names: List[str], directory: str, compression: str = "gzip") -> GraphDumpManifest:
+        validate_compression(compression)
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+
+        manifest = GraphDumpManifest(
+            graph_name=self._graph_name,
+            compression=compression,
+            created_at=datetime.now(),
+            edge_definitions=self._edge_definitions(),
+            collections=[self._dump_collection(name, root, compression) for name in collection_names],
+        )
+        (root / MANIFEST_FILE).write_text(manifest.model_dump_json(indent=2))
+
+        return manifest
+
+    def _edge_definitions(self) -> List[Dict[str, Any]]:
+        if not self._db.has_graph(self._graph_name):
+            return []
+
+        return list(self._db.graph(self._graph_name).edge_definitions())  # type: ignore[arg-type]
+
+    def _dump_collection(self, name: str, root: Path, compression: str) -> DumpedCollection:
+        collection = self._db.collection(name)
+        file_name = f"{name}.jsonl.{COMPRESSION_EXTENSIONS[compression]}"
+        digest = hashlib.sha256()
+        documents = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            DUMP_QUERY, bind_vars={"@collection": name}, batch_size=self._batch_size, stream=True
+        )
+
+        with open_compressed(root / file_name, "wb", compression) as output:
+            count = self._write_documents(documents, output, digest)  # type: ignore[arg-type]
+
+        return DumpedCollection(
+            name=name,
+            edge=bool(collection.properties()["edge"]),  # type: ignore[index]
+            file=file_name,
+            count=count,
+            sha256=digest.hexdigest(),
+            indexes=[
+                index_data(index)
+                for index in collection.indexes()  # type: ignore[union-attr]
+                if index["type"] not in SYSTEM_INDEX_TYPES
+            ],
+        )
+
+    def _write_documents(self, documents: Iterable[Dict[str, Any]], output: IO[bytes], digest: Any) -> int:
+        count = 0
+
+        for document in documents:
+            line = (json.dumps(document, separators=(",", ":")) + "\n").encode("utf-8")
+            digest.update(line)
+            output.write(line)
+            count += 1
+
+        return count
+
+
+class ArangoGraphRestorer:
+    def __init__(self, db: StandardDatabase, graph_name: str, chunk_size: int = 1000, parallelism: int = 4) -> None:
+        if parallelism < 1:
+            raise ValueError("Parallelism must be at least 1")
+
+        self._db = db
+        self._graph_name = graph_name
+        self._chunk_size = chunk_size
+        self._parallelism = parallelism
+
+    def restore(self, directory: str) -> List[RestoreResult]:
+        root = Path(directory)
+        manifest = GraphDumpManifest.model_validate_json((root / MANIFEST_FILE).read_text())
+
+        for dumped in manifest.collections:
+            self._ensure_collection(dumped)
+
+        self._ensure_graph(manifest)
+
+        with ThreadPoolExecutor(max_workers=self._parallelism) as executor:
+            return list(
+                executor.map(lambda dumped: self._import(root, manifest.compression, dumped), manifest.collections)
+            )
+
+    def _ensure_collection(self, dumped: DumpedCollection) -> None:
+        if not self._db.has_collection(dumped.name):
+            self._db.create_collection(dumped.name, edge=dumped.edge)
+
+        collection = self._db.collection(dumped.name)
+
+        for index in dumped.indexes:
+            collection.add_index(index)
+
+    def _ensure_graph(self, manifest: GraphDumpManifest) -> None:
+        if manifest.edge_definitions and not self._db.has_graph(self._graph_name):
+            self._db.create_graph(self._graph_name, edge_definitions=manifest.edge_definitions)
+
+    def _import(self, root: Path, compression: str, dumped: DumpedCollection) -> RestoreResult:
+        result = RestoreResult(collection_name=dumped.name, expected=dumped.count)
+        collection = self._db.collection(dumped.name)
+        digest = hashlib.sha256()
+
+        with open_compressed(root / dumped.file, "rb", compression) as source:
+            for chunk in _chunks((json.loads(line) for line in _digested(source, digest)), self._chunk_size):
+                response = collection.import_bulk(chunk, halt_on_error=False, details=False, on_duplicate="replace")
+                result.imported += response["created"] + response["updated"]  # type: ignore[index, call-overload]
+                result.errors += response["errors"]  # type: ignore[index, call-overload]
+
+        if digest.hexdigest() != dumped.sha256:
+            raise ValueError(
+                f"Checksum mismatch for {dumped.file}; the dump is corrupt and {dumped.name} may be partially restored"
+            )
+
+        return result
@@ -1,17 +1,114 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from arango import ArangoClient
+from arango.collection import StandardCollection
 from arango.database import StandardDatabase
-from arango.exceptions import DocumentInsertError, GraphCreateError
+from arango.exceptions import ArangoServerError, GraphCreateError
+from arango.http import HTTPClient, RequestCompression
+from arango.resolver import HostResolver
 
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
 from via_node.domain.model.dns_record import DnsRecord
 from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
 from via_node.domain.model.host import Host
-from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError, validate_edge_type
+from via_node.domain.model.page import Page
 from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
 from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
 from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.arango.arango_collection_handles import ArangoCollectionHandles
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    DEFAULT_DISCOVERY_TTL_MULTIPLIER,
+    DNS_DISCOVERIES_COLLECTION,
+    DNS_RECORDS_COLLECTION,
+    DNS_RESOLVES_TO_HOST_EDGES_COLLECTION,
+    DOMAIN_PORT_EDGES_COLLECTION,
+    HOSTS_COLLECTION,
+    LINK_DOMAIN_PORTS_QUERY,
+    PORT_SCAN_HISTORY_COLLECTION,
+    PORT_SCAN_RESULTS_COLLECTION,
+    PORTS_COLLECTION,
+    edge_collection_name,
+    dns_record_discovery_document,
+    dns_record_discovery_from_document,
+    dns_record_document,
+    dns_record_from_document,
+    domain_port_link_document,
+    edge_document,
+    edge_documents_by_collection,
+    edge_from_document,
+    edge_upsert_query,
+    edge_upsert_result,
+    existing_vertices_edge_query,
+    host_document,
+    host_from_document,
+    keyset_page,
+    keyset_page_query,
+    live_discovery_filter,
+    projected_model_from_document,
+    port_document,
+    port_from_document,
+    port_key,
+    port_scan_observation_from_document,
+    port_scan_result_document,
+    port_scan_result_from_document,
+    projection_clause,
+    validate_discovery_ttl_multiplier,
+)
+from via_node.infrastructure.persistence.arango.arango_edge_compactor import ArangoEdgeCompactor, EdgeCompactionResult
+from via_node.infrastructure.persistence.arango.arango_exposure_statistics import (
+    HOSTS_PER_OPEN_PORT_QUERY,
+    OPEN_PORTS_PER_SERVICE_QUERY,
+    open_port_statistics_bind_vars,
+    record_types_per_domain_query,
+    statistics_bind_vars,
+)
+from via_node.infrastructure.persistence.arango.arango_graph_dump import (
+    ArangoGraphDumper,
+    ArangoGraphRestorer,
+    GraphDumpManifest,
+    RestoreResult,
+)
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import (
+    PORT_SCAN_HISTORY_QUERY,
+    PORT_SCAN_RESULT_UPSERT_QUERY,
+    PORT_SCAN_STATE_AT_QUERY,
+    ArangoPortScanHistoryCompactor,
+    port_scan_result_upsert_bind_vars,
+    port_scan_state_at_bind_vars,
+    stored_observation_documents,
+)
+from via_node.infrastructure.persistence.arango.arango_schema_marker import ArangoSchemaMarker, schema_marker_scope
+from via_node.infrastructure.persistence.arango.arango_schema_migrations import (
+    LATEST_SCHEMA_VERSION,
+    SCHEMA_MIGRATIONS_COLLECTION,
+    ArangoSchemaMigrator,
+)
+from via_node.infrastructure.persistence.arango.arango_traversal import (
+    neighbors_query,
+    shortest_path_query,
+    traversal_path_from_results,
+    traversal_vertex_from_result,
+)
+from via_node.infrastructure.persistence.arango.pooled_http_client import PooledHttpClient
+
+ItemType = TypeVar("ItemType")
 
 
 class ArangoNetworkTopologyRepository(NetworkTopologyRepository):
@@ -24,6 +121,16 @@ class ArangoNetworkTopologyRepository(NetworkTopologyRepository):
         password: str,
         graph_name: str,
         auto_create_database: bool = True,
+        bulk_chunk_size: int = 1000,
+        auto_migrate: bool = False,
+        http_client: Optional[HTTPClient] = None,
+        request_compression: Optional[RequestCompression] = None,
+        response_compression: Optional[str] = None,
+        discovery_ttl_multiplier: float = DEFAULT_DISCOVERY_TTL_MULTIPLIER,
+        hide_expired_discoveries: bool = False,
+        schema_marker: Optional[ArangoSchemaMarker] = None,
+        hosts: Optional[List[str]] = None,
+        host_resolver: Optional[HostResolver] = None,
     ) -> None:
         self._host = host
         self._port = port
@@ -32,18 +139,96 @@ class ArangoNetworkTopologyRepository(NetworkTopologyRepository):
         self._password = password
         self._graph_name = graph_name
         self._auto_create_database = auto_create_database
+        self._bulk_chunk_size = bulk_chunk_size
+        self._auto_migrate = auto_migrate
+        self._discovery_ttl_multiplier = validate_discovery_ttl_multiplier(discovery_ttl_multiplier)
+        self._live_discovery_filter = live_discovery_filter(hide_expired_discoveries)
+        self._schema_marker = schema_marker
+
+        self._dns_collection_name = DNS_RECORDS_COLLECTION
+        self._port_collection_name = PORTS_COLLECTION
+        self._hosts_collection_name = HOSTS_COLLECTION
+        self._dns_discoveries_collection_name = DNS_DISCOVERIES_COLLECTION
+        self._port_scan_results_collection_name = PORT_SCAN_RESULTS_COLLECTION
+        self._port_scan_history_collection_name = PORT_SCAN_HISTORY_COLLECTION
+        self._edge_collection_name = DOMAIN_PORT_EDGES_COLLECTION
+        self._dns_resolves_to_host_edge_collection_name = DNS_RESOLVES_TO_HOST_EDGES_COLLECTION
+
+        self._http_client = http_client or PooledHttpClient()
+        self._client = ArangoClient(
+            hosts=hosts or f"http://{self._host}:{self._port}",
+            host_resolver=host_resolver or "fallback",
+            http_client=self._http_client,
+            request_compression=request_compression,
+            response_compression=response_compression,
+        )
+        self._database: Optional[StandardDatabase] = None
+        self._migrator: Optional[ArangoSchemaMigrator] = None
+        self._collection_handles: Optional[ArangoCollectionHandles] = None
+
+    @property
+    def _db(self) -> StandardDatabase:
+        if self._database is None:
+            self._database = self._bootstrap()
+        return self._database
+
+    @property
+    def _schema_migrator(self) -> ArangoSchemaMigrator:
+        if self._migrator is None:
+            self._migrator = ArangoSchemaMigrator(self._db, self._graph_name)
+        return self._migrator
+
+    @property
+    def _handles(self) -> ArangoCollectionHandles:
+        if self._collection_handles is None:
+            self._collection_handles = self._resolve_collection_handles()
+        return self._collection_handles
+
+    def connection_pool_stats(self) -> List[Dict[str, Any]]:
+        if isinstance(self._http_client, PooledHttpClient):
+            return self._http_client.pool_stats()
+        return []
+
+    def migrate_schema(self) -> List[int]:
+        return self._schema_migrator.migrate()
+
+    def schema_version(self) -> int:
+        return self._schema_migrator.current_version()
+
+    def refresh_collection_handles(self) -> None:
+        self._collection_handles = self._resolve_collection_handles()
+
+    def _resolve_collection_handles(self) -> ArangoCollectionHandles:
+        return ArangoCollectionHandles(
+            dns_records=self._db.collection(self._dns_collection_name),
+            ports=self._db.collection(self._port_collection_name),
+            hosts=self._db.collection(self._hosts_collection_name),
+            dns_discoveries=self._db.collection(self._dns_discoveries_collection_name),
+            port_scan_results=self._db.collection(self._port_scan_results_collection_name),
+            port_scan_history=self._db.collection(self._port_scan_history_collection_name),
+            domain_port_edges=self._db.collection(self._edge_collection_name),
+            dns_resolves_to_host_edges=self._db.collection(self._dns_resolves_to_host_edge_collection_name),
+        )
+
+    def _bootstrap(self) -> StandardDatabase:
+        scope = self._schema_marker_scope()
+
+        if self._schema_marker is not None and self._schema_marker.is_fresh(scope):
+            return self._client.db(self._database_name, username=self._username, password=self._password)
+
+        db = self._initialize_connection()
+        self._migrator = ArangoSchemaMigrator(db, self._graph_name)
+        self._initialize_graph(db)
+
+        if self._schema_marker is not None:
+            self._schema_marker.record(scope)
+
+        return db
 
-        self._dns_collection_name = "dns_records"
-        self._port_collection_name = "ports"
-        self._hosts_collection_name = "hosts"
-        self._dns_discoveries_collection_name = "dns_discoveries"
-        self._port_scan_results_collection_name = "port_scan_results"
-        self._edge_collection_name = "domain_port_edges"
-        self._dns_resolves_to_host_edge_collection_name = "dns_resolves_to_host_edges"
+    def _schema_marker_scope(self) -> str:
+        schema_version = LATEST_SCHEMA_VERSION if self._auto_migrate else 0
 
-        self._client = ArangoClient(hosts=f"http://{self._host}:{self._port}")
-        self._db = self._initialize_connection()
-        self._initialize_graph()
+        return schema_marker_scope(self._host, self._port, self._database_name, self._graph_name, schema_version)
 
     def _initialize_connection(self) -> StandardDatabase:
         db = self._client.db(self._database_name, username=self._username, password=self._password)
@@ -61,12 +246,19 @@ class ArangoNetworkTopologyRepository(NetworkTopologyRepository):
 
         return db
 
-    def _initialize_graph(self) -> None:  # pragma: no cover
-        if self._db.has_graph(self._graph_name):
-            return
+    def _initialize_graph(self, db: StandardDatabase) -> None:
+        if not db.has_graph(self._graph_name):
+            self._create_graph(db)
 
+        if not db.has_collection(self._port_scan_history_collection_name):
+            db.create_collection(self._port_scan_history_collection_name)
+
+        if self._auto_migrate:
+            self._schema_migrator.migrate()
+
+    def _create_graph(self, db: StandardDatabase) -> None:  # pragma: no cover
         try:
-            graph = self._db.create_graph(self._graph_name)
+            graph = db.create_graph(self._graph_name)
 
             graph.create_vertex_collection(self._dns_collection_name)  # type: ignore[union-attr]
             graph.create_vertex_collection(self._port_collection_name)  # type: ignore[union-attr]
@@ -89,247 +281,392 @@ class ArangoNetworkTopologyRepository(NetworkTopologyRepository):
             pass
 
     def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._dns_collection_name)
-
-        document = {
-            "_key": dns_record.domain_name,
-            "domain_name": dns_record.domain_name,
-            "record_type": dns_record.record_type,
-            "ip_addresses": dns_record.ip_addresses,
-            "created_at": dns_record.created_at.isoformat(),
-            "updated_at": dns_record.updated_at.isoformat(),
-        }
-
-        try:
-            collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            collection.replace(document)
+        self._upsert(self._handles.dns_records, dns_record_document(dns_record))
 
         return dns_record
 
     def create_or_update_port(self, port: Port) -> Port:
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._port_collection_name)
-
-        document = {
-            "_key": f"{port.port_number}_{port.protocol}",
-            "port_number": port.port_number,
-            "protocol": port.protocol,
-            "service_name": port.service_name,
-            "created_at": port.created_at.isoformat(),
-            "updated_at": port.updated_at.isoformat(),
-        }
-
-        try:
-            collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            collection.replace(document)
+        self._upsert(self._handles.ports, port_document(port))
 
         return port
 
-    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-
-        if edge.edge_type == "dns_resolves_to_host":  # pragma: no cover
-            edge_collection = graph.edge_collection(self._dns_resolves_to_host_edge_collection_name)
-            from_vertex = f"{self._dns_collection_name}/{edge.source_id}"
-            to_vertex = f"{self._hosts_collection_name}/{edge.target_id}"
-        else:
-            edge_collection = graph.edge_collection(self._edge_collection_name)
-            from_vertex = f"{self._dns_collection_name}/{edge.source_id}"
-            to_vertex = f"{self._port_collection_name}/{edge.target_id}"
-
-        document = {
-            "_from": from_vertex,
-            "_to": to_vertex,
-            "source_id": edge.source_id,
-            "target_id": edge.target_id,
-            "edge_type": edge.edge_type,
-            "metadata": edge.metadata,
-            "created_at": edge.created_at.isoformat(),
-        }
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            edge_upsert_query(edge_collection_name(edge.edge_type)), bind_vars={"edges": [edge_document(edge)]}
+        )
+
+        return edge
 
-        try:
-            edge_collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            pass
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        if not links:
+            return []
+
+        self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            LINK_DOMAIN_PORTS_QUERY, bind_vars={"links": [domain_port_link_document(link) for link in links]}
+        )
+
+        return [link.edge for link in links]
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        cursor = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            existing_vertices_edge_query(edge_collection_name(edge.edge_type)), bind_vars={"edge": edge_document(edge)}
+        )
+        found = next(cursor)  # type: ignore[arg-type]
+
+        if not (found["source_found"] and found["target_found"]):
+            raise VertexNotFoundError.for_edge(edge, found["source_found"])
 
         return edge
 
     def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._dns_collection_name)
+        collection = self._handles.dns_records
 
         if not collection.has(domain_name):
             return None
 
-        document = collection.get(domain_name)
-
-        return DnsRecord(
-            domain_name=document["domain_name"],  # type: ignore[index]
-            record_type=document["record_type"],  # type: ignore[index]
-            ip_addresses=document["ip_addresses"],  # type: ignore[index]
-            created_at=datetime.fromisoformat(document["created_at"]),  # type: ignore[index]
-            updated_at=datetime.fromisoformat(document["updated_at"]),  # type: ignore[index]
-        )
+        return dns_record_from_document(collection.get(domain_name))  # type: ignore[arg-type]
 
     def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._port_collection_name)
+        collection = self._handles.ports
 
-        port_key = f"{port_number}_{protocol}"
+        key = port_key(port_number, protocol)
 
-        if not collection.has(port_key):
+        if not collection.has(key):
             return None
 
-        document = collection.get(port_key)
-
-        return Port(
-            port_number=document["port_number"],  # type: ignore[index]
-            protocol=document["protocol"],  # type: ignore[index]
-            service_name=document.get("service_name"),  # type: ignore[union-attr]
-            created_at=datetime.fromisoformat(document["created_at"]),  # type: ignore[index]
-            updated_at=datetime.fromisoformat(document["updated_at"]),  # type: ignore[index]
-        )
+        return port_from_document(collection.get(key))  # type: ignore[arg-type]
 
     def create_or_update_host(self, host: Host) -> Host:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._hosts_collection_name)
-
-        document = {
-            "_key": host.ip_address,
-            "ip_address": host.ip_address,
-            "hostname": host.hostname,
-            "os_type": host.os_type,
-            "metadata": host.metadata,
-            "created_at": host.created_at.isoformat(),
-            "updated_at": host.updated_at.isoformat(),
-        }
-
-        try:
-            collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            collection.replace(document)
+        self._upsert(self._handles.hosts, host_document(host))
 
         return host
 
     def get_host(self, ip_address: str) -> Optional[Host]:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        collection = graph.vertex_collection(self._hosts_collection_name)
+        collection = self._handles.hosts
 
         if not collection.has(ip_address):
             return None
 
-        document = collection.get(ip_address)
-
-        return Host(
-            ip_address=document["ip_address"],  # type: ignore[index]
-            hostname=document["hostname"],  # type: ignore[index]
-            os_type=document["os_type"],  # type: ignore[index]
-            metadata=document.get("metadata"),  # type: ignore[union-attr]
-            created_at=datetime.fromisoformat(document["created_at"]),  # type: ignore[index]
-            updated_at=datetime.fromisoformat(document["updated_at"]),  # type: ignore[index]
-        )
+        return host_from_document(collection.get(ip_address))  # type: ignore[arg-type]
 
     def create_or_update_dns_record_discovery(
         self, dns_record_discovery: DnsRecordDiscovery
     ) -> DnsRecordDiscovery:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        dns_collection = graph.vertex_collection(self._dns_discoveries_collection_name)
-
-        document_key = f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}"
-
-        document = {
-            "_key": document_key,
-            "domain_name": dns_record_discovery.domain_name,
-            "record_type": dns_record_discovery.record_type.value,
-            "values": dns_record_discovery.values,
-            "ttl": dns_record_discovery.ttl,
-            "discovered_at": dns_record_discovery.discovered_at.isoformat(),
-        }
-
-        try:
-            dns_collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            dns_collection.replace(document)
+        self._upsert(
+            self._handles.dns_discoveries,
+            dns_record_discovery_document(dns_record_discovery, self._discovery_ttl_multiplier),
+        )
 
         return dns_record_discovery
 
-    def get_dns_record_discoveries(self, domain_name: str) -> List[DnsRecordDiscovery]:  # pragma: no cover
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:  # pragma: no cover
         query = f"""
             FOR doc IN {self._dns_discoveries_collection_name}
-            FILTER doc.domain_name == @domain_name
-            RETURN doc
+            FILTER doc.domain_name == @domain_name {self._live_discovery_filter}
+            RETURN {projection_clause(DnsRecordDiscovery, fields)}
         """
 
         results = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query  # type: ignore[misc]
             query, bind_vars={"domain_name": domain_name}
         )
 
-        discoveries: List[DnsRecordDiscovery] = []
+        return [
+            projected_model_from_document(DnsRecordDiscovery, result, fields, dns_record_discovery_from_document)
+            for result in results  # type: ignore[union-attr]
+        ]
 
-        for result in results:  # type: ignore[union-attr]
-            discoveries.append(
-                DnsRecordDiscovery(
-                    domain_name=result["domain_name"],
-                    record_type=result["record_type"],
-                    values=result["values"],
-                    ttl=result.get("ttl"),
-                    discovered_at=datetime.fromisoformat(result["discovered_at"]),
-                )
-            )
-
-        return discoveries
-
-    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:  # pragma: no cover
-        graph = self._db.graph(self._graph_name)
-        scan_collection = graph.vertex_collection(self._port_scan_results_collection_name)
-
-        document_key = f"{port_scan_result.target_ip}_{port_scan_result.protocol}_" f"{port_scan_result.port_number}"
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
+        query = f"""
+            FOR doc IN {self._dns_discoveries_collection_name}
+            FILTER doc.domain_name == @domain_name {self._live_discovery_filter}
+            RETURN {projection_clause(DnsRecordDiscovery, fields)}
+        """
+        documents = self._stream(query, {"domain_name": domain_name}, batch_size, ttl)
 
-        document = {
-            "_key": document_key,
-            "target_ip": port_scan_result.target_ip,
-            "port_number": port_scan_result.port_number,
-            "protocol": port_scan_result.protocol,
-            "state": port_scan_result.state.value,
-            "service_name": port_scan_result.service_name,
-            "service_version": port_scan_result.service_version,
-            "scanned_at": port_scan_result.scanned_at.isoformat(),
-        }
+        for document in documents:
+            yield projected_model_from_document(
+                DnsRecordDiscovery, document, fields, dns_record_discovery_from_document
+            )
 
-        try:
-            scan_collection.insert(document)
-        except DocumentInsertError:  # pragma: no cover
-            scan_collection.replace(document)
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            PORT_SCAN_RESULT_UPSERT_QUERY, bind_vars=port_scan_result_upsert_bind_vars(port_scan_result)
+        )
 
         return port_scan_result
 
-    def get_port_scan_results(self, target_ip: str) -> List[PortScanResult]:  # pragma: no cover
+    def get_port_scan_results(
+        self, target_ip: str, fields: Optional[List[str]] = None
+    ) -> List[PortScanResult]:  # pragma: no cover
         query = f"""
             FOR doc IN {self._port_scan_results_collection_name}
             FILTER doc.target_ip == @target_ip
-            RETURN doc
+            RETURN {projection_clause(PortScanResult, fields)}
         """
 
         results = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query  # type: ignore[misc]
             query, bind_vars={"target_ip": target_ip}
         )
 
-        scan_results: List[PortScanResult] = []
-
-        for result in results:  # type: ignore[union-attr]
-            scan_results.append(
-                PortScanResult(
-                    target_ip=result["target_ip"],
-                    port_number=result["port_number"],
-                    protocol=result["protocol"],
-                    state=result["state"],
-                    service_name=result.get("service_name"),
-                    service_version=result.get("service_version"),
-                    scanned_at=datetime.fromisoformat(result["scanned_at"]),
-                )
-            )
+        return [
+            projected_model_from_document(PortScanResult, result, fields, port_scan_result_from_document)
+            for result in results  # type: ignore[union-attr]
+        ]
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        query = f"""
+            FOR doc IN {self._port_scan_results_collection_name}
+            FILTER doc.target_ip == @target_ip
+            RETURN {projection_clause(PortScanResult, fields)}
+        """
+        documents = self._stream(query, {"target_ip": target_ip}, batch_size, ttl)
+
+        for document in documents:
+            yield projected_model_from_document(PortScanResult, document, fields, port_scan_result_from_document)
+
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        results = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            PORT_SCAN_HISTORY_QUERY, bind_vars={"target_ip": target_ip}
+        )
+
+        return [port_scan_observation_from_document(result) for result in results]  # type: ignore[union-attr]
+
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        results = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            PORT_SCAN_STATE_AT_QUERY, bind_vars=port_scan_state_at_bind_vars(target_ip, at)
+        )
+
+        return [port_scan_observation_from_document(result) for result in results]  # type: ignore[union-attr]
+
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        rows = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            OPEN_PORTS_PER_SERVICE_QUERY, bind_vars=open_port_statistics_bind_vars(limit)
+        )
+
+        return [ServiceExposure.model_validate(row) for row in rows]  # type: ignore[union-attr]
+
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        rows = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            HOSTS_PER_OPEN_PORT_QUERY, bind_vars=open_port_statistics_bind_vars(limit)
+        )
+
+        return [PortExposure.model_validate(row) for row in rows]  # type: ignore[union-attr]
+
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        rows = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            record_types_per_domain_query(self._live_discovery_filter), bind_vars=statistics_bind_vars(limit)
+        )
+
+        return [DomainRecordTypes.model_validate(row) for row in rows]  # type: ignore[union-attr]
+
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        return ArangoPortScanHistoryCompactor(self._db, self._bulk_chunk_size).compact()
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        documents = [port_scan_result_document(result) for result in port_scan_results]
+        result = self._bulk_insert(
+            self._handles.port_scan_results, list(enumerate(documents)), "replace", BulkWriteResult()
+        )
+        history = self._bulk_insert(
+            self._handles.port_scan_history,
+            stored_observation_documents(port_scan_results, result),
+            "ignore",
+            BulkWriteResult(),
+        )
+        result.errors.extend(history.errors)
+
+        return result
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        documents = [
+            dns_record_discovery_document(discovery, self._discovery_ttl_multiplier)
+            for discovery in dns_record_discoveries
+        ]
+
+        return self._bulk_insert(
+            self._handles.dns_discoveries, list(enumerate(documents)), "replace", BulkWriteResult()
+        )
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        documents = [dns_record_document(dns_record) for dns_record in dns_records]
+
+        return self._bulk_insert(self._handles.dns_records, list(enumerate(documents)), "replace", BulkWriteResult())
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        documents = [port_document(port) for port in ports]
+
+        return self._bulk_insert(self._handles.ports, list(enumerate(documents)), "replace", BulkWriteResult())
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        documents = [host_document(host) for host in hosts]
+
+        return self._bulk_insert(self._handles.hosts, list(enumerate(documents)), "replace", BulkWriteResult())
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        result = BulkWriteResult()
+
+        for collection_name, indexed_documents in edge_documents_by_collection(edges).items():
+            for offset in range(0, len(indexed_documents), self._bulk_chunk_size):
+                chunk = indexed_documents[offset : offset + self._bulk_chunk_size]
+                self._upsert_edges(collection_name, chunk, result)
 
-        return scan_results
+        return result
+
+    def compact_edges(self) -> List[EdgeCompactionResult]:
+        return ArangoEdgeCompactor(self._db, self._bulk_chunk_size).compact(
+            [self._edge_collection_name, self._dns_resolves_to_host_edge_collection_name]
+        )
+
+    def dump_graph(self, directory: str, compression: str = "gzip") -> GraphDumpManifest:
+        return ArangoGraphDumper(self._db, self._graph_name, self._bulk_chunk_size).dump(
+            [
+                self._dns_collection_name,
+                self._port_collection_name,
+                self._hosts_collection_name,
+                self._dns_discoveries_collection_name,
+                self._port_scan_results_collection_name,
+                self._port_scan_history_collection_name,
+                self._edge_collection_name,
+                self._dns_resolves_to_host_edge_collection_name,
+                SCHEMA_MIGRATIONS_COLLECTION,
+            ],
+            directory,
+            compression,
+        )
+
+    def restore_graph(self, directory: str, parallelism: int = 4) -> List[RestoreResult]:
+        return ArangoGraphRestorer(self._db, self._graph_name, self._bulk_chunk_size, parallelism).restore(directory)
+
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        return self._page(self._dns_collection_name, page_size, page_token, dns_record_from_document)
+
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        return self._page(self._port_collection_name, page_size, page_token, port_from_document)
+
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        return self._page(self._hosts_collection_name, page_size, page_token, host_from_document)
+
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        return self._page(
+            self._dns_discoveries_collection_name, page_size, page_token, dns_record_discovery_from_document
+        )
+
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        return self._page(
+            self._port_scan_results_collection_name, page_size, page_token, port_scan_result_from_document
+        )
+
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        return self._page(
+            edge_collection_name(validate_edge_type(edge_type)), page_size, page_token, edge_from_document
+        )
+
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        query, bind_vars = neighbors_query(vertex, depth, direction, edge_types, limit)
+        results = self._db.aql.execute(query, bind_vars=bind_vars)  # nosemgrep: sqlalchemy-execute-raw-query
+
+        return [traversal_vertex_from_result(result) for result in results]  # type: ignore[union-attr]
+
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        query, bind_vars = shortest_path_query(source, target, max_depth, direction, edge_types)
+        results = self._db.aql.execute(query, bind_vars=bind_vars)  # nosemgrep: sqlalchemy-execute-raw-query
+
+        return traversal_path_from_results(list(results))  # type: ignore[arg-type]
+
+    def _page(
+        self,
+        collection_name: str,
+        page_size: int,
+        page_token: Optional[str],
+        from_document: Callable[[Dict[str, Any]], ItemType],
+    ) -> Page[ItemType]:
+        query, bind_vars = keyset_page_query(collection_name, page_size, page_token)
+        documents = self._db.aql.execute(query, bind_vars=bind_vars)  # nosemgrep: sqlalchemy-execute-raw-query
+
+        return keyset_page(collection_name, list(documents), page_size, from_document)  # type: ignore[arg-type]
+
+    def _stream(
+        self, query: str, bind_vars: Dict[str, Any], batch_size: int, ttl: Optional[int]
+    ) -> Iterator[Dict[str, Any]]:
+        cursor = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            query, bind_vars=bind_vars, batch_size=batch_size, ttl=ttl, stream=True  # type: ignore[arg-type]
+        )
+
+        try:
+            for document in cursor:  # type: ignore[union-attr]
+                yield document
+        finally:
+            if cursor.has_more():  # type: ignore[union-attr]
+                cursor.close(ignore_missing=True)  # type: ignore[union-attr]
+
+    def _upsert_edges(
+        self, collection_name: str, indexed_documents: List[Tuple[int, Dict[str, Any]]], result: BulkWriteResult
+    ) -> None:
+        written_keys = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            edge_upsert_query(collection_name), bind_vars={"edges": [document for _, document in indexed_documents]}
+        )
+
+        edge_upsert_result(indexed_documents, list(written_keys), result)  # type: ignore[arg-type]
+
+    def _upsert(self, collection: StandardCollection, document: Dict[str, Any]) -> None:
+        collection.insert(document, overwrite_mode="replace", silent=True)
+
+    def _bulk_insert(
+        self,
+        collection: StandardCollection,
+        indexed_documents: List[Tuple[int, Dict[str, Any]]],
+        overwrite_mode: Optional[str],
+        result: BulkWriteResult,
+    ) -> BulkWriteResult:
+        for offset in range(0, len(indexed_documents), self._bulk_chunk_size):
+            chunk = indexed_documents[offset : offset + self._bulk_chunk_size]
+            responses = collection.insert_many([document for _, document in chunk], overwrite_mode=overwrite_mode)
+            self._collect_bulk_responses(chunk, responses, result)  # type: ignore[arg-type]
+
+        return result
+
+    def _collect_bulk_responses(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        responses: List[Any],
+        result: BulkWriteResult,
+    ) -> None:
+        for (index, document), response in zip(chunk, responses):
+            if isinstance(response, ArangoServerError):
+                result.errors.append(
+                    BulkWriteError(index=index, key=document.get("_key"), error_message=str(response.error_message))
+                )
+            else:
+                result.written += 1
@@ -0,0 +1,140 @@
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+
+from arango.database import StandardDatabase
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.port_scan_observation import (
+    Interval,
+    PortScanObservation,
+    ScanHistoryCompactionResult,
+    compact_history,
+)
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    PORT_SCAN_HISTORY_COLLECTION,
+    PORT_SCAN_RESULTS_COLLECTION,
+    port_scan_observation_document,
+    port_scan_observation_from_document,
+    port_scan_result_document,
+)
+
+PORT_SCAN_RESULT_UPSERT_QUERY = f"""
+    LET replaced = (
+        INSERT @result INTO {PORT_SCAN_RESULTS_COLLECTION} OPTIONS {{ overwriteMode: "replace" }}
+        RETURN NEW._key
+    )
+    INSERT @observation INTO {PORT_SCAN_HISTORY_COLLECTION} OPTIONS {{ overwriteMode: "ignore" }}
+"""
+
+PORT_SCAN_HISTORY_QUERY = f"""
+    FOR doc IN {PORT_SCAN_HISTORY_COLLECTION}
+    FILTER doc.target_ip == @target_ip
+    SORT doc.port_number, doc.protocol, doc.first_observed_at
+    RETURN doc
+"""
+
+PORT_SCAN_STATE_AT_QUERY = f"""
+    FOR doc IN {PORT_SCAN_HISTORY_COLLECTION}
+    FILTER doc.target_ip == @target_ip AND doc.first_observed_us <= @at
+    COLLECT port_number = doc.port_number, protocol = doc.protocol AGGREGATE latest = MAX(doc.first_observed_us)
+    RETURN FIRST(
+        FOR candidate IN {PORT_SCAN_HISTORY_COLLECTION}
+        FILTER candidate.target_ip == @target_ip
+            AND candidate.port_number == port_number
+            AND candidate.protocol == protocol
+            AND candidate.first_observed_us == latest
+        RETURN candidate
+    )
+"""
+
+PORT_SCAN_SERIES_QUERY = f"""
+    FOR doc IN {PORT_SCAN_HISTORY_COLLECTION}
+    SORT doc.target_ip, doc.port_number, doc.protocol, doc.first_observed_at
+    RETURN doc
+"""
+
+OBSERVATION_EPOCH_BACKFILL_QUERY = f"""
+    FOR doc IN {PORT_SCAN_HISTORY_COLLECTION}
+    FILTER doc.first_observed_us == null
+    RETURN {{ _key: doc._key, first_observed_at: doc.first_observed_at }}
+"""
+
+
+class ArangoPortScanHistoryCompactor:
+    def __init__(self, db: StandardDatabase, chunk_size: int = 1000) -> None:
+        self._db = db
+        self._chunk_size = chunk_size
+
+    def compact(self) -> ScanHistoryCompactionResult:
+        result = ScanHistoryCompactionResult()
+        documents = self._db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+            PORT_SCAN_SERIES_QUERY, batch_size=self._chunk_size, stream=True
+        )
+        intervals = compact_history(
+            port_scan_observation_from_document(document) for document in documents  # type: ignore[union-attr]
+        )
+
+        while chunk := list(islice(intervals, self._chunk_size)):
+            self._rewrite(chunk, result)
+
+        return result
+
+    def _rewrite(self, intervals: List[Interval], result: ScanHistoryCompactionResult) -> None:
+        collection = self._db.collection(PORT_SCAN_HISTORY_COLLECTION)
+        absorbed = _absorbed_keys(absorbed for _, absorbed in intervals)
+
+        collection.insert_many(
+            [port_scan_observation_document(interval) for interval, _ in intervals],
+            overwrite_mode="replace",
+            silent=True,
+        )
+        collection.delete_many(absorbed, silent=True)
+
+        result.rewritten += len(intervals)
+        result.removed += len(absorbed)
+
+
+def port_scan_result_upsert_bind_vars(port_scan_result: PortScanResult) -> Dict[str, Any]:
+    return {
+        "result": port_scan_result_document(port_scan_result),
+        "observation": port_scan_observation_document(PortScanObservation.from_result(port_scan_result)),
+    }
+
+
+def port_scan_state_at_bind_vars(target_ip: str, at: datetime) -> Dict[str, Any]:
+    return {"target_ip": target_ip, "at": epoch_microseconds(at)}
+
+
+def stored_observation_documents(
+    port_scan_results: List[PortScanResult], result: BulkWriteResult
+) -> List[Tuple[int, Dict[str, Any]]]:
+    rejected = {error.index for error in result.errors}
+
+    return [
+        (index, port_scan_observation_document(PortScanObservation.from_result(port_scan_result)))
+        for index, port_scan_result in enumerate(port_scan_results)
+        if index not in rejected
+    ]
+
+
+def backfill_observation_epochs(db: StandardDatabase, chunk_size: int = 1000) -> None:
+    collection = db.collection(PORT_SCAN_HISTORY_COLLECTION)
+    documents = db.aql.execute(  # nosemgrep: sqlalchemy-execute-raw-query
+        OBSERVATION_EPOCH_BACKFILL_QUERY, batch_size=chunk_size, stream=True
+    )
+
+    while chunk := list(islice(documents, chunk_size)):  # type: ignore[arg-type]
+        collection.update_many([_observation_epoch(document) for document in chunk], silent=True)
+
+
+def _observation_epoch(document: Dict[str, Any]) -> Dict[str, Any]:
+    first_observed_at = datetime.fromisoformat(document["first_observed_at"])
+
+    return {"_key": document["_key"], "first_observed_us": epoch_microseconds(first_observed_at)}
+
+
+def _absorbed_keys(groups: Iterable[List[PortScanObservation]]) -> List[Dict[str, str]]:
+    return [{"_key": observation.key} for group in groups for observation in group]
@@ -0,0 +1,53 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_MARKER_DIRECTORY = "~/.cache/via-node"
+
+
+def schema_marker_scope(host: str, port: str, database: str, graph_name: str, schema_version: int) -> str:
+    return f"http://{host}:{port}/{database}/{graph_name}@v{schema_version}"
+
+
+class ArangoSchemaMarker:
+    def __init__(
+        self,
+        directory: str = DEFAULT_MARKER_DIRECTORY,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = Path(directory).expanduser()
+        self._ttl = ttl
+        self._clock = clock
+
+    def is_fresh(self, scope: str) -> bool:
+        if self._ttl <= 0:
+            return False
+
+        try:
+            verified_at = float(self._path(scope).read_text())
+        except (OSError, ValueError):
+            return False
+
+        return 0 <= self._clock() - verified_at < self._ttl
+
+    def record(self, scope: str) -> None:
+        if self._ttl <= 0:
+            return
+
+        path = self._path(scope)
+        staging = path.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            staging.write_text(repr(self._clock()))
+            staging.replace(path)
+        except OSError:
+            pass
+
+    def _path(self, scope: str) -> Path:
+        digest = hashlib.sha1(scope.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+        return self._directory / f"arango-schema-{digest}.marker"
@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from arango.collection import StandardCollection
+from arango.database import StandardDatabase
+
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import backfill_observation_epochs
+
+
+class ArangoIndexDefinition:
+    def __init__(
+        self,
+        collection_name: str,
+        fields: List[str],
+        name: str,
+        unique: bool = False,
+        sparse: bool = False,
+    ) -> None:
+        self.collection_name = collection_name
+        self.fields = fields
+        self.name = name
+        self.unique = unique
+        self.sparse = sparse
+
+    def to_index_data(self) -> Dict[str, Any]:
+        return {
+            "type": "persistent",
+            "fields": self.fields,
+            "name": self.name,
+            "unique": self.unique,
+            "sparse": self.sparse,
+            "inBackground": True,
+        }
+
+
+class ArangoTtlIndexDefinition(ArangoIndexDefinition):
+    def __init__(self, collection_name: str, field: str, name: str, expire_after: int = 0) -> None:
+        super().__init__(collection_name, [field], name)
+        self.expire_after = expire_after
+
+    def to_index_data(self) -> Dict[str, Any]:
+        return {
+            "type": "ttl",
+            "fields": self.fields,
+            "name": self.name,
+            "expireAfter": self.expire_after,
+            "inBackground": True,
+        }
+
+
+class ArangoSchemaMigration:
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        indexes: List[ArangoIndexDefinition],
+        collections: Optional[List[str]] = None,
+        backfill: Optional[Callable[[StandardDatabase], None]] = None,
+    ) -> None:
+        self.version = version
+        self.description = description
+        self.indexes = indexes
+        self.collections = collections or []
+        self.backfill = backfill
+
+
+SCHEMA_MIGRATIONS: List[ArangoSchemaMigration] = [
+    ArangoSchemaMigration(
+        version=1,
+        description="Index discovery, scan result and edge lookups",
+        indexes=[
+            ArangoIndexDefinition("dns_discoveries", ["domain_name"], "idx_dns_discoveries_domain_name"),
+            ArangoIndexDefinition("dns_discoveries", ["discovered_at"], "idx_dns_discoveries_discovered_at"),
+            ArangoIndexDefinition("port_scan_results", ["target_ip"], "idx_port_scan_results_target_ip"),
+            ArangoIndexDefinition("port_scan_results", ["scanned_at"], "idx_port_scan_results_scanned_at"),
+            ArangoIndexDefinition("domain_port_edges", ["edge_type"], "idx_domain_port_edges_edge_type"),
+            ArangoIndexDefinition(
+                "dns_resolves_to_host_edges", ["edge_type"], "idx_dns_resolves_to_host_edges_edge_type"
+            ),
+        ],
+    ),
+    ArangoSchemaMigration(
+        version=2,
+        description="Append-only port scan history",
+        collections=["port_scan_history"],
+        indexes=[
+            ArangoIndexDefinition(
+                "port_scan_history", ["target_ip", "first_observed_at"], "idx_port_scan_history_target_ip_observed"
+            ),
+            ArangoIndexDefinition(
+                "port_scan_history",
+                ["target_ip", "port_number", "protocol", "first_observed_at"],
+                "idx_port_scan_history_series",
+                unique=True,
+            ),
+        ],
+    ),
+    ArangoSchemaMigration(
+        version=3,
+        description="Expire stale DNS discoveries",
+        indexes=[ArangoTtlIndexDefinition("dns_discoveries", "expires_at", "idx_dns_discoveries_expires_at")],
+    ),
+    ArangoSchemaMigration(
+        version=4,
+        description="Index exposure statistics",
+        indexes=[
+            ArangoIndexDefinition(
+                "port_scan_results", ["state", "service_name", "target_ip"], "idx_port_scan_results_state_service"
+            ),
+            ArangoIndexDefinition(
+                "port_scan_results", ["state", "port_number", "protocol"], "idx_port_scan_results_state_port"
+            ),
+            ArangoIndexDefinition(
+                "dns_discoveries", ["domain_name", "record_type"], "idx_dns_discoveries_domain_record_type"
+            ),
+        ],
+    ),
+    ArangoSchemaMigration(
+        version=5,
+        description="Compare port scan history by epoch microseconds",
+        indexes=[
+            ArangoIndexDefinition(
+                "port_scan_history", ["target_ip", "first_observed_us"], "idx_port_scan_history_target_ip_observed_us"
+            ),
+        ],
+        backfill=backfill_observation_epochs,
+    ),
+]
+
+SCHEMA_MIGRATIONS_COLLECTION = "schema_migrations"
+LATEST_SCHEMA_VERSION = max(migration.version for migration in SCHEMA_MIGRATIONS)
+
+
+class ArangoSchemaMigrator:
+    def __init__(
+        self,
+        db: StandardDatabase,
+        graph_name: str,
+        migrations: Optional[List[ArangoSchemaMigration]] = None,
+        collection_name: str = SCHEMA_MIGRATIONS_COLLECTION,
+    ) -> None:
+        self._db = db
+        self._graph_name = graph_name
+        self._migrations = sorted(
+            SCHEMA_MIGRATIONS if migrations is None else migrations, key=lambda migration: migration.version
+        )
+        self._collection_name = collection_name
+        self._collection: Optional[StandardCollection] = None
+
+    @property
+    def latest_version(self) -> int:
+        return self._migrations[-1].version if self._migrations else 0
+
+    def current_version(self) -> int:
+        document = self._migrations_collection().get(self._graph_name)
+
+        if document is None:
+            return 0
+
+        return int(document["version"])  # type: ignore[index]
+
+    def pending_migrations(self) -> List[ArangoSchemaMigration]:
+        current_version = self.current_version()
+
+        return [migration for migration in self._migrations if migration.version > current_version]
+
+    def migrate(self) -> List[int]:
+        applied: List[int] = []
+
+        for migration in self.pending_migrations():
+            self._apply(migration)
+            applied.append(migration.version)
+
+        return applied
+
+    def _apply(self, migration: ArangoSchemaMigration) -> None:
+        for collection_name in migration.collections:
+            if not self._db.has_collection(collection_name):
+                self._db.create_collection(collection_name)
+
+        for index in migration.indexes:
+            self._db.collection(index.collection_name).add_index(index.to_index_data())
+
+        if migration.backfill is not None:
+            migration.backfill(self._db)
+
+        self._migrations_collection().insert(
+            {
+                "_key": self._graph_name,
+                "version": migration.version,
+                "description": migration.description,
+                "applied_at": datetime.now().isoformat(),
+            },
+            overwrite_mode="replace",
+            silent=True,
+        )
+
+    def _migrations_collection(self) -> StandardCollection:
+        if self._collection is None:
+            if not self._db.has_collection(self._collection_name):
+                self._db.create_collection(self._collection_name)
+
+            self._collection = self._db.collection(self._collection_name)
+
+        return self._collection
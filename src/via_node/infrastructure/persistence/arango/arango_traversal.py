@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from via_node.domain.model.topology_traversal import (
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+    selected_edge_types,
+    validate_traversal_depth,
+    validate_traversal_limit,
+)
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    DNS_RECORDS_COLLECTION,
+    HOSTS_COLLECTION,
+    PORTS_COLLECTION,
+    edge_collection_name,
+    edge_from_document,
+)
+
+VERTEX_COLLECTIONS = {"dns_record": DNS_RECORDS_COLLECTION, "host": HOSTS_COLLECTION, "port": PORTS_COLLECTION}
+VERTEX_KINDS_BY_COLLECTION = {collection_name: kind for kind, collection_name in VERTEX_COLLECTIONS.items()}
+TRAVERSAL_OPTIONS = 'OPTIONS { order: "bfs", uniqueVertices: "global" }'
+
+
+def vertex_id(vertex: VertexReference) -> str:
+    return f"{VERTEX_COLLECTIONS[vertex.kind]}/{vertex.key}"
+
+
+def vertex_reference(document_id: str) -> VertexReference:
+    collection_name, _, key = document_id.partition("/")
+
+    return VertexReference(kind=VERTEX_KINDS_BY_COLLECTION[collection_name], key=key)
+
+
+def traversal_edge_collections(edge_types: Optional[List[str]]) -> str:
+    return ", ".join(dict.fromkeys(edge_collection_name(edge_type) for edge_type in selected_edge_types(edge_types)))
+
+
+def neighbors_query(
+    vertex: VertexReference,
+    depth: int,
+    direction: TraversalDirection,
+    edge_types: Optional[List[str]],
+    limit: int,
+) -> Tuple[str, Dict[str, Any]]:
+    bind_vars = {
+        "start": vertex_id(vertex),
+        "depth": validate_traversal_depth(depth),
+        "limit": validate_traversal_limit(limit),
+        "edge_types": selected_edge_types(edge_types),
+    }
+    query = f"""
+        FOR vertex, edge, path IN 1..@depth {direction.name} @start {traversal_edge_collections(edge_types)}
+        PRUNE edge.edge_type NOT IN @edge_types OR LENGTH(path.edges) >= @depth
+        {TRAVERSAL_OPTIONS}
+        FILTER vertex != null AND edge.edge_type IN @edge_types
+        LIMIT @limit
+        RETURN {{ vertex: vertex, depth: LENGTH(path.edges) }}
+    """
+
+    return query, bind_vars
+
+
+def shortest_path_query(
+    source: VertexReference,
+    target: VertexReference,
+    max_depth: int,
+    direction: TraversalDirection,
+    edge_types: Optional[List[str]],
+) -> Tuple[str, Dict[str, Any]]:
+    bind_vars = {
+        "source": vertex_id(source),
+        "target": vertex_id(target),
+        "max_depth": validate_traversal_depth(max_depth),
+    }
+    query = f"""
+        FOR vertex, edge, path IN 0..@max_depth {direction.name} @source {traversal_edge_collections(edge_types)}
+        PRUNE vertex._id == @target
+        {TRAVERSAL_OPTIONS}
+        FILTER vertex._id == @target
+        LIMIT 1
+        RETURN {{ vertices: path.vertices[*]._id, edges: path.edges }}
+    """
+
+    return query, bind_vars
+
+
+def traversal_vertex_from_result(result: Dict[str, Any]) -> TraversalVertex:
+    document = result["vertex"]
+
+    return TraversalVertex(
+        vertex=vertex_reference(document["_id"]),
+        depth=result["depth"],
+        attributes={name: value for name, value in document.items() if not name.startswith("_")},
+    )
+
+
+def traversal_path_from_results(results: List[Dict[str, Any]]) -> Optional[TraversalPath]:
+    if not results:
+        return None
+
+    return TraversalPath(
+        vertices=[vertex_reference(document_id) for document_id in results[0]["vertices"]],
+        edges=[edge_from_document(document) for document in results[0]["edges"]],
+    )
@@ -0,0 +1,607 @@
+import asyncio
+from contextlib import aclosing
+from datetime import datetime
+from types import TracebackType
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from urllib.parse import quote
+
+import httpx
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError, validate_edge_type
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import (
+    Interval,
+    PortScanObservation,
+    ScanHistoryCompactionResult,
+    compact_series,
+)
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    DEFAULT_DISCOVERY_TTL_MULTIPLIER,
+    DNS_DISCOVERIES_COLLECTION,
+    DNS_RECORDS_COLLECTION,
+    HOSTS_COLLECTION,
+    LINK_DOMAIN_PORTS_QUERY,
+    PORT_SCAN_HISTORY_COLLECTION,
+    PORT_SCAN_RESULTS_COLLECTION,
+    PORTS_COLLECTION,
+    dns_record_discovery_document,
+    dns_record_discovery_from_document,
+    dns_record_document,
+    dns_record_from_document,
+    domain_port_link_document,
+    edge_collection_name,
+    edge_document,
+    edge_documents_by_collection,
+    edge_from_document,
+    edge_upsert_query,
+    edge_upsert_result,
+    existing_vertices_edge_query,
+    host_document,
+    host_from_document,
+    keyset_page,
+    keyset_page_query,
+    live_discovery_filter,
+    projected_model_from_document,
+    port_document,
+    port_from_document,
+    port_key,
+    port_scan_observation_document,
+    port_scan_observation_from_document,
+    port_scan_result_document,
+    port_scan_result_from_document,
+    projection_clause,
+    validate_discovery_ttl_multiplier,
+)
+from via_node.infrastructure.persistence.arango.arango_exposure_statistics import (
+    HOSTS_PER_OPEN_PORT_QUERY,
+    OPEN_PORTS_PER_SERVICE_QUERY,
+    open_port_statistics_bind_vars,
+    record_types_per_domain_query,
+    statistics_bind_vars,
+)
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import (
+    PORT_SCAN_HISTORY_QUERY,
+    PORT_SCAN_RESULT_UPSERT_QUERY,
+    PORT_SCAN_SERIES_QUERY,
+    PORT_SCAN_STATE_AT_QUERY,
+    port_scan_result_upsert_bind_vars,
+    port_scan_state_at_bind_vars,
+    stored_observation_documents,
+)
+from via_node.infrastructure.persistence.arango.arango_traversal import (
+    neighbors_query,
+    shortest_path_query,
+    traversal_path_from_results,
+    traversal_vertex_from_result,
+)
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+from via_node.infrastructure.persistence.arango.coordinator_transport import CoordinatorTransport
+
+ItemType = TypeVar("ItemType")
+
+UPSERT_PARAMS = {"overwriteMode": "replace", "silent": "true"}
+BULK_UPSERT_PARAMS = {"overwriteMode": "replace"}
+BULK_APPEND_PARAMS = {"overwriteMode": "ignore"}
+
+
+class AsyncArangoError(Exception):
+    def __init__(self, status_code: int, error_number: int, error_message: str) -> None:
+        super().__init__(status_code, error_number, error_message)
+        self.status_code = status_code
+        self.error_number = error_number
+        self.error_message = error_message
+
+    def __str__(self) -> str:
+        return f"[HTTP {self.status_code}][ERR {self.error_number}] {self.error_message}"
+
+
+class AsyncArangoNetworkTopologyRepository(AsyncNetworkTopologyRepository):
+    def __init__(
+        self,
+        host: str,
+        port: str,
+        database: str,
+        username: str,
+        password: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        request_timeout: float = 60.0,
+        bulk_chunk_size: int = 1000,
+        cursor_batch_size: int = 1000,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        discovery_ttl_multiplier: float = DEFAULT_DISCOVERY_TTL_MULTIPLIER,
+        hide_expired_discoveries: bool = False,
+        host_resolver: Optional[CoordinatorHostResolver] = None,
+    ) -> None:
+        self._bulk_chunk_size = bulk_chunk_size
+        self._discovery_ttl_multiplier = validate_discovery_ttl_multiplier(discovery_ttl_multiplier)
+        self._live_discovery_filter = live_discovery_filter(hide_expired_discoveries)
+        self._cursor_batch_size = cursor_batch_size
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+
+        if host_resolver is not None:
+            transport = CoordinatorTransport(host_resolver, transport or httpx.AsyncHTTPTransport(limits=limits))
+
+        self._client = httpx.AsyncClient(
+            base_url=f"http://{host}:{port}/_db/{database}",
+            auth=(username, password),
+            limits=limits,
+            timeout=request_timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncArangoNetworkTopologyRepository":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        await self._upsert(DNS_RECORDS_COLLECTION, dns_record_document(dns_record))
+
+        return dns_record
+
+    async def create_or_update_port(self, port: Port) -> Port:
+        await self._upsert(PORTS_COLLECTION, port_document(port))
+
+        return port
+
+    async def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        await self._query(edge_upsert_query(edge_collection_name(edge.edge_type)), {"edges": [edge_document(edge)]})
+
+        return edge
+
+    async def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        if not links:
+            return []
+
+        await self._query(LINK_DOMAIN_PORTS_QUERY, {"links": [domain_port_link_document(link) for link in links]})
+
+        return [link.edge for link in links]
+
+    async def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        [found] = await self._query(
+            existing_vertices_edge_query(edge_collection_name(edge.edge_type)), {"edge": edge_document(edge)}
+        )
+
+        if not (found["source_found"] and found["target_found"]):
+            raise VertexNotFoundError.for_edge(edge, found["source_found"])
+
+        return edge
+
+    async def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        document = await self._get_document(DNS_RECORDS_COLLECTION, domain_name)
+
+        return dns_record_from_document(document) if document else None
+
+    async def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        document = await self._get_document(PORTS_COLLECTION, port_key(port_number, protocol))
+
+        return port_from_document(document) if document else None
+
+    async def create_or_update_host(self, host: Host) -> Host:
+        await self._upsert(HOSTS_COLLECTION, host_document(host))
+
+        return host
+
+    async def get_host(self, ip_address: str) -> Optional[Host]:
+        document = await self._get_document(HOSTS_COLLECTION, ip_address)
+
+        return host_from_document(document) if document else None
+
+    async def create_or_update_dns_record_discovery(
+        self, dns_record_discovery: DnsRecordDiscovery
+    ) -> DnsRecordDiscovery:
+        await self._upsert(
+            DNS_DISCOVERIES_COLLECTION,
+            dns_record_discovery_document(dns_record_discovery, self._discovery_ttl_multiplier),
+        )
+
+        return dns_record_discovery
+
+    async def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        documents = await self._query(
+            f"FOR doc IN {DNS_DISCOVERIES_COLLECTION} FILTER doc.domain_name == @domain_name "
+            f"{self._live_discovery_filter} RETURN {projection_clause(DnsRecordDiscovery, fields)}",
+            {"domain_name": domain_name},
+        )
+
+        return [
+            projected_model_from_document(DnsRecordDiscovery, document, fields, dns_record_discovery_from_document)
+            for document in documents
+        ]
+
+    async def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[DnsRecordDiscovery]:
+        documents = self._iter_query(
+            f"FOR doc IN {DNS_DISCOVERIES_COLLECTION} FILTER doc.domain_name == @domain_name "
+            f"{self._live_discovery_filter} RETURN {projection_clause(DnsRecordDiscovery, fields)}",
+            {"domain_name": domain_name},
+            batch_size,
+            ttl=ttl,
+            stream=True,
+        )
+
+        async with aclosing(documents):
+            async for document in documents:
+                yield projected_model_from_document(
+                    DnsRecordDiscovery, document, fields, dns_record_discovery_from_document
+                )
+
+    async def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        await self._query(PORT_SCAN_RESULT_UPSERT_QUERY, port_scan_result_upsert_bind_vars(port_scan_result))
+
+        return port_scan_result
+
+    async def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        documents = await self._query(
+            f"FOR doc IN {PORT_SCAN_RESULTS_COLLECTION} FILTER doc.target_ip == @target_ip "
+            f"RETURN {projection_clause(PortScanResult, fields)}",
+            {"target_ip": target_ip},
+        )
+
+        return [
+            projected_model_from_document(PortScanResult, document, fields, port_scan_result_from_document)
+            for document in documents
+        ]
+
+    async def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[PortScanResult]:
+        documents = self._iter_query(
+            f"FOR doc IN {PORT_SCAN_RESULTS_COLLECTION} FILTER doc.target_ip == @target_ip "
+            f"RETURN {projection_clause(PortScanResult, fields)}",
+            {"target_ip": target_ip},
+            batch_size,
+            ttl=ttl,
+            stream=True,
+        )
+
+        async with aclosing(documents):
+            async for document in documents:
+                yield projected_model_from_document(PortScanResult, document, fields, port_scan_result_from_document)
+
+    async def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        documents = await self._query(PORT_SCAN_HISTORY_QUERY, {"target_ip": target_ip})
+
+        return [port_scan_observation_from_document(document) for document in documents]
+
+    async def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        documents = await self._query(PORT_SCAN_STATE_AT_QUERY, port_scan_state_at_bind_vars(target_ip, at))
+
+        return [port_scan_observation_from_document(document) for document in documents]
+
+    async def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        result = ScanHistoryCompactionResult()
+        intervals: List[Interval] = []
+        series: List[PortScanObservation] = []
+        documents = self._iter_query(PORT_SCAN_SERIES_QUERY, {}, self._cursor_batch_size, stream=True)
+
+        async with aclosing(documents):
+            async for document in documents:
+                observation = port_scan_observation_from_document(document)
+
+                if series and series[0].series != observation.series:
+                    intervals = await self._compact_series(series, intervals, result)
+                    series = []
+
+                series.append(observation)
+
+        await self._rewrite_history(await self._compact_series(series, intervals, result), result)
+
+        return result
+
+    async def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        documents = [port_scan_result_document(result) for result in port_scan_results]
+        result = await self._bulk_insert(PORT_SCAN_RESULTS_COLLECTION, list(enumerate(documents)), BULK_UPSERT_PARAMS)
+        history = await self._bulk_insert(
+            PORT_SCAN_HISTORY_COLLECTION, stored_observation_documents(port_scan_results, result), BULK_APPEND_PARAMS
+        )
+        result.errors.extend(history.errors)
+
+        return result
+
+    async def bulk_upsert_dns_record_discoveries(
+        self, dns_record_discoveries: List[DnsRecordDiscovery]
+    ) -> BulkWriteResult:
+        documents = [
+            dns_record_discovery_document(discovery, self._discovery_ttl_multiplier)
+            for discovery in dns_record_discoveries
+        ]
+
+        return await self._bulk_insert(DNS_DISCOVERIES_COLLECTION, list(enumerate(documents)), BULK_UPSERT_PARAMS)
+
+    async def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        documents = [dns_record_document(dns_record) for dns_record in dns_records]
+
+        return await self._bulk_insert(DNS_RECORDS_COLLECTION, list(enumerate(documents)), BULK_UPSERT_PARAMS)
+
+    async def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        documents = [port_document(port) for port in ports]
+
+        return await self._bulk_insert(PORTS_COLLECTION, list(enumerate(documents)), BULK_UPSERT_PARAMS)
+
+    async def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        documents = [host_document(host) for host in hosts]
+
+        return await self._bulk_insert(HOSTS_COLLECTION, list(enumerate(documents)), BULK_UPSERT_PARAMS)
+
+    async def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        results = await asyncio.gather(
+            *(
+                self._upsert_edges(collection_name, chunk)
+                for collection_name, indexed_documents in edge_documents_by_collection(edges).items()
+                for chunk in self._chunks(indexed_documents)
+            )
+        )
+
+        return self._merge(results)
+
+    async def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        return await self._page(DNS_RECORDS_COLLECTION, page_size, page_token, dns_record_from_document)
+
+    async def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        return await self._page(PORTS_COLLECTION, page_size, page_token, port_from_document)
+
+    async def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        return await self._page(HOSTS_COLLECTION, page_size, page_token, host_from_document)
+
+    async def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        return await self._page(DNS_DISCOVERIES_COLLECTION, page_size, page_token, dns_record_discovery_from_document)
+
+    async def list_port_scan_results(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[PortScanResult]:
+        return await self._page(PORT_SCAN_RESULTS_COLLECTION, page_size, page_token, port_scan_result_from_document)
+
+    async def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        return await self._page(
+            edge_collection_name(validate_edge_type(edge_type)), page_size, page_token, edge_from_document
+        )
+
+    async def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        query, bind_vars = neighbors_query(vertex, depth, direction, edge_types, limit)
+
+        return [traversal_vertex_from_result(result) for result in await self._query(query, bind_vars)]
+
+    async def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        query, bind_vars = shortest_path_query(source, target, max_depth, direction, edge_types)
+
+        return traversal_path_from_results(await self._query(query, bind_vars))
+
+    async def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        rows = await self._query(OPEN_PORTS_PER_SERVICE_QUERY, open_port_statistics_bind_vars(limit))
+
+        return [ServiceExposure.model_validate(row) for row in rows]
+
+    async def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        rows = await self._query(HOSTS_PER_OPEN_PORT_QUERY, open_port_statistics_bind_vars(limit))
+
+        return [PortExposure.model_validate(row) for row in rows]
+
+    async def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        rows = await self._query(
+            record_types_per_domain_query(self._live_discovery_filter), statistics_bind_vars(limit)
+        )
+
+        return [DomainRecordTypes.model_validate(row) for row in rows]
+
+    async def _page(
+        self,
+        collection_name: str,
+        page_size: int,
+        page_token: Optional[str],
+        from_document: Callable[[Dict[str, Any]], ItemType],
+    ) -> Page[ItemType]:
+        query, bind_vars = keyset_page_query(collection_name, page_size, page_token)
+
+        return keyset_page(collection_name, await self._query(query, bind_vars), page_size, from_document)
+
+    async def _compact_series(
+        self, series: List[PortScanObservation], intervals: List[Interval], result: ScanHistoryCompactionResult
+    ) -> List[Interval]:
+        intervals = [*intervals, *((interval, absorbed) for interval, absorbed in compact_series(series) if absorbed)]
+
+        if len(intervals) < self._bulk_chunk_size:
+            return intervals
+
+        await self._rewrite_history(intervals, result)
+
+        return []
+
+    async def _rewrite_history(self, intervals: List[Interval], result: ScanHistoryCompactionResult) -> None:
+        if not intervals:
+            return
+
+        absorbed = [observation.key for _, observations in intervals for observation in observations]
+        documents = [port_scan_observation_document(interval) for interval, _ in intervals]
+        path = f"/_api/document/{PORT_SCAN_HISTORY_COLLECTION}"
+
+        await self._request("POST", path, params=UPSERT_PARAMS, json=documents)
+        await self._request("DELETE", path, params={"silent": "true"}, json=absorbed)
+
+        result.rewritten += len(intervals)
+        result.removed += len(absorbed)
+
+    def _merge(self, results: List[BulkWriteResult]) -> BulkWriteResult:
+        return BulkWriteResult(
+            written=sum(result.written for result in results),
+            errors=sorted((error for result in results for error in result.errors), key=lambda error: error.index),
+        )
+
+    def _chunks(self, indexed_documents: List[Tuple[int, Dict[str, Any]]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        return [
+            indexed_documents[offset : offset + self._bulk_chunk_size]
+            for offset in range(0, len(indexed_documents), self._bulk_chunk_size)
+        ]
+
+    async def _upsert_edges(
+        self, collection_name: str, indexed_documents: List[Tuple[int, Dict[str, Any]]]
+    ) -> BulkWriteResult:
+        written_keys = await self._query(
+            edge_upsert_query(collection_name), {"edges": [document for _, document in indexed_documents]}
+        )
+
+        return edge_upsert_result(indexed_documents, written_keys, BulkWriteResult())  # type: ignore[arg-type]
+
+    async def _upsert(self, collection_name: str, document: Dict[str, Any]) -> None:
+        await self._request("POST", f"/_api/document/{collection_name}", params=UPSERT_PARAMS, json=document)
+
+    async def _get_document(self, collection_name: str, key: str) -> Optional[Dict[str, Any]]:
+        response = await self._client.get(f"/_api/document/{collection_name}/{quote(key, safe='')}")
+
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return None
+
+        return self._parse(response)  # type: ignore[no-any-return]
+
+    async def _query(self, query: str, bind_vars: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [document async for document in self._iter_query(query, bind_vars, self._cursor_batch_size)]
+
+    async def _iter_query(
+        self,
+        query: str,
+        bind_vars: Dict[str, Any],
+        batch_size: int,
+        ttl: Optional[int] = None,
+        stream: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        cursor = await self._request(
+            "POST", "/_api/cursor", json=self._cursor_body(query, bind_vars, batch_size, ttl, stream)
+        )
+
+        try:
+            for document in cursor["result"]:
+                yield document
+
+            while cursor.get("hasMore"):
+                cursor = await self._request("PUT", f"/_api/cursor/{cursor['id']}")
+
+                for document in cursor["result"]:
+                    yield document
+        finally:
+            if cursor.get("hasMore"):
+                await self._client.delete(f"/_api/cursor/{cursor['id']}")
+
+    def _cursor_body(
+        self, query: str, bind_vars: Dict[str, Any], batch_size: int, ttl: Optional[int], stream: bool
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"query": query, "bindVars": bind_vars, "batchSize": batch_size}
+
+        if ttl is not None:
+            body["ttl"] = ttl
+
+        if stream:
+            body["options"] = {"stream": True}
+
+        return body
+
+    async def _bulk_insert(
+        self,
+        collection_name: str,
+        indexed_documents: List[Tuple[int, Dict[str, Any]]],
+        params: Dict[str, str],
+    ) -> BulkWriteResult:
+        chunks = self._chunks(indexed_documents)
+        responses = await asyncio.gather(
+            *(
+                self._request(
+                    "POST",
+                    f"/_api/document/{collection_name}",
+                    params=params,
+                    json=[document for _, document in chunk],
+                )
+                for chunk in chunks
+            )
+        )
+        result = BulkWriteResult()
+
+        for chunk, chunk_responses in zip(chunks, responses):
+            self._collect_bulk_responses(chunk, chunk_responses, result)
+
+        return result
+
+    def _collect_bulk_responses(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        responses: List[Dict[str, Any]],
+        result: BulkWriteResult,
+    ) -> None:
+        for (index, document), response in zip(chunk, responses):
+            if response.get("error"):
+                result.errors.append(
+                    BulkWriteError(index=index, key=document.get("_key"), error_message=response["errorMessage"])
+                )
+            else:
+                result.written += 1
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        return self._parse(await self._client.request(method, path, **kwargs))
+
+    def _parse(self, response: httpx.Response) -> Any:
+        body = response.json() if response.content else {}
+
+        if response.is_error:
+            raise AsyncArangoError(
+                response.status_code, body.get("errorNum", 0), body.get("errorMessage", response.reason_phrase)
+            )
+
+        return body
@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Callable, List, Optional, Set
+
+from arango.resolver import HostResolver
+from pydantic import BaseModel
+
+HOST_SELECTIONS = ("round-robin", "least-latency")
+LATENCY_SMOOTHING = 0.2
+
+
+def coordinator_urls(endpoints: str, host: str, port: str) -> List[str]:
+    return [_coordinator_url(endpoint) for endpoint in endpoints.split(",") if endpoint.strip()] or [
+        f"http://{host}:{port}"
+    ]
+
+
+def _coordinator_url(endpoint: str) -> str:
+    url = endpoint.strip().rstrip("/")
+
+    return url if "://" in url else f"http://{url}"
+
+
+class CoordinatorHealth(BaseModel):
+    host: str
+    admitted: bool = True
+    latency: Optional[float] = None
+    failures: int = 0
+    requests: int = 0
+    ejected_until: float = 0.0
+
+
+class CoordinatorHostResolver(HostResolver):
+    def __init__(
+        self,
+        hosts: List[str],
+        selection: str = "round-robin",
+        ejection_threshold: int = 3,
+        ejection_period: float = 30.0,
+        max_tries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if selection not in HOST_SELECTIONS:
+            raise ValueError(f"Host selection must be one of {set(HOST_SELECTIONS)}")
+
+        if ejection_threshold < 1:
+            raise ValueError("Ejection threshold must be at least 1")
+
+        super().__init__(len(hosts), max_tries)
+        self._hosts = list(hosts)
+        self._selection = selection
+        self._ejection_threshold = ejection_threshold
+        self._ejection_period = ejection_period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._coordinators = [CoordinatorHealth(host=host) for host in self._hosts]
+        self._next = 0
+
+    @property
+    def hosts(self) -> List[str]:
+        return list(self._hosts)
+
+    def get_host_index(self, indexes_to_filter: Optional[Set[int]] = None) -> int:
+        with self._lock:
+            candidates = self._candidates(indexes_to_filter or set(), self._clock())
+            index = self._select(candidates)
+            self._coordinators[index].requests += 1
+
+            return index
+
+    def record_success(self, host: str, elapsed: float) -> None:
+        with self._lock:
+            coordinator = self._coordinator(host)
+
+            if coordinator is None:
+                return
+
+            coordinator.failures = 0
+            coordinator.ejected_until = 0.0
+            coordinator.latency = (
+                elapsed
+                if coordinator.latency is None
+                else coordinator.latency + LATENCY_SMOOTHING * (elapsed - coordinator.latency)
+            )
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            coordinator = self._coordinator(host)
+
+            if coordinator is None:
+                return
+
+            coordinator.failures += 1
+
+            if coordinator.failures >= self._ejection_threshold:
+                coordinator.ejected_until = self._clock() + self._ejection_period
+
+    def health(self) -> List[CoordinatorHealth]:
+        with self._lock:
+            now = self._clock()
+
+            return [
+                coordinator.model_copy(update={"admitted": coordinator.ejected_until <= now})
+                for coordinator in self._coordinators
+            ]
+
+    def _coordinator(self, host: str) -> Optional[CoordinatorHealth]:
+        return self._coordinators[self._hosts.index(host)] if host in self._hosts else None
+
+    def _candidates(self, excluded: Set[int], now: float) -> List[int]:
+        allowed = self._allowed(excluded)
+        admitted = [index for index in allowed if self._coordinators[index].ejected_until <= now]
+
+        return admitted or [min(allowed, key=lambda index: self._coordinators[index].ejected_until)]
+
+    def _allowed(self, excluded: Set[int]) -> List[int]:
+        return [index for index in range(self.host_count) if index not in excluded] or list(range(self.host_count))
+
+    def _select(self, candidates: List[int]) -> int:
+        if self._selection == "least-latency":
+            return min(candidates, key=lambda index: self._coordinators[index].latency or 0.0)
+
+        index = min(candidates, key=lambda candidate: (candidate - self._next) % self.host_count)
+        self._next = (index + 1) % self.host_count
+
+        return index
@@ -0,0 +1,51 @@
+import time
+from typing import Set
+
+import httpx
+
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+from via_node.infrastructure.persistence.arango.pooled_http_client import UNAVAILABLE_STATUSES
+
+
+class CoordinatorTransport(httpx.AsyncBaseTransport):
+    def __init__(self, host_resolver: CoordinatorHostResolver, transport: httpx.AsyncBaseTransport) -> None:
+        self._host_resolver = host_resolver
+        self._hosts = host_resolver.hosts
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        excluded: Set[int] = set()
+
+        while True:
+            index = self._host_resolver.get_host_index(excluded)
+
+            try:
+                return await self._send(request, index)
+            except httpx.ConnectError:
+                excluded.add(index)
+
+                if len(excluded) >= self._host_resolver.host_count:
+                    raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    async def _send(self, request: httpx.Request, index: int) -> httpx.Response:
+        host = self._hosts[index]
+        origin = httpx.URL(host)
+        request.url = request.url.copy_with(scheme=origin.scheme, host=origin.host, port=origin.port)
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+        started = time.perf_counter()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._host_resolver.record_failure(host)
+            raise
+
+        if response.status_code in UNAVAILABLE_STATUSES:
+            self._host_resolver.record_failure(host)
+        else:
+            self._host_resolver.record_success(host, time.perf_counter() - started)
+
+        return response
@@ -0,0 +1,153 @@
+import socket
+import time
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple, Union
+
+from arango.http import HTTPClient
+from arango.response import Response
+from arango.typings import Headers
+from requests import ConnectionError, Session
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder  # type: ignore[import-untyped]
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+READ_METHODS = ["HEAD", "GET", "OPTIONS"]
+WRITE_METHODS = ["POST", "PUT", "PATCH", "DELETE"]
+UNAVAILABLE_STATUSES = [502, 503, 504]
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    def __init__(self, keep_alive: bool = True, **kwargs: Any) -> None:
+        self._keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self._keep_alive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+
+        super().init_poolmanager(*args, **kwargs)
+
+
+class PooledHttpClient(HTTPClient):
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        request_timeout: float = 60.0,
+        retry_attempts: int = 3,
+        retry_backoff_factor: float = 0.5,
+        retry_writes: bool = False,
+        host_resolver: Optional[CoordinatorHostResolver] = None,
+    ) -> None:
+        self.request_timeout = request_timeout
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._retry_attempts = retry_attempts
+        self._retry_backoff_factor = retry_backoff_factor
+        self._retry_writes = retry_writes
+        self._host_resolver = host_resolver
+        self._adapters: List[KeepAliveHTTPAdapter] = []
+        self._session_hosts: Dict[int, str] = {}
+
+    def create_session(self, host: str) -> Session:
+        adapter = KeepAliveHTTPAdapter(
+            keep_alive=self._keep_alive,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            max_retries=self._retry_strategy(),
+        )
+        self._adapters.append(adapter)
+
+        session = Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive" if self._keep_alive else "close"
+        self._session_hosts[id(session)] = host
+
+        return session
+
+    def send_request(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: Optional[Headers] = None,
+        params: Optional[MutableMapping[str, str]] = None,
+        data: Union[str, bytes, MultipartEncoder, None] = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> Response:
+        started = time.perf_counter()
+
+        try:
+            response = session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=self.request_timeout,
+            )
+        except ConnectionError:
+            self._report(session, None)
+            raise
+
+        self._report(session, None if response.status_code in UNAVAILABLE_STATUSES else time.perf_counter() - started)
+
+        return Response(
+            method=method,
+            url=response.url,
+            headers=response.headers,
+            status_code=response.status_code,
+            status_text=response.reason,
+            raw_body=response.text,
+        )
+
+    def pool_stats(self) -> List[Dict[str, Any]]:
+        return [
+            self._connection_pool_stats(key, adapter.poolmanager.pools[key])
+            for adapter in self._adapters
+            for key in adapter.poolmanager.pools.keys()
+        ]
+
+    def _report(self, session: Session, elapsed: Optional[float]) -> None:
+        host = self._session_hosts.get(id(session))
+
+        if self._host_resolver is None or host is None:
+            return
+
+        if elapsed is None:
+            self._host_resolver.record_failure(host)
+        else:
+            self._host_resolver.record_success(host, elapsed)
+
+    def _retry_strategy(self) -> Retry:
+        return Retry(
+            total=self._retry_attempts,
+            backoff_factor=self._retry_backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=READ_METHODS + WRITE_METHODS if self._retry_writes else READ_METHODS,
+            raise_on_status=False,
+        )
+
+    def _connection_pool_stats(self, key: Any, pool: Any) -> Dict[str, Any]:
+        queued = list(pool.pool.queue)
+
+        return {
+            "host": f"{key.key_scheme}://{key.key_host}:{key.key_port}",
+            "max_size": pool.pool.maxsize,
+            "in_use": pool.pool.maxsize - len(queued),
+            "idle": sum(1 for connection in queued if connection is not None),
+            "connections_opened": pool.num_connections,
+            "requests_sent": pool.num_requests,
+        }
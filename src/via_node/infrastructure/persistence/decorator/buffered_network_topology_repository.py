@@ -0,0 +1,436 @@
+import atexit
+import threading
+from datetime import datetime
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.delegating_network_topology_repository import (
+    DelegatingNetworkTopologyRepository,
+)
+
+DNS_RECORD = "dns_record"
+PORT = "port"
+HOST = "host"
+DNS_RECORD_DISCOVERY = "dns_record_discovery"
+PORT_SCAN_RESULT = "port_scan_result"
+EDGE = "edge"
+
+FLUSH_ORDER = [DNS_RECORD, PORT, HOST, DNS_RECORD_DISCOVERY, PORT_SCAN_RESULT, EDGE]
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+PendingWrites = Dict[str, Dict[str, Any]]
+
+MAX_BACKOFF_DOUBLINGS = 32
+
+
+class WriteBufferFullError(Exception):
+    @classmethod
+    def holding(cls, pending_bytes: int, limit: int) -> "WriteBufferFullError":
+        return cls(f"Write buffer holds {pending_bytes} unwritten byte(s), limit is {limit}")
+
+
+class BufferedNetworkTopologyRepository(DelegatingNetworkTopologyRepository):
+    def __init__(
+        self,
+        repository: NetworkTopologyRepository,
+        max_count: int = 1000,
+        max_bytes: int = 1_048_576,
+        max_delay: float = 1.0,
+        flush_at_exit: bool = True,
+        max_backoff: float = 60.0,
+        max_buffered_bytes: int = 67_108_864,
+    ) -> None:
+        super().__init__(repository)
+        self._max_count = max_count
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._max_backoff = max(max_backoff, max_delay)
+        self._max_buffered_bytes = max_buffered_bytes
+        self._failures = 0
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._pending: PendingWrites = _empty_pending()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._pending_bytes = 0
+        self._timer: Optional[threading.Timer] = None
+        self._unreported = BulkWriteResult()
+
+        if flush_at_exit:
+            atexit.register(self.close)
+
+    def __enter__(self) -> "BufferedNetworkTopologyRepository":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._sizes)
+
+    @property
+    def pending_bytes(self) -> int:
+        with self._lock:
+            return self._pending_bytes
+
+    @property
+    def unreported_errors(self) -> List[BulkWriteError]:
+        with self._lock:
+            return list(self._unreported.errors)
+
+    def flush(self) -> BulkWriteResult:
+        self._flush_pending()
+
+        with self._lock:
+            result, self._unreported = self._unreported, BulkWriteResult()
+
+        return result
+
+    def close(self) -> BulkWriteResult:
+        atexit.unregister(self.close)
+
+        return self.flush()
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        return self._enqueue(DNS_RECORD, dns_record.domain_name, dns_record)
+
+    def create_or_update_port(self, port: Port) -> Port:
+        return self._enqueue(PORT, f"{port.port_number}_{port.protocol}", port)
+
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        return self._enqueue(EDGE, edge.key, edge)
+
+    def create_or_update_host(self, host: Host) -> Host:
+        return self._enqueue(HOST, host.ip_address, host)
+
+    def create_or_update_dns_record_discovery(self, dns_record_discovery: DnsRecordDiscovery) -> DnsRecordDiscovery:
+        key = f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}"
+
+        return self._enqueue(DNS_RECORD_DISCOVERY, key, dns_record_discovery)
+
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        key = f"{port_scan_result.target_ip}_{port_scan_result.protocol}_{port_scan_result.port_number}"
+
+        return self._enqueue(PORT_SCAN_RESULT, key, port_scan_result)
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        self._flush_pending()
+
+        return super().link_domain_ports(links)
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        self._flush_pending()
+
+        return super().create_edge_between_existing_vertices(edge)
+
+    def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        return self._pending_or(DNS_RECORD, domain_name, lambda: self._repository.get_dns_record(domain_name))
+
+    def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        return self._pending_or(
+            PORT, f"{port_number}_{protocol}", lambda: self._repository.get_port(port_number, protocol)
+        )
+
+    def get_host(self, ip_address: str) -> Optional[Host]:
+        return self._pending_or(HOST, ip_address, lambda: self._repository.get_host(ip_address))
+
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        self._flush_pending()
+
+        return super().get_dns_record_discoveries(domain_name, fields)
+
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
+        self._flush_pending()
+
+        return super().iter_dns_record_discoveries(domain_name, batch_size, fields, ttl)
+
+    def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        self._flush_pending()
+
+        return super().get_port_scan_results(target_ip, fields)
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        self._flush_pending()
+
+        return super().iter_port_scan_results(target_ip, batch_size, fields, ttl)
+
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        self._flush_pending()
+
+        return super().get_port_scan_history(target_ip)
+
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        self._flush_pending()
+
+        return super().get_port_scan_state_at(target_ip, at)
+
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        self._flush_pending()
+
+        return super().compact_port_scan_history()
+
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        self._flush_pending()
+
+        return super().open_ports_per_service(limit)
+
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        self._flush_pending()
+
+        return super().hosts_per_open_port(limit)
+
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        self._flush_pending()
+
+        return super().record_types_per_domain(limit)
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_upsert_port_scan_results(port_scan_results)
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_upsert_dns_record_discoveries(dns_record_discoveries)
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_upsert_dns_records(dns_records)
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_upsert_ports(ports)
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_upsert_hosts(hosts)
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        self._flush_pending()
+
+        return super().bulk_create_edges(edges)
+
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        self._flush_pending()
+
+        return super().list_dns_records(page_size, page_token)
+
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        self._flush_pending()
+
+        return super().list_ports(page_size, page_token)
+
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        self._flush_pending()
+
+        return super().list_hosts(page_size, page_token)
+
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        self._flush_pending()
+
+        return super().list_dns_record_discoveries(page_size, page_token)
+
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        self._flush_pending()
+
+        return super().list_port_scan_results(page_size, page_token)
+
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        self._flush_pending()
+
+        return super().list_edges(edge_type, page_size, page_token)
+
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        self._flush_pending()
+
+        return super().neighbors(vertex, depth, direction, edge_types, limit)
+
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        self._flush_pending()
+
+        return super().shortest_path(source, target, max_depth, direction, edge_types)
+
+    def _enqueue(self, entity: str, key: str, model: ModelType) -> ModelType:
+        size = len(model.model_dump_json())
+
+        with self._lock:
+            pending_bytes = self._pending_bytes + size - self._sizes.get((entity, key), 0)
+
+            if pending_bytes > self._max_buffered_bytes:
+                raise WriteBufferFullError.holding(self._pending_bytes, self._max_buffered_bytes)
+
+            self._pending[entity][key] = model
+            self._pending_bytes = pending_bytes
+            self._sizes[(entity, key)] = size
+            should_flush = self._should_flush()
+
+            if not should_flush:
+                self._arm_timer()
+
+        if should_flush:
+            self._flush_pending()
+
+        return model
+
+    def _pending_or(self, entity: str, key: str, read: Callable[[], Optional[Any]]) -> Optional[Any]:
+        with self._lock:
+            pending = self._pending[entity].get(key)
+
+        return pending if pending is not None else read()
+
+    def _should_flush(self) -> bool:
+        if self._failures and self._timer is not None:
+            return False
+
+        return len(self._sizes) >= self._max_count or self._pending_bytes >= self._max_bytes
+
+    def _arm_timer(self) -> None:
+        if self._timer is None and self._max_delay > 0:
+            self._timer = threading.Timer(self._retry_delay(), self._flush_pending)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _retry_delay(self) -> float:
+        if not self._failures:
+            return self._max_delay
+
+        return min(self._max_delay * 2.0 ** min(self._failures, MAX_BACKOFF_DOUBLINGS), self._max_backoff)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_pending(self) -> None:
+        with self._flush_lock:
+            result = self._write(self._drain())
+
+            with self._lock:
+                self._failures = 0
+                self._unreported.written += result.written
+                self._unreported.errors.extend(result.errors)
+
+    def _drain(self) -> PendingWrites:
+        with self._lock:
+            self._cancel_timer()
+            pending, self._pending = self._pending, _empty_pending()
+            self._sizes = {}
+            self._pending_bytes = 0
+
+            return pending
+
+    def _write(self, pending: PendingWrites) -> BulkWriteResult:
+        result = BulkWriteResult()
+
+        for position, (entity, write) in enumerate(self._writers()):
+            models = list(pending[entity].values())
+
+            if not models:
+                continue
+
+            try:
+                written = write(models)
+            except Exception:
+                self._requeue(pending, FLUSH_ORDER[position:])
+                raise
+
+            result.written += written.written
+            result.errors.extend(written.errors)
+
+        return result
+
+    def _writers(self) -> List[Tuple[str, Callable[[List[Any]], BulkWriteResult]]]:
+        return [
+            (DNS_RECORD, self._repository.bulk_upsert_dns_records),
+            (PORT, self._repository.bulk_upsert_ports),
+            (HOST, self._repository.bulk_upsert_hosts),
+            (DNS_RECORD_DISCOVERY, self._repository.bulk_upsert_dns_record_discoveries),
+            (PORT_SCAN_RESULT, self._repository.bulk_upsert_port_scan_results),
+            (EDGE, self._repository.bulk_create_edges),
+        ]
+
+    def _requeue(self, pending: PendingWrites, entities: List[str]) -> None:
+        with self._lock:
+            for entity in entities:
+                for key, model in pending[entity].items():
+                    if key not in self._pending[entity]:
+                        self._pending[entity][key] = model
+                        self._sizes[(entity, key)] = len(model.model_dump_json())
+                        self._pending_bytes += self._sizes[(entity, key)]
+
+            self._failures += 1
+            self._cancel_timer()
+            self._arm_timer()
+
+
+def _empty_pending() -> PendingWrites:
+    return {entity: {} for entity in FLUSH_ORDER}
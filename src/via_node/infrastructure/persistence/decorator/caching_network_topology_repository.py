@@ -0,0 +1,109 @@
+from typing import Dict, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.delegating_network_topology_repository import (
+    DelegatingNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.decorator.ttl_lru_cache import CacheStatistics, TtlLruCache
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def _copy(model: Optional[ModelType]) -> Optional[ModelType]:
+    return None if model is None else model.model_copy(deep=True)
+
+
+class CachingNetworkTopologyRepository(DelegatingNetworkTopologyRepository):
+    def __init__(
+        self,
+        repository: NetworkTopologyRepository,
+        dns_record_capacity: int = 10_000,
+        port_capacity: int = 1_000,
+        host_capacity: int = 10_000,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+    ) -> None:
+        super().__init__(repository)
+        self._dns_records: TtlLruCache[DnsRecord] = TtlLruCache(dns_record_capacity, ttl, negative_ttl)
+        self._ports: TtlLruCache[Port] = TtlLruCache(port_capacity, ttl, negative_ttl)
+        self._hosts: TtlLruCache[Host] = TtlLruCache(host_capacity, ttl, negative_ttl)
+
+    def cache_statistics(self) -> Dict[str, CacheStatistics]:
+        return {
+            "dns_records": self._dns_records.statistics(),
+            "ports": self._ports.statistics(),
+            "hosts": self._hosts.statistics(),
+        }
+
+    def clear_cache(self) -> None:
+        self._dns_records.clear()
+        self._ports.clear()
+        self._hosts.clear()
+
+    def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        return _copy(self._dns_records.get_or_load(domain_name, lambda: self._repository.get_dns_record(domain_name)))
+
+    def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        return _copy(
+            self._ports.get_or_load(
+                f"{port_number}_{protocol}", lambda: self._repository.get_port(port_number, protocol)
+            )
+        )
+
+    def get_host(self, ip_address: str) -> Optional[Host]:
+        return _copy(self._hosts.get_or_load(ip_address, lambda: self._repository.get_host(ip_address)))
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        self._dns_records.invalidate(dns_record.domain_name)
+        stored = self._repository.create_or_update_dns_record(dns_record)
+        self._dns_records.put(stored.domain_name, stored.model_copy(deep=True))
+
+        return stored
+
+    def create_or_update_port(self, port: Port) -> Port:
+        key = f"{port.port_number}_{port.protocol}"
+        self._ports.invalidate(key)
+        stored = self._repository.create_or_update_port(port)
+        self._ports.put(key, stored.model_copy(deep=True))
+
+        return stored
+
+    def create_or_update_host(self, host: Host) -> Host:
+        self._hosts.invalidate(host.ip_address)
+        stored = self._repository.create_or_update_host(host)
+        self._hosts.put(stored.ip_address, stored.model_copy(deep=True))
+
+        return stored
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        for dns_record in dns_records:
+            self._dns_records.invalidate(dns_record.domain_name)
+
+        return self._repository.bulk_upsert_dns_records(dns_records)
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        for port in ports:
+            self._ports.invalidate(f"{port.port_number}_{port.protocol}")
+
+        return self._repository.bulk_upsert_ports(ports)
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        for host in hosts:
+            self._hosts.invalidate(host.ip_address)
+
+        return self._repository.bulk_upsert_hosts(hosts)
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        for link in links:
+            self._dns_records.invalidate(link.dns_record.domain_name)
+            self._ports.invalidate(f"{link.port.port_number}_{link.port.protocol}")
+
+        return self._repository.link_domain_ports(links)
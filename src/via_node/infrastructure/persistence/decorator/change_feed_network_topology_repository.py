@@ -0,0 +1,130 @@
+from typing import Callable, List, TypeVar
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_change import (
+    TopologyChange,
+    dns_record_change,
+    dns_record_discovery_change,
+    edge_change,
+    host_change,
+    port_change,
+    port_scan_result_change,
+)
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.domain.service.topology_change_feed import TopologyChangeSink
+from via_node.infrastructure.persistence.decorator.delegating_network_topology_repository import (
+    DelegatingNetworkTopologyRepository,
+)
+
+T = TypeVar("T")
+
+
+def _written(models: List[T], result: BulkWriteResult) -> List[T]:
+    failed = {error.index for error in result.errors}
+
+    return [model for index, model in enumerate(models) if index not in failed]
+
+
+def _link_changes(link: DomainPortLink) -> List[TopologyChange]:
+    return [dns_record_change(link.dns_record), port_change(link.port), edge_change(link.edge)]
+
+
+class ChangeFeedNetworkTopologyRepository(DelegatingNetworkTopologyRepository):
+    def __init__(self, repository: NetworkTopologyRepository, sink: TopologyChangeSink) -> None:
+        super().__init__(repository)
+        self._sink = sink
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        stored = self._repository.create_or_update_dns_record(dns_record)
+        self._sink.publish([dns_record_change(stored)])
+
+        return stored
+
+    def create_or_update_port(self, port: Port) -> Port:
+        stored = self._repository.create_or_update_port(port)
+        self._sink.publish([port_change(stored)])
+
+        return stored
+
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        stored = self._repository.create_edge(edge)
+        self._sink.publish([edge_change(stored)])
+
+        return stored
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        edges = self._repository.link_domain_ports(links)
+        self._sink.publish([change for link in links for change in _link_changes(link)])
+
+        return edges
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        stored = self._repository.create_edge_between_existing_vertices(edge)
+        self._sink.publish([edge_change(stored)])
+
+        return stored
+
+    def create_or_update_host(self, host: Host) -> Host:
+        stored = self._repository.create_or_update_host(host)
+        self._sink.publish([host_change(stored)])
+
+        return stored
+
+    def create_or_update_dns_record_discovery(self, dns_record_discovery: DnsRecordDiscovery) -> DnsRecordDiscovery:
+        stored = self._repository.create_or_update_dns_record_discovery(dns_record_discovery)
+        self._sink.publish([dns_record_discovery_change(stored)])
+
+        return stored
+
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        stored = self._repository.create_or_update_port_scan_result(port_scan_result)
+        self._sink.publish([port_scan_result_change(stored)])
+
+        return stored
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        result = self._repository.bulk_upsert_port_scan_results(port_scan_results)
+
+        return self._publish_written(port_scan_results, result, port_scan_result_change)
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        result = self._repository.bulk_upsert_dns_record_discoveries(dns_record_discoveries)
+
+        return self._publish_written(dns_record_discoveries, result, dns_record_discovery_change)
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        result = self._repository.bulk_upsert_dns_records(dns_records)
+
+        return self._publish_written(dns_records, result, dns_record_change)
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        result = self._repository.bulk_upsert_ports(ports)
+
+        return self._publish_written(ports, result, port_change)
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        result = self._repository.bulk_upsert_hosts(hosts)
+
+        return self._publish_written(hosts, result, host_change)
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        result = self._repository.bulk_create_edges(edges)
+
+        return self._publish_written(edges, result, edge_change)
+
+    def _publish_written(
+        self, models: List[T], result: BulkWriteResult, change: Callable[[T], TopologyChange]
+    ) -> BulkWriteResult:
+        changes = [change(model) for model in _written(models, result)]
+
+        if changes:
+            self._sink.publish(changes)
+
+        return result
@@ -0,0 +1,173 @@
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+
+class DelegatingNetworkTopologyRepository(NetworkTopologyRepository):
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    @property
+    def repository(self) -> NetworkTopologyRepository:
+        return self._repository
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        return self._repository.create_or_update_dns_record(dns_record)
+
+    def create_or_update_port(self, port: Port) -> Port:
+        return self._repository.create_or_update_port(port)
+
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        return self._repository.create_edge(edge)
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        return self._repository.link_domain_ports(links)
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        return self._repository.create_edge_between_existing_vertices(edge)
+
+    def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        return self._repository.get_dns_record(domain_name)
+
+    def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        return self._repository.get_port(port_number, protocol)
+
+    def create_or_update_host(self, host: Host) -> Host:
+        return self._repository.create_or_update_host(host)
+
+    def get_host(self, ip_address: str) -> Optional[Host]:
+        return self._repository.get_host(ip_address)
+
+    def create_or_update_dns_record_discovery(self, dns_record_discovery: DnsRecordDiscovery) -> DnsRecordDiscovery:
+        return self._repository.create_or_update_dns_record_discovery(dns_record_discovery)
+
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        return self._repository.get_dns_record_discoveries(domain_name, fields)
+
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
+        return self._repository.iter_dns_record_discoveries(domain_name, batch_size, fields, ttl)
+
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        return self._repository.create_or_update_port_scan_result(port_scan_result)
+
+    def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        return self._repository.get_port_scan_results(target_ip, fields)
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        return self._repository.iter_port_scan_results(target_ip, batch_size, fields, ttl)
+
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        return self._repository.get_port_scan_history(target_ip)
+
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        return self._repository.get_port_scan_state_at(target_ip, at)
+
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        return self._repository.compact_port_scan_history()
+
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        return self._repository.open_ports_per_service(limit)
+
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        return self._repository.hosts_per_open_port(limit)
+
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        return self._repository.record_types_per_domain(limit)
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        return self._repository.bulk_upsert_port_scan_results(port_scan_results)
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        return self._repository.bulk_upsert_dns_record_discoveries(dns_record_discoveries)
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        return self._repository.bulk_upsert_dns_records(dns_records)
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        return self._repository.bulk_upsert_ports(ports)
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        return self._repository.bulk_upsert_hosts(hosts)
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        return self._repository.bulk_create_edges(edges)
+
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        return self._repository.list_dns_records(page_size, page_token)
+
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        return self._repository.list_ports(page_size, page_token)
+
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        return self._repository.list_hosts(page_size, page_token)
+
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        return self._repository.list_dns_record_discoveries(page_size, page_token)
+
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        return self._repository.list_port_scan_results(page_size, page_token)
+
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        return self._repository.list_edges(edge_type, page_size, page_token)
+
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        return self._repository.neighbors(vertex, depth, direction, edge_types, limit)
+
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        return self._repository.shortest_path(source, target, max_depth, direction, edge_types)
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional, TypeVar
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+)
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncNetworkTopologyRepository(AsyncNetworkTopologyRepository):
+    def __init__(self, repository: NetworkTopologyRepository) -> None:
+        self._repository = repository
+
+    @property
+    def repository(self) -> NetworkTopologyRepository:
+        return self._repository
+
+    async def aclose(self) -> None:
+        close = getattr(self._repository, "close", None)
+
+        if close is not None:
+            await asyncio.to_thread(close)
+
+    async def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        return await asyncio.to_thread(self._repository.create_or_update_dns_record, dns_record)
+
+    async def create_or_update_port(self, port: Port) -> Port:
+        return await asyncio.to_thread(self._repository.create_or_update_port, port)
+
+    async def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        return await asyncio.to_thread(self._repository.create_edge, edge)
+
+    async def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        return await asyncio.to_thread(self._repository.link_domain_ports, links)
+
+    async def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        return await asyncio.to_thread(self._repository.create_edge_between_existing_vertices, edge)
+
+    async def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        return await asyncio.to_thread(self._repository.get_dns_record, domain_name)
+
+    async def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        return await asyncio.to_thread(self._repository.get_port, port_number, protocol)
+
+    async def create_or_update_host(self, host: Host) -> Host:
+        return await asyncio.to_thread(self._repository.create_or_update_host, host)
+
+    async def get_host(self, ip_address: str) -> Optional[Host]:
+        return await asyncio.to_thread(self._repository.get_host, ip_address)
+
+    async def create_or_update_dns_record_discovery(
+        self, dns_record_discovery: DnsRecordDiscovery
+    ) -> DnsRecordDiscovery:
+        return await asyncio.to_thread(self._repository.create_or_update_dns_record_discovery, dns_record_discovery)
+
+    async def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        return await asyncio.to_thread(self._repository.get_dns_record_discoveries, domain_name, fields)
+
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[DnsRecordDiscovery]:
+        return _batched(self._repository.iter_dns_record_discoveries(domain_name, batch_size, fields, ttl), batch_size)
+
+    async def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        return await asyncio.to_thread(self._repository.create_or_update_port_scan_result, port_scan_result)
+
+    async def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        return await asyncio.to_thread(self._repository.get_port_scan_results, target_ip, fields)
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> AsyncIterator[PortScanResult]:
+        return _batched(self._repository.iter_port_scan_results(target_ip, batch_size, fields, ttl), batch_size)
+
+    async def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        return await asyncio.to_thread(self._repository.get_port_scan_history, target_ip)
+
+    async def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        return await asyncio.to_thread(self._repository.get_port_scan_state_at, target_ip, at)
+
+    async def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        return await asyncio.to_thread(self._repository.compact_port_scan_history)
+
+    async def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        return await asyncio.to_thread(self._repository.open_ports_per_service, limit)
+
+    async def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        return await asyncio.to_thread(self._repository.hosts_per_open_port, limit)
+
+    async def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        return await asyncio.to_thread(self._repository.record_types_per_domain, limit)
+
+    async def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_upsert_port_scan_results, port_scan_results)
+
+    async def bulk_upsert_dns_record_discoveries(
+        self, dns_record_discoveries: List[DnsRecordDiscovery]
+    ) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_upsert_dns_record_discoveries, dns_record_discoveries)
+
+    async def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_upsert_dns_records, dns_records)
+
+    async def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_upsert_ports, ports)
+
+    async def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_upsert_hosts, hosts)
+
+    async def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        return await asyncio.to_thread(self._repository.bulk_create_edges, edges)
+
+    async def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        return await asyncio.to_thread(self._repository.list_dns_records, page_size, page_token)
+
+    async def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        return await asyncio.to_thread(self._repository.list_ports, page_size, page_token)
+
+    async def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        return await asyncio.to_thread(self._repository.list_hosts, page_size, page_token)
+
+    async def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        return await asyncio.to_thread(self._repository.list_dns_record_discoveries, page_size, page_token)
+
+    async def list_port_scan_results(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[PortScanResult]:
+        return await asyncio.to_thread(self._repository.list_port_scan_results, page_size, page_token)
+
+    async def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        return await asyncio.to_thread(self._repository.list_edges, edge_type, page_size, page_token)
+
+    async def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        return await asyncio.to_thread(self._repository.neighbors, vertex, depth, direction, edge_types, limit)
+
+    async def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        return await asyncio.to_thread(self._repository.shortest_path, source, target, max_depth, direction, edge_types)
+
+
+async def _batched(items: Iterator[T], batch_size: int) -> AsyncIterator[T]:
+    while batch := await asyncio.to_thread(list, islice(items, batch_size)):
+        for item in batch:
+            yield item
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+ValueType = TypeVar("ValueType")
+
+
+class CacheStatistics(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TtlLruCache(Generic[ValueType]):
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float,
+        negative_ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._capacity = capacity
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Optional[ValueType]]]" = OrderedDict()
+        self._statistics = CacheStatistics()
+
+    def get_or_load(self, key: str, load: Callable[[], Optional[ValueType]]) -> Optional[ValueType]:
+        found, value = self._lookup(key)
+
+        if found:
+            return value
+
+        value = load()
+        self.put(key, value)
+        return value
+
+    def put(self, key: str, value: Optional[ValueType]) -> None:
+        ttl = self._ttl if value is not None else self._negative_ttl
+
+        with self._lock:
+            if self._capacity <= 0 or ttl <= 0:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return self._statistics.model_copy(update={"size": len(self._entries)})
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[ValueType]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= self._clock():
+                self._entries.pop(key, None)
+                self._statistics.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._statistics.hits += 1
+            return True, entry[1]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self._statistics.evictions += 1
@@ -0,0 +1,15 @@
+from typing import Callable, Dict
+
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.sqlite.sqlite_network_topology_repository import (
+    SqliteNetworkTopologyRepository,
+)
+from via_node.shared.configuration import ApplicationSettings
+
+EMBEDDED_REPOSITORIES: Dict[str, Callable[[ApplicationSettings], NetworkTopologyRepository]] = {
+    "memory": lambda settings: InMemoryNetworkTopologyRepository(),
+    "sqlite": lambda settings: SqliteNetworkTopologyRepository(settings.sqlite_path, settings.sqlite_timeout),
+}
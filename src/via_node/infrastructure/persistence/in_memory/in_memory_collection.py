@@ -0,0 +1,50 @@
+from bisect import bisect_right, insort
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+from via_node.domain.model.page import Page
+from via_node.infrastructure.persistence.page_token import decode_page_token, encode_page_token, validate_page_size
+
+ItemType = TypeVar("ItemType")
+
+
+class InMemoryCollection(Generic[ItemType]):
+    def __init__(self, name: str, indexed_by: Optional[Callable[[ItemType], str]] = None) -> None:
+        self.name = name
+        self._documents: Dict[str, ItemType] = {}
+        self._sorted_keys: List[str] = []
+        self._indexed_by = indexed_by
+        self._index: Dict[str, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def put(self, key: str, item: ItemType) -> None:
+        if key not in self._documents:
+            insort(self._sorted_keys, key)
+            self._add_to_index(key, item)
+
+        self._documents[key] = item
+
+    def get(self, key: str) -> Optional[ItemType]:
+        return self._documents.get(key)
+
+    def values(self) -> List[ItemType]:
+        return list(self._documents.values())
+
+    def lookup(self, value: str) -> List[ItemType]:
+        return [self._documents[key] for key in self._index.get(value, {})]
+
+    def page(self, page_size: int, page_token: Optional[str]) -> Page[ItemType]:
+        validate_page_size(page_size)
+        start = bisect_right(self._sorted_keys, decode_page_token(self.name, page_token)) if page_token else 0
+        keys = self._sorted_keys[start : start + page_size + 1]
+        next_page_token = None
+
+        if len(keys) > page_size:
+            next_page_token = encode_page_token(self.name, keys[page_size - 1])
+
+        return Page(items=[self._documents[key] for key in keys[:page_size]], next_page_token=next_page_token)
+
+    def _add_to_index(self, key: str, item: ItemType) -> None:
+        if self._indexed_by is not None:
+            self._index.setdefault(self._indexed_by(item), {})[key] = None
@@ -0,0 +1,443 @@
+import threading
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+    domain_record_types,
+    port_exposures,
+    service_exposures,
+    validate_statistics_limit,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError, validate_edge_type
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import (
+    PortScanObservation,
+    ScanHistoryCompactionResult,
+    compact_series,
+)
+from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+    edge_endpoints,
+    selected_edge_types,
+    validate_traversal_depth,
+    validate_traversal_limit,
+)
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.in_memory.in_memory_collection import InMemoryCollection
+from via_node.infrastructure.persistence.projection import project
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+Step = Tuple[VertexReference, VertexReference, NetworkTopologyEdge]
+History = Dict[Tuple[int, str], List[PortScanObservation]]
+
+
+def _port_key(port_number: int, protocol: str) -> str:
+    return f"{port_number}_{protocol}"
+
+
+def _dns_record_discovery_key(dns_record_discovery: DnsRecordDiscovery) -> str:
+    return f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}"
+
+
+def _port_scan_result_key(port_scan_result: PortScanResult) -> str:
+    return f"{port_scan_result.target_ip}_{port_scan_result.protocol}_{port_scan_result.port_number}"
+
+
+def _first_observed_us(observation: PortScanObservation) -> int:
+    return epoch_microseconds(observation.first_observed_at)
+
+
+class InMemoryNetworkTopologyRepository(NetworkTopologyRepository):
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._dns_records: InMemoryCollection[DnsRecord] = InMemoryCollection("dns_records")
+        self._ports: InMemoryCollection[Port] = InMemoryCollection("ports")
+        self._hosts: InMemoryCollection[Host] = InMemoryCollection("hosts")
+        self._dns_record_discoveries: InMemoryCollection[DnsRecordDiscovery] = InMemoryCollection(
+            "dns_discoveries", indexed_by=lambda discovery: discovery.domain_name
+        )
+        self._port_scan_results: InMemoryCollection[PortScanResult] = InMemoryCollection(
+            "port_scan_results", indexed_by=lambda result: result.target_ip
+        )
+        self._port_scan_history: Dict[str, History] = {}
+        self._edges: Dict[str, InMemoryCollection[NetworkTopologyEdge]] = {
+            "domain_to_port": InMemoryCollection("domain_port_edges"),
+            "dns_resolves_to_host": InMemoryCollection("dns_resolves_to_host_edges"),
+        }
+        self._vertices: Dict[str, InMemoryCollection[Any]] = {
+            "dns_record": self._dns_records,
+            "host": self._hosts,
+            "port": self._ports,
+        }
+        self._outbound: Dict[str, Dict[str, str]] = {}
+        self._inbound: Dict[str, Dict[str, str]] = {}
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        with self._lock:
+            self._dns_records.put(dns_record.domain_name, dns_record)
+
+        return dns_record
+
+    def create_or_update_port(self, port: Port) -> Port:
+        with self._lock:
+            self._ports.put(_port_key(port.port_number, port.protocol), port)
+
+        return port
+
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        with self._lock:
+            self._upsert_edge(edge)
+
+        return edge
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        with self._lock:
+            for link in links:
+                self._touch(self._dns_records, link.dns_record.domain_name, link.dns_record)
+                self._touch(self._ports, _port_key(link.port.port_number, link.port.protocol), link.port)
+                self._upsert_edge(link.edge)
+
+        return [link.edge for link in links]
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        source, target = edge_endpoints(edge)
+
+        with self._lock:
+            source_found = self._vertex(source) is not None
+
+            if not (source_found and self._vertex(target) is not None):
+                raise VertexNotFoundError.for_edge(edge, source_found)
+
+            self._upsert_edge(edge)
+
+        return edge
+
+    def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        with self._lock:
+            return self._dns_records.get(domain_name)
+
+    def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        with self._lock:
+            return self._ports.get(_port_key(port_number, protocol))
+
+    def create_or_update_host(self, host: Host) -> Host:
+        with self._lock:
+            self._hosts.put(host.ip_address, host)
+
+        return host
+
+    def get_host(self, ip_address: str) -> Optional[Host]:
+        with self._lock:
+            return self._hosts.get(ip_address)
+
+    def create_or_update_dns_record_discovery(self, dns_record_discovery: DnsRecordDiscovery) -> DnsRecordDiscovery:
+        with self._lock:
+            self._dns_record_discoveries.put(_dns_record_discovery_key(dns_record_discovery), dns_record_discovery)
+
+        return dns_record_discovery
+
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        with self._lock:
+            return [project(discovery, fields) for discovery in self._dns_record_discoveries.lookup(domain_name)]
+
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
+        yield from self.get_dns_record_discoveries(domain_name, fields)
+
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        with self._lock:
+            self._port_scan_results.put(_port_scan_result_key(port_scan_result), port_scan_result)
+            self._record_observation(PortScanObservation.from_result(port_scan_result))
+
+        return port_scan_result
+
+    def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        with self._lock:
+            return [project(result, fields) for result in self._port_scan_results.lookup(target_ip)]
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        yield from self.get_port_scan_results(target_ip, fields)
+
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        with self._lock:
+            return [observation for _, series in self._history_of(target_ip) for observation in series]
+
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        with self._lock:
+            return [
+                series[position - 1]
+                for _, series in self._history_of(target_ip)
+                if (position := bisect_right(series, epoch_microseconds(at), key=_first_observed_us))
+            ]
+
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        validate_statistics_limit(limit)
+
+        with self._lock:
+            return service_exposures(self._port_scan_results.values(), limit)
+
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        validate_statistics_limit(limit)
+
+        with self._lock:
+            return port_exposures(self._port_scan_results.values(), limit)
+
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        validate_statistics_limit(limit)
+
+        with self._lock:
+            return domain_record_types(self._dns_record_discoveries.values(), limit)
+
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        result = ScanHistoryCompactionResult()
+
+        with self._lock:
+            for history in self._port_scan_history.values():
+                for series in history.values():
+                    self._compact_series(series, result)
+
+        return result
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        return self._bulk(port_scan_results, self.create_or_update_port_scan_result)
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        return self._bulk(dns_record_discoveries, self.create_or_update_dns_record_discovery)
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        return self._bulk(dns_records, self.create_or_update_dns_record)
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        return self._bulk(ports, self.create_or_update_port)
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        return self._bulk(hosts, self.create_or_update_host)
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        return self._bulk(edges, self.create_edge)
+
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        with self._lock:
+            return self._dns_records.page(page_size, page_token)
+
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        with self._lock:
+            return self._ports.page(page_size, page_token)
+
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        with self._lock:
+            return self._hosts.page(page_size, page_token)
+
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        with self._lock:
+            return self._dns_record_discoveries.page(page_size, page_token)
+
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        with self._lock:
+            return self._port_scan_results.page(page_size, page_token)
+
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        with self._lock:
+            return self._edges[validate_edge_type(edge_type)].page(page_size, page_token)
+
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        steps = self._breadth_first(vertex, validate_traversal_depth(depth), direction, selected_edge_types(edge_types))
+
+        with self._lock:
+            return [
+                TraversalVertex(vertex=neighbor, depth=level, attributes=self._attributes(neighbor))
+                for level, (neighbor, _, _) in islice(steps, validate_traversal_limit(limit))
+            ]
+
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        steps = self._breadth_first(
+            source, validate_traversal_depth(max_depth), direction, selected_edge_types(edge_types)
+        )
+
+        with self._lock:
+            if source == target and self._vertex(source) is not None:
+                return TraversalPath(vertices=[source], edges=[])
+
+            return self._find_path(source, target, steps)
+
+    def _bulk(self, models: List[ModelType], write: Callable[[ModelType], ModelType]) -> BulkWriteResult:
+        with self._lock:
+            for model in models:
+                write(model)
+
+        return BulkWriteResult(written=len(models))
+
+    def _record_observation(self, observation: PortScanObservation) -> None:
+        history = self._port_scan_history.setdefault(observation.target_ip, {})
+        series = history.setdefault((observation.port_number, observation.protocol), [])
+        first_observed_us = _first_observed_us(observation)
+        position = bisect_right(series, first_observed_us, key=_first_observed_us)
+
+        if position == 0 or _first_observed_us(series[position - 1]) != first_observed_us:
+            series.insert(position, observation)
+
+    def _compact_series(self, series: List[PortScanObservation], result: ScanHistoryCompactionResult) -> None:
+        intervals = compact_series(series)
+        series[:] = [interval for interval, _ in intervals]
+        result.rewritten += sum(1 for _, absorbed in intervals if absorbed)
+        result.removed += sum(len(absorbed) for _, absorbed in intervals)
+
+    def _history_of(self, target_ip: str) -> List[Tuple[Tuple[int, str], List[PortScanObservation]]]:
+        return sorted(self._port_scan_history.get(target_ip, {}).items())
+
+    def _touch(self, collection: InMemoryCollection[Any], key: str, vertex: Any) -> None:
+        existing = collection.get(key)
+
+        collection.put(
+            key, vertex if existing is None else existing.model_copy(update={"updated_at": vertex.updated_at})
+        )
+
+    def _upsert_edge(self, edge: NetworkTopologyEdge) -> None:
+        collection = self._edges[validate_edge_type(edge.edge_type)]
+        existing = collection.get(edge.key)
+        last_seen_at = edge.last_seen_at or edge.created_at
+
+        if existing is None:
+            collection.put(edge.key, edge.model_copy(update={"last_seen_at": last_seen_at}))
+            self._link(edge)
+        else:
+            collection.put(
+                edge.key, existing.model_copy(update={"last_seen_at": last_seen_at, "metadata": edge.metadata})
+            )
+
+    def _link(self, edge: NetworkTopologyEdge) -> None:
+        source, target = edge_endpoints(edge)
+
+        self._outbound.setdefault(str(source), {})[edge.key] = edge.edge_type
+        self._inbound.setdefault(str(target), {})[edge.key] = edge.edge_type
+
+    def _vertex(self, vertex: VertexReference) -> Optional[BaseModel]:
+        return self._vertices[vertex.kind].get(vertex.key)
+
+    def _attributes(self, vertex: VertexReference) -> Dict[str, Any]:
+        return self._vertex(vertex).model_dump(mode="json")  # type: ignore[union-attr]
+
+    def _adjacent(
+        self, vertex: VertexReference, direction: TraversalDirection, edge_types: List[str]
+    ) -> Iterator[Tuple[NetworkTopologyEdge, VertexReference]]:
+        if direction != TraversalDirection.INBOUND:
+            for edge in self._incident_edges(self._outbound, vertex, edge_types):
+                yield edge, edge_endpoints(edge)[1]
+
+        if direction != TraversalDirection.OUTBOUND:
+            for edge in self._incident_edges(self._inbound, vertex, edge_types):
+                yield edge, edge_endpoints(edge)[0]
+
+    def _incident_edges(
+        self, adjacency: Dict[str, Dict[str, str]], vertex: VertexReference, edge_types: List[str]
+    ) -> List[NetworkTopologyEdge]:
+        return [
+            self._edges[edge_type].get(key)  # type: ignore[misc]
+            for key, edge_type in adjacency.get(str(vertex), {}).items()
+            if edge_type in edge_types
+        ]
+
+    def _breadth_first(
+        self, start: VertexReference, max_depth: int, direction: TraversalDirection, edge_types: List[str]
+    ) -> Iterator[Tuple[int, Step]]:
+        visited = {str(start)}
+        frontier = [start] if self._vertex(start) is not None else []
+
+        for level in range(1, max_depth + 1):
+            discovered = self._expand(frontier, direction, edge_types, visited)
+            frontier = [neighbor for neighbor, _, _ in discovered]
+
+            yield from ((level, step) for step in discovered)
+
+    def _expand(
+        self, frontier: List[VertexReference], direction: TraversalDirection, edge_types: List[str], visited: set
+    ) -> List[Step]:
+        discovered: List[Step] = []
+
+        for vertex in frontier:
+            for edge, neighbor in self._adjacent(vertex, direction, edge_types):
+                if str(neighbor) not in visited and self._vertex(neighbor) is not None:
+                    visited.add(str(neighbor))
+                    discovered.append((neighbor, vertex, edge))
+
+        return discovered
+
+    def _find_path(
+        self, source: VertexReference, target: VertexReference, steps: Iterator[Tuple[int, Step]]
+    ) -> Optional[TraversalPath]:
+        parents: Dict[str, Tuple[VertexReference, NetworkTopologyEdge]] = {}
+
+        for _, (neighbor, parent, edge) in steps:
+            parents[str(neighbor)] = (parent, edge)
+
+            if neighbor == target:
+                return self._path(source, target, parents)
+
+        return None
+
+    def _path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        parents: Dict[str, Tuple[VertexReference, NetworkTopologyEdge]],
+    ) -> TraversalPath:
+        vertices = [target]
+        edges: List[NetworkTopologyEdge] = []
+
+        while vertices[-1] != source:
+            parent, edge = parents[str(vertices[-1])]
+            vertices.append(parent)
+            edges.append(edge)
+
+        return TraversalPath(vertices=vertices[::-1], edges=edges[::-1])
@@ -0,0 +1,27 @@
+import base64
+import json
+
+from via_node.domain.model.page import InvalidPageTokenError
+
+
+def encode_page_token(collection_name: str, last_key: str) -> str:
+    payload = json.dumps({"c": collection_name, "k": last_key}, separators=(",", ":")).encode("utf-8")
+
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_page_token(collection_name: str, page_token: str) -> str:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(page_token + "=" * (-len(page_token) % 4)))
+    except ValueError as error:
+        raise InvalidPageTokenError("Page token is malformed") from error
+
+    if not isinstance(payload, dict) or payload.get("c") != collection_name or not isinstance(payload.get("k"), str):
+        raise InvalidPageTokenError(f"Page token does not belong to {collection_name}")
+
+    return str(payload["k"])
+
+
+def validate_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError("Page size must be at least 1")
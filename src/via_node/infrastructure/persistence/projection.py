@@ -0,0 +1,20 @@
+from typing import List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def projected_fields(model_class: Type[BaseModel], fields: List[str]) -> List[str]:
+    unknown = [field for field in fields if field not in model_class.model_fields]
+    if unknown:
+        raise ValueError(f"Invalid projected field(s) {unknown}, must be one of {list(model_class.model_fields)}")
+
+    return fields
+
+
+def project(model: ModelType, fields: Optional[List[str]]) -> ModelType:
+    if not fields:
+        return model
+
+    return type(model).model_construct(**{name: getattr(model, name) for name in projected_fields(type(model), fields)})
@@ -0,0 +1,518 @@
+import json
+import threading
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from via_node.domain.model.bulk_write_result import BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import (
+    DEFAULT_STATISTICS_LIMIT,
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+    validate_statistics_limit,
+)
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError, validate_edge_type
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import (
+    PortScanObservation,
+    ScanHistoryCompactionResult,
+    compact_history,
+)
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.domain.model.topology_traversal import (
+    MAX_TRAVERSAL_DEPTH,
+    TraversalDirection,
+    TraversalPath,
+    TraversalVertex,
+    VertexReference,
+    edge_endpoints,
+    selected_edge_types,
+    validate_traversal_depth,
+    validate_traversal_limit,
+)
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.page_token import decode_page_token, encode_page_token, validate_page_size
+from via_node.infrastructure.persistence.projection import project
+from via_node.infrastructure.persistence.sqlite.sqlite_schema import open_connection, open_read_connection
+from via_node.infrastructure.persistence.sqlite.sqlite_traversal import (
+    distances_query,
+    neighbors_query,
+    predecessors_query,
+)
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+Row = Tuple[Any, ...]
+
+EDGE_COLLECTIONS = {"domain_to_port": "domain_port_edges", "dns_resolves_to_host": "dns_resolves_to_host_edges"}
+
+UPSERT_VERTEX = """
+    INSERT INTO vertices (vertex, kind, key, document) VALUES (?, ?, ?, ?)
+    ON CONFLICT (vertex) DO UPDATE SET document = excluded.document
+"""
+TOUCH_VERTEX = """
+    INSERT INTO vertices (vertex, kind, key, document) VALUES (?, ?, ?, ?)
+    ON CONFLICT (vertex) DO UPDATE
+    SET document = json_set(vertices.document, '$.updated_at', json_extract(excluded.document, '$.updated_at'))
+"""
+UPSERT_DNS_DISCOVERY = """
+    INSERT INTO dns_discoveries (domain_name, key, document) VALUES (?, ?, ?)
+    ON CONFLICT (domain_name, key) DO UPDATE SET document = excluded.document
+"""
+UPSERT_PORT_SCAN_RESULT = """
+    INSERT INTO port_scan_results (target_ip, key, document) VALUES (?, ?, ?)
+    ON CONFLICT (target_ip, key) DO UPDATE SET document = excluded.document
+"""
+INSERT_OBSERVATION = """
+    INSERT INTO port_scan_history (target_ip, port_number, protocol, first_observed_at, first_observed_us, document)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (target_ip, port_number, protocol, first_observed_at) DO NOTHING
+"""
+REPLACE_OBSERVATION = """
+    INSERT INTO port_scan_history (target_ip, port_number, protocol, first_observed_at, first_observed_us, document)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (target_ip, port_number, protocol, first_observed_at) DO UPDATE SET document = excluded.document
+"""
+DELETE_OBSERVATION = """
+    DELETE FROM port_scan_history WHERE target_ip = ? AND port_number = ? AND protocol = ? AND first_observed_at = ?
+"""
+UPSERT_EDGE = """
+    INSERT INTO edges (key, edge_type, source_vertex, target_vertex, document) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET document = json_set(
+        edges.document,
+        '$.last_seen_at', json_extract(excluded.document, '$.last_seen_at'),
+        '$.metadata', json(json_extract(excluded.document, '$.metadata'))
+    )
+"""
+SELECT_VERTEX = "SELECT document FROM vertices WHERE vertex = ?"
+SELECT_DNS_DISCOVERIES = "SELECT document FROM dns_discoveries WHERE domain_name = ? ORDER BY key"
+SELECT_PORT_SCAN_RESULTS = "SELECT document FROM port_scan_results WHERE target_ip = ? ORDER BY key"
+SELECT_PORT_SCAN_HISTORY = """
+    SELECT document FROM port_scan_history WHERE target_ip = ? ORDER BY port_number, protocol, first_observed_at
+"""
+SELECT_PORT_SCAN_STATE_AT = """
+    SELECT document, MAX(first_observed_us) FROM port_scan_history
+    WHERE target_ip = ? AND first_observed_us <= ?
+    GROUP BY port_number, protocol
+    ORDER BY port_number, protocol
+"""
+SELECT_ALL_PORT_SCAN_HISTORY = """
+    SELECT document FROM port_scan_history ORDER BY target_ip, port_number, protocol, first_observed_at
+"""
+OPEN_PORTS_PER_SERVICE = """
+    SELECT json_extract(document, '$.service_name') AS service_name, COUNT(*) AS open_ports,
+        COUNT(DISTINCT target_ip) AS hosts
+    FROM port_scan_results WHERE json_extract(document, '$.state') = ?
+    GROUP BY service_name
+    ORDER BY open_ports DESC, service_name
+    LIMIT ?
+"""
+HOSTS_PER_OPEN_PORT = """
+    SELECT json_extract(document, '$.port_number') AS port_number, json_extract(document, '$.protocol') AS protocol,
+        COUNT(*) AS hosts
+    FROM port_scan_results WHERE json_extract(document, '$.state') = ?
+    GROUP BY port_number, protocol
+    ORDER BY hosts DESC, port_number, protocol
+    LIMIT ?
+"""
+RECORD_TYPES_PER_DOMAIN = """
+    SELECT domain_name, json_group_array(DISTINCT json_extract(document, '$.record_type')) AS record_types
+    FROM dns_discoveries
+    GROUP BY domain_name
+    ORDER BY domain_name
+    LIMIT ?
+"""
+LIST_VERTICES = "SELECT key, document FROM vertices WHERE kind = ? AND key > ? ORDER BY kind, key LIMIT ?"
+LIST_DNS_DISCOVERIES = "SELECT key, document FROM dns_discoveries WHERE key > ? ORDER BY key LIMIT ?"
+LIST_PORT_SCAN_RESULTS = "SELECT key, document FROM port_scan_results WHERE key > ? ORDER BY key LIMIT ?"
+LIST_EDGES = "SELECT key, document FROM edges WHERE edge_type = ? AND key > ? ORDER BY edge_type, key LIMIT ?"
+
+
+def _port_key(port_number: int, protocol: str) -> str:
+    return f"{port_number}_{protocol}"
+
+
+def _vertex_row(kind: str, key: str, vertex: BaseModel) -> Row:
+    return (f"{kind}:{key}", kind, key, vertex.model_dump_json())
+
+
+def _dns_record_row(dns_record: DnsRecord) -> Row:
+    return _vertex_row("dns_record", dns_record.domain_name, dns_record)
+
+
+def _port_row(port: Port) -> Row:
+    return _vertex_row("port", _port_key(port.port_number, port.protocol), port)
+
+
+def _host_row(host: Host) -> Row:
+    return _vertex_row("host", host.ip_address, host)
+
+
+def _dns_record_discovery_row(dns_record_discovery: DnsRecordDiscovery) -> Row:
+    key = f"{dns_record_discovery.domain_name}_{dns_record_discovery.record_type.value}"
+
+    return (dns_record_discovery.domain_name, key, dns_record_discovery.model_dump_json())
+
+
+def _port_scan_result_row(port_scan_result: PortScanResult) -> Row:
+    key = f"{port_scan_result.target_ip}_{port_scan_result.protocol}_{port_scan_result.port_number}"
+
+    return (port_scan_result.target_ip, key, port_scan_result.model_dump_json())
+
+
+def _observation_row(observation: PortScanObservation) -> Row:
+    return (
+        *_observation_key(observation),
+        epoch_microseconds(observation.first_observed_at),
+        observation.model_dump_json(),
+    )
+
+
+def _observation_key(observation: PortScanObservation) -> Row:
+    return (
+        observation.target_ip,
+        observation.port_number,
+        observation.protocol,
+        observation.first_observed_at.isoformat(),
+    )
+
+
+def _edge_row(edge: NetworkTopologyEdge) -> Row:
+    source, target = edge_endpoints(edge)
+    document = edge.model_copy(update={"last_seen_at": edge.last_seen_at or edge.created_at})
+
+    return (edge.key, edge.edge_type, str(source), str(target), document.model_dump_json())
+
+
+class SqliteNetworkTopologyRepository(NetworkTopologyRepository):
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._lock = threading.RLock()
+        self._connection = open_connection(path, timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def create_or_update_dns_record(self, dns_record: DnsRecord) -> DnsRecord:
+        self._write(UPSERT_VERTEX, [_dns_record_row(dns_record)])
+
+        return dns_record
+
+    def create_or_update_port(self, port: Port) -> Port:
+        self._write(UPSERT_VERTEX, [_port_row(port)])
+
+        return port
+
+    def create_edge(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        self._write(UPSERT_EDGE, [_edge_row(edge)])
+
+        return edge
+
+    def link_domain_ports(self, links: List[DomainPortLink]) -> List[NetworkTopologyEdge]:
+        with self._lock, self._connection:
+            self._connection.executemany(TOUCH_VERTEX, [_dns_record_row(link.dns_record) for link in links])
+            self._connection.executemany(TOUCH_VERTEX, [_port_row(link.port) for link in links])
+            self._connection.executemany(UPSERT_EDGE, [_edge_row(link.edge) for link in links])
+
+        return [link.edge for link in links]
+
+    def create_edge_between_existing_vertices(self, edge: NetworkTopologyEdge) -> NetworkTopologyEdge:
+        source, target = edge_endpoints(edge)
+
+        with self._lock, self._connection:
+            source_found = self._document(SELECT_VERTEX, (str(source),)) is not None
+
+            if not (source_found and self._document(SELECT_VERTEX, (str(target),)) is not None):
+                raise VertexNotFoundError.for_edge(edge, source_found)
+
+            self._connection.execute(UPSERT_EDGE, _edge_row(edge))
+
+        return edge
+
+    def get_dns_record(self, domain_name: str) -> Optional[DnsRecord]:
+        return self._get(DnsRecord, f"dns_record:{domain_name}")
+
+    def get_port(self, port_number: int, protocol: str) -> Optional[Port]:
+        return self._get(Port, f"port:{_port_key(port_number, protocol)}")
+
+    def create_or_update_host(self, host: Host) -> Host:
+        self._write(UPSERT_VERTEX, [_host_row(host)])
+
+        return host
+
+    def get_host(self, ip_address: str) -> Optional[Host]:
+        return self._get(Host, f"host:{ip_address}")
+
+    def create_or_update_dns_record_discovery(self, dns_record_discovery: DnsRecordDiscovery) -> DnsRecordDiscovery:
+        self._write(UPSERT_DNS_DISCOVERY, [_dns_record_discovery_row(dns_record_discovery)])
+
+        return dns_record_discovery
+
+    def get_dns_record_discoveries(
+        self, domain_name: str, fields: Optional[List[str]] = None
+    ) -> List[DnsRecordDiscovery]:
+        return list(self.iter_dns_record_discoveries(domain_name, fields=fields))
+
+    def iter_dns_record_discoveries(
+        self,
+        domain_name: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[DnsRecordDiscovery]:
+        for (document,) in self._stream(SELECT_DNS_DISCOVERIES, (domain_name,), batch_size):
+            yield project(DnsRecordDiscovery.model_validate_json(document), fields)
+
+    def create_or_update_port_scan_result(self, port_scan_result: PortScanResult) -> PortScanResult:
+        self._write_port_scan_results([port_scan_result])
+
+        return port_scan_result
+
+    def get_port_scan_results(self, target_ip: str, fields: Optional[List[str]] = None) -> List[PortScanResult]:
+        return list(self.iter_port_scan_results(target_ip, fields=fields))
+
+    def iter_port_scan_results(
+        self,
+        target_ip: str,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Iterator[PortScanResult]:
+        for (document,) in self._stream(SELECT_PORT_SCAN_RESULTS, (target_ip,), batch_size):
+            yield project(PortScanResult.model_validate_json(document), fields)
+
+    def get_port_scan_history(self, target_ip: str) -> List[PortScanObservation]:
+        return self._observations(SELECT_PORT_SCAN_HISTORY, (target_ip,))
+
+    def get_port_scan_state_at(self, target_ip: str, at: datetime) -> List[PortScanObservation]:
+        return self._observations(SELECT_PORT_SCAN_STATE_AT, (target_ip, epoch_microseconds(at)))
+
+    def open_ports_per_service(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[ServiceExposure]:
+        rows = self._rows(OPEN_PORTS_PER_SERVICE, (PortState.OPEN.value, validate_statistics_limit(limit)))
+
+        return [
+            ServiceExposure(service_name=service_name, open_ports=open_ports, hosts=hosts)
+            for service_name, open_ports, hosts in rows
+        ]
+
+    def hosts_per_open_port(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[PortExposure]:
+        rows = self._rows(HOSTS_PER_OPEN_PORT, (PortState.OPEN.value, validate_statistics_limit(limit)))
+
+        return [
+            PortExposure(port_number=port_number, protocol=protocol, hosts=hosts)
+            for port_number, protocol, hosts in rows
+        ]
+
+    def record_types_per_domain(self, limit: int = DEFAULT_STATISTICS_LIMIT) -> List[DomainRecordTypes]:
+        rows = self._rows(RECORD_TYPES_PER_DOMAIN, (validate_statistics_limit(limit),))
+
+        return [
+            DomainRecordTypes(domain_name=domain_name, record_types=sorted(json.loads(record_types)))
+            for domain_name, record_types in rows
+        ]
+
+    def compact_port_scan_history(self) -> ScanHistoryCompactionResult:
+        with self._lock, self._connection:
+            intervals = list(compact_history(self._observations(SELECT_ALL_PORT_SCAN_HISTORY, ())))
+            absorbed = [_observation_key(observation) for _, observations in intervals for observation in observations]
+
+            self._connection.executemany(REPLACE_OBSERVATION, [_observation_row(interval) for interval, _ in intervals])
+            self._connection.executemany(DELETE_OBSERVATION, absorbed)
+
+        return ScanHistoryCompactionResult(rewritten=len(intervals), removed=len(absorbed))
+
+    def bulk_upsert_port_scan_results(self, port_scan_results: List[PortScanResult]) -> BulkWriteResult:
+        self._write_port_scan_results(port_scan_results)
+
+        return BulkWriteResult(written=len(port_scan_results))
+
+    def bulk_upsert_dns_record_discoveries(self, dns_record_discoveries: List[DnsRecordDiscovery]) -> BulkWriteResult:
+        return self._bulk(
+            UPSERT_DNS_DISCOVERY, [_dns_record_discovery_row(discovery) for discovery in dns_record_discoveries]
+        )
+
+    def bulk_upsert_dns_records(self, dns_records: List[DnsRecord]) -> BulkWriteResult:
+        return self._bulk(UPSERT_VERTEX, [_dns_record_row(dns_record) for dns_record in dns_records])
+
+    def bulk_upsert_ports(self, ports: List[Port]) -> BulkWriteResult:
+        return self._bulk(UPSERT_VERTEX, [_port_row(port) for port in ports])
+
+    def bulk_upsert_hosts(self, hosts: List[Host]) -> BulkWriteResult:
+        return self._bulk(UPSERT_VERTEX, [_host_row(host) for host in hosts])
+
+    def bulk_create_edges(self, edges: List[NetworkTopologyEdge]) -> BulkWriteResult:
+        return self._bulk(UPSERT_EDGE, [_edge_row(edge) for edge in edges])
+
+    def list_dns_records(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[DnsRecord]:
+        return self._page("dns_records", LIST_VERTICES, ("dns_record",), page_size, page_token, DnsRecord)
+
+    def list_ports(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Port]:
+        return self._page("ports", LIST_VERTICES, ("port",), page_size, page_token, Port)
+
+    def list_hosts(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[Host]:
+        return self._page("hosts", LIST_VERTICES, ("host",), page_size, page_token, Host)
+
+    def list_dns_record_discoveries(
+        self, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[DnsRecordDiscovery]:
+        return self._page("dns_discoveries", LIST_DNS_DISCOVERIES, (), page_size, page_token, DnsRecordDiscovery)
+
+    def list_port_scan_results(self, page_size: int = 100, page_token: Optional[str] = None) -> Page[PortScanResult]:
+        return self._page("port_scan_results", LIST_PORT_SCAN_RESULTS, (), page_size, page_token, PortScanResult)
+
+    def list_edges(
+        self, edge_type: str, page_size: int = 100, page_token: Optional[str] = None
+    ) -> Page[NetworkTopologyEdge]:
+        edge_type = validate_edge_type(edge_type)
+
+        return self._page(
+            EDGE_COLLECTIONS[edge_type], LIST_EDGES, (edge_type,), page_size, page_token, NetworkTopologyEdge
+        )
+
+    def neighbors(
+        self,
+        vertex: VertexReference,
+        depth: int = 1,
+        direction: TraversalDirection = TraversalDirection.OUTBOUND,
+        edge_types: Optional[List[str]] = None,
+        limit: int = 1000,
+    ) -> List[TraversalVertex]:
+        parameters = {
+            "start": str(vertex),
+            "depth": validate_traversal_depth(depth),
+            "edge_types": json.dumps(selected_edge_types(edge_types)),
+            "limit": validate_traversal_limit(limit),
+        }
+
+        with self._lock:
+            rows = self._connection.execute(neighbors_query(direction), parameters).fetchall()
+
+        return [
+            TraversalVertex(vertex=VertexReference.parse(neighbor), depth=level, attributes=json.loads(document))
+            for neighbor, level, document in rows
+        ]
+
+    def shortest_path(
+        self,
+        source: VertexReference,
+        target: VertexReference,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: TraversalDirection = TraversalDirection.ANY,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[TraversalPath]:
+        selected = json.dumps(selected_edge_types(edge_types))
+        parameters = {"start": str(source), "depth": validate_traversal_depth(max_depth), "edge_types": selected}
+
+        with self._lock:
+            distances = dict(self._connection.execute(distances_query(direction), parameters).fetchall())
+
+            if str(target) not in distances:
+                return None
+
+            return self._walk_back(target, distances, direction, selected)
+
+    def _write_port_scan_results(self, port_scan_results: List[PortScanResult]) -> None:
+        observations = [PortScanObservation.from_result(result) for result in port_scan_results]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                UPSERT_PORT_SCAN_RESULT, [_port_scan_result_row(result) for result in port_scan_results]
+            )
+            self._connection.executemany(
+                INSERT_OBSERVATION, [_observation_row(observation) for observation in observations]
+            )
+
+    def _observations(self, statement: str, parameters: Sequence[Any]) -> List[PortScanObservation]:
+        return [PortScanObservation.model_validate_json(row[0]) for row in self._rows(statement, parameters)]
+
+    def _rows(self, statement: str, parameters: Sequence[Any]) -> List[Row]:
+        with self._lock:
+            return self._connection.execute(statement, parameters).fetchall()
+
+    def _write(self, statement: str, rows: List[Row]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(statement, rows)
+
+    def _bulk(self, statement: str, rows: List[Row]) -> BulkWriteResult:
+        self._write(statement, rows)
+
+        return BulkWriteResult(written=len(rows))
+
+    def _document(self, statement: str, parameters: Sequence[Any]) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(statement, parameters).fetchone()
+
+        return None if row is None else str(row[0])
+
+    def _get(self, model_class: Type[ModelType], vertex: str) -> Optional[ModelType]:
+        document = self._document(SELECT_VERTEX, (vertex,))
+
+        return None if document is None else model_class.model_validate_json(document)
+
+    def _stream(self, statement: str, parameters: Sequence[Any], batch_size: int) -> Iterator[Row]:
+        with closing(open_read_connection(self._path, self._timeout)) as connection:
+            cursor = connection.execute(statement, parameters)
+
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+
+    def _page(
+        self,
+        collection_name: str,
+        statement: str,
+        parameters: Tuple[Any, ...],
+        page_size: int,
+        page_token: Optional[str],
+        model_class: Type[ModelType],
+    ) -> Page[ModelType]:
+        validate_page_size(page_size)
+        after = decode_page_token(collection_name, page_token) if page_token else ""
+
+        with self._lock:
+            rows = self._connection.execute(statement, (*parameters, after, page_size + 1)).fetchall()
+
+        next_page_token = encode_page_token(collection_name, rows[page_size - 1][0]) if len(rows) > page_size else None
+
+        return Page(
+            items=[model_class.model_validate_json(document) for _, document in rows[:page_size]],
+            next_page_token=next_page_token,
+        )
+
+    def _walk_back(
+        self, target: VertexReference, distances: Dict[str, int], direction: TraversalDirection, edge_types: str
+    ) -> TraversalPath:
+        vertices = [str(target)]
+        edges: List[NetworkTopologyEdge] = []
+
+        for depth in range(distances[str(target)], 0, -1):
+            origin, document = self._predecessor(vertices[-1], depth - 1, distances, direction, edge_types)
+            vertices.append(origin)
+            edges.append(NetworkTopologyEdge.model_validate_json(document))
+
+        return TraversalPath(
+            vertices=[VertexReference.parse(vertex) for vertex in reversed(vertices)], edges=edges[::-1]
+        )
+
+    def _predecessor(
+        self,
+        vertex: str,
+        depth: int,
+        distances: Dict[str, int],
+        direction: TraversalDirection,
+        edge_types: str,
+    ) -> Tuple[str, str]:
+        rows = self._connection.execute(
+            predecessors_query(direction), {"vertex": vertex, "edge_types": edge_types}
+        ).fetchall()
+
+        return next((origin, document) for origin, document in rows if distances.get(origin) == depth)
@@ -0,0 +1,101 @@
+import sqlite3
+from datetime import datetime
+
+from via_node.domain.model.timestamp import epoch_microseconds
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+)
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS vertices (
+        vertex TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        document TEXT NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS vertices_by_kind ON vertices (kind, key);
+
+    CREATE TABLE IF NOT EXISTS dns_discoveries (
+        domain_name TEXT NOT NULL,
+        key TEXT NOT NULL,
+        document TEXT NOT NULL,
+        PRIMARY KEY (domain_name, key)
+    ) WITHOUT ROWID;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS dns_discoveries_by_key ON dns_discoveries (key);
+
+    CREATE TABLE IF NOT EXISTS port_scan_results (
+        target_ip TEXT NOT NULL,
+        key TEXT NOT NULL,
+        document TEXT NOT NULL,
+        PRIMARY KEY (target_ip, key)
+    ) WITHOUT ROWID;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS port_scan_results_by_key ON port_scan_results (key);
+
+    CREATE TABLE IF NOT EXISTS port_scan_history (
+        target_ip TEXT NOT NULL,
+        port_number INTEGER NOT NULL,
+        protocol TEXT NOT NULL,
+        first_observed_at TEXT NOT NULL,
+        first_observed_us INTEGER,
+        document TEXT NOT NULL,
+        PRIMARY KEY (target_ip, port_number, protocol, first_observed_at)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS edges (
+        key TEXT PRIMARY KEY,
+        edge_type TEXT NOT NULL,
+        source_vertex TEXT NOT NULL,
+        target_vertex TEXT NOT NULL,
+        document TEXT NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS edges_by_type ON edges (edge_type, key);
+    CREATE INDEX IF NOT EXISTS edges_by_source ON edges (source_vertex, edge_type, target_vertex);
+    CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target_vertex, edge_type, source_vertex);
+"""
+
+HISTORY_COLUMNS = "PRAGMA table_info(port_scan_history)"
+ADD_OBSERVATION_EPOCH = "ALTER TABLE port_scan_history ADD COLUMN first_observed_us INTEGER"
+SELECT_OBSERVATION_TIMES = "SELECT DISTINCT first_observed_at FROM port_scan_history"
+SET_OBSERVATION_EPOCH = "UPDATE port_scan_history SET first_observed_us = ? WHERE first_observed_at = ?"
+QUERY_ONLY = "PRAGMA query_only = ON"
+
+
+def open_connection(path: str, timeout: float) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+
+    for pragma in PRAGMAS:
+        connection.execute(pragma)
+
+    connection.executescript(SCHEMA)
+    _add_observation_epoch(connection)
+
+    return connection
+
+
+def open_read_connection(path: str, timeout: float) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+    connection.execute(QUERY_ONLY)
+
+    return connection
+
+
+def _add_observation_epoch(connection: sqlite3.Connection) -> None:
+    if "first_observed_us" in {column[1] for column in connection.execute(HISTORY_COLUMNS)}:
+        return
+
+    with connection:
+        connection.execute(ADD_OBSERVATION_EPOCH)
+        connection.executemany(
+            SET_OBSERVATION_EPOCH,
+            [
+                (epoch_microseconds(datetime.fromisoformat(first_observed_at)), first_observed_at)
+                for (first_observed_at,) in connection.execute(SELECT_OBSERVATION_TIMES).fetchall()
+            ],
+        )
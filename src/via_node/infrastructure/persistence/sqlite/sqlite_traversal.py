@@ -0,0 +1,67 @@
+from typing import Dict, List, Tuple
+
+from via_node.domain.model.topology_traversal import TraversalDirection
+
+EDGE_TYPE_FILTER = "edges.edge_type IN (SELECT value FROM json_each(:edge_types))"
+
+ENDPOINTS: Dict[TraversalDirection, List[Tuple[str, str]]] = {
+    TraversalDirection.OUTBOUND: [("source_vertex", "target_vertex")],
+    TraversalDirection.INBOUND: [("target_vertex", "source_vertex")],
+    TraversalDirection.ANY: [("source_vertex", "target_vertex"), ("target_vertex", "source_vertex")],
+}
+
+
+def _step(origin: str, destination: str) -> str:
+    return f"""
+        SELECT edges.{destination}, steps.depth + 1
+        FROM steps
+        JOIN edges ON edges.{origin} = steps.vertex
+        JOIN vertices ON vertices.vertex = edges.{destination}
+        WHERE steps.depth < :depth AND {EDGE_TYPE_FILTER}
+    """
+
+
+def _steps_query(direction: TraversalDirection) -> str:
+    steps = " UNION ".join(_step(origin, destination) for origin, destination in ENDPOINTS[direction])
+
+    return f"""
+        WITH RECURSIVE steps(vertex, depth) AS (
+            SELECT vertex, 0 FROM vertices WHERE vertex = :start
+            UNION
+            {steps}
+        )
+    """
+
+
+def neighbors_query(direction: TraversalDirection) -> str:
+    return f"""
+        {_steps_query(direction)}
+        SELECT steps.vertex, MIN(steps.depth) AS depth, vertices.document
+        FROM steps
+        JOIN vertices ON vertices.vertex = steps.vertex
+        WHERE steps.vertex != :start
+        GROUP BY steps.vertex
+        ORDER BY depth, steps.vertex
+        LIMIT :limit
+    """
+
+
+def distances_query(direction: TraversalDirection) -> str:
+    return f"""
+        {_steps_query(direction)}
+        SELECT vertex, MIN(depth) FROM steps GROUP BY vertex
+    """
+
+
+def _predecessor(origin: str, destination: str) -> str:
+    return f"""
+        SELECT edges.{origin} AS origin, edges.key AS key, edges.document AS document
+        FROM edges
+        WHERE edges.{destination} = :vertex AND {EDGE_TYPE_FILTER}
+    """
+
+
+def predecessors_query(direction: TraversalDirection) -> str:
+    predecessors = " UNION ALL ".join(_predecessor(origin, destination) for origin, destination in ENDPOINTS[direction])
+
+    return f"SELECT origin, document FROM ({predecessors}) ORDER BY origin, key"
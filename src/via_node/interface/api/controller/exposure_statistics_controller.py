@@ -0,0 +1,54 @@
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPBasicCredentials
+
+from lagom import Container
+
+from via_node.application.use_case.exposure_statistics_use_case import AsyncExposureStatisticsUseCase
+from via_node.domain.model.exposure_statistics import DEFAULT_STATISTICS_LIMIT
+from via_node.interface.api.data_transfer_object.exposure_statistics_data_transfer_object import (
+    ExposureStatisticsApiResponseDataTransferObject,
+)
+
+
+class ExposureStatisticsController:
+    def __init__(
+        self,
+        statistics_use_case: AsyncExposureStatisticsUseCase,
+        authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None,
+    ) -> None:
+        self.statistics_use_case = statistics_use_case
+        self.authentication_dependency = authentication_dependency
+        self.router = APIRouter(prefix="/topology", tags=["topology"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        dependencies = [Depends(self.authentication_dependency)] if self.authentication_dependency else []
+
+        self.router.add_api_route(
+            "/statistics",
+            self.get_statistics,
+            methods=["GET"],
+            response_model=ExposureStatisticsApiResponseDataTransferObject,
+            dependencies=dependencies,
+        )
+
+    async def get_statistics(
+        self, limit: int = DEFAULT_STATISTICS_LIMIT
+    ) -> ExposureStatisticsApiResponseDataTransferObject:
+        try:
+            statistics = await self.statistics_use_case.statistics(limit)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return ExposureStatisticsApiResponseDataTransferObject.from_domain_model(statistics)
+
+
+def create_exposure_statistics_controller(
+    container: Container, authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None
+) -> ExposureStatisticsController:
+    return ExposureStatisticsController(
+        statistics_use_case=container[AsyncExposureStatisticsUseCase],
+        authentication_dependency=authentication_dependency,
+    )
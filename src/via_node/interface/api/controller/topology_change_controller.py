@@ -0,0 +1,103 @@
+import asyncio
+from typing import AsyncIterator, Callable, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPBasicCredentials
+
+from lagom import Container
+
+from via_node.application.use_case.topology_change_feed_use_case import AsyncTopologyChangeFeedUseCase
+from via_node.domain.model.topology_change import DEFAULT_CHANGE_LIMIT, TopologyChange, validate_after_sequence
+
+HEARTBEAT = ": keep-alive\n\n"
+
+
+def server_sent_events(changes: List[TopologyChange]) -> str:
+    return "".join(
+        f"id: {change.sequence}\nevent: {change.kind.value}\ndata: {change.model_dump_json()}\n\n" for change in changes
+    )
+
+
+def _requested_sequence(after: Optional[int], last_event_id: Optional[str]) -> Optional[int]:
+    if after is not None:
+        return after
+
+    return int(last_event_id) if last_event_id else None
+
+
+class TopologyChangeController:
+    def __init__(
+        self,
+        change_feed_use_case: AsyncTopologyChangeFeedUseCase,
+        authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 15.0,
+    ) -> None:
+        self.change_feed_use_case = change_feed_use_case
+        self.authentication_dependency = authentication_dependency
+        self.poll_interval = poll_interval
+        self.heartbeat_polls = max(1, round(heartbeat_interval / poll_interval))
+        self.router = APIRouter(prefix="/topology", tags=["topology"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        dependencies = [Depends(self.authentication_dependency)] if self.authentication_dependency else []
+
+        self.router.add_api_route(
+            "/changes",
+            self.stream_changes,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            dependencies=dependencies,
+        )
+
+    async def stream_changes(
+        self, after: Optional[int] = None, follow: bool = True, last_event_id: Optional[str] = Header(default=None)
+    ) -> StreamingResponse:
+        try:
+            after_sequence = await self._after_sequence(_requested_sequence(after, last_event_id))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return StreamingResponse(
+            self.events(after_sequence, follow), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+        )
+
+    async def events(self, after_sequence: int, follow: bool) -> AsyncIterator[str]:
+        idle_polls = 0
+
+        while True:
+            changes = await self.change_feed_use_case.changes_after(after_sequence, DEFAULT_CHANGE_LIMIT)
+
+            if changes:
+                after_sequence, idle_polls = changes[-1].sequence, 0
+                yield server_sent_events(changes)
+            elif not follow:
+                return
+            else:
+                idle_polls += 1
+                await asyncio.sleep(self.poll_interval)
+
+                if idle_polls % self.heartbeat_polls == 0:
+                    yield HEARTBEAT
+
+    async def _after_sequence(self, requested: Optional[int]) -> int:
+        if requested is None:
+            return await self.change_feed_use_case.latest_sequence()
+
+        return validate_after_sequence(requested)
+
+
+def create_topology_change_controller(
+    container: Container,
+    authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None,
+    poll_interval: float = 1.0,
+    heartbeat_interval: float = 15.0,
+) -> TopologyChangeController:
+    return TopologyChangeController(
+        change_feed_use_case=container[AsyncTopologyChangeFeedUseCase],
+        authentication_dependency=authentication_dependency,
+        poll_interval=poll_interval,
+        heartbeat_interval=heartbeat_interval,
+    )
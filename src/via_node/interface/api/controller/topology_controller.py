@@ -0,0 +1,89 @@
+from typing import Callable, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security import HTTPBasicCredentials
+
+from lagom import Container
+
+from via_node.application.use_case.traverse_network_topology_use_case import AsyncTraverseNetworkTopologyUseCase
+from via_node.domain.model.topology_traversal import MAX_TRAVERSAL_DEPTH
+from via_node.interface.api.data_transfer_object.topology_traversal_data_transfer_object import (
+    NeighborsApiResponseDataTransferObject,
+    PathApiResponseDataTransferObject,
+)
+
+
+class TopologyController:
+    def __init__(
+        self,
+        traverse_use_case: AsyncTraverseNetworkTopologyUseCase,
+        authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None,
+    ) -> None:
+        self.traverse_use_case = traverse_use_case
+        self.authentication_dependency = authentication_dependency
+        self.router = APIRouter(prefix="/topology", tags=["topology"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        dependencies = [Depends(self.authentication_dependency)] if self.authentication_dependency else []
+
+        self.router.add_api_route(
+            "/neighbors",
+            self.get_neighbors,
+            methods=["GET"],
+            response_model=NeighborsApiResponseDataTransferObject,
+            dependencies=dependencies,
+        )
+
+        self.router.add_api_route(
+            "/path",
+            self.get_path,
+            methods=["GET"],
+            response_model=PathApiResponseDataTransferObject,
+            dependencies=dependencies,
+        )
+
+    async def get_neighbors(
+        self,
+        vertex: str,
+        depth: int = 1,
+        direction: str = "outbound",
+        edge_type: List[str] = Query(default=[]),
+        limit: int = 1000,
+    ) -> NeighborsApiResponseDataTransferObject:
+        try:
+            neighbors = await self.traverse_use_case.neighbors(vertex, depth, direction, edge_type, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return NeighborsApiResponseDataTransferObject.from_domain_model(vertex, neighbors)
+
+    async def get_path(
+        self,
+        source: str,
+        target: str,
+        max_depth: int = MAX_TRAVERSAL_DEPTH,
+        direction: str = "any",
+        edge_type: List[str] = Query(default=[]),
+    ) -> PathApiResponseDataTransferObject:
+        try:
+            path = await self.traverse_use_case.shortest_path(source, target, max_depth, direction, edge_type)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if path is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No path from {source} to {target} within {max_depth} hops",
+            )
+
+        return PathApiResponseDataTransferObject.from_domain_model(path)
+
+
+def create_topology_controller(
+    container: Container, authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None
+) -> TopologyController:
+    return TopologyController(
+        traverse_use_case=container[AsyncTraverseNetworkTopologyUseCase],
+        authentication_dependency=authentication_dependency,
+    )
@@ -0,0 +1,71 @@
+from typing import Callable, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security import HTTPBasicCredentials
+
+from lagom import Container
+
+from via_node.application.use_case.query_network_topology_use_case import AsyncQueryNetworkTopologyUseCase
+from via_node.interface.api.data_transfer_object.topology_query_data_transfer_object import (
+    ProjectedRecordsApiResponseDataTransferObject,
+)
+
+
+class TopologyQueryController:
+    def __init__(
+        self,
+        query_use_case: AsyncQueryNetworkTopologyUseCase,
+        authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None,
+    ) -> None:
+        self.query_use_case = query_use_case
+        self.authentication_dependency = authentication_dependency
+        self.router = APIRouter(prefix="/topology", tags=["topology"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        dependencies = [Depends(self.authentication_dependency)] if self.authentication_dependency else []
+
+        self.router.add_api_route(
+            "/port-scan-results",
+            self.get_port_scan_results,
+            methods=["GET"],
+            response_model=ProjectedRecordsApiResponseDataTransferObject,
+            dependencies=dependencies,
+        )
+
+        self.router.add_api_route(
+            "/dns-discoveries",
+            self.get_dns_discoveries,
+            methods=["GET"],
+            response_model=ProjectedRecordsApiResponseDataTransferObject,
+            dependencies=dependencies,
+        )
+
+    async def get_port_scan_results(
+        self, target_ip: str, fields: List[str] = Query(default=[])
+    ) -> ProjectedRecordsApiResponseDataTransferObject:
+        try:
+            results = await self.query_use_case.port_scan_results(target_ip, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return ProjectedRecordsApiResponseDataTransferObject.from_domain_model(results, fields)
+
+    async def get_dns_discoveries(
+        self, domain_name: str, fields: List[str] = Query(default=[])
+    ) -> ProjectedRecordsApiResponseDataTransferObject:
+        try:
+            discoveries = await self.query_use_case.dns_record_discoveries(domain_name, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return ProjectedRecordsApiResponseDataTransferObject.from_domain_model(discoveries, fields)
+
+
+def create_topology_query_controller(
+    container: Container, authentication_dependency: Optional[Callable[[Optional[HTTPBasicCredentials]], None]] = None
+) -> TopologyQueryController:
+    return TopologyQueryController(
+        query_use_case=container[AsyncQueryNetworkTopologyUseCase],
+        authentication_dependency=authentication_dependency,
+    )
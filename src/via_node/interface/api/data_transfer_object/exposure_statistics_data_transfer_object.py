@@ -0,0 +1,53 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ServiceExposureApiResponseDataTransferObject(BaseModel):
+    service_name: Optional[str] = Field(default=None)
+    open_ports: int = Field(...)
+    hosts: int = Field(...)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "ServiceExposureApiResponseDataTransferObject":
+        return cls(service_name=domain_model.service_name, open_ports=domain_model.open_ports, hosts=domain_model.hosts)
+
+
+class PortExposureApiResponseDataTransferObject(BaseModel):
+    port_number: int = Field(...)
+    protocol: str = Field(...)
+    hosts: int = Field(...)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "PortExposureApiResponseDataTransferObject":
+        return cls(port_number=domain_model.port_number, protocol=domain_model.protocol, hosts=domain_model.hosts)
+
+
+class DomainRecordTypesApiResponseDataTransferObject(BaseModel):
+    domain_name: str = Field(...)
+    record_types: List[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "DomainRecordTypesApiResponseDataTransferObject":
+        return cls(
+            domain_name=domain_model.domain_name,
+            record_types=[record_type.value for record_type in domain_model.record_types],
+        )
+
+
+class ExposureStatisticsApiResponseDataTransferObject(BaseModel):
+    services: List[ServiceExposureApiResponseDataTransferObject] = Field(default_factory=list)
+    ports: List[PortExposureApiResponseDataTransferObject] = Field(default_factory=list)
+    domains: List[DomainRecordTypesApiResponseDataTransferObject] = Field(default_factory=list)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "ExposureStatisticsApiResponseDataTransferObject":
+        return cls(
+            services=[
+                ServiceExposureApiResponseDataTransferObject.from_domain_model(item) for item in domain_model.services
+            ],
+            ports=[PortExposureApiResponseDataTransferObject.from_domain_model(item) for item in domain_model.ports],
+            domains=[
+                DomainRecordTypesApiResponseDataTransferObject.from_domain_model(item) for item in domain_model.domains
+            ],
+        )
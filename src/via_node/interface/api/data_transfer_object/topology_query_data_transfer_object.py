@@ -0,0 +1,17 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class ProjectedRecordsApiResponseDataTransferObject(BaseModel):
+    count: int = Field(...)
+    items: List[Dict[str, Any]] = Field(default_factory=list)
+
+    @classmethod
+    def from_domain_model(
+        cls, domain_model: List[Any], fields: List[str]
+    ) -> "ProjectedRecordsApiResponseDataTransferObject":
+        return cls(
+            count=len(domain_model),
+            items=[item.model_dump(mode="json", include=set(fields) or None) for item in domain_model],
+        )
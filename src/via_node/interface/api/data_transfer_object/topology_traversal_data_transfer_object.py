@@ -0,0 +1,49 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class TraversalVertexApiResponseDataTransferObject(BaseModel):
+    vertex: str = Field(...)
+    depth: int = Field(...)
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "TraversalVertexApiResponseDataTransferObject":
+        return cls(vertex=str(domain_model.vertex), depth=domain_model.depth, attributes=domain_model.attributes)
+
+
+class NeighborsApiResponseDataTransferObject(BaseModel):
+    vertex: str = Field(...)
+    neighbors: List[TraversalVertexApiResponseDataTransferObject] = Field(default_factory=list)
+
+    @classmethod
+    def from_domain_model(cls, vertex: str, domain_model: List[Any]) -> "NeighborsApiResponseDataTransferObject":
+        return cls(
+            vertex=vertex,
+            neighbors=[TraversalVertexApiResponseDataTransferObject.from_domain_model(item) for item in domain_model],
+        )
+
+
+class TraversalEdgeApiResponseDataTransferObject(BaseModel):
+    source_id: str = Field(...)
+    target_id: str = Field(...)
+    edge_type: str = Field(...)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "TraversalEdgeApiResponseDataTransferObject":
+        return cls(source_id=domain_model.source_id, target_id=domain_model.target_id, edge_type=domain_model.edge_type)
+
+
+class PathApiResponseDataTransferObject(BaseModel):
+    length: int = Field(...)
+    vertices: List[str] = Field(default_factory=list)
+    edges: List[TraversalEdgeApiResponseDataTransferObject] = Field(default_factory=list)
+
+    @classmethod
+    def from_domain_model(cls, domain_model: Any) -> "PathApiResponseDataTransferObject":
+        return cls(
+            length=domain_model.length,
+            vertices=[str(vertex) for vertex in domain_model.vertices],
+            edges=[TraversalEdgeApiResponseDataTransferObject.from_domain_model(edge) for edge in domain_model.edges],
+        )
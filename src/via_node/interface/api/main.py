@@ -1,12 +1,33 @@
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
 import uvicorn
 from fastapi import FastAPI
 from lagom import Container
 
 from via_node.application.use_case.coconut_use_case import CreateCoconutUseCase, GetCoconutUseCase
+from via_node.application.use_case.exposure_statistics_use_case import AsyncExposureStatisticsUseCase
 from via_node.application.use_case.health_use_case import HealthUseCase
+from via_node.application.use_case.query_network_topology_use_case import AsyncQueryNetworkTopologyUseCase
+from via_node.application.use_case.topology_change_feed_use_case import AsyncTopologyChangeFeedUseCase
+from via_node.application.use_case.traverse_network_topology_use_case import AsyncTraverseNetworkTopologyUseCase
 from via_node.domain.health.health_checker import HealthChecker
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
 from via_node.domain.repository.coconut_repository import CoconutCommandRepository, CoconutQueryRepository
+from via_node.domain.service.topology_change_feed import TopologyChangeReader
+from via_node.infrastructure.change_feed.jsonl_change_log import JsonlChangeLog
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import (
+    CoordinatorHostResolver,
+    coordinator_urls,
+)
+from via_node.infrastructure.persistence.decorator.threaded_async_network_topology_repository import (
+    ThreadedAsyncNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.embedded_repositories import EMBEDDED_REPOSITORIES
 from via_node.infrastructure.persistence.in_memory.in_memory_coconut_command_repository import (
     InMemoryCoconutCommandRepository,
 )
@@ -22,10 +43,21 @@ from via_node.infrastructure.system.health_factory import create_health_checker
 from via_node.interface.api.controller.coconut_controller import (
     create_coconut_controller,
 )
+from via_node.interface.api.controller.exposure_statistics_controller import create_exposure_statistics_controller
 from via_node.interface.api.controller.health_controller import create_health_controller
-from via_node.shared.configuration import get_application_setting_provider
+from via_node.interface.api.controller.topology_change_controller import create_topology_change_controller
+from via_node.interface.api.controller.topology_controller import create_topology_controller
+from via_node.interface.api.controller.topology_query_controller import create_topology_query_controller
+from via_node.shared.configuration import ApplicationSettings, get_application_setting_provider
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await global_container[AsyncNetworkTopologyRepository].aclose()  # type: ignore[type-abstract]
 
-app = FastAPI(title="Via Node API", version="1.0.0")
+
+app = FastAPI(title="Via Node API", version="1.0.0", lifespan=lifespan)
 
 
 def get_container() -> Container:
@@ -40,6 +72,18 @@ def get_container() -> Container:
     container[GetCoconutUseCase] = GetCoconutUseCase
     container[CreateCoconutUseCase] = CreateCoconutUseCase
 
+    settings = ApplicationSettings()
+    container[ApplicationSettings] = lambda: settings
+    topology_repository = create_async_network_topology_repository(settings)
+    container[AsyncNetworkTopologyRepository] = lambda: topology_repository  # type: ignore[type-abstract]
+    container[AsyncTraverseNetworkTopologyUseCase] = AsyncTraverseNetworkTopologyUseCase
+    container[AsyncQueryNetworkTopologyUseCase] = AsyncQueryNetworkTopologyUseCase
+    container[AsyncExposureStatisticsUseCase] = AsyncExposureStatisticsUseCase
+
+    change_log = JsonlChangeLog(settings.change_feed_path)
+    container[TopologyChangeReader] = lambda: change_log  # type: ignore[type-abstract]
+    container[AsyncTopologyChangeFeedUseCase] = AsyncTopologyChangeFeedUseCase
+
     authenticator = get_basic_authenticator()
     security_dependency = SecurityDependency(authenticator)
     container[BasicAuthenticator] = lambda: authenticator
@@ -53,6 +97,41 @@ def get_container() -> Container:
     return container
 
 
+def create_async_network_topology_repository(settings: ApplicationSettings) -> AsyncNetworkTopologyRepository:
+    if settings.repository_backend in EMBEDDED_REPOSITORIES:
+        return ThreadedAsyncNetworkTopologyRepository(EMBEDDED_REPOSITORIES[settings.repository_backend](settings))
+
+    return _create_async_arango_repository(settings)
+
+
+def _create_async_arango_repository(settings: ApplicationSettings) -> AsyncArangoNetworkTopologyRepository:
+    hosts = coordinator_urls(settings.arango_endpoints, settings.arango_host, settings.arango_port)
+
+    return AsyncArangoNetworkTopologyRepository(
+        host=settings.arango_host,
+        port=settings.arango_port,
+        database=settings.arango_database,
+        username=settings.arango_username,
+        password=settings.arango_password,
+        max_connections=settings.arango_async_max_connections,
+        max_keepalive_connections=settings.arango_async_max_keepalive_connections,
+        request_timeout=settings.arango_request_timeout,
+        bulk_chunk_size=settings.arango_bulk_chunk_size,
+        discovery_ttl_multiplier=settings.arango_discovery_ttl_multiplier,
+        hide_expired_discoveries=settings.arango_hide_expired_discoveries,
+        host_resolver=_create_host_resolver(hosts, settings) if len(hosts) > 1 else None,
+    )
+
+
+def _create_host_resolver(hosts: List[str], settings: ApplicationSettings) -> CoordinatorHostResolver:
+    return CoordinatorHostResolver(
+        hosts,
+        selection=settings.arango_host_selection,
+        ejection_threshold=settings.arango_host_ejection_threshold,
+        ejection_period=settings.arango_host_ejection_period,
+    )
+
+
 global_container = get_container()
 
 
@@ -66,6 +145,24 @@ authentication_dependency = security_dependency.authentication_dependency()
 coconut_controller = create_coconut_controller(global_container, authentication_dependency)
 app.include_router(coconut_controller.router)
 
+topology_controller = create_topology_controller(global_container, authentication_dependency)
+app.include_router(topology_controller.router)
+
+topology_query_controller = create_topology_query_controller(global_container, authentication_dependency)
+app.include_router(topology_query_controller.router)
+
+exposure_statistics_controller = create_exposure_statistics_controller(global_container, authentication_dependency)
+app.include_router(exposure_statistics_controller.router)
+
+change_feed_settings = global_container[ApplicationSettings]
+topology_change_controller = create_topology_change_controller(
+    global_container,
+    authentication_dependency,
+    poll_interval=change_feed_settings.change_feed_poll_interval,
+    heartbeat_interval=change_feed_settings.change_feed_heartbeat_interval,
+)
+app.include_router(topology_change_controller.router)
+
 health_use_case = global_container[HealthUseCase]
 health_controller = create_health_controller(health_use_case)
 app.include_router(health_controller)
@@ -1,3 +1,6 @@
+from typing import List, Optional
+
+from arango.http import DeflateRequestCompression, RequestCompression
 from lagom import Container
 
 from via_node.application.use_case.add_domain_port_edge_use_case import (
@@ -13,11 +16,34 @@ from via_node.application.use_case.discover_dns_records_use_case import (
 from via_node.application.use_case.discover_subdomains_use_case import (
     DiscoverSubdomainsUseCase,
 )
+from via_node.application.use_case.exposure_statistics_use_case import ExposureStatisticsUseCase
+from via_node.application.use_case.export_network_topology_use_case import ExportNetworkTopologyUseCase
+from via_node.application.use_case.port_scan_history_use_case import PortScanHistoryUseCase
+from via_node.application.use_case.query_network_topology_use_case import QueryNetworkTopologyUseCase
 from via_node.application.use_case.scan_ports_use_case import ScanPortsUseCase
+from via_node.application.use_case.topology_change_feed_use_case import TopologyChangeFeedUseCase
+from via_node.application.use_case.traverse_network_topology_use_case import TraverseNetworkTopologyUseCase
 from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.domain.service.topology_change_feed import TopologyChangeReader, TopologyChangeSink
+from via_node.infrastructure.change_feed.jsonl_change_log import JsonlChangeLog
+from via_node.infrastructure.change_feed.topology_change_bus import TopologyChangeBus
+from via_node.infrastructure.change_feed.unix_socket_change_sink import UnixSocketChangeSink
 from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
     ArangoNetworkTopologyRepository,
 )
+from via_node.infrastructure.persistence.arango.arango_schema_marker import ArangoSchemaMarker
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import (
+    CoordinatorHostResolver,
+    coordinator_urls,
+)
+from via_node.infrastructure.persistence.arango.pooled_http_client import PooledHttpClient
+from via_node.infrastructure.persistence.decorator.buffered_network_topology_repository import (
+    BufferedNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.decorator.change_feed_network_topology_repository import (
+    ChangeFeedNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.embedded_repositories import EMBEDDED_REPOSITORIES
 from via_node.shared.configuration import ApplicationSettings
 
 
@@ -26,6 +52,31 @@ def create_container() -> Container:
 
     settings = ApplicationSettings()
 
+    if settings.repository_backend in EMBEDDED_REPOSITORIES:
+        _register_repositories(container, EMBEDDED_REPOSITORIES[settings.repository_backend](settings), settings)
+        container[ArangoNetworkTopologyRepository] = _require_arango_backend
+    else:
+        _register_arango_repositories(container, settings)
+
+    container[AddDomainPortEdgeUseCase] = AddDomainPortEdgeUseCase
+    container[AddDnsResolvesToHostEdgeUseCase] = AddDnsResolvesToHostEdgeUseCase
+    container[AddHostUseCase] = AddHostUseCase
+    container[DiscoverDnsRecordsUseCase] = DiscoverDnsRecordsUseCase
+    container[DiscoverSubdomainsUseCase] = DiscoverSubdomainsUseCase
+    container[ScanPortsUseCase] = ScanPortsUseCase
+    container[ExportNetworkTopologyUseCase] = ExportNetworkTopologyUseCase
+    container[TraverseNetworkTopologyUseCase] = TraverseNetworkTopologyUseCase
+    container[PortScanHistoryUseCase] = PortScanHistoryUseCase
+    container[QueryNetworkTopologyUseCase] = QueryNetworkTopologyUseCase
+    container[ExposureStatisticsUseCase] = ExposureStatisticsUseCase
+    container[TopologyChangeReader] = lambda: JsonlChangeLog(settings.change_feed_path)  # type: ignore[type-abstract]
+    container[TopologyChangeFeedUseCase] = TopologyChangeFeedUseCase
+
+    return container
+
+
+def _register_arango_repositories(container: Container, settings: ApplicationSettings) -> None:
+    host_resolver = _create_host_resolver(settings)
     repository = ArangoNetworkTopologyRepository(
         host=settings.arango_host,
         port=settings.arango_port,
@@ -34,14 +85,90 @@ def create_container() -> Container:
         password=settings.arango_password,
         graph_name=settings.arango_graph_name,
         auto_create_database=settings.arango_auto_create_database,
+        bulk_chunk_size=settings.arango_bulk_chunk_size,
+        auto_migrate=settings.arango_auto_migrate,
+        http_client=_create_http_client(settings, host_resolver),
+        request_compression=_create_request_compression(settings),
+        response_compression=settings.arango_response_compression or None,
+        discovery_ttl_multiplier=settings.arango_discovery_ttl_multiplier,
+        hide_expired_discoveries=settings.arango_hide_expired_discoveries,
+        schema_marker=ArangoSchemaMarker(settings.arango_schema_marker_directory, settings.arango_schema_marker_ttl),
+        hosts=host_resolver.hosts if host_resolver else None,
+        host_resolver=host_resolver,
     )
 
-    container[NetworkTopologyRepository] = lambda: repository  # type: ignore[type-abstract]
-    container[AddDomainPortEdgeUseCase] = AddDomainPortEdgeUseCase
-    container[AddDnsResolvesToHostEdgeUseCase] = AddDnsResolvesToHostEdgeUseCase
-    container[AddHostUseCase] = AddHostUseCase
-    container[DiscoverDnsRecordsUseCase] = DiscoverDnsRecordsUseCase
-    container[DiscoverSubdomainsUseCase] = DiscoverSubdomainsUseCase
-    container[ScanPortsUseCase] = ScanPortsUseCase
+    _register_repositories(container, repository, settings)
+    container[ArangoNetworkTopologyRepository] = lambda: repository
 
-    return container
+
+def _register_repositories(
+    container: Container, repository: NetworkTopologyRepository, settings: ApplicationSettings
+) -> None:
+    topology_repository = _decorate_repository(repository, settings)
+
+    container[NetworkTopologyRepository] = lambda: topology_repository  # type: ignore[type-abstract]
+
+
+def _require_arango_backend() -> ArangoNetworkTopologyRepository:
+    raise ValueError("This command requires APP_REPOSITORY_BACKEND=arango")
+
+
+def _create_host_resolver(settings: ApplicationSettings) -> Optional[CoordinatorHostResolver]:
+    hosts = coordinator_urls(settings.arango_endpoints, settings.arango_host, settings.arango_port)
+
+    if len(hosts) == 1:
+        return None
+    return CoordinatorHostResolver(
+        hosts,
+        selection=settings.arango_host_selection,
+        ejection_threshold=settings.arango_host_ejection_threshold,
+        ejection_period=settings.arango_host_ejection_period,
+    )
+
+
+def _create_http_client(
+    settings: ApplicationSettings, host_resolver: Optional[CoordinatorHostResolver] = None
+) -> PooledHttpClient:
+    return PooledHttpClient(
+        pool_connections=settings.arango_http_pool_connections,
+        pool_maxsize=settings.arango_http_pool_maxsize,
+        pool_block=settings.arango_http_pool_block,
+        keep_alive=settings.arango_http_keep_alive,
+        request_timeout=settings.arango_request_timeout,
+        retry_attempts=settings.arango_retry_attempts,
+        retry_backoff_factor=settings.arango_retry_backoff_factor,
+        retry_writes=settings.arango_retry_writes,
+        host_resolver=host_resolver,
+    )
+
+
+def _create_request_compression(settings: ApplicationSettings) -> Optional[RequestCompression]:
+    if settings.arango_request_compression_threshold <= 0:
+        return None
+    return DeflateRequestCompression(threshold=settings.arango_request_compression_threshold)
+
+
+def _create_change_bus(settings: ApplicationSettings) -> TopologyChangeBus:
+    change_log = JsonlChangeLog(settings.change_feed_path, settings.change_feed_max_bytes)
+    sinks: List[TopologyChangeSink] = []
+
+    if settings.change_feed_socket_path:
+        sinks.append(UnixSocketChangeSink(settings.change_feed_socket_path))
+    return TopologyChangeBus(sinks, settings.change_feed_history_size, change_log.last_sequence(), journal=change_log)
+
+
+def _decorate_repository(
+    repository: NetworkTopologyRepository, settings: ApplicationSettings
+) -> NetworkTopologyRepository:
+    if settings.change_feed_enabled:
+        repository = ChangeFeedNetworkTopologyRepository(repository, _create_change_bus(settings))
+    if settings.write_buffer_enabled:
+        repository = BufferedNetworkTopologyRepository(
+            repository,
+            max_count=settings.write_buffer_max_count,
+            max_bytes=settings.write_buffer_max_bytes,
+            max_delay=settings.write_buffer_max_delay,
+            max_backoff=settings.write_buffer_max_backoff,
+            max_buffered_bytes=settings.write_buffer_max_buffered_bytes,
+        )
+    return repository
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
 import click
 
@@ -16,9 +17,30 @@ from via_node.application.use_case.discover_dns_records_use_case import (
 from via_node.application.use_case.discover_subdomains_use_case import (
     DiscoverSubdomainsUseCase,
 )
+from via_node.application.use_case.exposure_statistics_use_case import ExposureStatisticsUseCase
+from via_node.application.use_case.export_network_topology_use_case import ExportNetworkTopologyUseCase
+from via_node.application.use_case.port_scan_history_use_case import PortScanHistoryUseCase
+from via_node.application.use_case.query_network_topology_use_case import QueryNetworkTopologyUseCase
 from via_node.application.use_case.scan_ports_use_case import ScanPortsUseCase
+from via_node.application.use_case.topology_change_feed_use_case import TopologyChangeFeedUseCase
+from via_node.application.use_case.traverse_network_topology_use_case import TraverseNetworkTopologyUseCase
 from via_node.domain.model.dns_record_discovery import DnsRecordType
+from via_node.domain.model.exposure_statistics import DEFAULT_STATISTICS_LIMIT, ExposureStatistics, ServiceExposure
+from via_node.domain.model.port_scan_observation import PortScanObservation
 from via_node.domain.model.port_scan_result import PortScanResult
+from via_node.domain.model.topology_change import DEFAULT_CHANGE_LIMIT, TopologyChange
+from via_node.domain.model.topology_traversal import MAX_TRAVERSAL_DEPTH, TraversalPath, TraversalVertex
+from via_node.domain.service.topology_snapshot_writer import TopologySnapshotWriter
+from via_node.infrastructure.export.columnar_snapshot_writer import ColumnarSnapshotWriter
+from via_node.infrastructure.persistence.arango.arango_edge_compactor import EdgeCompactionResult
+from via_node.infrastructure.persistence.arango.arango_graph_dump import GraphDumpManifest, RestoreResult
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+
+SNAPSHOT_WRITERS: Dict[str, Callable[[str], TopologySnapshotWriter]] = {
+    "columnar": ColumnarSnapshotWriter,
+}
 
 
 @click.group()
@@ -223,3 +245,382 @@ def scan_ports(target: str, ports: str) -> None:
     except Exception as e:
         click.echo(f"✗ Error: {str(e)}", err=True)
         raise click.Abort()
+
+
+@cli.group()
+def scan_history() -> None:
+    pass
+
+
+@scan_history.command()
+@click.argument("target")
+@click.option("--at", type=click.DateTime(), help="Show the state of each port at this time instead of the history")
+def show(target: str, at: Optional[datetime]) -> None:
+    try:
+        container = create_container()
+        use_case = container[PortScanHistoryUseCase]
+
+        observations = use_case.history(target, at)
+
+        _display_observations(target, at, observations)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_observations(target: str, at: Optional[datetime], observations: List[PortScanObservation]) -> None:
+    heading = f"state of {target} at {at.isoformat()}" if at else f"history of {target}"
+    click.echo(f"✓ {len(observations)} observation(s) in the {heading}:")
+
+    for observation in observations:
+        service_str = f" ({observation.service_name})" if observation.service_name else ""
+        click.echo(
+            f"  {observation.protocol.upper()}/{observation.port_number}: {observation.state.value.upper()}"
+            f"{service_str} from {observation.first_observed_at.isoformat()}"
+            f" to {observation.last_observed_at.isoformat()} x{observation.observations}"
+        )
+
+
+@scan_history.command()
+def compact() -> None:
+    try:
+        container = create_container()
+        use_case = container[PortScanHistoryUseCase]
+
+        result = use_case.compact()
+
+        click.echo(f"✓ Rewrote {result.rewritten} interval(s), removed {result.removed} observation(s)")
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+def migrate() -> None:
+    try:
+        container = create_container()
+        repository = container[ArangoNetworkTopologyRepository]
+
+        applied = repository.migrate_schema()
+
+        _display_migration_result(applied, repository.schema_version())
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_migration_result(applied: List[int], schema_version: int) -> None:
+    if applied:
+        versions_str = ", ".join(str(version) for version in applied)
+        click.echo(f"✓ Applied migration(s) {versions_str}; schema is at version {schema_version}")
+    else:
+        click.echo(f"✓ Schema is up to date at version {schema_version}")
+
+
+@cli.command()
+def compact_edges() -> None:
+    try:
+        container = create_container()
+        repository = container[ArangoNetworkTopologyRepository]
+
+        results = repository.compact_edges()
+
+        _display_compaction_results(results)
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_compaction_results(results: List[EdgeCompactionResult]) -> None:
+    for result in results:
+        click.echo(
+            f"✓ {result.collection_name}: rewrote {result.rewritten} edge(s), removed {result.removed} duplicate(s)"
+        )
+
+
+@cli.command()
+@click.option("--output", "-o", required=True, type=click.Path(file_okay=False), help="Directory to write to")
+@click.option(
+    "--compression",
+    default="gzip",
+    type=click.Choice(["gzip", "zstd"], case_sensitive=False),
+    help="Compression for the JSON Lines files",
+)
+def dump(output: str, compression: str) -> None:
+    try:
+        container = create_container()
+        repository = container[ArangoNetworkTopologyRepository]
+
+        manifest = repository.dump_graph(output, compression.lower())
+
+        _display_dump_manifest(output, manifest)
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_dump_manifest(output: str, manifest: GraphDumpManifest) -> None:
+    total = sum(collection.count for collection in manifest.collections)
+    click.echo(f"✓ Dumped {total} document(s) from {len(manifest.collections)} collection(s) to {output}")
+
+    for collection in manifest.collections:
+        click.echo(f"  {collection.name}: {collection.count} (sha256 {collection.sha256[:12]})")
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "-i",
+    "input_directory",
+    required=True,
+    type=click.Path(file_okay=False, exists=True),
+    help="Directory written by dump",
+)
+@click.option("--parallelism", default=4, type=int, help="Collections imported at the same time")
+def restore(input_directory: str, parallelism: int) -> None:
+    try:
+        container = create_container()
+        repository = container[ArangoNetworkTopologyRepository]
+
+        results = repository.restore_graph(input_directory, parallelism)
+
+        _display_restore_results(input_directory, results)
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_restore_results(input_directory: str, results: List[RestoreResult]) -> None:
+    click.echo(f"✓ Restored {sum(result.imported for result in results)} document(s) from {input_directory}")
+
+    for result in results:
+        errors = f", {result.errors} error(s)" if result.errors else ""
+        click.echo(f"  {result.collection_name}: {result.imported}/{result.expected}{errors}")
+
+
+@cli.command()
+@click.option(
+    "--format",
+    "export_format",
+    default="columnar",
+    type=click.Choice(list(SNAPSHOT_WRITERS), case_sensitive=False),
+    help="Snapshot format",
+)
+@click.option("--output", "-o", required=True, type=click.Path(file_okay=False), help="Directory to write to")
+@click.option("--page-size", default=1000, type=int, help="Documents read from the repository per request")
+def export(export_format: str, output: str, page_size: int) -> None:
+    try:
+        container = create_container()
+        use_case = container[ExportNetworkTopologyUseCase]
+
+        counts = use_case.execute(SNAPSHOT_WRITERS[export_format.lower()](output), page_size)
+
+        _display_export_counts(output, counts)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_export_counts(output: str, counts: Dict[str, int]) -> None:
+    click.echo(f"✓ Exported {sum(counts.values())} document(s) to {output}")
+
+    for name, count in counts.items():
+        click.echo(f"  {name}: {count}")
+
+
+@cli.group()
+def traverse() -> None:
+    pass
+
+
+@traverse.command()
+@click.argument("vertex")
+@click.option("--depth", default=1, type=int, help="Maximum number of hops (1-10)")
+@click.option(
+    "--direction",
+    default="outbound",
+    type=click.Choice(["outbound", "inbound", "any"], case_sensitive=False),
+    help="Edge direction to follow",
+)
+@click.option("--edge-type", "-e", multiple=True, help="Edge type to follow (repeatable, default all)")
+@click.option("--limit", default=1000, type=int, help="Maximum number of vertices to return")
+def neighbors(vertex: str, depth: int, direction: str, edge_type: tuple, limit: int) -> None:
+    try:
+        container = create_container()
+        use_case = container[TraverseNetworkTopologyUseCase]
+
+        results = use_case.neighbors(vertex, depth, direction, list(edge_type), limit)
+
+        _display_neighbors(vertex, results)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_neighbors(vertex: str, results: List[TraversalVertex]) -> None:
+    click.echo(f"✓ Found {len(results)} vertex(es) reachable from {vertex}:")
+
+    for result in results:
+        click.echo(f"  [{result.depth}] {result.vertex}")
+
+
+@traverse.command()
+@click.argument("source")
+@click.argument("target")
+@click.option("--max-depth", default=MAX_TRAVERSAL_DEPTH, type=int, help="Maximum number of hops (1-10)")
+@click.option(
+    "--direction",
+    default="any",
+    type=click.Choice(["outbound", "inbound", "any"], case_sensitive=False),
+    help="Edge direction to follow",
+)
+@click.option("--edge-type", "-e", multiple=True, help="Edge type to follow (repeatable, default all)")
+def path(source: str, target: str, max_depth: int, direction: str, edge_type: tuple) -> None:
+    try:
+        container = create_container()
+        use_case = container[TraverseNetworkTopologyUseCase]
+
+        result = use_case.shortest_path(source, target, max_depth, direction, list(edge_type))
+
+        _display_path(source, target, max_depth, result)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_path(source: str, target: str, max_depth: int, result: Optional[TraversalPath]) -> None:
+    if result is None:
+        click.echo(f"✗ No path from {source} to {target} within {max_depth} hop(s)")
+        return
+
+    click.echo(f"✓ Path ({result.length} hop(s)): {' -> '.join(str(vertex) for vertex in result.vertices)}")
+
+
+@cli.group()
+def query() -> None:
+    pass
+
+
+@query.command()
+@click.argument("target")
+@click.option("--fields", "-f", default="", help="Comma-separated fields to return, e.g. port_number,state")
+def ports(target: str, fields: str) -> None:
+    try:
+        container = create_container()
+        use_case = container[QueryNetworkTopologyUseCase]
+
+        selected = _parse_fields(fields)
+        results = use_case.port_scan_results(target, selected)
+
+        _display_query_results(f"port scan result(s) for {target}", results, selected)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+@query.command()
+@click.argument("domain")
+@click.option("--fields", "-f", default="", help="Comma-separated fields to return, e.g. record_type,values")
+def dns(domain: str, fields: str) -> None:
+    try:
+        container = create_container()
+        use_case = container[QueryNetworkTopologyUseCase]
+
+        selected = _parse_fields(fields)
+        results = use_case.dns_record_discoveries(domain, selected)
+
+        _display_query_results(f"DNS discovery(ies) for {domain}", results, selected)
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _parse_fields(fields: str) -> List[str]:
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def _display_query_results(description: str, results: List[Any], fields: List[str]) -> None:
+    click.echo(f"✓ Found {len(results)} {description}:")
+
+    for result in results:
+        values = result.model_dump(mode="json", include=set(fields) or None)
+        click.echo("  " + " ".join(f"{name}={value}" for name, value in values.items()))
+
+
+@cli.command()
+@click.option("--limit", default=DEFAULT_STATISTICS_LIMIT, type=int, help="Maximum number of rows per summary")
+def stats(limit: int) -> None:
+    try:
+        container = create_container()
+        use_case = container[ExposureStatisticsUseCase]
+
+        _display_statistics(use_case.statistics(limit))
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_statistics(statistics: ExposureStatistics) -> None:
+    click.echo(f"✓ Found {len(statistics.services)} service(s) with open ports:")
+
+    for service in statistics.services:
+        click.echo(f"  {_service_name(service)}: {service.open_ports} open port(s) on {service.hosts} host(s)")
+
+    click.echo(f"✓ Found {len(statistics.ports)} open port(s):")
+
+    for port in statistics.ports:
+        click.echo(f"  {port.port_number}/{port.protocol}: {port.hosts} host(s)")
+
+    click.echo(f"✓ Found {len(statistics.domains)} domain(s) with DNS records:")
+
+    for domain in statistics.domains:
+        click.echo(f"  {domain.domain_name}: {', '.join(record_type.value for record_type in domain.record_types)}")
+
+
+def _service_name(service: ServiceExposure) -> str:
+    return service.service_name or "unknown"
+
+
+@cli.command()
+@click.option("--after", default=0, type=int, help="Return changes with a sequence number greater than this")
+@click.option("--limit", default=DEFAULT_CHANGE_LIMIT, type=int, help="Maximum number of changes to return")
+def changes(after: int, limit: int) -> None:
+    try:
+        container = create_container()
+        use_case = container[TopologyChangeFeedUseCase]
+
+        _display_changes(after, use_case.changes_after(after, limit))
+    except ValueError as e:
+        click.echo(f"✗ Validation error: {str(e)}", err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+def _display_changes(after: int, results: List[TopologyChange]) -> None:
+    click.echo(f"✓ Found {len(results)} change(s) after sequence {after}:")
+
+    for change in results:
+        click.echo(f"  [{change.sequence}] {change.operation.value} {change.kind.value} {change.key}")
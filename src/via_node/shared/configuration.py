@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,13 +24,51 @@ class ApplicationSettings(BaseSettings):
     password: str = "password"
     reload: bool = False
     host: str = ""
+    repository_backend: Literal["arango", "memory", "sqlite"] = "arango"
+    sqlite_path: str = "via-node.sqlite3"
+    sqlite_timeout: float = 5.0
     arango_host: str = "172.17.0.1"
     arango_port: str = "8083"
+    arango_endpoints: str = ""
+    arango_host_selection: Literal["round-robin", "least-latency"] = "round-robin"
+    arango_host_ejection_threshold: int = 3
+    arango_host_ejection_period: float = 30.0
     arango_database: str = "network_topology"
     arango_username: str = "root"
     arango_password: str = ""
     arango_graph_name: str = "network_graph"
     arango_auto_create_database: bool = True
+    arango_bulk_chunk_size: int = 1000
+    arango_auto_migrate: bool = True
+    arango_http_pool_connections: int = 10
+    arango_http_pool_maxsize: int = 10
+    arango_http_pool_block: bool = False
+    arango_http_keep_alive: bool = True
+    arango_request_timeout: float = 60.0
+    arango_retry_attempts: int = 3
+    arango_retry_backoff_factor: float = 0.5
+    arango_retry_writes: bool = False
+    arango_request_compression_threshold: int = 0
+    arango_response_compression: str = ""
+    arango_async_max_connections: int = 100
+    arango_async_max_keepalive_connections: int = 20
+    arango_discovery_ttl_multiplier: float = 2.0
+    arango_hide_expired_discoveries: bool = False
+    arango_schema_marker_ttl: float = 300.0
+    arango_schema_marker_directory: str = "~/.cache/via-node"
+    write_buffer_enabled: bool = False
+    write_buffer_max_count: int = 1000
+    write_buffer_max_bytes: int = 1_048_576
+    write_buffer_max_delay: float = 1.0
+    write_buffer_max_backoff: float = 60.0
+    write_buffer_max_buffered_bytes: int = 67_108_864
+    change_feed_enabled: bool = False
+    change_feed_path: str = "~/.cache/via-node/changes.jsonl"
+    change_feed_max_bytes: int = 67_108_864
+    change_feed_socket_path: str = ""
+    change_feed_history_size: int = 10_000
+    change_feed_poll_interval: float = 1.0
+    change_feed_heartbeat_interval: float = 15.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,326 +1,96 @@
-from datetime import datetime
+from typing import List
 from unittest.mock import Mock
 
+import pytest
+from assertpy import assert_that
+
 from via_node.application.use_case.add_domain_port_edge_use_case import AddDomainPortEdgeUseCase
-from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.domain_port_link import DomainPortLink
 from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
-from via_node.domain.model.port import Port
+
+
+def create_repository() -> Mock:
+    repository = Mock()
+    repository.link_domain_ports.side_effect = lambda links: [link.edge for link in links]
+    return repository
+
+
+def linked(repository: Mock) -> List[DomainPortLink]:
+    return repository.link_domain_ports.call_args.args[0]
 
 
 class TestAddDomainPortEdgeUseCase:
-    def test_should_create_dns_record_when_it_does_not_exist(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        repository.create_or_update_dns_record.assert_called_once()
-
-    def test_should_create_port_when_it_does_not_exist(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        repository.create_or_update_port.assert_called_once()
-
-    def test_should_create_edge_between_dns_record_and_port(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        repository.create_edge.assert_called_once()
-
-    def test_should_update_existing_dns_record_when_it_exists(self) -> None:
-        existing_dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 1, 1),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = existing_dns_record
-        repository.create_or_update_dns_record.return_value = existing_dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        repository.create_or_update_dns_record.assert_called_once()
-
-    def test_should_update_existing_port_when_it_exists(self) -> None:
-        existing_port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name="https",
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 1, 1),
-        )
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = existing_port
-        repository.create_or_update_port.return_value = existing_port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        repository.create_or_update_port.assert_called_once()
+    def test_should_link_domain_and_port_in_single_repository_call(self) -> None:
+        repository = create_repository()
 
-    def test_should_return_created_edge(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        expected_edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = expected_edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        result = use_case.execute("example.com", 443, "TCP")
-
-        assert result == expected_edge
+        AddDomainPortEdgeUseCase(repository).execute("example.com", 443, "TCP")
+
+        repository.link_domain_ports.assert_called_once()
+        assert_that(linked(repository)).is_length(1)
+
+    def test_should_not_read_vertices_before_linking(self) -> None:
+        repository = create_repository()
+
+        AddDomainPortEdgeUseCase(repository).execute("example.com", 443, "TCP")
+
+        repository.get_dns_record.assert_not_called()
+        repository.get_port.assert_not_called()
+
+    def test_should_describe_dns_record_to_ensure(self) -> None:
+        repository = create_repository()
+
+        AddDomainPortEdgeUseCase(repository).execute("Example.com", 443, "TCP")
+
+        dns_record = linked(repository)[0].dns_record
+        assert_that(dns_record.domain_name).is_equal_to("example.com")
+        assert_that(dns_record.record_type).is_equal_to("A")
+        assert_that(dns_record.created_at).is_equal_to(dns_record.updated_at)
+
+    def test_should_describe_port_to_ensure(self) -> None:
+        repository = create_repository()
+
+        AddDomainPortEdgeUseCase(repository).execute("example.com", 53, "udp")
+
+        port = linked(repository)[0].port
+        assert_that(port.port_number).is_equal_to(53)
+        assert_that(port.protocol).is_equal_to("UDP")
 
     def test_should_use_tcp_as_default_protocol(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443)
-
-        repository.create_or_update_port.assert_called_once()
-
-    def test_should_pass_domain_name_to_dns_record_creation(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        call_args = repository.create_or_update_dns_record.call_args[0][0]
-        assert call_args.domain_name == "example.com"
-
-    def test_should_pass_port_number_to_port_creation(self) -> None:
-        dns_record = DnsRecord(
-            domain_name="example.com",
-            record_type="A",
-            ip_addresses=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        port = Port(
-            port_number=443,
-            protocol="TCP",
-            service_name=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        edge = NetworkTopologyEdge(
-            source_id="example.com",
-            target_id="443_TCP",
-            edge_type="domain_to_port",
-            metadata={},
-            created_at=datetime.now(),
-        )
-
-        repository = Mock()
-        repository.get_dns_record.return_value = None
-        repository.create_or_update_dns_record.return_value = dns_record
-        repository.get_port.return_value = None
-        repository.create_or_update_port.return_value = port
-        repository.create_edge.return_value = edge
-
-        use_case = AddDomainPortEdgeUseCase(repository)
-        use_case.execute("example.com", 443, "TCP")
-
-        call_args = repository.create_or_update_port.call_args[0][0]
-        assert call_args.port_number == 443
+        repository = create_repository()
+
+        AddDomainPortEdgeUseCase(repository).execute("example.com", 443)
+
+        assert_that(linked(repository)[0].port.protocol).is_equal_to("TCP")
+
+    def test_should_return_created_edge(self) -> None:
+        repository = create_repository()
+
+        edge = AddDomainPortEdgeUseCase(repository).execute("example.com", 443, "TCP")
+
+        assert_that(edge).is_instance_of(NetworkTopologyEdge)
+        assert_that(edge.source_id).is_equal_to("example.com")
+        assert_that(edge.target_id).is_equal_to("443_TCP")
+        assert_that(edge.edge_type).is_equal_to("domain_to_port")
+
+    def test_should_link_many_ports_in_single_repository_call(self) -> None:
+        repository = create_repository()
+
+        edges = AddDomainPortEdgeUseCase(repository).execute_many("example.com", [80, 443, 8443])
+
+        repository.link_domain_ports.assert_called_once()
+        assert_that([edge.target_id for edge in edges]).is_equal_to(["80_TCP", "443_TCP", "8443_TCP"])
+
+    def test_should_share_timestamp_across_batch(self) -> None:
+        repository = create_repository()
+
+        AddDomainPortEdgeUseCase(repository).execute_many("example.com", [80, 443])
+
+        assert_that({link.edge.created_at for link in linked(repository)}).is_length(1)
+
+    def test_should_reject_invalid_port_before_contacting_repository(self) -> None:
+        repository = create_repository()
+
+        with pytest.raises(ValueError):
+            AddDomainPortEdgeUseCase(repository).execute("example.com", 70000, "TCP")
+
+        repository.link_domain_ports.assert_not_called()
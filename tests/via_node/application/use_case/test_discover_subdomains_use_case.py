@@ -5,6 +5,7 @@ import pytest
 from assertpy import assert_that
 
 from via_node.application.use_case.discover_subdomains_use_case import DiscoverSubdomainsUseCase
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteFailedError, BulkWriteResult
 from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
 from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
 
@@ -134,7 +135,7 @@ class TestDiscoverSubdomainsUseCaseExecution:
             assert_that(result).is_instance_of(list)
             assert_that(len(result)).is_greater_than(0)
 
-    def test_execute_calls_repository_for_each_discovery(self) -> None:
+    def test_execute_stores_all_discoveries_in_single_bulk_call(self) -> None:
         repository = MagicMock(spec=NetworkTopologyRepository)
         use_case = DiscoverSubdomainsUseCase(repository)
 
@@ -151,9 +152,26 @@ class TestDiscoverSubdomainsUseCaseExecution:
             mock_discover.return_value = expected_discovery
             result = use_case.execute(domain_name="example.com")
 
-            assert_that(repository.create_or_update_dns_record_discovery.call_count).is_greater_than(0)
+            repository.bulk_upsert_dns_record_discoveries.assert_called_once_with(result)
             assert_that(result).is_instance_of(list)
 
+    def test_execute_raises_when_discoveries_fail_to_store(self) -> None:
+        repository = MagicMock(spec=NetworkTopologyRepository)
+        repository.bulk_upsert_dns_record_discoveries.return_value = BulkWriteResult(
+            errors=[BulkWriteError(index=0, key="www.example.com_A", error_message="conflict")]
+        )
+        use_case = DiscoverSubdomainsUseCase(repository, subdomains=["www"])
+        discovery = DnsRecordDiscovery(
+            domain_name="www.example.com",
+            record_type=DnsRecordType.A,
+            values=["192.168.1.1"],
+            discovered_at=datetime.now(),
+        )
+
+        with patch.object(use_case, "_discover_subdomain", return_value=discovery):
+            with pytest.raises(BulkWriteFailedError, match="www.example.com_A: conflict"):
+                use_case.execute(domain_name="example.com")
+
     def test_execute_with_custom_subdomains_list(self) -> None:
         repository = MagicMock(spec=NetworkTopologyRepository)
         custom_subdomains = ["custom1", "custom2"]
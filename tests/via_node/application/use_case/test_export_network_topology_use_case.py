@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Type
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from pydantic import BaseModel
+
+from via_node.application.use_case.export_network_topology_use_case import ExportNetworkTopologyUseCase
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import Page
+from via_node.domain.model.port import Port
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.domain.service.topology_snapshot_writer import TopologySnapshotWriter
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+PORTS = [
+    Port(port_number=port_number, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW)
+    for port_number in (22, 80, 443)
+]
+EDGE = NetworkTopologyEdge(
+    source_id="example.com", target_id="443_TCP", edge_type="domain_to_port", metadata={}, created_at=NOW
+)
+
+
+class RecordingSnapshotWriter(TopologySnapshotWriter):
+    def __init__(self) -> None:
+        self.collections: Dict[str, List[BaseModel]] = {}
+        self.model_classes: Dict[str, Type[BaseModel]] = {}
+        self.finished = False
+
+    def write_collection(self, name: str, model_class: Type[BaseModel], models: Iterable[BaseModel]) -> int:
+        self.collections[name] = list(models)
+        self.model_classes[name] = model_class
+        return len(self.collections[name])
+
+    def finish(self) -> None:
+        self.finished = True
+
+
+def paged(items: List[Any]) -> Any:
+    def list_page(page_size: int, page_token: Any = None) -> Page:
+        start = int(page_token or 0)
+        next_page_token = str(start + page_size) if start + page_size < len(items) else None
+        return Page(items=items[start : start + page_size], next_page_token=next_page_token)
+
+    return list_page
+
+
+@pytest.fixture
+def repository() -> Mock:
+    repository = Mock(spec=NetworkTopologyRepository)
+    empty = Page(items=[])
+
+    for method in ("list_dns_records", "list_hosts", "list_dns_record_discoveries", "list_port_scan_results"):
+        getattr(repository, method).return_value = empty
+
+    repository.list_ports.side_effect = paged(PORTS)
+    repository.list_edges.side_effect = lambda edge_type, page_size, page_token: (
+        Page(items=[EDGE]) if edge_type == "domain_to_port" else empty
+    )
+    return repository
+
+
+class TestExportNetworkTopologyUseCase:
+    def test_should_export_every_collection(self, repository: Mock) -> None:
+        writer = RecordingSnapshotWriter()
+
+        counts = ExportNetworkTopologyUseCase(repository).execute(writer, page_size=2)
+
+        assert_that(counts).is_equal_to(
+            {
+                "dns_records": 0,
+                "ports": 3,
+                "hosts": 0,
+                "dns_discoveries": 0,
+                "port_scan_results": 0,
+                "domain_port_edges": 1,
+                "dns_resolves_to_host_edges": 0,
+            }
+        )
+        assert_that(writer.finished).is_true()
+
+    def test_should_follow_page_tokens(self, repository: Mock) -> None:
+        writer = RecordingSnapshotWriter()
+
+        ExportNetworkTopologyUseCase(repository).execute(writer, page_size=2)
+
+        assert_that(writer.collections["ports"]).is_equal_to(PORTS)
+        assert_that(writer.model_classes["ports"]).is_equal_to(Port)
+        assert_that(repository.list_ports.call_count).is_equal_to(2)
+
+    def test_should_read_edges_by_type(self, repository: Mock) -> None:
+        writer = RecordingSnapshotWriter()
+
+        ExportNetworkTopologyUseCase(repository).execute(writer, page_size=5)
+
+        assert_that(writer.collections["domain_port_edges"]).is_equal_to([EDGE])
+        repository.list_edges.assert_any_call("dns_resolves_to_host", 5, None)
+
+    def test_should_reject_non_positive_page_size(self, repository: Mock) -> None:
+        with pytest.raises(ValueError, match="Page size must be at least 1"):
+            ExportNetworkTopologyUseCase(repository).execute(RecordingSnapshotWriter(), page_size=0)
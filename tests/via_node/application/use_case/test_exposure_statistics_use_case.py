@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.application.use_case.exposure_statistics_use_case import (
+    AsyncExposureStatisticsUseCase,
+    ExposureStatisticsUseCase,
+)
+from via_node.domain.model.dns_record_discovery import DnsRecordType
+from via_node.domain.model.exposure_statistics import DomainRecordTypes, PortExposure, ServiceExposure
+
+SERVICES = [ServiceExposure(service_name="http", open_ports=3, hosts=2)]
+PORTS = [PortExposure(port_number=80, protocol="tcp", hosts=2)]
+DOMAINS = [DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.A])]
+
+
+class TestExposureStatisticsUseCase:
+    def test_should_combine_repository_aggregations(self) -> None:
+        repository = Mock()
+        repository.open_ports_per_service.return_value = SERVICES
+        repository.hosts_per_open_port.return_value = PORTS
+        repository.record_types_per_domain.return_value = DOMAINS
+
+        statistics = ExposureStatisticsUseCase(repository).statistics(5)
+
+        repository.open_ports_per_service.assert_called_once_with(5)
+        repository.hosts_per_open_port.assert_called_once_with(5)
+        repository.record_types_per_domain.assert_called_once_with(5)
+        assert_that(statistics.services).is_equal_to(SERVICES)
+        assert_that(statistics.ports).is_equal_to(PORTS)
+        assert_that(statistics.domains).is_equal_to(DOMAINS)
+
+    def test_should_reject_non_positive_limit_before_contacting_repository(self) -> None:
+        repository = Mock()
+
+        with pytest.raises(ValueError, match="Statistics limit must be at least 1"):
+            ExposureStatisticsUseCase(repository).statistics(0)
+
+        repository.open_ports_per_service.assert_not_called()
+
+
+class TestAsyncExposureStatisticsUseCase:
+    def test_should_combine_repository_aggregations(self) -> None:
+        repository = AsyncMock()
+        repository.open_ports_per_service.return_value = SERVICES
+        repository.hosts_per_open_port.return_value = PORTS
+        repository.record_types_per_domain.return_value = DOMAINS
+
+        statistics = asyncio.run(AsyncExposureStatisticsUseCase(repository).statistics(5))
+
+        repository.open_ports_per_service.assert_awaited_once_with(5)
+        repository.hosts_per_open_port.assert_awaited_once_with(5)
+        repository.record_types_per_domain.assert_awaited_once_with(5)
+        assert_that(statistics.services).is_equal_to(SERVICES)
+        assert_that(statistics.ports).is_equal_to(PORTS)
+        assert_that(statistics.domains).is_equal_to(DOMAINS)
+
+    def test_should_reject_non_positive_limit_before_contacting_repository(self) -> None:
+        repository = AsyncMock()
+
+        with pytest.raises(ValueError, match="Statistics limit must be at least 1"):
+            asyncio.run(AsyncExposureStatisticsUseCase(repository).statistics(-1))
+
+        repository.open_ports_per_service.assert_not_awaited()
@@ -0,0 +1,38 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.application.use_case.port_scan_history_use_case import PortScanHistoryUseCase
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class TestPortScanHistoryUseCase:
+    def test_should_read_full_history_without_time(self) -> None:
+        repository = Mock()
+
+        result = PortScanHistoryUseCase(repository).history(" 10.0.0.1 ")
+
+        repository.get_port_scan_history.assert_called_once_with("10.0.0.1")
+        assert_that(result).is_same_as(repository.get_port_scan_history.return_value)
+
+    def test_should_read_state_at_time(self) -> None:
+        repository = Mock()
+
+        result = PortScanHistoryUseCase(repository).history("10.0.0.1", NOW)
+
+        repository.get_port_scan_state_at.assert_called_once_with("10.0.0.1", NOW)
+        assert_that(result).is_same_as(repository.get_port_scan_state_at.return_value)
+
+    def test_should_reject_empty_target(self) -> None:
+        with pytest.raises(ValueError, match="Target IP cannot be empty"):
+            PortScanHistoryUseCase(Mock()).history("  ")
+
+    def test_should_compact_history(self) -> None:
+        repository = Mock()
+
+        result = PortScanHistoryUseCase(repository).compact()
+
+        assert_that(result).is_same_as(repository.compact_port_scan_history.return_value)
@@ -0,0 +1,74 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.application.use_case.query_network_topology_use_case import (
+    AsyncQueryNetworkTopologyUseCase,
+    QueryNetworkTopologyUseCase,
+)
+
+
+class TestQueryNetworkTopologyUseCase:
+    def test_should_request_selected_port_scan_result_fields(self) -> None:
+        repository = Mock()
+
+        result = QueryNetworkTopologyUseCase(repository).port_scan_results(" 10.0.0.1 ", ["port_number", " state "])
+
+        repository.get_port_scan_results.assert_called_once_with("10.0.0.1", ["port_number", "state"])
+        assert_that(result).is_same_as(repository.get_port_scan_results.return_value)
+
+    def test_should_request_every_field_when_none_selected(self) -> None:
+        repository = Mock()
+
+        QueryNetworkTopologyUseCase(repository).port_scan_results("10.0.0.1", [])
+
+        repository.get_port_scan_results.assert_called_once_with("10.0.0.1", None)
+
+    def test_should_drop_repeated_fields(self) -> None:
+        repository = Mock()
+
+        QueryNetworkTopologyUseCase(repository).dns_record_discoveries("Example.com", ["values", "values", "ttl"])
+
+        repository.get_dns_record_discoveries.assert_called_once_with("example.com", ["values", "ttl"])
+
+    def test_should_reject_unknown_fields_before_contacting_repository(self) -> None:
+        repository = Mock()
+
+        with pytest.raises(ValueError, match=r"Unknown field\(s\) \['_rev'\]"):
+            QueryNetworkTopologyUseCase(repository).port_scan_results("10.0.0.1", ["state", "_rev"])
+
+        repository.get_port_scan_results.assert_not_called()
+
+    def test_should_reject_empty_domain_name(self) -> None:
+        repository = Mock()
+
+        with pytest.raises(ValueError, match="Domain name cannot be empty"):
+            QueryNetworkTopologyUseCase(repository).dns_record_discoveries(" ")
+
+        repository.get_dns_record_discoveries.assert_not_called()
+
+
+class TestAsyncQueryNetworkTopologyUseCase:
+    def test_should_request_selected_port_scan_result_fields(self) -> None:
+        repository = AsyncMock()
+
+        asyncio.run(AsyncQueryNetworkTopologyUseCase(repository).port_scan_results("10.0.0.1", ["state"]))
+
+        repository.get_port_scan_results.assert_awaited_once_with("10.0.0.1", ["state"])
+
+    def test_should_request_selected_dns_record_discovery_fields(self) -> None:
+        repository = AsyncMock()
+
+        asyncio.run(AsyncQueryNetworkTopologyUseCase(repository).dns_record_discoveries("example.com", ["values"]))
+
+        repository.get_dns_record_discoveries.assert_awaited_once_with("example.com", ["values"])
+
+    def test_should_reject_empty_target_ip(self) -> None:
+        repository = AsyncMock()
+
+        with pytest.raises(ValueError, match="Target IP cannot be empty"):
+            asyncio.run(AsyncQueryNetworkTopologyUseCase(repository).port_scan_results(""))
+
+        repository.get_port_scan_results.assert_not_awaited()
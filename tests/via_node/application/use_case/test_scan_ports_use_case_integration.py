@@ -1,9 +1,11 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
 from assertpy import assert_that
 
 from via_node.application.use_case.scan_ports_use_case import ScanPortsUseCase
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteFailedError, BulkWriteResult
 from via_node.domain.model.port_scan_result import PortScanResult, PortState
 from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
 
@@ -107,7 +109,7 @@ class TestScanPortsUseCaseIntegration:
             assert_that(result).is_length(3)
             assert_that([r.state for r in result]).contains(PortState.OPEN, PortState.CLOSED)
 
-    def test_execute_calls_repository_for_each_port(self) -> None:
+    def test_execute_stores_all_ports_in_single_bulk_call(self) -> None:
         repository = MagicMock(spec=NetworkTopologyRepository)
         use_case = ScanPortsUseCase(repository)
 
@@ -131,7 +133,8 @@ class TestScanPortsUseCaseIntegration:
 
             use_case.execute(target_ip="192.168.1.1")
 
-            assert_that(repository.create_or_update_port_scan_result.call_count).is_equal_to(2)
+            repository.bulk_upsert_port_scan_results.assert_called_once()
+            assert_that(repository.bulk_upsert_port_scan_results.call_args[0][0]).is_length(2)
 
     def test_execute_handles_udp_protocol(self) -> None:
         repository = MagicMock(spec=NetworkTopologyRepository)
@@ -287,3 +290,20 @@ class TestScanPortsUseCaseIntegration:
                 use_case.execute(target_ip="192.168.1.1")
             except ValueError as e:
                 assert_that(str(e)).contains("No open ports found")
+
+    def test_execute_raises_when_results_fail_to_store(self) -> None:
+        repository = MagicMock(spec=NetworkTopologyRepository)
+        repository.bulk_upsert_port_scan_results.return_value = BulkWriteResult(
+            errors=[BulkWriteError(index=0, key="192.168.1.1_tcp_80", error_message="conflict")]
+        )
+        use_case = ScanPortsUseCase(repository)
+
+        with patch("via_node.application.use_case.scan_ports_use_case.nmap.PortScanner") as mock_scanner_class:
+            mock_scanner = mock_scanner_class.return_value
+            mock_scanner.all_hosts.return_value = ["192.168.1.1"]
+            mock_scanner.__getitem__.return_value.all_protocols.return_value = ["tcp"]
+            mock_scanner.__getitem__.return_value.__getitem__.return_value.keys.return_value = [80]
+            mock_scanner.__getitem__.return_value.__getitem__.return_value.__getitem__.return_value = {"state": "open"}
+
+            with pytest.raises(BulkWriteFailedError, match="Stored 0 of 1 document\\(s\\), failed 192.168.1.1_tcp_80"):
+                use_case.execute(target_ip="192.168.1.1")
@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.application.use_case.topology_change_feed_use_case import (
+    AsyncTopologyChangeFeedUseCase,
+    TopologyChangeFeedUseCase,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeReader
+
+
+class TestTopologyChangeFeedUseCase:
+    def test_should_read_changes_after_sequence(self) -> None:
+        reader = Mock(spec=TopologyChangeReader)
+
+        result = TopologyChangeFeedUseCase(reader).changes_after(5, 10)
+
+        reader.read_after.assert_called_once_with(5, 10)
+        assert_that(result).is_same_as(reader.read_after.return_value)
+
+    def test_should_report_latest_sequence(self) -> None:
+        reader = Mock(spec=TopologyChangeReader)
+        reader.last_sequence.return_value = 42
+
+        assert_that(TopologyChangeFeedUseCase(reader).latest_sequence()).is_equal_to(42)
+
+    def test_should_reject_invalid_position_before_reading(self) -> None:
+        reader = Mock(spec=TopologyChangeReader)
+
+        with pytest.raises(ValueError, match="Change limit must be at least 1"):
+            TopologyChangeFeedUseCase(reader).changes_after(0, 0)
+
+        reader.read_after.assert_not_called()
+
+
+class TestAsyncTopologyChangeFeedUseCase:
+    def test_should_read_changes_off_the_event_loop(self) -> None:
+        reader = Mock(spec=TopologyChangeReader)
+        reader.last_sequence.return_value = 3
+
+        result = asyncio.run(AsyncTopologyChangeFeedUseCase(reader).changes_after(1))
+        latest = asyncio.run(AsyncTopologyChangeFeedUseCase(reader).latest_sequence())
+
+        reader.read_after.assert_called_once_with(1, 1000)
+        assert_that(result).is_same_as(reader.read_after.return_value)
+        assert_that(latest).is_equal_to(3)
+
+    def test_should_reject_negative_sequence(self) -> None:
+        reader = Mock(spec=TopologyChangeReader)
+
+        with pytest.raises(ValueError, match="Sequence must not be negative"):
+            asyncio.run(AsyncTopologyChangeFeedUseCase(reader).changes_after(-1))
@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.application.use_case.traverse_network_topology_use_case import (
+    AsyncTraverseNetworkTopologyUseCase,
+    TraverseNetworkTopologyUseCase,
+)
+from via_node.domain.model.topology_traversal import TraversalDirection, VertexReference
+
+DOMAIN = VertexReference(kind="dns_record", key="example.com")
+HOST = VertexReference(kind="host", key="10.0.0.1")
+
+
+class TestTraverseNetworkTopologyUseCase:
+    def test_should_parse_neighbors_request(self) -> None:
+        repository = Mock()
+
+        result = TraverseNetworkTopologyUseCase(repository).neighbors(
+            "dns_record:example.com", 2, "INBOUND", ["domain_to_port"], 10
+        )
+
+        repository.neighbors.assert_called_once_with(DOMAIN, 2, TraversalDirection.INBOUND, ["domain_to_port"], 10)
+        assert_that(result).is_same_as(repository.neighbors.return_value)
+
+    def test_should_follow_every_edge_type_when_none_given(self) -> None:
+        repository = Mock()
+
+        TraverseNetworkTopologyUseCase(repository).neighbors("dns_record:example.com", edge_types=[])
+
+        assert_that(repository.neighbors.call_args.args[3]).is_none()
+
+    def test_should_parse_shortest_path_request(self) -> None:
+        repository = Mock()
+
+        result = TraverseNetworkTopologyUseCase(repository).shortest_path("dns_record:example.com", "host:10.0.0.1", 3)
+
+        repository.shortest_path.assert_called_once_with(DOMAIN, HOST, 3, TraversalDirection.ANY, None)
+        assert_that(result).is_same_as(repository.shortest_path.return_value)
+
+    def test_should_reject_unknown_direction_before_contacting_repository(self) -> None:
+        repository = Mock()
+
+        with pytest.raises(ValueError, match="Direction must be one of"):
+            TraverseNetworkTopologyUseCase(repository).neighbors("dns_record:example.com", direction="sideways")
+
+        repository.neighbors.assert_not_called()
+
+    def test_should_reject_malformed_vertex_before_contacting_repository(self) -> None:
+        repository = Mock()
+
+        with pytest.raises(ValueError):
+            TraverseNetworkTopologyUseCase(repository).shortest_path("example.com", "host:10.0.0.1")
+
+        repository.shortest_path.assert_not_called()
+
+
+class TestAsyncTraverseNetworkTopologyUseCase:
+    def test_should_parse_neighbors_request(self) -> None:
+        repository = AsyncMock()
+
+        asyncio.run(AsyncTraverseNetworkTopologyUseCase(repository).neighbors("dns_record:example.com", 2))
+
+        repository.neighbors.assert_awaited_once_with(DOMAIN, 2, TraversalDirection.OUTBOUND, None, 1000)
+
+    def test_should_parse_shortest_path_request(self) -> None:
+        repository = AsyncMock()
+
+        asyncio.run(
+            AsyncTraverseNetworkTopologyUseCase(repository).shortest_path(
+                "dns_record:example.com", "host:10.0.0.1", direction="outbound", edge_types=["dns_resolves_to_host"]
+            )
+        )
+
+        repository.shortest_path.assert_awaited_once_with(
+            DOMAIN, HOST, 10, TraversalDirection.OUTBOUND, ["dns_resolves_to_host"]
+        )
@@ -0,0 +1,47 @@
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteFailedError, BulkWriteResult
+
+
+class TestBulkWriteResult:
+    def test_should_start_empty(self) -> None:
+        result = BulkWriteResult()
+
+        assert_that(result.written).is_equal_to(0)
+        assert_that(result.errors).is_empty()
+
+    def test_should_report_no_errors_when_errors_are_empty(self) -> None:
+        result = BulkWriteResult(written=3)
+
+        assert_that(result.has_errors).is_false()
+
+    def test_should_report_errors_when_errors_exist(self) -> None:
+        result = BulkWriteResult(errors=[BulkWriteError(index=1, key="example.com", error_message="conflict")])
+
+        assert_that(result.has_errors).is_true()
+
+    def test_should_not_share_errors_between_instances(self) -> None:
+        first = BulkWriteResult()
+        second = BulkWriteResult()
+
+        first.errors.append(BulkWriteError(index=0, error_message="conflict"))
+
+        assert_that(second.errors).is_empty()
+
+    def test_should_accept_result_without_errors(self) -> None:
+        BulkWriteResult(written=3).raise_for_errors(3)
+
+    def test_should_raise_for_failed_documents(self) -> None:
+        result = BulkWriteResult(
+            written=1,
+            errors=[
+                BulkWriteError(index=1, key="example.com", error_message="conflict"),
+                BulkWriteError(index=2, error_message="timeout"),
+            ],
+        )
+
+        with pytest.raises(
+            BulkWriteFailedError, match="Stored 1 of 3 document\\(s\\), failed example.com: conflict; 2: timeout"
+        ):
+            result.raise_for_errors(3)
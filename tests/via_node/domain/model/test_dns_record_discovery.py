@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from assertpy import assert_that
@@ -185,6 +185,30 @@ class TestDnsRecordDiscoveryTtlValidation:
         assert_that(discovery.ttl).is_equal_to(86400)
 
 
+class TestDnsRecordDiscoveryExpiry:
+    def test_expires_after_multiple_of_ttl(self) -> None:
+        discovered_at = datetime(2024, 1, 1, 12, 0, 0)
+        discovery = DnsRecordDiscovery(
+            domain_name="example.com",
+            record_type=DnsRecordType.A,
+            values=["192.168.1.1"],
+            ttl=300,
+            discovered_at=discovered_at,
+        )
+
+        assert_that(discovery.expires_at(2.0)).is_equal_to(discovered_at + timedelta(seconds=600))
+
+    def test_never_expires_without_ttl(self) -> None:
+        discovery = DnsRecordDiscovery(
+            domain_name="example.com",
+            record_type=DnsRecordType.A,
+            values=["192.168.1.1"],
+            discovered_at=datetime.now(),
+        )
+
+        assert_that(discovery.expires_at(2.0)).is_none()
+
+
 class TestDnsRecordTypeEnum:
     def test_dns_record_type_a(self) -> None:
         assert_that(DnsRecordType.A.value).is_equal_to("A")
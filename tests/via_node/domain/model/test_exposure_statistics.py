@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.exposure_statistics import (
+    DomainRecordTypes,
+    PortExposure,
+    ServiceExposure,
+    domain_record_types,
+    port_exposures,
+    service_exposures,
+    validate_statistics_limit,
+)
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def scan_result(
+    target_ip: str, port_number: int, service_name: Optional[str], state: PortState = PortState.OPEN
+) -> PortScanResult:
+    return PortScanResult(
+        target_ip=target_ip,
+        port_number=port_number,
+        protocol="tcp",
+        state=state,
+        service_name=service_name,
+        scanned_at=NOW,
+    )
+
+
+def discovery(domain_name: str, record_type: DnsRecordType) -> DnsRecordDiscovery:
+    return DnsRecordDiscovery(domain_name=domain_name, record_type=record_type, values=["10.0.0.1"], discovered_at=NOW)
+
+
+RESULTS = [
+    scan_result("10.0.0.1", 22, "ssh"),
+    scan_result("10.0.0.1", 2222, "ssh"),
+    scan_result("10.0.0.2", 22, "ssh"),
+    scan_result("10.0.0.1", 80, "http"),
+    scan_result("10.0.0.2", 80, "http", PortState.CLOSED),
+    scan_result("10.0.0.3", 9000, None),
+]
+
+
+class TestExposureStatistics:
+    def test_should_count_open_ports_and_distinct_hosts_per_service(self) -> None:
+        assert_that(service_exposures(RESULTS, 10)).is_equal_to(
+            [
+                ServiceExposure(service_name="ssh", open_ports=3, hosts=2),
+                ServiceExposure(service_name=None, open_ports=1, hosts=1),
+                ServiceExposure(service_name="http", open_ports=1, hosts=1),
+            ]
+        )
+
+    def test_should_count_hosts_per_open_port(self) -> None:
+        assert_that(port_exposures(RESULTS, 10)).is_equal_to(
+            [
+                PortExposure(port_number=22, protocol="tcp", hosts=2),
+                PortExposure(port_number=80, protocol="tcp", hosts=1),
+                PortExposure(port_number=2222, protocol="tcp", hosts=1),
+                PortExposure(port_number=9000, protocol="tcp", hosts=1),
+            ]
+        )
+
+    def test_should_collect_distinct_record_types_per_domain(self) -> None:
+        discoveries = [
+            discovery("b.example.com", DnsRecordType.MX),
+            discovery("a.example.com", DnsRecordType.TXT),
+            discovery("a.example.com", DnsRecordType.A),
+        ]
+
+        assert_that(domain_record_types(discoveries, 10)).is_equal_to(
+            [
+                DomainRecordTypes(domain_name="a.example.com", record_types=[DnsRecordType.A, DnsRecordType.TXT]),
+                DomainRecordTypes(domain_name="b.example.com", record_types=[DnsRecordType.MX]),
+            ]
+        )
+
+    def test_should_truncate_to_limit(self) -> None:
+        assert_that(service_exposures(RESULTS, 1)).is_length(1)
+        assert_that(port_exposures(RESULTS, 2)).is_length(2)
+
+    def test_should_reject_non_positive_limit(self) -> None:
+        with pytest.raises(ValueError, match="Statistics limit must be at least 1"):
+            validate_statistics_limit(0)
@@ -2,7 +2,12 @@ from datetime import datetime
 
 import pytest
 
-from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.network_topology_edge import (
+    NetworkTopologyEdge,
+    VertexNotFoundError,
+    edge_key,
+    validate_edge_type,
+)
 
 
 class TestNetworkTopologyEdge:
@@ -70,6 +75,12 @@ class TestNetworkTopologyEdge:
 
         assert edge.edge_type == "domain_to_port"
 
+    def test_should_validate_edge_type_outside_model(self) -> None:
+        assert validate_edge_type("DNS_RESOLVES_TO_HOST") == "dns_resolves_to_host"
+
+        with pytest.raises(ValueError, match="Edge type must be one of"):
+            validate_edge_type("peers_with")
+
     def test_should_raise_error_when_edge_type_is_invalid(self) -> None:
         with pytest.raises(ValueError, match="Edge type must be one of"):
             NetworkTopologyEdge(
@@ -91,3 +102,83 @@ class TestNetworkTopologyEdge:
         )
 
         assert edge.metadata == metadata
+
+
+class TestNetworkTopologyEdgeKey:
+    def test_should_derive_same_key_for_same_endpoints_and_type(self) -> None:
+        first = NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="443_TCP",
+            edge_type="domain_to_port",
+            metadata={},
+            created_at=datetime(2024, 1, 1),
+        )
+        second = NetworkTopologyEdge(
+            source_id=" example.com ",
+            target_id="443_TCP",
+            edge_type="DOMAIN_TO_PORT",
+            metadata={"seen": True},
+            created_at=datetime(2024, 6, 1),
+        )
+
+        assert first.key == second.key
+
+    def test_should_derive_different_key_for_different_target(self) -> None:
+        assert edge_key("domain_to_port", "example.com", "443_TCP") != edge_key(
+            "domain_to_port", "example.com", "80_TCP"
+        )
+
+    def test_should_derive_different_key_for_different_type(self) -> None:
+        assert edge_key("domain_to_port", "example.com", "x") != edge_key("dns_resolves_to_host", "example.com", "x")
+
+    def test_should_derive_arango_safe_key(self) -> None:
+        assert edge_key("domain_to_port", "example.com", "443_TCP").isalnum()
+
+    def test_should_default_last_seen_at_to_none(self) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="443_TCP",
+            edge_type="domain_to_port",
+            metadata={},
+            created_at=datetime(2024, 1, 1),
+        )
+
+        assert edge.last_seen_at is None
+
+
+class TestVertexNotFoundError:
+    def test_should_describe_missing_dns_record(self) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="10.0.0.1",
+            edge_type="dns_resolves_to_host",
+            metadata={},
+            created_at=datetime.now(),
+        )
+
+        assert str(VertexNotFoundError.for_edge(edge, source_found=False)) == "DNS record 'example.com' not found"
+
+    def test_should_describe_missing_host(self) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="10.0.0.1",
+            edge_type="dns_resolves_to_host",
+            metadata={},
+            created_at=datetime.now(),
+        )
+
+        assert str(VertexNotFoundError.for_edge(edge, source_found=True)) == "Host with IP '10.0.0.1' not found"
+
+    def test_should_describe_missing_port(self) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="443_TCP",
+            edge_type="domain_to_port",
+            metadata={},
+            created_at=datetime.now(),
+        )
+
+        assert str(VertexNotFoundError.for_edge(edge, source_found=True)) == "Port '443_TCP' not found"
+
+    def test_should_be_a_value_error(self) -> None:
+        assert issubclass(VertexNotFoundError, ValueError)
@@ -0,0 +1,19 @@
+from assertpy import assert_that
+
+from via_node.domain.model.page import InvalidPageTokenError, Page
+
+
+class TestPage:
+    def test_should_start_empty_without_next_page(self) -> None:
+        page: Page[str] = Page()
+
+        assert_that(page.items).is_empty()
+        assert_that(page.has_next_page).is_false()
+
+    def test_should_report_next_page_when_token_present(self) -> None:
+        page = Page[str](items=["a"], next_page_token="token")
+
+        assert_that(page.has_next_page).is_true()
+
+    def test_should_treat_invalid_page_token_as_value_error(self) -> None:
+        assert_that(issubclass(InvalidPageTokenError, ValueError)).is_true()
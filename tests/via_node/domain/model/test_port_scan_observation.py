@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from assertpy import assert_that
+
+from via_node.domain.model.port_scan_observation import (
+    PortScanObservation,
+    compact_history,
+    compact_series,
+    observation_key,
+)
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def observation(hours: int, state: PortState = PortState.OPEN, port_number: int = 22) -> PortScanObservation:
+    return PortScanObservation.from_result(
+        PortScanResult(
+            target_ip="10.0.0.1",
+            port_number=port_number,
+            protocol="tcp",
+            state=state,
+            service_name="ssh",
+            scanned_at=NOW + timedelta(hours=hours),
+        )
+    )
+
+
+class TestPortScanObservation:
+    def test_should_start_as_single_observation_of_result(self) -> None:
+        started = observation(0)
+
+        assert_that(started.first_observed_at).is_equal_to(NOW)
+        assert_that(started.last_observed_at).is_equal_to(NOW)
+        assert_that(started.observations).is_equal_to(1)
+
+    def test_should_key_by_series_and_start(self) -> None:
+        assert_that(observation(0).key).is_equal_to(observation_key("10.0.0.1", "tcp", 22, NOW))
+        assert_that(observation(0).key).is_not_equal_to(observation(1).key)
+
+    def test_should_compare_state_within_series(self) -> None:
+        assert_that(observation(0).same_state(observation(1))).is_true()
+        assert_that(observation(0).same_state(observation(1, PortState.CLOSED))).is_false()
+        assert_that(observation(0).same_state(observation(1, port_number=80))).is_false()
+
+    def test_should_extend_interval_with_later_observation(self) -> None:
+        extended = observation(0).extend(observation(2))
+
+        assert_that(extended.first_observed_at).is_equal_to(NOW)
+        assert_that(extended.last_observed_at).is_equal_to(NOW + timedelta(hours=2))
+        assert_that(extended.observations).is_equal_to(2)
+
+
+class TestCompactSeries:
+    def test_should_collapse_runs_of_identical_observations(self) -> None:
+        intervals = compact_series([observation(3), observation(0), observation(1), observation(2, PortState.CLOSED)])
+
+        assert_that(
+            [(interval.first_observed_at.hour, interval.observations) for interval, _ in intervals]
+        ).is_equal_to([(12, 2), (14, 1), (15, 1)])
+        assert_that([len(absorbed) for _, absorbed in intervals]).is_equal_to([1, 0, 0])
+
+    def test_should_yield_only_intervals_that_absorbed_observations(self) -> None:
+        history = [observation(0), observation(1), observation(0, port_number=80), observation(1, PortState.CLOSED, 80)]
+
+        compacted = list(compact_history(history))
+
+        assert_that(compacted).is_length(1)
+        assert_that(compacted[0][0].port_number).is_equal_to(22)
+        assert_that(compacted[0][1]).is_equal_to([observation(1)])
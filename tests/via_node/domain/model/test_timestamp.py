@@ -0,0 +1,38 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.timestamp import epoch_microseconds
+
+
+@pytest.fixture
+def berlin_time(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestEpochMicroseconds:
+    def test_should_count_microseconds_since_epoch(self) -> None:
+        value = datetime(1970, 1, 1, 0, 0, 1, 500, tzinfo=timezone.utc)
+
+        assert_that(epoch_microseconds(value)).is_equal_to(1_000_500)
+
+    def test_should_order_offsets_by_instant(self) -> None:
+        earlier = datetime(2024, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=1)))
+        later = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        assert_that(epoch_microseconds(earlier)).is_less_than(epoch_microseconds(later))
+
+    def test_should_treat_naive_values_as_local_time(self, berlin_time: None) -> None:
+        naive = datetime(2024, 1, 1, 12, 0)
+
+        assert_that(epoch_microseconds(naive)).is_equal_to(int(naive.timestamp() * 1_000_000))
+        assert_that(epoch_microseconds(naive)).is_equal_to(
+            epoch_microseconds(datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc))
+        )
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.topology_change import (
+    ChangeSequenceExpiredError,
+    TopologyChangeFingerprints,
+    TopologyChangeKind,
+    TopologyChangeOperation,
+    dns_record_discovery_change,
+    edge_change,
+    host_change,
+    port_change,
+    port_scan_result_change,
+    validate_after_sequence,
+    validate_change_limit,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class TestTopologyChange:
+    def test_should_describe_opened_port_with_its_storage_key(self) -> None:
+        result = PortScanResult(
+            target_ip="10.0.0.1", port_number=22, protocol="tcp", state=PortState.OPEN, scanned_at=NOW
+        )
+
+        change = port_scan_result_change(result)
+
+        assert_that(change.kind).is_equal_to(TopologyChangeKind.PORT_SCAN_RESULT)
+        assert_that(change.key).is_equal_to("10.0.0.1_tcp_22")
+        assert_that(change.document).contains_entry({"state": "open"}, {"scanned_at": "2024-01-01T12:00:00"})
+        assert_that(change.sequence).is_equal_to(0)
+
+    def test_should_key_vertices_and_edges_like_the_repositories(self) -> None:
+        port = Port(port_number=443, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW)
+        host = Host(ip_address="10.0.0.1", hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+        edge = NetworkTopologyEdge(
+            source_id="example.com", target_id="10.0.0.1", edge_type="dns_resolves_to_host", metadata={}, created_at=NOW
+        )
+        discovery = DnsRecordDiscovery(
+            domain_name="example.com", record_type=DnsRecordType.MX, values=["mail"], discovered_at=NOW
+        )
+
+        assert_that(port_change(port).key).is_equal_to("443_TCP")
+        assert_that(host_change(host).key).is_equal_to("10.0.0.1")
+        assert_that(edge_change(edge).key).is_equal_to(edge.key)
+        assert_that(dns_record_discovery_change(discovery).key).is_equal_to("example.com_MX")
+
+    def test_should_fingerprint_documents_without_timestamps(self) -> None:
+        first = Host(ip_address="10.0.0.1", hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+        rescanned = first.model_copy(update={"updated_at": datetime(2024, 2, 1)})
+        renamed = first.model_copy(update={"hostname": "api"})
+
+        assert_that(host_change(rescanned).fingerprint).is_equal_to(host_change(first).fingerprint)
+        assert_that(host_change(renamed).fingerprint).is_not_equal_to(host_change(first).fingerprint)
+
+    def test_should_keep_only_changed_documents(self) -> None:
+        host = Host(ip_address="10.0.0.1", hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+        fingerprints = TopologyChangeFingerprints()
+
+        [created] = fingerprints.changed([host_change(host)])
+        unchanged = fingerprints.changed([host_change(host)])
+        [updated] = fingerprints.changed([host_change(host.model_copy(update={"os_type": "bsd"}))])
+
+        assert_that(created.operation).is_equal_to(TopologyChangeOperation.CREATED)
+        assert_that(unchanged).is_empty()
+        assert_that(updated.operation).is_equal_to(TopologyChangeOperation.UPDATED)
+
+    def test_should_reject_negative_sequence(self) -> None:
+        with pytest.raises(ValueError, match="Sequence must not be negative"):
+            validate_after_sequence(-1)
+
+    def test_should_reject_non_positive_limit(self) -> None:
+        with pytest.raises(ValueError, match="Change limit must be at least 1"):
+            validate_change_limit(0)
+
+    def test_should_report_oldest_retained_sequence(self) -> None:
+        error = ChangeSequenceExpiredError.for_sequence(3, 10)
+
+        assert_that(error).is_instance_of(ValueError)
+        assert_that(str(error)).is_equal_to("Changes after sequence 3 are no longer retained, oldest is 10")
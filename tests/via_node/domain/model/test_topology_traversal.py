@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.topology_traversal import (
+    EDGE_TYPES,
+    MAX_TRAVERSAL_DEPTH,
+    TraversalPath,
+    VertexReference,
+    edge_endpoints,
+    selected_edge_types,
+    validate_edge_types,
+    validate_traversal_depth,
+    validate_traversal_limit,
+)
+
+
+class TestVertexReference:
+    def test_should_parse_kind_and_key(self) -> None:
+        vertex = VertexReference.parse("dns_record:example.com")
+
+        assert_that(vertex.kind).is_equal_to("dns_record")
+        assert_that(vertex.key).is_equal_to("example.com")
+
+    def test_should_keep_separators_inside_key(self) -> None:
+        assert_that(VertexReference.parse("host:fe80::1").key).is_equal_to("fe80::1")
+
+    def test_should_normalize_kind(self) -> None:
+        assert_that(VertexReference.parse(" Host :10.0.0.1").kind).is_equal_to("host")
+
+    def test_should_render_as_reference(self) -> None:
+        assert_that(str(VertexReference(kind="port", key="443_TCP"))).is_equal_to("port:443_TCP")
+
+    def test_should_reject_reference_without_kind(self) -> None:
+        with pytest.raises(ValueError, match="<kind>:<key>"):
+            VertexReference.parse("example.com")
+
+    def test_should_reject_unknown_kind(self) -> None:
+        with pytest.raises(ValueError, match="Vertex kind must be one of"):
+            VertexReference.parse("router:10.0.0.1")
+
+    def test_should_reject_empty_key(self) -> None:
+        with pytest.raises(ValueError, match="Vertex key cannot be empty"):
+            VertexReference.parse("host: ")
+
+
+class TestTraversalPath:
+    def test_should_measure_length_in_hops(self) -> None:
+        path = TraversalPath(
+            vertices=[VertexReference.parse("dns_record:example.com"), VertexReference.parse("host:10.0.0.1")],
+            edges=[
+                NetworkTopologyEdge(
+                    source_id="example.com",
+                    target_id="10.0.0.1",
+                    edge_type="dns_resolves_to_host",
+                    metadata={},
+                    created_at=datetime(2024, 1, 1),
+                )
+            ],
+        )
+
+        assert_that(path.length).is_equal_to(1)
+
+
+class TestTraversalValidation:
+    @pytest.mark.parametrize("depth", [1, MAX_TRAVERSAL_DEPTH])
+    def test_should_accept_depth_within_bounds(self, depth: int) -> None:
+        assert_that(validate_traversal_depth(depth)).is_equal_to(depth)
+
+    @pytest.mark.parametrize("depth", [0, MAX_TRAVERSAL_DEPTH + 1])
+    def test_should_reject_depth_out_of_bounds(self, depth: int) -> None:
+        with pytest.raises(ValueError, match="Traversal depth must be between 1 and"):
+            validate_traversal_depth(depth)
+
+    def test_should_normalize_edge_types(self) -> None:
+        assert_that(validate_edge_types(["DOMAIN_TO_PORT"])).is_equal_to(["domain_to_port"])
+
+    def test_should_reject_unknown_edge_type(self) -> None:
+        with pytest.raises(ValueError, match="Edge type must be one of"):
+            validate_edge_types(["domain_to_port", "peers_with"])
+
+    def test_should_reject_non_positive_limit(self) -> None:
+        with pytest.raises(ValueError, match="Traversal limit must be at least 1"):
+            validate_traversal_limit(0)
+
+
+class TestEdgeEndpoints:
+    @pytest.mark.parametrize("edge_type,target_kind", [("domain_to_port", "port"), ("dns_resolves_to_host", "host")])
+    def test_should_resolve_vertices_joined_by_edge(self, edge_type: str, target_kind: str) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com", target_id="t", edge_type=edge_type, metadata={}, created_at=datetime(2024, 1, 1)
+        )
+
+        assert_that(edge_endpoints(edge)).is_equal_to(
+            (VertexReference(kind="dns_record", key="example.com"), VertexReference(kind=target_kind, key="t"))
+        )
+
+
+class TestSelectedEdgeTypes:
+    def test_should_select_every_edge_type_by_default(self) -> None:
+        assert_that(selected_edge_types(None)).is_equal_to(list(EDGE_TYPES))
+
+    def test_should_select_requested_edge_types(self) -> None:
+        assert_that(selected_edge_types(["DNS_RESOLVES_TO_HOST"])).is_equal_to(["dns_resolves_to_host"])
@@ -0,0 +1,13 @@
+from assertpy import assert_that
+
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+
+ASYNC_ONLY = {"aclose"}
+
+
+class TestAsyncNetworkTopologyRepository:
+    def test_should_declare_every_synchronous_operation(self) -> None:
+        assert_that(AsyncNetworkTopologyRepository.__abstractmethods__ - ASYNC_ONLY).is_equal_to(
+            NetworkTopologyRepository.__abstractmethods__
+        )
@@ -0,0 +1,216 @@
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.topology_change import TopologyChange, TopologyChangeKind, TopologyChangeOperation
+from via_node.infrastructure.change_feed.jsonl_change_log import JsonlChangeLog, last_complete_line
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def change(key: str, fingerprint: str = "a") -> TopologyChange:
+    return TopologyChange(
+        kind=TopologyChangeKind.PORT, key=key, fingerprint=fingerprint, occurred_at=NOW, document={"key": key}
+    )
+
+
+def changes(*keys: str) -> List[TopologyChange]:
+    return [change(key) for key in keys]
+
+
+def sequences(log: JsonlChangeLog, after_sequence: int = 0) -> List[int]:
+    return [change.sequence for change in log.read_after(after_sequence, 1000)]
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "feed" / "changes.jsonl"
+
+
+class TestJsonlChangeLog:
+    def test_should_append_one_json_line_per_change(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+
+        recorded = log.append(changes("1", "2"))
+        log.close()
+
+        lines = path.read_text().splitlines()
+        assert_that([change.sequence for change in recorded]).is_equal_to([1, 2])
+        assert_that(lines).is_length(2)
+        assert_that(TopologyChange.model_validate_json(lines[1])).is_equal_to(recorded[1])
+
+    def test_should_read_changes_after_sequence(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1", "2", "3", "4"))
+
+        assert_that(sequences(log, 2)).is_equal_to([3, 4])
+        assert_that([change.sequence for change in log.read_after(0, 2)]).is_equal_to([1, 2])
+        assert_that(log.read_after(4, 10)).is_empty()
+
+    def test_should_continue_sequence_written_by_another_writer(self, path: Path) -> None:
+        first = JsonlChangeLog(str(path))
+        second = JsonlChangeLog(str(path))
+        first.append(changes("1"))
+        first.read_after(0, 10)
+
+        recorded = second.append(changes("2", "3"))
+
+        assert_that([change.sequence for change in recorded]).is_equal_to([2, 3])
+        assert_that(sequences(first, 1)).is_equal_to([2, 3])
+        first.append(changes("4"))
+        assert_that(sequences(second)).is_equal_to([1, 2, 3, 4])
+
+    def test_should_keep_sequence_monotonic_across_concurrent_writers(self, path: Path) -> None:
+        writers = [JsonlChangeLog(str(path)) for _ in range(4)]
+
+        def write(writer_index: int) -> None:
+            for change_index in range(50):
+                writers[writer_index].append(changes(f"{writer_index}_{change_index}"))
+
+        threads = [threading.Thread(target=write, args=(index,)) for index in range(len(writers))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_that(sequences(JsonlChangeLog(str(path)))).is_equal_to(list(range(1, 201)))
+
+    def test_should_skip_unchanged_documents(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append([change("443", "open")])
+
+        assert_that(log.append([change("443", "open")])).is_empty()
+        assert_that(JsonlChangeLog(str(path)).append([change("443", "open")])).is_empty()
+
+    def test_should_mark_changed_documents_as_updated(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append([change("443", "open")])
+
+        [updated] = JsonlChangeLog(str(path)).append([change("443", "closed")])
+
+        assert_that(updated.operation).is_equal_to(TopologyChangeOperation.UPDATED)
+        assert_that(updated.sequence).is_equal_to(2)
+
+    def test_should_record_change_again_after_failed_write(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+
+        with patch(
+            "via_node.infrastructure.change_feed.jsonl_change_log.encode_changes", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(OSError):
+                log.append(changes("1"))
+
+        assert_that([change.sequence for change in log.append(changes("1"))]).is_equal_to([1])
+
+    def test_should_skip_partially_written_line(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1"))
+        with path.open("ab") as file:
+            file.write(b'{"sequence":2,"kind"')
+
+        assert_that(sequences(log)).is_equal_to([1])
+        assert_that(log.last_sequence()).is_equal_to(1)
+
+    def test_should_terminate_partially_written_line_before_appending(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1"))
+        with path.open("ab") as file:
+            file.write(b'{"sequence":2,"kind"')
+
+        log.append(changes("2"))
+
+        assert_that(sequences(log)).is_equal_to([1, 2])
+        assert_that(log.read_after(1, 10)[0].key).is_equal_to("2")
+
+    def test_should_skip_lines_without_sequence(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1"))
+        with path.open("ab") as file:
+            file.write(b"\n")
+        log.append(changes("2"))
+
+        assert_that(sequences(log)).is_equal_to([1, 2])
+
+    def test_should_index_keys_that_need_escaping(self, path: Path) -> None:
+        JsonlChangeLog(str(path)).append([change('say "hi"\\', "open")])
+
+        assert_that(JsonlChangeLog(str(path)).append([change('say "hi"\\', "open")])).is_empty()
+
+    def test_should_compact_log_to_newest_line_per_document(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path), max_bytes=500)
+        log.append([change("443", "open"), change("80", "open")])
+        log.append([change("443", "closed")])
+        log.append([change("443", "open")])
+
+        assert_that([(change.sequence, change.key) for change in log.read_after(0, 10)]).is_equal_to(
+            [(2, "80"), (4, "443")]
+        )
+        assert_that(path.read_text().splitlines()).is_length(2)
+        assert_that([change.sequence for change in log.append([change("22", "open")])]).is_equal_to([5])
+        assert_that(log.append([change("443", "open")])).is_empty()
+
+    def test_should_not_compact_log_below_limit(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append([change("443", "open")])
+        log.append([change("443", "closed")])
+
+        assert_that(sequences(log)).is_equal_to([1, 2])
+
+    def test_should_follow_log_compacted_by_another_writer(self, path: Path) -> None:
+        compacting = JsonlChangeLog(str(path), max_bytes=500)
+        other = JsonlChangeLog(str(path))
+        other.append([change("443", "open"), change("80", "open")])
+        assert_that(sequences(other)).is_equal_to([1, 2])
+
+        compacting.append([change("443", "closed"), change("443", "open")])
+        other.append([change("22", "open")])
+
+        assert_that(sequences(other)).is_equal_to([2, 4, 5])
+        assert_that(sequences(JsonlChangeLog(str(path)))).is_equal_to([2, 4, 5])
+
+    def test_should_reopen_removed_log(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1"))
+        path.unlink()
+
+        assert_that([change.sequence for change in log.append(changes("2"))]).is_equal_to([1])
+        assert_that(path.read_text().splitlines()).is_length(1)
+
+    def test_should_close_without_writing(self, path: Path) -> None:
+        JsonlChangeLog(str(path)).close()
+
+        assert_that(path.exists()).is_false()
+
+    def test_should_reindex_truncated_log(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+        log.append(changes("1", "2"))
+        log.read_after(0, 10)
+        log.close()
+        path.write_text(change("5").model_copy(update={"sequence": 5}).model_dump_json() + "\n")
+
+        assert_that(sequences(log)).is_equal_to([5])
+
+    def test_should_report_last_sequence(self, path: Path) -> None:
+        log = JsonlChangeLog(str(path))
+
+        assert_that(log.last_sequence()).is_equal_to(0)
+        assert_that(log.read_after(0, 10)).is_empty()
+
+        log.append(changes("7", "8"))
+
+        assert_that(log.last_sequence()).is_equal_to(2)
+
+    def test_should_find_last_line_across_blocks(self, path: Path) -> None:
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"first\n" + b"x" * 50 + b"\nlast-complete\npartial")
+
+        assert_that(last_complete_line(path, block_size=8)).is_equal_to(b"last-complete")
+
+    def test_should_reject_negative_sequence(self, path: Path) -> None:
+        with pytest.raises(ValueError, match="Sequence must not be negative"):
+            JsonlChangeLog(str(path)).read_after(-1, 10)
@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.topology_change import (
+    ChangeSequenceExpiredError,
+    TopologyChange,
+    TopologyChangeKind,
+    TopologyChangeOperation,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeJournal, TopologyChangeSink
+from via_node.infrastructure.change_feed.topology_change_bus import (
+    ChangeSubscriptionOverflowError,
+    TopologyChangeBus,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def change(key: str, fingerprint: str = "a") -> TopologyChange:
+    return TopologyChange(
+        kind=TopologyChangeKind.HOST, key=key, fingerprint=fingerprint, occurred_at=NOW, document={"ip_address": key}
+    )
+
+
+def keys(changes: List[TopologyChange]) -> List[str]:
+    return [change.key for change in changes]
+
+
+class TestTopologyChangeBus:
+    def test_should_number_changes_and_fan_out_to_sinks(self) -> None:
+        sink = Mock(spec=TopologyChangeSink)
+        bus = TopologyChangeBus([sink], last_sequence=41)
+
+        bus.publish([change("a"), change("b")])
+
+        [published] = sink.publish.call_args.args
+        assert_that([item.sequence for item in published]).is_equal_to([42, 43])
+        assert_that(bus.last_sequence).is_equal_to(43)
+
+    def test_should_deliver_live_changes_to_subscribers(self) -> None:
+        bus = TopologyChangeBus()
+        subscription = bus.subscribe()
+
+        bus.publish([change("a")])
+
+        assert_that(subscription.get(timeout=0).key).is_equal_to("a")  # type: ignore[union-attr]
+        assert_that(subscription.get(timeout=0)).is_none()
+        assert_that(subscription.last_sequence).is_equal_to(1)
+
+    def test_should_replay_retained_changes_when_resuming(self) -> None:
+        bus = TopologyChangeBus()
+        bus.publish([change("a"), change("b"), change("c")])
+
+        subscription = bus.subscribe(after_sequence=1)
+
+        assert_that([subscription.get(timeout=0).key for _ in range(2)]).is_equal_to(["b", "c"])  # type: ignore
+
+    def test_should_refuse_to_resume_before_retained_history(self) -> None:
+        bus = TopologyChangeBus(history_size=2)
+        bus.publish([change("a"), change("b"), change("c")])
+
+        with pytest.raises(ChangeSequenceExpiredError, match="oldest is 2"):
+            bus.subscribe(after_sequence=0)
+
+    def test_should_resume_from_seeded_sequence_without_history(self) -> None:
+        bus = TopologyChangeBus(last_sequence=7)
+
+        subscription = bus.subscribe(after_sequence=7)
+        bus.publish([change("a")])
+
+        assert_that(subscription.get(timeout=0).sequence).is_equal_to(8)  # type: ignore[union-attr]
+
+    def test_should_stop_delivering_after_close(self) -> None:
+        bus = TopologyChangeBus()
+        subscription = bus.subscribe()
+
+        subscription.close()
+        subscription.close()
+        bus.publish([change("a")])
+
+        assert_that(subscription.get(timeout=0)).is_none()
+
+    def test_should_signal_overflow_after_draining_pending_changes(self) -> None:
+        bus = TopologyChangeBus(max_pending=1)
+        subscription = bus.subscribe()
+
+        bus.publish([change("a"), change("b")])
+
+        assert_that(subscription.get(timeout=0).key).is_equal_to("a")  # type: ignore[union-attr]
+        with pytest.raises(ChangeSubscriptionOverflowError, match="resume after sequence 1"):
+            subscription.get(timeout=0)
+
+    def test_should_close_sinks(self) -> None:
+        sink = Mock(spec=TopologyChangeSink)
+        bus = TopologyChangeBus([sink])
+
+        bus.close()
+
+        sink.close.assert_called_once_with()
+
+    def test_should_skip_unchanged_documents(self) -> None:
+        sink = Mock(spec=TopologyChangeSink)
+        bus = TopologyChangeBus([sink])
+        bus.publish([change("a")])
+
+        bus.publish([change("a")])
+        bus.publish([change("a", "b")])
+
+        [published] = sink.publish.call_args.args
+        assert_that(sink.publish.call_count).is_equal_to(2)
+        assert_that(published[0].operation).is_equal_to(TopologyChangeOperation.UPDATED)
+        assert_that(bus.last_sequence).is_equal_to(2)
+
+    def test_should_fan_out_changes_recorded_by_journal(self) -> None:
+        sink = Mock(spec=TopologyChangeSink)
+        journal = Mock(spec=TopologyChangeJournal)
+        journal.append.return_value = [change("a").model_copy(update={"sequence": 7})]
+        bus = TopologyChangeBus([sink], journal=journal)
+
+        bus.publish([change("a")])
+
+        journal.append.assert_called_once_with([change("a")])
+        sink.publish.assert_called_once_with(journal.append.return_value)
+        assert_that(bus.last_sequence).is_equal_to(7)
+
+    def test_should_close_journal(self) -> None:
+        journal = Mock(spec=TopologyChangeJournal)
+        bus = TopologyChangeBus(journal=journal)
+
+        bus.close()
+
+        journal.close.assert_called_once_with()
@@ -0,0 +1,73 @@
+import socket
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.topology_change import TopologyChange, TopologyChangeKind
+from via_node.infrastructure.change_feed.unix_socket_change_sink import UnixSocketChangeSink
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+CHANGE = TopologyChange(sequence=1, kind=TopologyChangeKind.HOST, key="10.0.0.1", occurred_at=NOW, document={})
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / "changes.sock")
+
+
+@pytest.fixture
+def listener(socket_path: str) -> Iterator[socket.socket]:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    server.settimeout(1.0)
+    yield server
+    server.close()
+
+
+class TestUnixSocketChangeSink:
+    def test_should_stream_json_lines_to_listener(self, socket_path: str, listener: socket.socket) -> None:
+        sink = UnixSocketChangeSink(socket_path)
+
+        sink.publish([CHANGE])
+        sink.publish([CHANGE])
+        connection, _ = listener.accept()
+        received = connection.makefile("rb")
+        lines = [received.readline(), received.readline()]
+        sink.close()
+        connection.close()
+
+        assert_that([TopologyChange.model_validate_json(line) for line in lines]).is_equal_to([CHANGE, CHANGE])
+
+    def test_should_close_without_connecting(self, socket_path: str) -> None:
+        sink = UnixSocketChangeSink(socket_path)
+
+        sink.close()
+
+        assert_that(sink.dropped).is_equal_to(0)
+
+    def test_should_count_dropped_changes_without_listener(self, socket_path: str) -> None:
+        sink = UnixSocketChangeSink(socket_path)
+
+        sink.publish([CHANGE, CHANGE])
+
+        assert_that(sink.dropped).is_equal_to(2)
+
+    def test_should_reconnect_after_listener_appears(self, socket_path: str) -> None:
+        sink = UnixSocketChangeSink(socket_path)
+        sink.publish([CHANGE])
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        sink.publish([CHANGE])
+        connection, _ = server.accept()
+
+        assert_that(connection.makefile("rb").readline()).is_not_empty()
+        assert_that(sink.dropped).is_equal_to(1)
+        sink.close()
+        connection.close()
+        server.close()
@@ -0,0 +1,161 @@
+import json
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
+from via_node.domain.model.port import Port
+from via_node.infrastructure.export.columnar_snapshot_writer import ColumnarSnapshotWriter, column_kind
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+NOW_MICROSECONDS = 1_704_110_400_000_000
+
+
+def port(port_number: int, service_name: Optional[str] = None) -> Port:
+    return Port(port_number=port_number, protocol="TCP", service_name=service_name, created_at=NOW, updated_at=NOW)
+
+
+def read_column(directory: Path, column: Dict[str, Any]) -> List[Any]:
+    values = array({"<i8": "q", "<f8": "d", "<i4": "i", "|u1": "B"}[column["dtype"]])
+    values.frombytes((directory / column["data"]).read_bytes())
+
+    return values.tolist()
+
+
+@pytest.fixture
+def tokyo_time(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Dict[str, Any]:
+    writer = ColumnarSnapshotWriter(str(tmp_path), flush_rows=2)
+
+    writer.write_collection("ports", Port, [port(443, "https"), port(80, "http"), port(8443, "https"), port(22)])
+    writer.write_collection(
+        "hosts",
+        Host,
+        [Host(ip_address="10.0.0.1", hostname="web", os_type="linux", metadata=None, created_at=NOW, updated_at=NOW)],
+    )
+    writer.finish()
+
+    return json.loads((tmp_path / "manifest.json").read_text())
+
+
+class TestColumnKind:
+    @pytest.mark.parametrize(
+        "annotation, expected",
+        [
+            (int, ("int64", False)),
+            (Optional[int], ("int64", True)),
+            (float, ("float64", False)),
+            (bool, ("bool", False)),
+            (datetime, ("timestamp[us]", False)),
+            (Optional[datetime], ("timestamp[us]", True)),
+            (str, ("string", False)),
+            (DnsRecordType, ("string", False)),
+            (List[str], ("json", False)),
+            (Optional[Dict[str, Any]], ("json", True)),
+        ],
+    )
+    def test_should_map_annotation_to_column_kind(self, annotation: Any, expected: Any) -> None:
+        assert_that(column_kind(annotation)).is_equal_to(expected)
+
+
+class TestColumnarSnapshotWriter:
+    def test_should_record_row_counts_in_manifest(self, manifest: Dict[str, Any]) -> None:
+        assert_that(manifest["format"]).is_equal_to("via-node-columnar")
+        assert_that(manifest["collections"]["ports"]["rows"]).is_equal_to(4)
+        assert_that(manifest["collections"]["hosts"]["rows"]).is_equal_to(1)
+
+    def test_should_write_integer_columns_as_raw_int64(self, manifest: Dict[str, Any], tmp_path: Path) -> None:
+        column = manifest["collections"]["ports"]["columns"]["port_number"]
+
+        assert_that(column["dtype"]).is_equal_to("<i8")
+        assert_that(read_column(tmp_path / "ports", column)).is_equal_to([443, 80, 8443, 22])
+
+    def test_should_write_timestamps_as_epoch_microseconds(self, manifest: Dict[str, Any], tmp_path: Path) -> None:
+        column = manifest["collections"]["ports"]["columns"]["created_at"]
+
+        assert_that(column["type"]).is_equal_to("timestamp[us]")
+        assert_that(read_column(tmp_path / "ports", column)).is_equal_to([int(NOW.timestamp() * 1_000_000)] * 4)
+
+    def test_should_treat_aware_timestamps_as_utc(self, tmp_path: Path) -> None:
+        writer = ColumnarSnapshotWriter(str(tmp_path))
+        aware = NOW.replace(tzinfo=timezone.utc)
+
+        writer.write_collection(
+            "ports", Port, [Port(port_number=1, protocol="TCP", service_name=None, created_at=aware, updated_at=aware)]
+        )
+
+        assert_that(array("q", (tmp_path / "ports" / "created_at.bin").read_bytes()).tolist()).is_equal_to(
+            [NOW_MICROSECONDS]
+        )
+
+    def test_should_treat_naive_timestamps_as_local_time(self, tokyo_time: None, tmp_path: Path) -> None:
+        writer = ColumnarSnapshotWriter(str(tmp_path))
+        aware = NOW.replace(tzinfo=timezone(timedelta(hours=5)))
+
+        writer.write_collection(
+            "ports", Port, [Port(port_number=1, protocol="TCP", service_name=None, created_at=NOW, updated_at=aware)]
+        )
+
+        assert_that(array("q", (tmp_path / "ports" / "created_at.bin").read_bytes()).tolist()).is_equal_to(
+            [NOW_MICROSECONDS - 9 * 3_600_000_000]
+        )
+        assert_that(array("q", (tmp_path / "ports" / "updated_at.bin").read_bytes()).tolist()).is_equal_to(
+            [NOW_MICROSECONDS - 5 * 3_600_000_000]
+        )
+
+    def test_should_dictionary_encode_strings_with_null_code(self, manifest: Dict[str, Any], tmp_path: Path) -> None:
+        column = manifest["collections"]["ports"]["columns"]["service_name"]
+        dictionary = json.loads((tmp_path / "ports" / column["dictionary"]).read_text())
+
+        assert_that(dictionary).is_equal_to(["https", "http"])
+        assert_that(read_column(tmp_path / "ports", column)).is_equal_to([0, 1, 0, -1])
+        assert_that(column).does_not_contain_key("validity")
+
+    def test_should_encode_nested_values_as_json(self, manifest: Dict[str, Any], tmp_path: Path) -> None:
+        column = manifest["collections"]["hosts"]["columns"]["metadata"]
+
+        assert_that(column["type"]).is_equal_to("json")
+        assert_that(read_column(tmp_path / "hosts", column)).is_equal_to([-1])
+
+    def test_should_write_validity_for_nullable_numbers(self, tmp_path: Path) -> None:
+        writer = ColumnarSnapshotWriter(str(tmp_path))
+        discoveries = [
+            DnsRecordDiscovery(
+                domain_name="example.com", record_type=DnsRecordType.A, values=["10.0.0.1"], ttl=ttl, discovered_at=NOW
+            )
+            for ttl in (300, None)
+        ]
+
+        writer.write_collection("dns_discoveries", DnsRecordDiscovery, discoveries)
+        writer.finish()
+
+        column = json.loads((tmp_path / "manifest.json").read_text())["collections"]["dns_discoveries"]["columns"]
+        directory = tmp_path / "dns_discoveries"
+        assert_that(read_column(directory, column["ttl"])).is_equal_to([300, 0])
+        assert_that(list((directory / column["ttl"]["validity"]).read_bytes())).is_equal_to([1, 0])
+        assert_that(json.loads((directory / column["record_type"]["dictionary"]).read_text())).is_equal_to(["A"])
+        assert_that(json.loads((directory / column["values"]["dictionary"]).read_text())).is_equal_to(['["10.0.0.1"]'])
+
+    def test_should_close_column_files_when_source_fails(self, tmp_path: Path) -> None:
+        def failing_ports() -> Any:
+            yield port(443)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            ColumnarSnapshotWriter(str(tmp_path)).write_collection("ports", Port, failing_ports())
+
+        assert_that(array("q", (tmp_path / "ports" / "port_number.bin").read_bytes()).tolist()).is_equal_to([443])
@@ -0,0 +1,316 @@
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+FILTER_QUERY = re.compile(r'FOR doc IN (\w+) FILTER doc\.(\w+) == @(\w+) RETURN (doc|\{ [\w:.,"` ]+ \})')
+PROJECTED_ATTRIBUTE = re.compile(r"\"(\w+)\": doc\.`\1`")
+KEYSET_QUERY = re.compile(r"FOR doc IN (\w+) (FILTER doc\._key > @after )?SORT doc\._key LIMIT @limit RETURN doc")
+EDGE_UPSERT_QUERY = re.compile(
+    r"FOR edge IN @edges UPSERT \{ _key: edge\._key \} INSERT edge "
+    r"UPDATE \{ last_seen_at: edge\.last_seen_at, metadata: edge\.metadata \} "
+    r"IN (\w+) OPTIONS \{ ignoreErrors: true \} RETURN NEW\._key"
+)
+
+PORT_SCAN_RESULT_UPSERT_QUERY = re.compile(
+    r'LET replaced = \( INSERT @result INTO (\w+) OPTIONS \{ overwriteMode: "replace" \} RETURN NEW\._key \) '
+    r'INSERT @observation INTO (\w+) OPTIONS \{ overwriteMode: "ignore" \}'
+)
+
+
+class _StandInServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
+
+class ArangoStandIn:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.rejected_keys: Set[str] = set()
+        self.cursors: Dict[str, Dict[str, Any]] = {}
+        self._cursor_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = _StandInServer(("127.0.0.1", 0), _build_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1"
+
+    @property
+    def port(self) -> str:
+        return str(self._server.server_address[1])
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    def __enter__(self) -> "ArangoStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_requests(self) -> None:
+        self.requests.clear()
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        time.sleep(self.latency)
+
+        with self._lock:
+            self.requests.append((method, path))
+            return self._route(method, _strip_database(path).split("/"), query, body)
+
+    def _route(self, method: str, parts: List[str], query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        routes = {
+            "/_api/gharial": self._graph,
+            "/_api/collection": self._collection,
+            "/_api/cursor": self._cursor,
+            "/_api/document": self._document,
+        }
+        route = routes.get("/".join(parts[:3]))
+
+        if route is None:
+            return 404, _error(404, 1203, "unknown resource")
+
+        return route(method, parts[3:], query, body)
+
+    def _graph(self, method: str, parts: List[str], query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, {"error": False, "code": 200, "graph": {"name": parts[0], "edgeDefinitions": []}}
+
+    def _collection(self, method: str, parts: List[str], query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, {"error": False, "code": 200, "result": []}
+
+    def _cursor(self, method: str, parts: List[str], query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        if method == "DELETE":
+            return self._close_cursor(parts[0])
+
+        if parts:
+            return self._next_batch(parts[0])
+
+        cursor_id = str(next(self._cursor_ids))
+        self.cursors[cursor_id] = {"remaining": self._execute(body), "batch_size": body.get("batchSize") or 1000}
+        return self._next_batch(cursor_id, status=201)
+
+    def _close_cursor(self, cursor_id: str) -> Tuple[int, Any]:
+        if self.cursors.pop(cursor_id, None) is None:
+            return 404, _error(404, 1600, "cursor not found")
+        return 202, {"error": False, "code": 202, "id": cursor_id}
+
+    def _next_batch(self, cursor_id: str, status: int = 200) -> Tuple[int, Any]:
+        if cursor_id not in self.cursors:
+            return 404, _error(404, 1600, "cursor not found")
+
+        cursor = self.cursors[cursor_id]
+        batch, cursor["remaining"] = (
+            cursor["remaining"][: cursor["batch_size"]],
+            cursor["remaining"][cursor["batch_size"] :],
+        )
+        has_more = len(cursor["remaining"]) > 0
+
+        if not has_more:
+            del self.cursors[cursor_id]
+
+        return status, {"error": False, "code": status, "result": batch, "hasMore": has_more, "id": cursor_id}
+
+    def _execute(self, body: Dict[str, Any]) -> List[Any]:
+        query = " ".join(body["query"].split())
+
+        for pattern, run in [
+            (FILTER_QUERY, self._filter_query),
+            (KEYSET_QUERY, self._keyset_query),
+            (EDGE_UPSERT_QUERY, self._edge_upsert_query),
+            (PORT_SCAN_RESULT_UPSERT_QUERY, self._port_scan_result_upsert_query),
+        ]:
+            match = pattern.fullmatch(query)
+
+            if match is not None:
+                return run(body.get("bindVars", {}), *match.groups())
+
+        raise ValueError(f"Unsupported query: {body['query']}")
+
+    def _filter_query(
+        self, bind_vars: Dict[str, Any], collection_name: str, attribute: str, variable: str, projection: str
+    ) -> List[Any]:
+        documents = _filter(self.collections.get(collection_name, {}), attribute, bind_vars[variable])
+
+        if projection == "doc":
+            return documents
+
+        return [_keep(document, PROJECTED_ATTRIBUTE.findall(projection)) for document in documents]
+
+    def _keyset_query(self, bind_vars: Dict[str, Any], collection_name: str, key_filter: Optional[str]) -> List[Any]:
+        documents = sorted(self.collections.get(collection_name, {}).values(), key=lambda document: document["_key"])
+
+        if key_filter:
+            documents = [document for document in documents if document["_key"] > bind_vars["after"]]
+
+        return documents[: bind_vars["limit"]]
+
+    def _edge_upsert_query(self, bind_vars: Dict[str, Any], collection_name: str) -> List[Any]:
+        collection = self.collections.setdefault(collection_name, {})
+
+        for edge in bind_vars["edges"]:
+            existing = collection.get(edge["_key"])
+            update = {"last_seen_at": edge["last_seen_at"], "metadata": edge["metadata"]}
+            self._store(collection_name, collection, edge["_key"], {**existing, **update} if existing else edge)
+
+        return [edge["_key"] for edge in bind_vars["edges"]]
+
+    def _port_scan_result_upsert_query(
+        self, bind_vars: Dict[str, Any], results_collection_name: str, history_collection_name: str
+    ) -> List[Any]:
+        result, observation = bind_vars["result"], bind_vars["observation"]
+        history = self.collections.setdefault(history_collection_name, {})
+        self._store(
+            results_collection_name, self.collections.setdefault(results_collection_name, {}), result["_key"], result
+        )
+
+        if observation["_key"] not in history:
+            self._store(history_collection_name, history, observation["_key"], observation)
+
+        return []
+
+    def _document(self, method: str, parts: List[str], query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        collection_name, key = parts[0], unquote("/".join(parts[1:]))
+        collection = self.collections.setdefault(collection_name, {})
+
+        if method == "POST":
+            return self._insert(collection_name, collection, body, query)
+
+        if method == "PUT":
+            return self._replace(collection_name, collection, key, body)
+
+        if key not in collection:
+            return 404, _error(404, 1202, "document not found")
+
+        return 200, collection[key]
+
+    def _insert(
+        self, collection_name: str, collection: Dict[str, Dict[str, Any]], body: Any, query: Dict[str, str]
+    ) -> Tuple[int, Any]:
+        if isinstance(body, list):
+            status, result = 202, [
+                self._insert_one(collection_name, collection, document, query)[1] for document in body
+            ]
+        else:
+            status, result = self._insert_one(collection_name, collection, body, query)
+
+        return status, _silenced(result) if query.get("silent") == "true" else result
+
+    def _insert_one(
+        self,
+        collection_name: str,
+        collection: Dict[str, Dict[str, Any]],
+        document: Dict[str, Any],
+        query: Dict[str, str],
+    ) -> Tuple[int, Any]:
+        key = document.get("_key") or uuid.uuid4().hex
+
+        if key in self.rejected_keys:
+            return 409, _error(409, 1210, "unique constraint violated")
+
+        if key in collection and not query.get("overwriteMode"):
+            return 409, _error(409, 1210, "unique constraint violated")
+
+        return self._store(collection_name, collection, key, document)
+
+    def _replace(
+        self, collection_name: str, collection: Dict[str, Dict[str, Any]], key: str, document: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        key = key.split("/")[-1]
+
+        if key not in collection:
+            return 404, _error(404, 1202, "document not found")
+
+        return self._store(collection_name, collection, key, document)
+
+    def _store(
+        self, collection_name: str, collection: Dict[str, Dict[str, Any]], key: str, document: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        metadata = {"_id": f"{collection_name}/{key}", "_key": key, "_rev": uuid.uuid4().hex[:8]}
+        collection[key] = {**document, **metadata}
+        return 202, metadata
+
+
+def _strip_database(path: str) -> str:
+    if path.startswith("/_db/"):
+        return "/" + path.split("/", 3)[3]
+    return path
+
+
+def _filter(collection: Dict[str, Dict[str, Any]], attribute: str, value: Any) -> List[Dict[str, Any]]:
+    return [document for document in collection.values() if document.get(attribute) == value]
+
+
+def _keep(document: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    return {field: document[field] for field in fields if field in document}
+
+
+def _silenced(result: Any) -> Any:
+    if isinstance(result, list):
+        return _errors(result) or {}
+
+    return result if result.get("error") else {}
+
+
+def _errors(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [result for result in results if result.get("error")]
+
+
+def _error(code: int, error_number: int, message: str) -> Dict[str, Any]:
+    return {"error": True, "code": code, "errorNum": error_number, "errorMessage": message}
+
+
+def _build_handler(stand_in: ArangoStandIn) -> type:
+    class ArangoStandInHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._dispatch(include_body=False)
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def do_PUT(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def do_DELETE(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _dispatch(self, include_body: bool = True) -> None:
+            url = urlparse(self.path)
+            query = {name: values[0] for name, values in parse_qs(url.query).items()}
+            status, payload = stand_in.handle(self.command, url.path, query, self._read_body())
+            self._respond(status, payload, include_body)
+
+        def _read_body(self) -> Optional[Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length)) if length else None
+
+        def _respond(self, status: int, payload: Any, include_body: bool) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body) if include_body else 0))
+            self.end_headers()
+            if include_body:
+                self.wfile.write(body)
+
+    return ArangoStandInHandler
@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_collection_handles import ArangoCollectionHandles
+
+
+class TestArangoCollectionHandles:
+    def _create_handles(self) -> ArangoCollectionHandles:
+        return ArangoCollectionHandles(
+            dns_records=Mock(),
+            ports=Mock(),
+            hosts=Mock(),
+            dns_discoveries=Mock(),
+            port_scan_results=Mock(),
+            port_scan_history=Mock(),
+            domain_port_edges=Mock(),
+            dns_resolves_to_host_edges=Mock(),
+        )
+
+    def test_should_return_dns_resolves_to_host_edges_for_dns_resolves_to_host(self) -> None:
+        handles = self._create_handles()
+
+        assert_that(handles.edge_collection("dns_resolves_to_host")).is_same_as(handles.dns_resolves_to_host_edges)
+
+    def test_should_return_domain_port_edges_for_domain_to_port(self) -> None:
+        handles = self._create_handles()
+
+        assert_that(handles.edge_collection("domain_to_port")).is_same_as(handles.domain_port_edges)
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    dns_record_discovery_document,
+    dns_record_discovery_from_document,
+    dns_record_document,
+    dns_record_from_document,
+    edge_document,
+    edge_from_document,
+    host_document,
+    host_from_document,
+    port_document,
+    port_from_document,
+    port_scan_result_document,
+    port_scan_result_from_document,
+)
+
+SCAN_RESULT_COUNT = 100_000
+SCANNED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def port_scan_result_documents() -> List[Dict[str, Any]]:
+    return [
+        port_scan_result_document(
+            PortScanResult(
+                target_ip=f"10.0.{index // 65_535}.1",
+                port_number=index % 65_535 + 1,
+                protocol="tcp",
+                state=PortState.OPEN,
+                service_name="http",
+                scanned_at=SCANNED_AT + timedelta(microseconds=index),
+            )
+        )
+        for index in range(SCAN_RESULT_COUNT)
+    ]
+
+
+def _validated_port_scan_result(document: Dict[str, Any]) -> PortScanResult:
+    return PortScanResult(
+        target_ip=document["target_ip"],
+        port_number=document["port_number"],
+        protocol=document["protocol"],
+        state=document["state"],
+        service_name=document.get("service_name"),
+        service_version=document.get("service_version"),
+        scanned_at=datetime.fromisoformat(document["scanned_at"]),
+    )
+
+
+def _hydrate(
+    benchmark, documents: List[Dict[str, Any]], from_document: Callable[[Dict[str, Any]], PortScanResult]
+) -> None:
+    results = benchmark(lambda: [from_document(document) for document in documents])
+
+    benchmark.extra_info["rows_per_second"] = round(len(documents) / benchmark.stats.stats.mean)
+    assert_that(results).is_length(len(documents))
+
+
+class TestArangoDocumentsTrustedHydration:
+    def test_should_hydrate_dns_record_equal_to_validated_model(self) -> None:
+        dns_record = DnsRecord(
+            domain_name="example.com",
+            record_type="A",
+            ip_addresses=["192.168.1.1"],
+            created_at=SCANNED_AT,
+            updated_at=SCANNED_AT,
+        )
+
+        assert_that(dns_record_from_document(dns_record_document(dns_record))).is_equal_to(dns_record)
+
+    def test_should_hydrate_port_equal_to_validated_model(self) -> None:
+        port = Port(port_number=443, protocol="TCP", service_name="https", created_at=SCANNED_AT, updated_at=SCANNED_AT)
+
+        assert_that(port_from_document(port_document(port))).is_equal_to(port)
+
+    def test_should_hydrate_host_equal_to_validated_model(self) -> None:
+        host = Host(
+            ip_address="192.168.1.1",
+            hostname="web.example.com",
+            os_type="Linux",
+            metadata={"rack": "a1"},
+            created_at=SCANNED_AT,
+            updated_at=SCANNED_AT,
+        )
+
+        assert_that(host_from_document(host_document(host))).is_equal_to(host)
+
+    def test_should_hydrate_dns_record_discovery_with_record_type_enum(self) -> None:
+        discovery = DnsRecordDiscovery(
+            domain_name="example.com", record_type=DnsRecordType.MX, values=["mx.example.com"], discovered_at=SCANNED_AT
+        )
+
+        hydrated = dns_record_discovery_from_document(dns_record_discovery_document(discovery))
+
+        assert_that(hydrated).is_equal_to(discovery)
+        assert_that(hydrated.record_type).is_instance_of(DnsRecordType)
+
+    def test_should_hydrate_port_scan_result_with_port_state_enum(self, port_scan_result_documents: List) -> None:
+        document = port_scan_result_documents[0]
+
+        hydrated = port_scan_result_from_document(document)
+
+        assert_that(hydrated).is_equal_to(_validated_port_scan_result(document))
+        assert_that(hydrated.state).is_instance_of(PortState)
+
+    def test_should_hydrate_edge_equal_to_validated_model(self) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="dns_records/example.com",
+            target_id="ports/443_tcp",
+            edge_type="domain_to_port",
+            metadata={"weight": 1},
+            created_at=SCANNED_AT,
+            last_seen_at=SCANNED_AT,
+        )
+
+        assert_that(edge_from_document(edge_document(edge))).is_equal_to(edge)
+
+
+@pytest.mark.benchmark
+def test_should_benchmark_validated_port_scan_result_hydration(benchmark, port_scan_result_documents: List):
+    _hydrate(benchmark, port_scan_result_documents, _validated_port_scan_result)
+
+
+@pytest.mark.benchmark
+def test_should_benchmark_trusted_port_scan_result_hydration(benchmark, port_scan_result_documents: List):
+    _hydrate(benchmark, port_scan_result_documents, port_scan_result_from_document)
@@ -0,0 +1,65 @@
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_edge_compactor import ArangoEdgeCompactor, EdgeCompactionResult
+
+
+def group(key: str, stale_keys: List[str]) -> Dict[str, Any]:
+    return {"edge": {"_key": key}, "stale_keys": stale_keys, "duplicates": len(stale_keys)}
+
+
+def compactor(groups: List[Dict[str, Any]], chunk_size: int = 1000) -> ArangoEdgeCompactor:
+    db = Mock()
+    db.aql.execute.return_value = iter(groups)
+    return ArangoEdgeCompactor(db, chunk_size)
+
+
+class TestArangoEdgeCompactor:
+    def test_should_group_edges_by_endpoints_and_type(self) -> None:
+        edge_compactor = compactor([])
+
+        edge_compactor.compact(["domain_port_edges"])
+
+        query = edge_compactor._db.aql.execute.call_args.args[0]
+        assert_that(query).contains("FOR edge IN domain_port_edges", "COLLECT source_id = edge.source_id")
+        assert_that(query).contains('SHA1(CONCAT_SEPARATOR("|", edge_type, source_id, target_id))')
+
+    def test_should_replace_survivor_and_delete_stale_duplicates(self) -> None:
+        edge_compactor = compactor([group("a", ["x", "y"])])
+
+        edge_compactor.compact(["domain_port_edges"])
+
+        collection = edge_compactor._db.collection.return_value
+        collection.insert_many.assert_called_once_with([{"_key": "a"}], overwrite_mode="replace", silent=True)
+        collection.delete_many.assert_called_once_with([{"_key": "x"}, {"_key": "y"}], silent=True)
+
+    def test_should_not_delete_when_only_rekeying(self) -> None:
+        edge_compactor = compactor([group("a", [])])
+
+        edge_compactor.compact(["domain_port_edges"])
+
+        edge_compactor._db.collection.return_value.delete_many.assert_not_called()
+
+    def test_should_rewrite_in_chunks(self) -> None:
+        edge_compactor = compactor([group(str(index), [f"old{index}"]) for index in range(5)], chunk_size=2)
+
+        edge_compactor.compact(["domain_port_edges"])
+
+        assert_that(edge_compactor._db.collection.return_value.insert_many.call_count).is_equal_to(3)
+
+    def test_should_report_counts_per_collection(self) -> None:
+        edge_compactor = compactor([group("a", ["x", "y"]), group("b", [])])
+
+        results = edge_compactor.compact(["domain_port_edges"])
+
+        assert_that(results).is_equal_to(
+            [EdgeCompactionResult(collection_name="domain_port_edges", rewritten=2, removed=2)]
+        )
+
+    def test_should_report_untouched_collection(self) -> None:
+        results = compactor([]).compact(["dns_resolves_to_host_edges"])
+
+        assert_that(results[0].rewritten).is_equal_to(0)
+        assert_that(results[0].removed).is_equal_to(0)
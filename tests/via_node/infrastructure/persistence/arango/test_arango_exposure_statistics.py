@@ -0,0 +1,160 @@
+import asyncio
+import json
+from typing import Any, Iterator, List, Tuple
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record_discovery import DnsRecordType
+from via_node.domain.model.exposure_statistics import DomainRecordTypes, PortExposure, ServiceExposure
+from via_node.infrastructure.persistence.arango.arango_exposure_statistics import (
+    HOSTS_PER_OPEN_PORT_QUERY,
+    OPEN_PORTS_PER_SERVICE_QUERY,
+    record_types_per_domain_query,
+)
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoNetworkTopologyRepository,
+)
+
+
+def _flat(query: str) -> str:
+    return " ".join(query.split())
+
+
+@pytest.fixture
+def arango() -> Iterator[Tuple[ArangoNetworkTopologyRepository, Mock]]:
+    with patch(
+        "via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient"
+    ) as mock_client_class:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            hide_expired_discoveries=True,
+        )
+        yield repository, mock_db
+
+
+def _async_repository(requests: List[httpx.Request], rows: List[Any]) -> AsyncArangoNetworkTopologyRepository:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"result": rows, "hasMore": False})
+
+    return AsyncArangoNetworkTopologyRepository(
+        host="localhost",
+        port="8083",
+        database="test_db",
+        username="root",
+        password="",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestArangoExposureStatisticsQueries:
+    def test_should_aggregate_services_on_the_server(self) -> None:
+        assert_that(_flat(OPEN_PORTS_PER_SERVICE_QUERY)).contains(
+            "FILTER doc.state == @state",
+            "COLLECT service_name = doc.service_name "
+            "AGGREGATE open_ports = LENGTH(1), hosts = COUNT_DISTINCT(doc.target_ip)",
+            "LIMIT @limit",
+        )
+
+    def test_should_count_hosts_per_port_on_the_server(self) -> None:
+        assert_that(_flat(HOSTS_PER_OPEN_PORT_QUERY)).contains(
+            "COLLECT port_number = doc.port_number, protocol = doc.protocol WITH COUNT INTO hosts"
+        )
+
+    def test_should_apply_live_discovery_filter_before_grouping(self) -> None:
+        assert_that(_flat(record_types_per_domain_query("AND doc.live"))).contains(
+            "FILTER doc.domain_name != null AND doc.live COLLECT domain_name = doc.domain_name "
+            "AGGREGATE record_types = SORTED_UNIQUE(doc.record_type)"
+        )
+
+
+class TestArangoNetworkTopologyRepositoryExposureStatistics:
+    def test_should_return_open_ports_per_service(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"service_name": "ssh", "open_ports": 3, "hosts": 2}])
+
+        services = repository.open_ports_per_service(limit=5)
+
+        assert_that(services).is_equal_to([ServiceExposure(service_name="ssh", open_ports=3, hosts=2)])
+        mock_db.aql.execute.assert_called_once_with(
+            OPEN_PORTS_PER_SERVICE_QUERY, bind_vars={"state": "open", "limit": 5}
+        )
+
+    def test_should_return_hosts_per_open_port(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"port_number": 22, "protocol": "tcp", "hosts": 2}])
+
+        assert_that(repository.hosts_per_open_port()).is_equal_to(
+            [PortExposure(port_number=22, protocol="tcp", hosts=2)]
+        )
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]).is_equal_to({"state": "open", "limit": 100})
+
+    def test_should_return_live_record_types_per_domain(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"domain_name": "example.com", "record_types": ["A", "MX"]}])
+
+        domains = repository.record_types_per_domain(limit=10)
+
+        assert_that(domains).is_equal_to(
+            [DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.A, DnsRecordType.MX])]
+        )
+        assert_that(_flat(mock_db.aql.execute.call_args.args[0])).contains("AND (doc.expires_at == null")
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]).is_equal_to({"limit": 10})
+
+    def test_should_reject_non_positive_limit_without_querying(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+
+        with pytest.raises(ValueError, match="Statistics limit must be at least 1"):
+            repository.open_ports_per_service(limit=0)
+
+        mock_db.aql.execute.assert_not_called()
+
+
+class TestAsyncArangoNetworkTopologyRepositoryExposureStatistics:
+    def test_should_return_open_ports_per_service(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _async_repository(requests, [{"service_name": None, "open_ports": 1, "hosts": 1}])
+
+        services = asyncio.run(repository.open_ports_per_service(limit=5))
+
+        assert_that(services).is_equal_to([ServiceExposure(service_name=None, open_ports=1, hosts=1)])
+        body = json.loads(requests[0].content)
+        assert_that(body["query"]).is_equal_to(OPEN_PORTS_PER_SERVICE_QUERY)
+        assert_that(body["bindVars"]).is_equal_to({"state": "open", "limit": 5})
+
+    def test_should_return_hosts_per_open_port(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _async_repository(requests, [{"port_number": 443, "protocol": "tcp", "hosts": 4}])
+
+        ports = asyncio.run(repository.hosts_per_open_port())
+
+        assert_that(ports).is_equal_to([PortExposure(port_number=443, protocol="tcp", hosts=4)])
+        assert_that(json.loads(requests[0].content)["query"]).is_equal_to(HOSTS_PER_OPEN_PORT_QUERY)
+
+    def test_should_return_record_types_per_domain(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _async_repository(requests, [{"domain_name": "example.com", "record_types": ["TXT"]}])
+
+        domains = asyncio.run(repository.record_types_per_domain(limit=3))
+
+        assert_that(domains).is_equal_to(
+            [DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.TXT])]
+        )
+        assert_that(json.loads(requests[0].content)["bindVars"]).is_equal_to({"limit": 3})
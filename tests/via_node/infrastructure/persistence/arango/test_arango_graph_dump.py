@@ -0,0 +1,211 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+from typing import IO, Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_graph_dump import (
+    ArangoGraphDumper,
+    ArangoGraphRestorer,
+    GraphDumpManifest,
+    RestoreResult,
+    index_data,
+    open_compressed,
+)
+
+PORTS = [{"_key": f"{port}_TCP", "port_number": port} for port in (22, 80, 443)]
+EDGES = [{"_key": "abc", "_from": "dns_records/example.com", "_to": "ports/443_TCP"}]
+EDGE_DEFINITIONS = [
+    {
+        "edge_collection": "domain_port_edges",
+        "from_vertex_collections": ["dns_records"],
+        "to_vertex_collections": ["ports"],
+    }
+]
+DOCUMENTS = {"ports": PORTS, "domain_port_edges": EDGES}
+
+
+def source_db(has_graph: bool = True) -> Mock:
+    db = Mock()
+    db.has_graph.return_value = has_graph
+    db.graph.return_value.edge_definitions.return_value = EDGE_DEFINITIONS
+    db.aql.execute.side_effect = lambda query, bind_vars, **kwargs: iter(DOCUMENTS[bind_vars["@collection"]])
+    db.collection.side_effect = lambda name: Mock(
+        properties=Mock(return_value={"edge": name.endswith("_edges")}),
+        indexes=Mock(
+            return_value=[
+                {"id": "0", "type": "primary", "fields": ["_key"]},
+                {"id": "1", "type": "persistent", "fields": ["port_number"], "name": "idx", "unique": False},
+            ]
+        ),
+    )
+    return db
+
+
+def dump(directory: Path, compression: str = "gzip") -> GraphDumpManifest:
+    return ArangoGraphDumper(source_db(), "network_graph").dump(
+        ["ports", "domain_port_edges"], str(directory), compression
+    )
+
+
+def target_db(has_collection: bool = False, has_graph: bool = False) -> Mock:
+    db = Mock()
+    db.has_collection.return_value = has_collection
+    db.has_graph.return_value = has_graph
+    db.collection.return_value.import_bulk.side_effect = lambda chunk, **kwargs: {
+        "created": len(chunk),
+        "updated": 0,
+        "errors": 0,
+    }
+    return db
+
+
+def imported_documents(db: Mock) -> List[Dict[str, Any]]:
+    return [document for call in db.collection.return_value.import_bulk.call_args_list for document in call.args[0]]
+
+
+class TestArangoGraphDumper:
+    def test_should_stream_each_collection_through_cursor(self, tmp_path: Path) -> None:
+        db = source_db()
+
+        ArangoGraphDumper(db, "network_graph", batch_size=500).dump(["ports"], str(tmp_path))
+
+        db.aql.execute.assert_called_once_with(
+            'FOR doc IN @@collection RETURN UNSET(doc, "_id", "_rev")',
+            bind_vars={"@collection": "ports"},
+            batch_size=500,
+            stream=True,
+        )
+
+    def test_should_write_compressed_json_lines(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+
+        with gzip.open(tmp_path / "ports.jsonl.gz", "rt") as lines:
+            assert_that([json.loads(line) for line in lines]).is_equal_to(PORTS)
+
+    def test_should_write_manifest_with_counts_and_checksums(self, tmp_path: Path) -> None:
+        manifest = dump(tmp_path)
+
+        written = GraphDumpManifest.model_validate_json((tmp_path / "manifest.json").read_text())
+        assert_that(written).is_equal_to(manifest)
+        assert_that(
+            [(collection.name, collection.count, collection.edge) for collection in manifest.collections]
+        ).is_equal_to([("ports", 3, False), ("domain_port_edges", 1, True)])
+        assert_that(manifest.collections[0].sha256).matches("^[0-9a-f]{64}$")
+        assert_that(manifest.edge_definitions).is_equal_to(EDGE_DEFINITIONS)
+
+    def test_should_keep_only_user_index_definitions(self, tmp_path: Path) -> None:
+        manifest = dump(tmp_path)
+
+        assert_that(manifest.collections[0].indexes).is_equal_to(
+            [{"type": "persistent", "fields": ["port_number"], "name": "idx", "unique": False}]
+        )
+
+    def test_should_omit_edge_definitions_without_graph(self, tmp_path: Path) -> None:
+        manifest = ArangoGraphDumper(source_db(has_graph=False), "network_graph").dump(["ports"], str(tmp_path))
+
+        assert_that(manifest.edge_definitions).is_empty()
+
+    def test_should_reject_unknown_compression(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Compression must be one of"):
+            dump(tmp_path, "lz4")
+
+    def test_should_require_zstandard_for_zstd(self, tmp_path: Path) -> None:
+        with patch.dict(sys.modules, {"zstandard": None}):
+            with pytest.raises(ValueError, match="requires the 'zstandard' package"):
+                open_compressed(tmp_path / "ports.jsonl.zst", "wb", "zstd")
+
+
+class TestIndexData:
+    def test_should_translate_formatted_index_to_api_attributes(self) -> None:
+        index = {"id": "1", "type": "ttl", "fields": ["expires_at"], "expiry_time": 0, "selectivity": 1.0}
+
+        assert_that(index_data(index)).is_equal_to({"type": "ttl", "fields": ["expires_at"], "expireAfter": 0})
+
+
+class TestArangoGraphRestorer:
+    def test_should_import_every_document_in_chunks(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        db = target_db()
+
+        results = ArangoGraphRestorer(db, "network_graph", chunk_size=2).restore(str(tmp_path))
+
+        assert_that(results).is_equal_to(
+            [
+                RestoreResult(collection_name="ports", expected=3, imported=3),
+                RestoreResult(collection_name="domain_port_edges", expected=1, imported=1),
+            ]
+        )
+        assert_that(imported_documents(db)).contains_only(*PORTS, *EDGES)
+        assert_that(db.collection.return_value.import_bulk.call_count).is_equal_to(3)
+        assert_that(db.collection.return_value.import_bulk.call_args.kwargs).is_equal_to(
+            {"halt_on_error": False, "details": False, "on_duplicate": "replace"}
+        )
+
+    def test_should_create_collections_indexes_and_graph(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        db = target_db()
+
+        ArangoGraphRestorer(db, "restored_graph").restore(str(tmp_path))
+
+        db.create_collection.assert_any_call("ports", edge=False)
+        db.create_collection.assert_any_call("domain_port_edges", edge=True)
+        db.collection.return_value.add_index.assert_any_call(
+            {"type": "persistent", "fields": ["port_number"], "name": "idx", "unique": False}
+        )
+        db.create_graph.assert_called_once_with("restored_graph", edge_definitions=EDGE_DEFINITIONS)
+
+    def test_should_reuse_existing_collections_and_graph(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        db = target_db(has_collection=True, has_graph=True)
+
+        ArangoGraphRestorer(db, "network_graph").restore(str(tmp_path))
+
+        db.create_collection.assert_not_called()
+        db.create_graph.assert_not_called()
+
+    def test_should_count_import_errors(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        db = target_db()
+        db.collection.return_value.import_bulk.side_effect = lambda chunk, **kwargs: {
+            "created": 0,
+            "updated": len(chunk) - 1,
+            "errors": 1,
+        }
+
+        results = ArangoGraphRestorer(db, "network_graph").restore(str(tmp_path))
+
+        assert_that(results[0]).is_equal_to(RestoreResult(collection_name="ports", expected=3, imported=2, errors=1))
+
+    def test_should_reject_corrupt_dump(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        with gzip.open(tmp_path / "ports.jsonl.gz", "wt") as lines:
+            lines.write('{"_key": "tampered"}\n')
+        db = target_db()
+
+        with pytest.raises(ValueError, match="Checksum mismatch for ports.jsonl.gz.*ports may be partially restored"):
+            ArangoGraphRestorer(db, "network_graph").restore(str(tmp_path))
+
+    def test_should_decompress_each_file_once(self, tmp_path: Path) -> None:
+        dump(tmp_path)
+        opened: List[str] = []
+
+        def recording_open(path: Path, mode: str, compression: str) -> IO[bytes]:
+            opened.append(path.name)
+            return gzip.open(path, mode)  # type: ignore[return-value]
+
+        with patch(
+            "via_node.infrastructure.persistence.arango.arango_graph_dump.open_compressed", side_effect=recording_open
+        ):
+            ArangoGraphRestorer(target_db(), "network_graph").restore(str(tmp_path))
+
+        assert_that(opened).contains_only("ports.jsonl.gz", "domain_port_edges.jsonl.gz")
+        assert_that(opened).is_length(2)
+
+    def test_should_reject_non_positive_parallelism(self) -> None:
+        with pytest.raises(ValueError, match="Parallelism must be at least 1"):
+            ArangoGraphRestorer(Mock(), "network_graph", parallelism=0)
@@ -1,14 +1,22 @@
 from datetime import datetime
-from unittest.mock import Mock, patch
+from typing import Any, List
+from unittest.mock import MagicMock, Mock, patch
 
+from arango.exceptions import DocumentInsertError
+from arango.http import DefaultHTTPClient, DeflateRequestCompression
 from assertpy import assert_that
 
 from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
 from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
 from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
 from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
     ArangoNetworkTopologyRepository,
 )
+from via_node.infrastructure.persistence.arango.arango_schema_migrations import LATEST_SCHEMA_VERSION
+from via_node.infrastructure.persistence.arango.pooled_http_client import PooledHttpClient
 
 
 class TestArangoNetworkTopologyRepository:
@@ -29,6 +37,19 @@ class TestArangoNetworkTopologyRepository:
 
         mock_client_class.assert_called_once()
 
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_defer_database_connection_until_first_use(self, mock_client_class: Mock) -> None:
+        ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+        )
+
+        mock_client_class.return_value.db.assert_not_called()
+
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
     def test_should_create_graph_when_it_does_not_exist(self, mock_client_class: Mock) -> None:
         mock_db = Mock()
@@ -37,7 +58,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = False
         mock_db.create_graph.return_value = mock_graph
 
-        ArangoNetworkTopologyRepository(
+        repository = ArangoNetworkTopologyRepository(
             host="localhost",
             port="8083",
             database="test_db",
@@ -45,9 +66,29 @@ class TestArangoNetworkTopologyRepository:
             password="",
             graph_name="test_graph",
         )
+        repository.refresh_collection_handles()
 
         mock_db.create_graph.assert_called_once()
 
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_create_port_scan_history_collection_without_migrating(self, mock_client_class: Mock) -> None:
+        mock_db = Mock()
+        mock_client_class.return_value.db.return_value = mock_db
+        mock_db.has_graph.return_value = True
+        mock_db.has_collection.return_value = False
+
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+        )
+        repository.refresh_collection_handles()
+
+        mock_db.create_collection.assert_called_once_with("port_scan_history")
+
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
     def test_should_not_create_graph_when_it_exists(self, mock_client_class: Mock) -> None:
         mock_db = Mock()
@@ -74,6 +115,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -105,6 +147,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -137,6 +180,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -168,6 +212,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -199,7 +244,7 @@ class TestArangoNetworkTopologyRepository:
         mock_client_class.return_value.db.return_value = mock_db
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
-        mock_graph.edge_collection.return_value = mock_edge_collection
+        mock_db.collection.return_value = mock_edge_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -220,8 +265,9 @@ class TestArangoNetworkTopologyRepository:
 
         repository.create_edge(edge)
 
-        call_args = mock_edge_collection.insert.call_args[0][0]
+        call_args = mock_db.aql.execute.call_args.kwargs["bind_vars"]["edges"][0]
         assert call_args["_from"] == "dns_records/example.com"
+        assert call_args["_key"] == edge.key
 
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
     def test_should_return_none_when_dns_record_does_not_exist(self, mock_client_class: Mock) -> None:
@@ -232,6 +278,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
         mock_collection.has.return_value = False
 
         repository = ArangoNetworkTopologyRepository(
@@ -256,6 +303,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
         mock_collection.has.return_value = True
         mock_collection.get.return_value = {
             "domain_name": "example.com",
@@ -287,6 +335,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
         mock_collection.has.return_value = False
 
         repository = ArangoNetworkTopologyRepository(
@@ -311,6 +360,7 @@ class TestArangoNetworkTopologyRepository:
         mock_db.has_graph.return_value = True
         mock_db.graph.return_value = mock_graph
         mock_graph.vertex_collection.return_value = mock_collection
+        mock_db.collection.return_value = mock_collection
         mock_collection.has.return_value = True
         mock_collection.get.return_value = {
             "port_number": 443,
@@ -334,26 +384,12 @@ class TestArangoNetworkTopologyRepository:
         assert_that(result).is_not_none()
 
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
-    def test_should_replace_dns_record_when_insert_fails(self, mock_client_class: Mock) -> None:
-        from unittest.mock import MagicMock
-
-        from arango.exceptions import DocumentInsertError
-
+    def test_should_upsert_dns_record_in_single_request(self, mock_client_class: Mock) -> None:
         mock_db = Mock()
-        mock_graph = Mock()
         mock_collection = Mock()
         mock_client_class.return_value.db.return_value = mock_db
         mock_db.has_graph.return_value = True
-        mock_db.graph.return_value = mock_graph
-        mock_graph.vertex_collection.return_value = mock_collection
-
-        mock_response = MagicMock()
-        mock_response.is_success = False
-        mock_response.error_code = 1210
-        mock_response.error_message = "unique constraint violated"
-        mock_request = MagicMock()
-
-        mock_collection.insert.side_effect = DocumentInsertError(mock_response, mock_request)
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -374,29 +410,16 @@ class TestArangoNetworkTopologyRepository:
 
         repository.create_or_update_dns_record(dns_record)
 
-        mock_collection.replace.assert_called_once()
+        assert_that(mock_collection.insert.call_args.kwargs["overwrite_mode"]).is_equal_to("replace")
+        mock_collection.replace.assert_not_called()
 
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
-    def test_should_replace_port_when_insert_fails(self, mock_client_class: Mock) -> None:
-        from unittest.mock import MagicMock
-
-        from arango.exceptions import DocumentInsertError
-
+    def test_should_upsert_port_in_single_request(self, mock_client_class: Mock) -> None:
         mock_db = Mock()
-        mock_graph = Mock()
         mock_collection = Mock()
         mock_client_class.return_value.db.return_value = mock_db
         mock_db.has_graph.return_value = True
-        mock_db.graph.return_value = mock_graph
-        mock_graph.vertex_collection.return_value = mock_collection
-
-        mock_response = MagicMock()
-        mock_response.is_success = False
-        mock_response.error_code = 1210
-        mock_response.error_message = "unique constraint violated"
-        mock_request = MagicMock()
-
-        mock_collection.insert.side_effect = DocumentInsertError(mock_response, mock_request)
+        mock_db.collection.return_value = mock_collection
 
         repository = ArangoNetworkTopologyRepository(
             host="localhost",
@@ -417,7 +440,8 @@ class TestArangoNetworkTopologyRepository:
 
         repository.create_or_update_port(port)
 
-        mock_collection.replace.assert_called_once()
+        assert_that(mock_collection.insert.call_args.kwargs["overwrite_mode"]).is_equal_to("replace")
+        mock_collection.replace.assert_not_called()
 
     @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
     def test_should_handle_graph_create_error_gracefully(self, mock_client_class: Mock) -> None:
@@ -447,3 +471,434 @@ class TestArangoNetworkTopologyRepository:
         )
 
         assert repository is not None
+
+
+class TestArangoNetworkTopologyRepositoryBulk:
+    def _create_repository(self, bulk_chunk_size: int = 1000) -> ArangoNetworkTopologyRepository:
+        return ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            bulk_chunk_size=bulk_chunk_size,
+        )
+
+    def _mock_collection(self, mock_client_class: Mock) -> Mock:
+        mock_db = Mock()
+        mock_graph = Mock()
+        mock_collection = Mock()
+        mock_client_class.return_value.db.return_value = mock_db
+        mock_db.has_graph.return_value = True
+        mock_db.graph.return_value = mock_graph
+        mock_db.collection.return_value = mock_collection
+        mock_collection.insert_many.side_effect = lambda documents, **kwargs: [{"_key": "k"} for _ in documents]
+        return mock_collection
+
+    def _overwrite_modes(self, mock_collection: Mock) -> List[str]:
+        return [call.kwargs["overwrite_mode"] for call in mock_collection.insert_many.call_args_list]
+
+    def _port_scan_results(self, count: int) -> List[PortScanResult]:
+        return [
+            PortScanResult(
+                target_ip="192.168.1.1",
+                port_number=port_number,
+                protocol="tcp",
+                state=PortState.OPEN,
+                scanned_at=datetime.now(),
+            )
+            for port_number in range(1, count + 1)
+        ]
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_send_port_scan_results_in_chunks(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository(bulk_chunk_size=2)
+
+        result = repository.bulk_upsert_port_scan_results(self._port_scan_results(5))
+
+        assert_that(self._overwrite_modes(mock_collection)).is_equal_to(["replace"] * 3 + ["ignore"] * 3)
+        assert_that(result.written).is_equal_to(5)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_replace_existing_documents_on_bulk_upsert(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        repository.bulk_upsert_port_scan_results(self._port_scan_results(1))
+
+        assert_that(mock_collection.insert_many.call_args_list[0].kwargs["overwrite_mode"]).is_equal_to("replace")
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_upsert_single_result_and_history_in_one_query(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+        [port_scan_result] = self._port_scan_results(1)
+
+        repository.create_or_update_port_scan_result(port_scan_result)
+
+        mock_db = mock_client_class.return_value.db.return_value
+        bind_vars = mock_db.aql.execute.call_args.kwargs["bind_vars"]
+        assert_that(mock_db.aql.execute.call_count).is_equal_to(1)
+        assert_that(bind_vars["result"]["_key"]).is_equal_to("192.168.1.1_tcp_1")
+        assert_that(bind_vars["observation"]["observations"]).is_equal_to(1)
+        mock_collection.insert.assert_not_called()
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_append_bulk_upserted_results_to_history(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        repository.bulk_upsert_port_scan_results(self._port_scan_results(2))
+
+        stored, appended = mock_collection.insert_many.call_args_list
+        assert_that(stored.kwargs).is_equal_to({"overwrite_mode": "replace"})
+        assert_that(appended.kwargs).is_equal_to({"overwrite_mode": "ignore"})
+        assert_that([document["first_observed_at"] for document in appended.args[0]]).is_length(2)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_not_send_request_for_empty_batch(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        result = repository.bulk_upsert_port_scan_results([])
+
+        mock_collection.insert_many.assert_not_called()
+        assert_that(result.written).is_equal_to(0)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_return_per_item_errors(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        mock_response = MagicMock()
+        mock_response.error_message = "unique constraint violated"
+        error = DocumentInsertError(mock_response, MagicMock())
+        mock_collection.insert_many.side_effect = lambda documents, overwrite_mode: (
+            [{"_key": "k"}, error, {"_key": "k"}] if overwrite_mode == "replace" else [{"_key": "k"}] * len(documents)
+        )
+        repository = self._create_repository(bulk_chunk_size=3)
+
+        result = repository.bulk_upsert_port_scan_results(self._port_scan_results(6))
+
+        assert_that(result.written).is_equal_to(4)
+        assert_that([error.index for error in result.errors]).is_equal_to([1, 4])
+        assert_that(result.errors[0].key).is_equal_to("192.168.1.1_tcp_2")
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_append_history_only_for_stored_results(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        mock_response = MagicMock()
+        mock_response.error_message = "unique constraint violated"
+        error = DocumentInsertError(mock_response, MagicMock())
+        mock_collection.insert_many.side_effect = lambda documents, overwrite_mode: (
+            [{"_key": "k"}, error] if overwrite_mode == "replace" else [{"_key": "k"}] * len(documents)
+        )
+        repository = self._create_repository()
+
+        repository.bulk_upsert_port_scan_results(self._port_scan_results(2))
+
+        appended = mock_collection.insert_many.call_args_list[-1]
+        assert_that([document["port_number"] for document in appended.args[0]]).is_equal_to([1])
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_report_history_errors(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        mock_response = MagicMock()
+        mock_response.error_message = "disk full"
+        error = DocumentInsertError(mock_response, MagicMock())
+        mock_collection.insert_many.side_effect = lambda documents, overwrite_mode: (
+            [{"_key": "k"}] * len(documents) if overwrite_mode == "replace" else [error]
+        )
+        repository = self._create_repository()
+
+        result = repository.bulk_upsert_port_scan_results(self._port_scan_results(1))
+
+        assert_that(result.written).is_equal_to(1)
+        assert_that([(item.index, item.error_message) for item in result.errors]).is_equal_to([(0, "disk full")])
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_bulk_upsert_dns_record_discoveries(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        discovery = DnsRecordDiscovery(
+            domain_name="www.example.com",
+            record_type=DnsRecordType.A,
+            values=["192.168.1.1"],
+            ttl=300,
+            discovered_at=datetime.now(),
+        )
+
+        result = repository.bulk_upsert_dns_record_discoveries([discovery])
+
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert_that(documents[0]["_key"]).is_equal_to("www.example.com_A")
+        assert_that(result.written).is_equal_to(1)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_bulk_upsert_hosts(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        host = Host(
+            ip_address="192.168.1.1",
+            hostname="server.example.com",
+            os_type="linux",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+
+        result = repository.bulk_upsert_hosts([host])
+
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert_that(documents[0]["_key"]).is_equal_to("192.168.1.1")
+        assert_that(result.written).is_equal_to(1)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_bulk_upsert_dns_records_and_ports(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+        now = datetime.now()
+        record = DnsRecord(
+            domain_name="example.com", record_type="A", ip_addresses=["10.0.0.1"], created_at=now, updated_at=now
+        )
+        port = Port(port_number=443, protocol="TCP", service_name="https", created_at=now, updated_at=now)
+
+        records = repository.bulk_upsert_dns_records([record])
+        ports = repository.bulk_upsert_ports([port])
+
+        [record_call, port_call] = mock_collection.insert_many.call_args_list
+        assert_that(record_call.args[0][0]["_key"]).is_equal_to("example.com")
+        assert_that(port_call.args[0][0]["_key"]).is_equal_to("443_TCP")
+        assert_that(port_call.kwargs["overwrite_mode"]).is_equal_to("replace")
+        assert_that([records.written, ports.written]).is_equal_to([1, 1])
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_bulk_create_edges_per_edge_collection(self, mock_client_class: Mock) -> None:
+        mock_collection = self._mock_collection(mock_client_class)
+        repository = self._create_repository()
+
+        edges = [
+            NetworkTopologyEdge(
+                source_id="example.com",
+                target_id="443_TCP",
+                edge_type="domain_to_port",
+                metadata={},
+                created_at=datetime.now(),
+            ),
+            NetworkTopologyEdge(
+                source_id="example.com",
+                target_id="192.168.1.1",
+                edge_type="dns_resolves_to_host",
+                metadata={},
+                created_at=datetime.now(),
+            ),
+        ]
+
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.aql.execute.side_effect = lambda query, bind_vars: [edge["_key"] for edge in bind_vars["edges"]]
+
+        result = repository.bulk_create_edges(edges)
+
+        to_vertices = [call.kwargs["bind_vars"]["edges"][0]["_to"] for call in mock_db.aql.execute.call_args_list]
+        assert_that(to_vertices).contains_only("ports/443_TCP", "hosts/192.168.1.1")
+        assert_that(result.written).is_equal_to(2)
+        mock_collection.insert_many.assert_not_called()
+
+
+class TestArangoNetworkTopologyRepositoryCollectionHandles:
+    def _create_repository(self) -> ArangoNetworkTopologyRepository:
+        return ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_resolve_all_collections_on_first_use(self, mock_client_class: Mock) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        mock_db.collection.return_value.has.return_value = False
+
+        self._create_repository().get_port(443, "TCP")
+
+        resolved = [call[0][0] for call in mock_db.collection.call_args_list]
+        assert_that(resolved).contains_only(
+            "dns_records",
+            "ports",
+            "hosts",
+            "dns_discoveries",
+            "port_scan_results",
+            "port_scan_history",
+            "domain_port_edges",
+            "dns_resolves_to_host_edges",
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_reuse_collection_handles_between_calls(self, mock_client_class: Mock) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        mock_db.collection.return_value.has.return_value = False
+        repository = self._create_repository()
+        repository.get_port(443, "TCP")
+        mock_db.collection.reset_mock()
+
+        repository.get_port(80, "TCP")
+
+        mock_db.collection.assert_not_called()
+        mock_db.graph.assert_not_called()
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_resolve_collection_handles_again_on_refresh(self, mock_client_class: Mock) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        repository = self._create_repository()
+        mock_db.collection.reset_mock()
+
+        repository.refresh_collection_handles()
+
+        assert_that(mock_db.collection.call_count).is_equal_to(8)
+
+
+class TestArangoNetworkTopologyRepositorySchemaMigrations:
+    def _create_repository(self, auto_migrate: bool) -> ArangoNetworkTopologyRepository:
+        return ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            auto_migrate=auto_migrate,
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_migrate_schema_on_first_use_when_enabled(
+        self, mock_client_class: Mock, mock_migrator: Mock
+    ) -> None:
+        self._create_repository(auto_migrate=True).refresh_collection_handles()
+
+        mock_migrator.return_value.migrate.assert_called_once()
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_not_migrate_schema_on_first_use_when_disabled(
+        self, mock_client_class: Mock, mock_migrator: Mock
+    ) -> None:
+        self._create_repository(auto_migrate=False).refresh_collection_handles()
+
+        mock_migrator.return_value.migrate.assert_not_called()
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_return_applied_versions_on_migrate(self, mock_client_class: Mock, mock_migrator: Mock) -> None:
+        mock_migrator.return_value.migrate.return_value = [1]
+        repository = self._create_repository(auto_migrate=False)
+
+        assert_that(repository.migrate_schema()).is_equal_to([1])
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_return_schema_version(self, mock_client_class: Mock, mock_migrator: Mock) -> None:
+        mock_migrator.return_value.current_version.return_value = 1
+        repository = self._create_repository(auto_migrate=False)
+
+        assert_that(repository.schema_version()).is_equal_to(1)
+
+
+class TestArangoNetworkTopologyRepositorySchemaMarker:
+    def _create_repository(self, schema_marker: Mock) -> ArangoNetworkTopologyRepository:
+        return ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            auto_migrate=True,
+            schema_marker=schema_marker,
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_skip_bootstrap_while_schema_marker_is_fresh(
+        self, mock_client_class: Mock, mock_migrator: Mock
+    ) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        schema_marker = Mock()
+        schema_marker.is_fresh.return_value = True
+
+        self._create_repository(schema_marker).refresh_collection_handles()
+
+        mock_db.has_graph.assert_not_called()
+        mock_migrator.return_value.migrate.assert_not_called()
+        schema_marker.record.assert_not_called()
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoSchemaMigrator")
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_record_schema_marker_after_bootstrap(self, mock_client_class: Mock, mock_migrator: Mock) -> None:
+        mock_client_class.return_value.db.return_value.has_graph.return_value = True
+        schema_marker = Mock()
+        schema_marker.is_fresh.return_value = False
+
+        self._create_repository(schema_marker).refresh_collection_handles()
+
+        mock_migrator.return_value.migrate.assert_called_once()
+        schema_marker.record.assert_called_once_with(schema_marker.is_fresh.call_args.args[0])
+        assert_that(schema_marker.is_fresh.call_args.args[0]).is_equal_to(
+            f"http://localhost:8083/test_db/test_graph@v{LATEST_SCHEMA_VERSION}"
+        )
+
+
+class TestArangoNetworkTopologyRepositoryConnection:
+    def _create_repository(self, **kwargs: Any) -> ArangoNetworkTopologyRepository:
+        return ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            **kwargs,
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_use_pooled_http_client_by_default(self, mock_client_class: Mock) -> None:
+        self._create_repository()
+
+        assert_that(mock_client_class.call_args.kwargs["http_client"]).is_instance_of(PooledHttpClient)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_pass_http_client_and_compression_to_client(self, mock_client_class: Mock) -> None:
+        http_client = PooledHttpClient(pool_maxsize=4)
+        request_compression = DeflateRequestCompression(threshold=512)
+
+        self._create_repository(
+            http_client=http_client, request_compression=request_compression, response_compression="gzip"
+        )
+
+        mock_client_class.assert_called_once_with(
+            hosts="http://localhost:8083",
+            host_resolver="fallback",
+            http_client=http_client,
+            request_compression=request_compression,
+            response_compression="gzip",
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_return_pool_stats_from_pooled_http_client(self, mock_client_class: Mock) -> None:
+        http_client = Mock(spec=PooledHttpClient)
+        http_client.pool_stats.return_value = [{"host": "http://localhost:8083", "in_use": 0}]
+        repository = self._create_repository(http_client=http_client)
+
+        assert_that(repository.connection_pool_stats()).is_equal_to([{"host": "http://localhost:8083", "in_use": 0}])
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_return_no_pool_stats_for_other_http_clients(self, mock_client_class: Mock) -> None:
+        repository = self._create_repository(http_client=DefaultHTTPClient())
+
+        assert_that(repository.connection_pool_stats()).is_empty()
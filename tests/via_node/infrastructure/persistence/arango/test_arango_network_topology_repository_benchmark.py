@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Iterator, List
+
+import pytest
+from arango.exceptions import DocumentInsertError
+from assertpy import assert_that
+
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.infrastructure.persistence.arango.arango_documents import port_scan_result_document
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+
+@pytest.fixture(scope="module")
+def stand_in() -> Iterator[ArangoStandIn]:
+    with ArangoStandIn(latency=0.0005) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def repository(stand_in: ArangoStandIn) -> ArangoNetworkTopologyRepository:
+    return ArangoNetworkTopologyRepository(
+        host=stand_in.host,
+        port=stand_in.port,
+        database="network_topology",
+        username="root",
+        password="",
+        graph_name="network_graph",
+        auto_create_database=False,
+    )
+
+
+@pytest.fixture
+def port_scan_results() -> List[PortScanResult]:
+    return [
+        PortScanResult(
+            target_ip="10.0.0.1",
+            port_number=port_number,
+            protocol="tcp",
+            state=PortState.OPEN,
+            scanned_at=datetime.now(),
+        )
+        for port_number in range(1, 101)
+    ]
+
+
+def _insert_then_replace(repository: ArangoNetworkTopologyRepository, port_scan_result: PortScanResult) -> None:
+    collection = repository._db.collection("port_scan_results")
+    document = port_scan_result_document(port_scan_result)
+
+    try:
+        collection.insert(document)
+    except DocumentInsertError:
+        collection.replace(document)
+
+
+class TestArangoNetworkTopologyRepositoryRoundTrips:
+    def test_should_rescan_existing_port_and_record_history_in_one_round_trip(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn, port_scan_results: List
+    ) -> None:
+        repository.create_or_update_port_scan_result(port_scan_results[0])
+        stand_in.reset_requests()
+
+        repository.create_or_update_port_scan_result(port_scan_results[0])
+
+        assert_that([path.rsplit("/", 1)[-1] for _, path in stand_in.requests]).is_equal_to(["cursor"])
+        assert_that(stand_in.collections["port_scan_history"]).is_length(1)
+
+    def test_should_keep_latest_state_after_rescan(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn, port_scan_results: List
+    ) -> None:
+        repository.create_or_update_port_scan_result(port_scan_results[0])
+        rescanned = port_scan_results[0].model_copy(update={"state": PortState.CLOSED})
+
+        repository.create_or_update_port_scan_result(rescanned)
+
+        assert_that(stand_in.collections["port_scan_results"]["10.0.0.1_tcp_1"]["state"]).is_equal_to("closed")
+
+    def test_should_take_two_round_trips_with_insert_then_replace(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn, port_scan_results: List
+    ) -> None:
+        repository.create_or_update_port_scan_result(port_scan_results[0])
+        stand_in.reset_requests()
+
+        _insert_then_replace(repository, port_scan_results[0])
+
+        assert_that(stand_in.request_count).is_equal_to(2)
+
+
+@pytest.mark.benchmark
+def test_should_benchmark_rescan_with_insert_then_replace(
+    benchmark, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn, port_scan_results: List
+):
+    repository.bulk_upsert_port_scan_results(port_scan_results)
+
+    def rescan() -> None:
+        for port_scan_result in port_scan_results:
+            _insert_then_replace(repository, port_scan_result)
+
+    stand_in.reset_requests()
+    benchmark(rescan)
+
+    assert_that(stand_in.request_count % (2 * len(port_scan_results))).is_equal_to(0)
+
+
+@pytest.mark.benchmark
+def test_should_benchmark_rescan_with_single_round_trip_upsert(
+    benchmark, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn, port_scan_results: List
+):
+    repository.bulk_upsert_port_scan_results(port_scan_results)
+
+    def rescan() -> None:
+        for port_scan_result in port_scan_results:
+            repository.create_or_update_port_scan_result(port_scan_result)
+
+    stand_in.reset_requests()
+    benchmark(rescan)
+
+    assert_that(stand_in.request_count % len(port_scan_results)).is_equal_to(0)
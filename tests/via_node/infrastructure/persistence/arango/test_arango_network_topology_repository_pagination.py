@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Iterator, List
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.page import InvalidPageTokenError
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def stand_in() -> Iterator[ArangoStandIn]:
+    with ArangoStandIn() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture(scope="module")
+def repository(stand_in: ArangoStandIn) -> ArangoNetworkTopologyRepository:
+    repository = ArangoNetworkTopologyRepository(
+        host=stand_in.host,
+        port=stand_in.port,
+        database="network_topology",
+        username="root",
+        password="",
+        graph_name="network_graph",
+        auto_create_database=False,
+    )
+    repository.bulk_upsert_hosts(
+        [
+            Host(ip_address=f"10.0.0.{index}", hostname=f"h{index}", os_type="linux", created_at=NOW, updated_at=NOW)
+            for index in range(1, 8)
+        ]
+    )
+    return repository
+
+
+def _all_pages(list_page, page_size: int) -> List[List]:
+    pages = []
+    page_token = None
+
+    while True:
+        page = list_page(page_size=page_size, page_token=page_token)
+        pages.append(page.items)
+
+        if not page.has_next_page:
+            return pages
+
+        page_token = page.next_page_token
+
+
+class TestArangoNetworkTopologyRepositoryPagination:
+    def test_should_walk_every_host_once_in_key_order(self, repository: ArangoNetworkTopologyRepository) -> None:
+        pages = _all_pages(repository.list_hosts, page_size=3)
+
+        assert_that([len(items) for items in pages]).is_equal_to([3, 3, 1])
+        assert_that([host.ip_address for items in pages for host in items]).is_equal_to(
+            [f"10.0.0.{index}" for index in range(1, 8)]
+        )
+
+    def test_should_not_offer_next_page_when_last_page_is_full(
+        self, repository: ArangoNetworkTopologyRepository
+    ) -> None:
+        page = repository.list_hosts(page_size=7)
+
+        assert_that(page.items).is_length(7)
+        assert_that(page.next_page_token).is_none()
+
+    def test_should_resume_from_key_instead_of_offset(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn
+    ) -> None:
+        first_page = repository.list_hosts(page_size=3)
+        stand_in.collections["hosts"].pop("10.0.0.1")
+
+        second_page = repository.list_hosts(page_size=3, page_token=first_page.next_page_token)
+
+        assert_that(second_page.items[0].ip_address).is_equal_to("10.0.0.4")
+        repository.create_or_update_host(first_page.items[0])
+
+    def test_should_reject_token_from_another_collection(self, repository: ArangoNetworkTopologyRepository) -> None:
+        page_token = repository.list_hosts(page_size=1).next_page_token
+
+        with pytest.raises(InvalidPageTokenError):
+            repository.list_ports(page_token=page_token)
+
+    def test_should_reject_empty_page_size(self, repository: ArangoNetworkTopologyRepository) -> None:
+        with pytest.raises(ValueError):
+            repository.list_hosts(page_size=0)
+
+    def test_should_page_every_vertex_and_edge_collection(self, repository: ArangoNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(
+            DnsRecord(
+                domain_name="example.com", record_type="A", ip_addresses=["10.0.0.1"], created_at=NOW, updated_at=NOW
+            )
+        )
+        repository.create_or_update_port(
+            Port(port_number=443, protocol="tcp", service_name="https", created_at=NOW, updated_at=NOW)
+        )
+        repository.create_or_update_dns_record_discovery(
+            DnsRecordDiscovery(
+                domain_name="example.com", record_type=DnsRecordType.A, values=["10.0.0.1"], discovered_at=NOW
+            )
+        )
+        repository.create_or_update_port_scan_result(
+            PortScanResult(target_ip="10.0.0.1", port_number=443, protocol="tcp", state=PortState.OPEN, scanned_at=NOW)
+        )
+        for edge_type, target_id in [("domain_to_port", "443_TCP"), ("dns_resolves_to_host", "10.0.0.1")]:
+            repository.create_edge(
+                NetworkTopologyEdge(
+                    source_id="example.com", target_id=target_id, edge_type=edge_type, metadata={}, created_at=NOW
+                )
+            )
+
+        assert_that(repository.list_dns_records().items[0].domain_name).is_equal_to("example.com")
+        assert_that(repository.list_ports().items[0].port_number).is_equal_to(443)
+        assert_that(repository.list_dns_record_discoveries().items[0].record_type).is_equal_to(DnsRecordType.A)
+        assert_that(repository.list_port_scan_results().items[0].state).is_equal_to(PortState.OPEN)
+        assert_that(repository.list_edges("domain_to_port").items[0].target_id).is_equal_to("443_TCP")
+        assert_that(repository.list_edges("dns_resolves_to_host").items[0].target_id).is_equal_to("10.0.0.1")
@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import Iterator
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def stand_in() -> Iterator[ArangoStandIn]:
+    with ArangoStandIn() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def repository(stand_in: ArangoStandIn) -> ArangoNetworkTopologyRepository:
+    repository = ArangoNetworkTopologyRepository(
+        host=stand_in.host,
+        port=stand_in.port,
+        database="network_topology",
+        username="root",
+        password="",
+        graph_name="network_graph",
+        auto_create_database=False,
+    )
+    repository.bulk_upsert_port_scan_results(
+        [
+            PortScanResult(target_ip="10.0.0.1", port_number=port, protocol="tcp", state=PortState.OPEN, scanned_at=NOW)
+            for port in range(1, 26)
+        ]
+    )
+    repository.create_or_update_dns_record_discovery(
+        DnsRecordDiscovery(
+            domain_name="example.com", record_type=DnsRecordType.A, values=["10.0.0.1"], discovered_at=NOW
+        )
+    )
+    stand_in.reset_requests()
+    return repository
+
+
+class TestArangoNetworkTopologyRepositoryStreaming:
+    def test_should_pull_scan_results_in_cursor_batches(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn
+    ) -> None:
+        port_numbers = [result.port_number for result in repository.iter_port_scan_results("10.0.0.1", batch_size=10)]
+
+        assert_that(sorted(port_numbers)).is_equal_to(list(range(1, 26)))
+        assert_that(stand_in.request_count).is_equal_to(3)
+
+    def test_should_fetch_next_batch_only_when_consumed(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn
+    ) -> None:
+        results = repository.iter_port_scan_results("10.0.0.1", batch_size=10)
+
+        next(results)
+
+        assert_that(stand_in.request_count).is_equal_to(1)
+
+    def test_should_close_server_cursor_when_abandoned(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn
+    ) -> None:
+        results = repository.iter_port_scan_results("10.0.0.1", batch_size=10)
+        next(results)
+
+        results.close()
+
+        assert_that(stand_in.cursors).is_empty()
+        assert_that(stand_in.requests[-1][0]).is_equal_to("DELETE")
+
+    def test_should_return_partial_models_for_projection(self, repository: ArangoNetworkTopologyRepository) -> None:
+        result = next(repository.iter_port_scan_results("10.0.0.1", fields=["port_number", "state"]))
+
+        assert_that(result.model_dump(exclude_unset=True)).is_equal_to(
+            {"port_number": result.port_number, "state": PortState.OPEN}
+        )
+
+    def test_should_return_only_requested_attributes_from_list_reads(
+        self, repository: ArangoNetworkTopologyRepository
+    ) -> None:
+        results = repository.get_port_scan_results("10.0.0.1", fields=["port_number", "state"])
+        discoveries = repository.get_dns_record_discoveries("example.com", fields=["values"])
+
+        assert_that(results).is_length(25)
+        assert_that(results[0].model_dump(exclude_unset=True)).is_equal_to(
+            {"port_number": results[0].port_number, "state": PortState.OPEN}
+        )
+        assert_that(discoveries[0].model_dump(exclude_unset=True)).is_equal_to({"values": ["10.0.0.1"]})
+
+    def test_should_reject_projected_fields_that_are_not_model_fields(
+        self, repository: ArangoNetworkTopologyRepository, stand_in: ArangoStandIn
+    ) -> None:
+        with pytest.raises(ValueError, match="Invalid projected field"):
+            repository.get_port_scan_results("10.0.0.1", fields=["state } RETURN doc //"])
+        with pytest.raises(ValueError, match="Invalid projected field"):
+            repository.get_port_scan_results("10.0.0.1", fields=["limit"])
+
+        assert_that(stand_in.request_count).is_equal_to(0)
+
+    def test_should_stream_dns_record_discoveries(self, repository: ArangoNetworkTopologyRepository) -> None:
+        discoveries = list(repository.iter_dns_record_discoveries("example.com"))
+
+        assert_that(discoveries[0].values).is_equal_to(["10.0.0.1"])
+
+    def test_should_project_dns_record_discoveries(self, repository: ArangoNetworkTopologyRepository) -> None:
+        discovery = next(repository.iter_dns_record_discoveries("example.com", fields=["record_type", "discovered_at"]))
+
+        assert_that(discovery.record_type).is_equal_to(DnsRecordType.A)
+        assert_that(discovery.discovered_at).is_equal_to(NOW)
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_treat_expired_dns_record_discoveries_as_misses(self, mock_client_class: Mock) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.aql.execute.return_value = MagicMock()
+        mock_db.aql.execute.return_value.__iter__ = Mock(return_value=iter([]))
+        mock_db.aql.execute.return_value.has_more.return_value = False
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost",
+            port="8083",
+            database="test_db",
+            username="root",
+            password="",
+            graph_name="test_graph",
+            hide_expired_discoveries=True,
+        )
+
+        list(repository.iter_dns_record_discoveries("example.com"))
+
+        assert_that(" ".join(mock_db.aql.execute.call_args.args[0].split())).contains(
+            "AND (doc.expires_at == null OR doc.expires_at > DATE_NOW() / 1000)"
+        )
+
+    @patch("via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient")
+    def test_should_request_streaming_cursor_with_ttl(self, mock_client_class: Mock) -> None:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.aql.execute.return_value = MagicMock()
+        mock_db.aql.execute.return_value.__iter__ = Mock(return_value=iter([]))
+        mock_db.aql.execute.return_value.has_more.return_value = False
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost", port="8083", database="test_db", username="root", password="", graph_name="test_graph"
+        )
+
+        list(repository.iter_port_scan_results("10.0.0.1", batch_size=50, fields=["state"], ttl=120))
+
+        assert_that(mock_db.aql.execute.call_args.kwargs).is_equal_to(
+            {
+                "bind_vars": {"target_ip": "10.0.0.1"},
+                "batch_size": 50,
+                "ttl": 120,
+                "stream": True,
+            }
+        )
+        assert_that(mock_db.aql.execute.call_args.args[0]).contains('RETURN { "state": doc.`state` }')
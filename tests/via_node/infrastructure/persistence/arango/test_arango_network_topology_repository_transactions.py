@@ -0,0 +1,194 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError
+from via_node.domain.model.port import Port
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def domain_port_link(port_number: int) -> DomainPortLink:
+    return DomainPortLink(
+        dns_record=DnsRecord(
+            domain_name="example.com", record_type="A", ip_addresses=[], created_at=NOW, updated_at=NOW
+        ),
+        port=Port(port_number=port_number, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW),
+        edge=NetworkTopologyEdge(
+            source_id="example.com",
+            target_id=f"{port_number}_TCP",
+            edge_type="domain_to_port",
+            metadata={},
+            created_at=NOW,
+        ),
+    )
+
+
+RESOLVES_EDGE = NetworkTopologyEdge(
+    source_id="example.com", target_id="10.0.0.1", edge_type="dns_resolves_to_host", metadata={}, created_at=NOW
+)
+
+
+@pytest.fixture
+def arango() -> Iterator[Tuple[ArangoNetworkTopologyRepository, Mock]]:
+    with patch(
+        "via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient"
+    ) as mock_client_class:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost", port="8083", database="test_db", username="root", password="", graph_name="test_graph"
+        )
+        yield repository, mock_db
+
+
+class TestArangoNetworkTopologyRepositoryLinkDomainPorts:
+    def test_should_link_batch_in_single_query(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+
+        repository.link_domain_ports([domain_port_link(80), domain_port_link(443)])
+
+        mock_db.aql.execute.assert_called_once()
+        mock_db.collection.return_value.insert.assert_not_called()
+
+    def test_should_send_vertex_and_edge_documents(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+
+        repository.link_domain_ports([domain_port_link(443)])
+
+        link = mock_db.aql.execute.call_args.kwargs["bind_vars"]["links"][0]
+        assert_that(link["dns_record"]["_key"]).is_equal_to("example.com")
+        assert_that(link["port"]["_key"]).is_equal_to("443_TCP")
+        assert_that(link["edge"]["_to"]).is_equal_to("ports/443_TCP")
+
+    def test_should_upsert_vertices_and_edge(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+
+        repository.link_domain_ports([domain_port_link(443)])
+
+        query = mock_db.aql.execute.call_args.args[0]
+        assert_that(query).contains("IN dns_records", "IN ports", "IN domain_port_edges")
+        assert_that(query).contains("UPDATE { updated_at: link.dns_record.updated_at }")
+
+    def test_should_return_linked_edges(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, _ = arango
+        links = [domain_port_link(80), domain_port_link(443)]
+
+        edges = repository.link_domain_ports(links)
+
+        assert_that(edges).is_equal_to([link.edge for link in links])
+
+    def test_should_skip_query_for_empty_batch(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+
+        assert_that(repository.link_domain_ports([])).is_empty()
+        mock_db.aql.execute.assert_not_called()
+
+
+class TestArangoNetworkTopologyRepositoryCreateEdgeBetweenExistingVertices:
+    def test_should_return_edge_when_both_vertices_exist(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"source_found": True, "target_found": True}])
+
+        assert_that(repository.create_edge_between_existing_vertices(RESOLVES_EDGE)).is_same_as(RESOLVES_EDGE)
+
+    def test_should_check_and_insert_in_single_query(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"source_found": True, "target_found": True}])
+
+        repository.create_edge_between_existing_vertices(RESOLVES_EDGE)
+
+        mock_db.aql.execute.assert_called_once()
+        assert_that(mock_db.aql.execute.call_args.args[0]).contains("IN dns_resolves_to_host_edges")
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]["edge"]["_to"]).is_equal_to("hosts/10.0.0.1")
+
+    def test_should_raise_when_dns_record_missing(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"source_found": False, "target_found": True}])
+
+        with pytest.raises(VertexNotFoundError, match="DNS record 'example.com' not found"):
+            repository.create_edge_between_existing_vertices(RESOLVES_EDGE)
+
+    def test_should_raise_when_host_missing(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"source_found": True, "target_found": False}])
+
+        with pytest.raises(VertexNotFoundError, match="Host with IP '10.0.0.1' not found"):
+            repository.create_edge_between_existing_vertices(RESOLVES_EDGE)
+
+    def test_should_bump_last_seen_at_on_existing_edge(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([{"source_found": True, "target_found": True}])
+
+        repository.create_edge_between_existing_vertices(RESOLVES_EDGE)
+
+        query = mock_db.aql.execute.call_args.args[0]
+        assert_that(query).contains("UPSERT { _key: @edge._key }", "UPDATE { last_seen_at: @edge.last_seen_at")
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]["edge"]["_key"]).is_equal_to(RESOLVES_EDGE.key)
+
+
+class TestArangoNetworkTopologyRepositoryCompactEdges:
+    def test_should_compact_every_edge_collection(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.side_effect = lambda *args, **kwargs: iter([])
+
+        results = repository.compact_edges()
+
+        assert_that([result.collection_name for result in results]).is_equal_to(
+            ["domain_port_edges", "dns_resolves_to_host_edges"]
+        )
+
+
+class TestArangoNetworkTopologyRepositoryDumpRestore:
+    def test_should_dump_every_topology_collection(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock], tmp_path: Path
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.side_effect = lambda *args, **kwargs: iter([])
+        mock_db.collection.return_value.properties.return_value = {"edge": False}
+        mock_db.collection.return_value.indexes.return_value = []
+
+        manifest = repository.dump_graph(str(tmp_path))
+
+        assert_that([collection.name for collection in manifest.collections]).is_equal_to(
+            [
+                "dns_records",
+                "ports",
+                "hosts",
+                "dns_discoveries",
+                "port_scan_results",
+                "port_scan_history",
+                "domain_port_edges",
+                "dns_resolves_to_host_edges",
+                "schema_migrations",
+            ]
+        )
+        assert_that(manifest.graph_name).is_equal_to("test_graph")
+
+    def test_should_restore_dump_into_graph(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock], tmp_path: Path
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.side_effect = lambda *args, **kwargs: iter([])
+        mock_db.collection.return_value.properties.return_value = {"edge": False}
+        mock_db.collection.return_value.indexes.return_value = []
+        repository.dump_graph(str(tmp_path))
+
+        results = repository.restore_graph(str(tmp_path), parallelism=2)
+
+        assert_that(results).is_length(9)
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.infrastructure.persistence.arango.arango_documents import port_scan_observation_document
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import (
+    PORT_SCAN_SERIES_QUERY,
+    PORT_SCAN_STATE_AT_QUERY,
+    ArangoPortScanHistoryCompactor,
+    backfill_observation_epochs,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def observed(port_number: int, hours: int, state: PortState = PortState.OPEN) -> Dict[str, Any]:
+    return port_scan_observation_document(
+        PortScanObservation.from_result(
+            PortScanResult(
+                target_ip="10.0.0.1",
+                port_number=port_number,
+                protocol="tcp",
+                state=state,
+                scanned_at=NOW + timedelta(hours=hours),
+            )
+        )
+    )
+
+
+def compactor(documents: List[Dict[str, Any]], chunk_size: int = 1000) -> ArangoPortScanHistoryCompactor:
+    db = Mock()
+    db.aql.execute.return_value = iter(documents)
+    return ArangoPortScanHistoryCompactor(db, chunk_size)
+
+
+@pytest.fixture
+def arango() -> Iterator[Tuple[ArangoNetworkTopologyRepository, Mock]]:
+    with patch(
+        "via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient"
+    ) as mock_client_class:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost", port="8083", database="test_db", username="root", password="", graph_name="test_graph"
+        )
+        yield repository, mock_db
+
+
+class TestArangoPortScanHistoryCompactor:
+    def test_should_stream_history_in_series_order(self) -> None:
+        history_compactor = compactor([])
+
+        history_compactor.compact()
+
+        history_compactor._db.aql.execute.assert_called_once_with(PORT_SCAN_SERIES_QUERY, batch_size=1000, stream=True)
+        assert_that(PORT_SCAN_SERIES_QUERY).contains(
+            "SORT doc.target_ip, doc.port_number, doc.protocol, doc.first_observed_at"
+        )
+
+    def test_should_replace_interval_and_delete_absorbed_observations(self) -> None:
+        history_compactor = compactor([observed(22, 0), observed(22, 1), observed(22, 2), observed(80, 0)])
+
+        result = history_compactor.compact()
+
+        collection = history_compactor._db.collection.return_value
+        [interval] = collection.insert_many.call_args.args[0]
+        assert_that(interval["_key"]).is_equal_to(observed(22, 0)["_key"])
+        assert_that(interval["last_observed_at"]).is_equal_to(observed(22, 2)["last_observed_at"])
+        assert_that(interval["observations"]).is_equal_to(3)
+        collection.delete_many.assert_called_once_with(
+            [{"_key": observed(22, 1)["_key"]}, {"_key": observed(22, 2)["_key"]}], silent=True
+        )
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult(rewritten=1, removed=2))
+
+    def test_should_keep_state_changes_apart(self) -> None:
+        history_compactor = compactor([observed(22, 0), observed(22, 1, PortState.CLOSED), observed(22, 2)])
+
+        result = history_compactor.compact()
+
+        history_compactor._db.collection.return_value.insert_many.assert_not_called()
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult())
+
+    def test_should_rewrite_in_chunks(self) -> None:
+        documents = [
+            document for port_number in range(1, 6) for document in (observed(port_number, 0), observed(port_number, 1))
+        ]
+        history_compactor = compactor(documents, chunk_size=2)
+
+        result = history_compactor.compact()
+
+        assert_that(history_compactor._db.collection.return_value.insert_many.call_count).is_equal_to(3)
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult(rewritten=5, removed=5))
+
+
+class TestBackfillObservationEpochs:
+    def test_should_store_epoch_of_documents_without_one(self) -> None:
+        db = Mock()
+        document = observed(22, 0)
+        db.aql.execute.return_value = iter([{"_key": document["_key"], "first_observed_at": "2024-01-01T12:00:00"}])
+
+        backfill_observation_epochs(db)
+
+        db.collection.return_value.update_many.assert_called_once_with(
+            [{"_key": document["_key"], "first_observed_us": document["first_observed_us"]}], silent=True
+        )
+
+    def test_should_update_in_chunks(self) -> None:
+        db = Mock()
+        db.aql.execute.return_value = iter(
+            [{"_key": str(hours), "first_observed_at": observed(22, hours)["first_observed_at"]} for hours in range(5)]
+        )
+
+        backfill_observation_epochs(db, chunk_size=2)
+
+        assert_that(db.collection.return_value.update_many.call_count).is_equal_to(3)
+
+
+class TestArangoNetworkTopologyRepositoryPortScanHistory:
+    def test_should_read_history_of_target(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([observed(22, 0), observed(22, 1)])
+
+        history = repository.get_port_scan_history("10.0.0.1")
+
+        assert_that([observation.first_observed_at for observation in history]).is_equal_to(
+            [NOW, NOW + timedelta(hours=1)]
+        )
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]).is_equal_to({"target_ip": "10.0.0.1"})
+
+    def test_should_read_latest_observation_per_port_at_time(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([observed(22, 1, PortState.CLOSED)])
+
+        [state] = repository.get_port_scan_state_at("10.0.0.1", NOW + timedelta(hours=2))
+
+        assert_that(state.state).is_equal_to(PortState.CLOSED)
+        mock_db.aql.execute.assert_called_once_with(
+            PORT_SCAN_STATE_AT_QUERY,
+            bind_vars={"target_ip": "10.0.0.1", "at": epoch_microseconds(NOW + timedelta(hours=2))},
+        )
+
+    def test_should_compare_state_at_time_by_instant(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([])
+        at = datetime(2024, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+
+        repository.get_port_scan_state_at("10.0.0.1", at)
+
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]["at"]).is_equal_to(
+            epoch_microseconds(datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc))
+        )
+        assert_that(PORT_SCAN_STATE_AT_QUERY).contains("doc.first_observed_us <= @at")
+
+    def test_should_compact_history_collection(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([observed(22, 0), observed(22, 1)])
+
+        result = repository.compact_port_scan_history()
+
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult(rewritten=1, removed=1))
+        mock_db.collection.assert_any_call("port_scan_history")
@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import List
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_schema_marker import ArangoSchemaMarker, schema_marker_scope
+
+SCOPE = schema_marker_scope("localhost", "8083", "network_topology", "network_graph", 3)
+
+
+def _marker(tmp_path: Path, now: List[float], ttl: float = 60.0) -> ArangoSchemaMarker:
+    return ArangoSchemaMarker(str(tmp_path / "markers"), ttl, clock=lambda: now[0])
+
+
+class TestArangoSchemaMarker:
+    def test_should_not_be_fresh_before_recording(self, tmp_path: Path) -> None:
+        assert_that(_marker(tmp_path, [0.0]).is_fresh(SCOPE)).is_false()
+
+    def test_should_be_fresh_within_ttl_across_instances(self, tmp_path: Path) -> None:
+        now = [1000.0]
+        _marker(tmp_path, now).record(SCOPE)
+        now[0] = 1059.0
+
+        assert_that(_marker(tmp_path, now).is_fresh(SCOPE)).is_true()
+
+    def test_should_expire_after_ttl(self, tmp_path: Path) -> None:
+        now = [1000.0]
+        marker = _marker(tmp_path, now)
+        marker.record(SCOPE)
+        now[0] = 1060.0
+
+        assert_that(marker.is_fresh(SCOPE)).is_false()
+
+    def test_should_not_be_fresh_when_clock_moved_backwards(self, tmp_path: Path) -> None:
+        now = [1000.0]
+        marker = _marker(tmp_path, now)
+        marker.record(SCOPE)
+        now[0] = 900.0
+
+        assert_that(marker.is_fresh(SCOPE)).is_false()
+
+    def test_should_scope_marker_per_database_graph_and_schema_version(self, tmp_path: Path) -> None:
+        marker = _marker(tmp_path, [1000.0])
+        marker.record(SCOPE)
+
+        assert_that(marker.is_fresh(schema_marker_scope("localhost", "8083", "other", "network_graph", 3))).is_false()
+        assert_that(
+            marker.is_fresh(schema_marker_scope("localhost", "8083", "network_topology", "other", 3))
+        ).is_false()
+        assert_that(
+            marker.is_fresh(schema_marker_scope("localhost", "8083", "network_topology", "network_graph", 4))
+        ).is_false()
+
+    def test_should_neither_read_nor_write_when_disabled(self, tmp_path: Path) -> None:
+        marker = _marker(tmp_path, [1000.0], ttl=0)
+
+        marker.record(SCOPE)
+
+        assert_that(marker.is_fresh(SCOPE)).is_false()
+        assert_that((tmp_path / "markers").exists()).is_false()
+
+    def test_should_ignore_unwritable_directory(self, tmp_path: Path) -> None:
+        (tmp_path / "markers").write_text("not a directory")
+        marker = _marker(tmp_path, [1000.0])
+
+        marker.record(SCOPE)
+
+        assert_that(marker.is_fresh(SCOPE)).is_false()
+
+    def test_should_ignore_corrupt_marker(self, tmp_path: Path) -> None:
+        marker = _marker(tmp_path, [1000.0])
+        marker.record(SCOPE)
+        [path] = (tmp_path / "markers").iterdir()
+        path.write_text("garbage")
+
+        assert_that(marker.is_fresh(SCOPE)).is_false()
@@ -0,0 +1,194 @@
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import backfill_observation_epochs
+from via_node.infrastructure.persistence.arango.arango_schema_migrations import (
+    SCHEMA_MIGRATIONS,
+    ArangoIndexDefinition,
+    ArangoSchemaMigration,
+    ArangoSchemaMigrator,
+    ArangoTtlIndexDefinition,
+)
+
+
+class TestArangoIndexDefinition:
+    def test_should_describe_persistent_index_built_in_background(self) -> None:
+        index = ArangoIndexDefinition("port_scan_results", ["target_ip"], "idx_port_scan_results_target_ip")
+
+        assert_that(index.to_index_data()).is_equal_to(
+            {
+                "type": "persistent",
+                "fields": ["target_ip"],
+                "name": "idx_port_scan_results_target_ip",
+                "unique": False,
+                "sparse": False,
+                "inBackground": True,
+            }
+        )
+
+    def test_should_describe_ttl_index_expiring_at_stored_timestamp(self) -> None:
+        index = ArangoTtlIndexDefinition("dns_discoveries", "expires_at", "idx_dns_discoveries_expires_at")
+
+        assert_that(index.to_index_data()).is_equal_to(
+            {
+                "type": "ttl",
+                "fields": ["expires_at"],
+                "name": "idx_dns_discoveries_expires_at",
+                "expireAfter": 0,
+                "inBackground": True,
+            }
+        )
+
+
+class TestSchemaMigrations:
+    def test_should_index_filtered_and_time_fields(self) -> None:
+        indexed = {(index.collection_name, tuple(index.fields)) for index in SCHEMA_MIGRATIONS[0].indexes}
+
+        assert_that(indexed).contains(
+            ("dns_discoveries", ("domain_name",)),
+            ("dns_discoveries", ("discovered_at",)),
+            ("port_scan_results", ("target_ip",)),
+            ("port_scan_results", ("scanned_at",)),
+            ("domain_port_edges", ("edge_type",)),
+            ("dns_resolves_to_host_edges", ("edge_type",)),
+        )
+
+    def test_should_create_and_index_port_scan_history(self) -> None:
+        [migration] = [migration for migration in SCHEMA_MIGRATIONS if "port_scan_history" in migration.collections]
+        indexed = {tuple(index.fields): index.unique for index in migration.indexes}
+
+        assert_that(indexed).is_equal_to(
+            {
+                ("target_ip", "first_observed_at"): False,
+                ("target_ip", "port_number", "protocol", "first_observed_at"): True,
+            }
+        )
+
+    def test_should_expire_dns_discoveries_with_ttl_index(self) -> None:
+        indexes = [index for migration in SCHEMA_MIGRATIONS for index in migration.indexes]
+        [ttl_index] = [index for index in indexes if isinstance(index, ArangoTtlIndexDefinition)]
+
+        assert_that(ttl_index.collection_name).is_equal_to("dns_discoveries")
+        assert_that(ttl_index.fields).is_equal_to(["expires_at"])
+
+    def test_should_index_exposure_statistics_groupings(self) -> None:
+        indexed = {(index.collection_name, tuple(index.fields)) for index in SCHEMA_MIGRATIONS[3].indexes}
+
+        assert_that(indexed).contains(
+            ("port_scan_results", ("state", "service_name", "target_ip")),
+            ("port_scan_results", ("state", "port_number", "protocol")),
+            ("dns_discoveries", ("domain_name", "record_type")),
+        )
+
+    def test_should_index_and_backfill_observation_epochs(self) -> None:
+        [migration] = [migration for migration in SCHEMA_MIGRATIONS if migration.backfill is not None]
+
+        assert_that([tuple(index.fields) for index in migration.indexes]).is_equal_to(
+            [("target_ip", "first_observed_us")]
+        )
+        assert_that(migration.backfill).is_same_as(backfill_observation_epochs)
+
+    def test_should_declare_unique_increasing_versions(self) -> None:
+        versions = [migration.version for migration in SCHEMA_MIGRATIONS]
+
+        assert_that(versions).is_equal_to(sorted(set(versions)))
+
+
+class TestArangoSchemaMigrator:
+    def _migrations(self) -> list:
+        return [
+            ArangoSchemaMigration(2, "second", [ArangoIndexDefinition("hosts", ["hostname"], "idx_hosts_hostname")]),
+            ArangoSchemaMigration(1, "first", [ArangoIndexDefinition("ports", ["protocol"], "idx_ports_protocol")]),
+        ]
+
+    def _mock_db(self, applied_version: int = 0) -> Mock:
+        mock_db = Mock()
+        mock_db.has_collection.return_value = True
+        mock_db.collection.return_value.get.return_value = (
+            {"_key": "network_graph", "version": applied_version} if applied_version else None
+        )
+        return mock_db
+
+    def test_should_report_version_zero_when_nothing_was_applied(self) -> None:
+        migrator = ArangoSchemaMigrator(self._mock_db(), "network_graph", self._migrations())
+
+        assert_that(migrator.current_version()).is_equal_to(0)
+
+    def test_should_report_recorded_version(self) -> None:
+        migrator = ArangoSchemaMigrator(self._mock_db(applied_version=1), "network_graph", self._migrations())
+
+        assert_that(migrator.current_version()).is_equal_to(1)
+
+    def test_should_report_latest_declared_version(self) -> None:
+        migrator = ArangoSchemaMigrator(self._mock_db(), "network_graph", self._migrations())
+
+        assert_that(migrator.latest_version).is_equal_to(2)
+
+    def test_should_report_version_zero_as_latest_without_migrations(self) -> None:
+        migrator = ArangoSchemaMigrator(self._mock_db(), "network_graph", [])
+
+        assert_that(migrator.latest_version).is_equal_to(0)
+
+    def test_should_apply_pending_migrations_in_version_order(self) -> None:
+        migrator = ArangoSchemaMigrator(self._mock_db(), "network_graph", self._migrations())
+
+        assert_that(migrator.migrate()).is_equal_to([1, 2])
+
+    def test_should_skip_already_applied_migrations(self) -> None:
+        mock_db = self._mock_db(applied_version=2)
+        migrator = ArangoSchemaMigrator(mock_db, "network_graph", self._migrations())
+
+        applied = migrator.migrate()
+
+        assert_that(applied).is_empty()
+        mock_db.collection.return_value.add_index.assert_not_called()
+
+    def test_should_ensure_declared_indexes(self) -> None:
+        mock_db = self._mock_db(applied_version=1)
+        migrator = ArangoSchemaMigrator(mock_db, "network_graph", self._migrations())
+
+        migrator.migrate()
+
+        mock_db.collection.return_value.add_index.assert_called_once()
+        assert_that(mock_db.collection.return_value.add_index.call_args[0][0]["fields"]).is_equal_to(["hostname"])
+
+    def test_should_record_applied_version(self) -> None:
+        mock_db = self._mock_db()
+        migrator = ArangoSchemaMigrator(mock_db, "network_graph", self._migrations())
+
+        migrator.migrate()
+
+        recorded = mock_db.collection.return_value.insert.call_args[0][0]
+        assert_that(recorded["_key"]).is_equal_to("network_graph")
+        assert_that(recorded["version"]).is_equal_to(2)
+
+    def test_should_run_backfill_after_indexing(self) -> None:
+        mock_db = self._mock_db()
+        backfill = Mock()
+        migration = ArangoSchemaMigration(1, "backfill", [], backfill=backfill)
+
+        ArangoSchemaMigrator(mock_db, "network_graph", [migration]).migrate()
+
+        backfill.assert_called_once_with(mock_db)
+
+    def test_should_create_missing_collections_before_indexing(self) -> None:
+        mock_db = self._mock_db()
+        mock_db.has_collection.side_effect = lambda name: name in ("schema_migrations", "hosts")
+        migration = ArangoSchemaMigration(
+            1, "history", [ArangoIndexDefinition("history", ["at"], "idx_history_at")], collections=["history", "hosts"]
+        )
+
+        ArangoSchemaMigrator(mock_db, "network_graph", [migration]).migrate()
+
+        mock_db.create_collection.assert_called_once_with("history")
+
+    def test_should_create_migrations_collection_when_missing(self) -> None:
+        mock_db = self._mock_db()
+        mock_db.has_collection.return_value = False
+        migrator = ArangoSchemaMigrator(mock_db, "network_graph", self._migrations())
+
+        migrator.current_version()
+        migrator.current_version()
+
+        mock_db.create_collection.assert_called_once_with("schema_migrations")
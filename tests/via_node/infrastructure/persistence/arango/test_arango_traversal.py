@@ -0,0 +1,148 @@
+from typing import Any, Dict, Iterator, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.topology_traversal import TraversalDirection, VertexReference
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.arango_traversal import (
+    neighbors_query,
+    shortest_path_query,
+    traversal_path_from_results,
+    traversal_vertex_from_result,
+    vertex_id,
+    vertex_reference,
+)
+
+DOMAIN = VertexReference.parse("dns_record:example.com")
+HOST = VertexReference.parse("host:10.0.0.1")
+
+EDGE_DOCUMENT = {
+    "_key": "k",
+    "_id": "dns_resolves_to_host_edges/k",
+    "source_id": "example.com",
+    "target_id": "10.0.0.1",
+    "edge_type": "dns_resolves_to_host",
+    "metadata": {},
+    "created_at": "2024-01-01T12:00:00",
+}
+PATH_RESULT: Dict[str, Any] = {"vertices": ["dns_records/example.com", "hosts/10.0.0.1"], "edges": [EDGE_DOCUMENT]}
+NEIGHBOR_RESULT: Dict[str, Any] = {
+    "vertex": {"_id": "ports/443_TCP", "_key": "443_TCP", "_rev": "r", "port_number": 443},
+    "depth": 1,
+}
+
+
+@pytest.fixture
+def arango() -> Iterator[Tuple[ArangoNetworkTopologyRepository, Mock]]:
+    with patch(
+        "via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient"
+    ) as mock_client_class:
+        mock_db = mock_client_class.return_value.db.return_value
+        mock_db.has_graph.return_value = True
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost", port="8083", database="test_db", username="root", password="", graph_name="test_graph"
+        )
+        yield repository, mock_db
+
+
+class TestArangoTraversalQueries:
+    def test_should_map_vertex_reference_to_document_id(self) -> None:
+        assert_that(vertex_id(DOMAIN)).is_equal_to("dns_records/example.com")
+        assert_that(vertex_reference("ports/443_TCP")).is_equal_to(VertexReference(kind="port", key="443_TCP"))
+
+    def test_should_traverse_breadth_first_from_start_vertex(self) -> None:
+        query, bind_vars = neighbors_query(DOMAIN, 2, TraversalDirection.OUTBOUND, None, 50)
+
+        assert_that(query).contains("IN 1..@depth OUTBOUND @start", 'order: "bfs"', "LIMIT @limit")
+        assert_that(bind_vars).is_equal_to(
+            {
+                "start": "dns_records/example.com",
+                "depth": 2,
+                "limit": 50,
+                "edge_types": ["domain_to_port", "dns_resolves_to_host"],
+            }
+        )
+
+    def test_should_prune_paths_leaving_requested_edge_types_or_depth(self) -> None:
+        query, bind_vars = neighbors_query(DOMAIN, 3, TraversalDirection.OUTBOUND, ["domain_to_port"], 10)
+
+        assert_that(query).contains(
+            "PRUNE edge.edge_type NOT IN @edge_types OR LENGTH(path.edges) >= @depth",
+            "FILTER vertex != null AND edge.edge_type IN @edge_types",
+        )
+        assert_that(bind_vars["edge_types"]).is_equal_to(["domain_to_port"])
+
+    def test_should_follow_every_edge_collection_by_default(self) -> None:
+        query, _ = neighbors_query(DOMAIN, 1, TraversalDirection.ANY, None, 10)
+
+        assert_that(query).contains("ANY @start domain_port_edges, dns_resolves_to_host_edges")
+
+    def test_should_restrict_traversal_to_requested_edge_types(self) -> None:
+        query, _ = neighbors_query(DOMAIN, 1, TraversalDirection.OUTBOUND, ["dns_resolves_to_host"], 10)
+
+        assert_that(query).contains("OUTBOUND @start dns_resolves_to_host_edges\n")
+
+    def test_should_reject_invalid_neighbors_arguments_before_querying(self) -> None:
+        with pytest.raises(ValueError):
+            neighbors_query(DOMAIN, 0, TraversalDirection.OUTBOUND, None, 10)
+
+        with pytest.raises(ValueError):
+            neighbors_query(DOMAIN, 1, TraversalDirection.OUTBOUND, ["peers_with"], 10)
+
+    def test_should_prune_path_search_at_target(self) -> None:
+        query, bind_vars = shortest_path_query(DOMAIN, HOST, 4, TraversalDirection.ANY, None)
+
+        assert_that(query).contains("IN 0..@max_depth ANY @source", "PRUNE vertex._id == @target", "LIMIT 1")
+        assert_that(bind_vars).is_equal_to(
+            {"source": "dns_records/example.com", "target": "hosts/10.0.0.1", "max_depth": 4}
+        )
+
+    def test_should_build_neighbor_without_system_attributes(self) -> None:
+        neighbor = traversal_vertex_from_result(NEIGHBOR_RESULT)
+
+        assert_that(str(neighbor.vertex)).is_equal_to("port:443_TCP")
+        assert_that(neighbor.depth).is_equal_to(1)
+        assert_that(neighbor.attributes).is_equal_to({"port_number": 443})
+
+    def test_should_build_path_from_first_result(self) -> None:
+        path = traversal_path_from_results([PATH_RESULT])
+
+        assert_that([str(vertex) for vertex in path.vertices]).is_equal_to(  # type: ignore[union-attr]
+            ["dns_record:example.com", "host:10.0.0.1"]
+        )
+        assert_that(path.edges[0].target_id).is_equal_to("10.0.0.1")  # type: ignore[union-attr]
+
+    def test_should_report_unreachable_target(self) -> None:
+        assert_that(traversal_path_from_results([])).is_none()
+
+
+class TestArangoNetworkTopologyRepositoryTraversal:
+    def test_should_return_neighbors_from_single_query(
+        self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]
+    ) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([NEIGHBOR_RESULT])
+
+        neighbors = repository.neighbors(DOMAIN, depth=2)
+
+        mock_db.aql.execute.assert_called_once()
+        assert_that(mock_db.aql.execute.call_args.kwargs["bind_vars"]["depth"]).is_equal_to(2)
+        assert_that([neighbor.vertex.key for neighbor in neighbors]).is_equal_to(["443_TCP"])
+
+    def test_should_return_shortest_path(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([PATH_RESULT])
+
+        path = repository.shortest_path(DOMAIN, HOST)
+
+        assert_that(path.length).is_equal_to(1)  # type: ignore[union-attr]
+
+    def test_should_return_none_when_unreachable(self, arango: Tuple[ArangoNetworkTopologyRepository, Mock]) -> None:
+        repository, mock_db = arango
+        mock_db.aql.execute.return_value = iter([])
+
+        assert_that(repository.shortest_path(DOMAIN, HOST, max_depth=2)).is_none()
@@ -0,0 +1,764 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import httpx
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.domain.model.topology_traversal import VertexReference
+from via_node.infrastructure.persistence.arango.arango_documents import (
+    LINK_DOMAIN_PORTS_QUERY,
+    dns_record_discovery_document,
+    port_scan_observation_document,
+    port_scan_result_document,
+)
+from via_node.infrastructure.persistence.arango.arango_port_scan_history import (
+    PORT_SCAN_HISTORY_QUERY,
+    PORT_SCAN_SERIES_QUERY,
+    PORT_SCAN_STATE_AT_QUERY,
+)
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoError,
+    AsyncArangoNetworkTopologyRepository,
+)
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _repository(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any
+) -> AsyncArangoNetworkTopologyRepository:
+    return AsyncArangoNetworkTopologyRepository(
+        host="localhost",
+        port="8083",
+        database="test_db",
+        username="root",
+        password="",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _recording_handler(requests: List[httpx.Request], status_code: int = 202, body: Any = None) -> Callable:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json={} if body is None else body)
+
+    return handler
+
+
+def _port_scan_results(count: int) -> List[PortScanResult]:
+    return [
+        PortScanResult(target_ip="192.168.1.1", port_number=port, protocol="tcp", state=PortState.OPEN, scanned_at=NOW)
+        for port in range(1, count + 1)
+    ]
+
+
+def _observed(port_number: int, hours: int, state: PortState = PortState.OPEN) -> Dict[str, Any]:
+    return port_scan_observation_document(
+        PortScanObservation.from_result(
+            PortScanResult(
+                target_ip="10.0.0.1",
+                port_number=port_number,
+                protocol="tcp",
+                state=state,
+                scanned_at=NOW + timedelta(hours=hours),
+            )
+        )
+    )
+
+
+def _cursor_handler(requests: List[httpx.Request], result: List[Any]) -> Callable:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.url.path.endswith("/_api/cursor"):
+            return httpx.Response(201, json={"result": result, "hasMore": False})
+
+        return httpx.Response(202, json={})
+
+    return handler
+
+
+def _edge(edge_type: str, target_id: str) -> NetworkTopologyEdge:
+    return NetworkTopologyEdge(
+        source_id="example.com", target_id=target_id, edge_type=edge_type, metadata={}, created_at=NOW
+    )
+
+
+class TestAsyncArangoNetworkTopologyRepositoryWrites:
+    def test_should_upsert_port_in_single_request(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests))
+        port = Port(port_number=443, protocol="TCP", service_name="https", created_at=NOW, updated_at=NOW)
+
+        asyncio.run(repository.create_or_update_port(port))
+
+        assert_that(requests).is_length(1)
+        assert_that(requests[0].method).is_equal_to("POST")
+        assert_that(requests[0].url.path).is_equal_to("/_db/test_db/_api/document/ports")
+        assert_that(dict(requests[0].url.params)).is_equal_to({"overwriteMode": "replace", "silent": "true"})
+        assert_that(json.loads(requests[0].content)["_key"]).is_equal_to("443_TCP")
+
+    def test_should_upsert_dns_record_host_discovery_and_scan_result(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 201, {"result": [], "hasMore": False}))
+
+        async def write() -> None:
+            await repository.create_or_update_dns_record(
+                DnsRecord(
+                    domain_name="example.com", record_type="A", ip_addresses=["1.1.1.1"], created_at=NOW, updated_at=NOW
+                )
+            )
+            await repository.create_or_update_host(
+                Host(ip_address="1.1.1.1", hostname="h", os_type="linux", created_at=NOW, updated_at=NOW)
+            )
+            await repository.create_or_update_dns_record_discovery(
+                DnsRecordDiscovery(
+                    domain_name="example.com", record_type=DnsRecordType.A, values=["1.1.1.1"], discovered_at=NOW
+                )
+            )
+            await repository.create_or_update_port_scan_result(_port_scan_results(1)[0])
+
+        asyncio.run(write())
+
+        assert_that([request.url.path.rsplit("/", 1)[-1] for request in requests]).is_equal_to(
+            ["dns_records", "hosts", "dns_discoveries", "cursor"]
+        )
+        bind_vars = json.loads(requests[-1].content)["bindVars"]
+        assert_that(bind_vars["result"]["_key"]).is_equal_to("192.168.1.1_tcp_1")
+        assert_that(bind_vars["observation"]["target_ip"]).is_equal_to("192.168.1.1")
+
+    def test_should_upsert_edge_into_edge_collection_for_type(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 201, {"result": [], "hasMore": False}))
+
+        asyncio.run(repository.create_edge(_edge("dns_resolves_to_host", "1.1.1.1")))
+
+        body = json.loads(requests[0].content)
+        assert_that(requests[0].url.path).ends_with("/_api/cursor")
+        assert_that(body["query"]).contains("UPSERT { _key: edge._key }", "IN dns_resolves_to_host_edges")
+        assert_that(body["bindVars"]["edges"][0]["_to"]).is_equal_to("hosts/1.1.1.1")
+
+    def test_should_send_deterministic_edge_key(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 201, {"result": [], "hasMore": False}))
+        edge = _edge("domain_to_port", "443_tcp")
+
+        assert_that(asyncio.run(repository.create_edge(edge))).is_equal_to(edge)
+        assert_that(json.loads(requests[0].content)["bindVars"]["edges"][0]["_key"]).is_equal_to(edge.key)
+
+    def test_should_raise_arango_error_on_failed_write(self) -> None:
+        repository = _repository(_recording_handler([], 503, {"errorNum": 503, "errorMessage": "unavailable"}))
+
+        with pytest.raises(AsyncArangoError) as error:
+            asyncio.run(repository.create_or_update_port_scan_result(_port_scan_results(1)[0]))
+
+        assert_that(error.value.status_code).is_equal_to(503)
+        assert_that(str(error.value)).is_equal_to("[HTTP 503][ERR 503] unavailable")
+
+    def test_should_use_reason_phrase_when_error_has_no_body(self) -> None:
+        repository = _repository(lambda request: httpx.Response(502))
+
+        with pytest.raises(AsyncArangoError) as error:
+            asyncio.run(repository.create_or_update_port_scan_result(_port_scan_results(1)[0]))
+
+        assert_that(error.value.error_message).is_equal_to("Bad Gateway")
+
+
+class TestAsyncArangoNetworkTopologyRepositoryReads:
+    def test_should_get_port_in_single_request(self) -> None:
+        document = {
+            "port_number": 443,
+            "protocol": "tcp",
+            "service_name": "https",
+            "created_at": NOW.isoformat(),
+            "updated_at": NOW.isoformat(),
+        }
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 200, document))
+
+        port = asyncio.run(repository.get_port(443, "tcp"))
+
+        assert_that(port.service_name).is_equal_to("https")
+        assert_that(requests).is_length(1)
+        assert_that(requests[0].url.path).is_equal_to("/_db/test_db/_api/document/ports/443_tcp")
+
+    def test_should_return_none_when_document_missing(self) -> None:
+        repository = _repository(_recording_handler([], 404, {"errorNum": 1202, "errorMessage": "not found"}))
+
+        async def read() -> List[Any]:
+            return [
+                await repository.get_port(443, "tcp"),
+                await repository.get_host("1.1.1.1"),
+                await repository.get_dns_record("example.com"),
+            ]
+
+        assert_that(asyncio.run(read())).is_equal_to([None, None, None])
+
+    def test_should_get_host_and_dns_record(self) -> None:
+        document = {
+            "domain_name": "example.com",
+            "record_type": "A",
+            "ip_addresses": ["1.1.1.1"],
+            "ip_address": "1.1.1.1",
+            "hostname": "h",
+            "os_type": "linux",
+            "created_at": NOW.isoformat(),
+            "updated_at": NOW.isoformat(),
+        }
+        repository = _repository(_recording_handler([], 200, document))
+
+        async def read() -> List[Any]:
+            return [await repository.get_host("1.1.1.1"), await repository.get_dns_record("example.com")]
+
+        host, dns_record = asyncio.run(read())
+
+        assert_that(host.hostname).is_equal_to("h")
+        assert_that(dns_record.ip_addresses).is_equal_to(["1.1.1.1"])
+
+    def test_should_follow_cursor_batches(self) -> None:
+        documents = [port_scan_result for port_scan_result in _port_scan_results(3)]
+        rows = [{**result.model_dump(mode="json"), "state": result.state.value} for result in documents]
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.method == "POST":
+                return httpx.Response(201, json={"result": rows[:2], "hasMore": True, "id": "42"})
+            return httpx.Response(200, json={"result": rows[2:], "hasMore": False})
+
+        repository = _repository(handler, cursor_batch_size=2)
+
+        results = asyncio.run(repository.get_port_scan_results("192.168.1.1"))
+
+        assert_that([result.port_number for result in results]).is_equal_to([1, 2, 3])
+        assert_that(json.loads(requests[0].content)).is_equal_to(
+            {
+                "query": "FOR doc IN port_scan_results FILTER doc.target_ip == @target_ip RETURN doc",
+                "bindVars": {"target_ip": "192.168.1.1"},
+                "batchSize": 2,
+            }
+        )
+        assert_that(requests[1].method).is_equal_to("PUT")
+        assert_that(requests[1].url.path).is_equal_to("/_db/test_db/_api/cursor/42")
+
+    def test_should_get_dns_record_discoveries(self) -> None:
+        row = {"domain_name": "example.com", "record_type": "A", "values": ["1.1.1.1"], "ttl": 300}
+        row["discovered_at"] = NOW.isoformat()
+        repository = _repository(_recording_handler([], 201, {"result": [row], "hasMore": False}))
+
+        discoveries = asyncio.run(repository.get_dns_record_discoveries("example.com"))
+
+        assert_that(discoveries[0].ttl).is_equal_to(300)
+
+    def test_should_skip_expired_dns_record_discoveries_when_hidden(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(
+            _recording_handler(requests, 201, {"result": [], "hasMore": False}), hide_expired_discoveries=True
+        )
+
+        asyncio.run(repository.get_dns_record_discoveries("example.com"))
+
+        assert_that(json.loads(requests[0].content)["query"]).contains(
+            "FILTER doc.domain_name == @domain_name AND (doc.expires_at == null OR doc.expires_at > DATE_NOW() / 1000)"
+        )
+
+    def test_should_reject_non_positive_discovery_ttl_multiplier(self) -> None:
+        assert_that(_repository).raises(ValueError).when_called_with(
+            _recording_handler([]), discovery_ttl_multiplier=0
+        ).is_equal_to("Discovery TTL multiplier must be positive")
+
+
+class TestAsyncArangoNetworkTopologyRepositoryBulk:
+    def test_should_send_chunks_and_report_per_document_errors(self) -> None:
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            documents = json.loads(request.content)
+            return httpx.Response(
+                202,
+                json=[
+                    (
+                        {"error": True, "errorNum": 1210, "errorMessage": "conflict"}
+                        if document["_key"].endswith("_3")
+                        else {"_key": document["_key"]}
+                    )
+                    for document in documents
+                ],
+            )
+
+        repository = _repository(handler, bulk_chunk_size=2)
+
+        result = asyncio.run(repository.bulk_upsert_port_scan_results(_port_scan_results(5)))
+
+        assert_that([request for request in requests if request.url.path.endswith("port_scan_results")]).is_length(3)
+        assert_that(result.written).is_equal_to(4)
+        assert_that(result.errors[0].index).is_equal_to(2)
+        assert_that(result.errors[0].key).is_equal_to("192.168.1.1_tcp_3")
+
+    def test_should_bulk_upsert_hosts_and_discoveries(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(202, json=[{} for _ in json.loads(request.content)])
+
+        repository = _repository(handler)
+        hosts = [Host(ip_address="1.1.1.1", hostname="h", os_type="linux", created_at=NOW, updated_at=NOW)]
+        discoveries = [
+            DnsRecordDiscovery(
+                domain_name="example.com", record_type=DnsRecordType.A, values=["1.1.1.1"], discovered_at=NOW
+            )
+        ]
+
+        async def write() -> List[int]:
+            return [
+                (await repository.bulk_upsert_hosts(hosts)).written,
+                (await repository.bulk_upsert_dns_record_discoveries(discoveries)).written,
+            ]
+
+        assert_that(asyncio.run(write())).is_equal_to([1, 1])
+
+    def test_should_bulk_upsert_dns_records_and_ports(self) -> None:
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(202, json=[{} for _ in json.loads(request.content)])
+
+        repository = _repository(handler)
+        records = [
+            DnsRecord(domain_name="example.com", record_type="A", ip_addresses=[], created_at=NOW, updated_at=NOW)
+        ]
+        ports = [Port(port_number=443, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW)]
+
+        async def write() -> List[int]:
+            return [
+                (await repository.bulk_upsert_dns_records(records)).written,
+                (await repository.bulk_upsert_ports(ports)).written,
+            ]
+
+        assert_that(asyncio.run(write())).is_equal_to([1, 1])
+        assert_that([request.url.path.rsplit("/", 1)[-1] for request in requests]).is_equal_to(["dns_records", "ports"])
+
+    def test_should_store_discovery_expiry_from_ttl_multiplier(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests), discovery_ttl_multiplier=3.0)
+        discovery = DnsRecordDiscovery(
+            domain_name="example.com", record_type=DnsRecordType.A, values=["1.1.1.1"], ttl=300, discovered_at=NOW
+        )
+
+        asyncio.run(repository.create_or_update_dns_record_discovery(discovery))
+
+        assert_that(json.loads(requests[0].content)["expires_at"]).is_equal_to(
+            (NOW + timedelta(seconds=900)).timestamp()
+        )
+
+    def test_should_upsert_edges_per_collection_with_original_indexes(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            failed = "domain_port_edges" in body["query"]
+            keys = [] if failed else [edge["_key"] for edge in body["bindVars"]["edges"]]
+            return httpx.Response(201, json={"result": keys, "hasMore": False})
+
+        repository = _repository(handler)
+        edges = [_edge("domain_to_port", "443_tcp"), _edge("dns_resolves_to_host", "1.1.1.1")]
+
+        result = asyncio.run(repository.bulk_create_edges(edges))
+
+        assert_that(result.written).is_equal_to(1)
+        assert_that([error.index for error in result.errors]).is_equal_to([0])
+        assert_that(result.errors[0].key).is_equal_to(edges[0].key)
+
+
+class TestAsyncArangoNetworkTopologyRepositoryAgainstStandIn:
+    def _repository(self, stand_in: ArangoStandIn, **kwargs: Any) -> AsyncArangoNetworkTopologyRepository:
+        return AsyncArangoNetworkTopologyRepository(
+            host=stand_in.host,
+            port=stand_in.port,
+            database="network_topology",
+            username="root",
+            password="",
+            **kwargs,
+        )
+
+    def test_should_round_trip_port_over_pooled_connection(self) -> None:
+        port = Port(port_number=22, protocol="tcp", service_name="ssh", created_at=NOW, updated_at=NOW)
+
+        async def round_trip(stand_in: ArangoStandIn) -> Port:
+            async with self._repository(stand_in) as repository:
+                await repository.create_or_update_port(port)
+                return await repository.get_port(22, "TCP")  # type: ignore[return-value]
+
+        with ArangoStandIn() as stand_in:
+            assert_that(asyncio.run(round_trip(stand_in))).is_equal_to(port)
+
+    def test_should_upsert_repeated_edge_into_single_document(self) -> None:
+        later = datetime(2024, 1, 2, 12, 0, 0)
+        edge = _edge("domain_to_port", "443_TCP")
+
+        async def write(stand_in: ArangoStandIn) -> None:
+            async with self._repository(stand_in) as repository:
+                await repository.create_edge(edge)
+                await repository.bulk_create_edges([edge.model_copy(update={"last_seen_at": later})])
+
+        with ArangoStandIn() as stand_in:
+            asyncio.run(write(stand_in))
+
+            documents = list(stand_in.collections["domain_port_edges"].values())
+            assert_that(documents).is_length(1)
+            assert_that(documents[0]["created_at"]).is_equal_to(NOW.isoformat())
+            assert_that(documents[0]["last_seen_at"]).is_equal_to(later.isoformat())
+
+    def test_should_attribute_bulk_errors_to_failing_documents(self) -> None:
+        async def write(stand_in: ArangoStandIn) -> Any:
+            async with self._repository(stand_in, bulk_chunk_size=2) as repository:
+                return await repository.bulk_upsert_port_scan_results(_port_scan_results(5))
+
+        with ArangoStandIn() as stand_in:
+            stand_in.rejected_keys.add("192.168.1.1_tcp_4")
+            result = asyncio.run(write(stand_in))
+
+        assert_that(result.written).is_equal_to(4)
+        assert_that([(error.index, error.key) for error in result.errors]).is_equal_to([(3, "192.168.1.1_tcp_4")])
+
+    def test_should_record_history_only_for_stored_results(self) -> None:
+        async def write(stand_in: ArangoStandIn) -> Any:
+            async with self._repository(stand_in, bulk_chunk_size=2) as repository:
+                return await repository.bulk_upsert_port_scan_results(_port_scan_results(5))
+
+        with ArangoStandIn() as stand_in:
+            stand_in.rejected_keys.add("192.168.1.1_tcp_4")
+            asyncio.run(write(stand_in))
+
+            history = stand_in.collections["port_scan_history"].values()
+            assert_that(sorted(document["port_number"] for document in history)).is_equal_to([1, 2, 3, 5])
+
+    def test_should_report_history_errors(self) -> None:
+        results = _port_scan_results(2)
+
+        async def write(stand_in: ArangoStandIn) -> Any:
+            async with self._repository(stand_in) as repository:
+                return await repository.bulk_upsert_port_scan_results(results)
+
+        with ArangoStandIn() as stand_in:
+            stand_in.rejected_keys.add(PortScanObservation.from_result(results[1]).key)
+            result = asyncio.run(write(stand_in))
+
+        assert_that(result.written).is_equal_to(2)
+        assert_that([(error.index, error.key) for error in result.errors]).is_equal_to(
+            [(1, PortScanObservation.from_result(results[1]).key)]
+        )
+
+    def test_should_keep_bulk_chunks_in_flight_concurrently(self) -> None:
+        async def write(stand_in: ArangoStandIn) -> Dict[str, Any]:
+            async with self._repository(stand_in, bulk_chunk_size=10) as repository:
+                started = asyncio.get_running_loop().time()
+                result = await repository.bulk_upsert_port_scan_results(_port_scan_results(100))
+                return {"result": result, "elapsed": asyncio.get_running_loop().time() - started}
+
+        with ArangoStandIn(latency=0.05) as stand_in:
+            outcome = asyncio.run(write(stand_in))
+
+            assert_that(outcome["result"].written).is_equal_to(100)
+            assert_that(stand_in.request_count).is_equal_to(20)
+            assert_that(outcome["elapsed"]).is_less_than(10 * 0.05)
+
+
+class TestAsyncArangoNetworkTopologyRepositoryStreaming:
+    def _seeded_repository(self, stand_in: ArangoStandIn) -> AsyncArangoNetworkTopologyRepository:
+        stand_in.collections["port_scan_results"] = {
+            str(index): {**port_scan_result_document(result), "_key": str(index)}
+            for index, result in enumerate(_port_scan_results(25))
+        }
+        stand_in.collections["dns_discoveries"] = {
+            "example.com_A": dns_record_discovery_document(
+                DnsRecordDiscovery(
+                    domain_name="example.com", record_type=DnsRecordType.A, values=["1.1.1.1"], discovered_at=NOW
+                )
+            )
+        }
+
+        return AsyncArangoNetworkTopologyRepository(
+            host=stand_in.host, port=stand_in.port, database="network_topology", username="root", password=""
+        )
+
+    def test_should_pull_scan_results_in_cursor_batches(self) -> None:
+        async def stream(repository: AsyncArangoNetworkTopologyRepository) -> List[int]:
+            async with repository:
+                return [result.port_number async for result in repository.iter_port_scan_results("192.168.1.1", 10)]
+
+        with ArangoStandIn() as stand_in:
+            port_numbers = asyncio.run(stream(self._seeded_repository(stand_in)))
+
+            assert_that(sorted(port_numbers)).is_equal_to(list(range(1, 26)))
+            assert_that(stand_in.request_count).is_equal_to(3)
+
+    def test_should_close_server_cursor_when_abandoned(self) -> None:
+        async def stream(repository: AsyncArangoNetworkTopologyRepository) -> None:
+            async with repository:
+                results = repository.iter_port_scan_results("192.168.1.1", batch_size=10)
+                await results.__anext__()
+                await results.aclose()  # type: ignore[attr-defined]
+
+        with ArangoStandIn() as stand_in:
+            asyncio.run(stream(self._seeded_repository(stand_in)))
+
+            assert_that(stand_in.cursors).is_empty()
+            assert_that(stand_in.requests[-1][0]).is_equal_to("DELETE")
+
+    def test_should_return_partial_models_for_projection(self) -> None:
+        async def stream(repository: AsyncArangoNetworkTopologyRepository) -> List[Any]:
+            async with repository:
+                scan_results = [r async for r in repository.iter_port_scan_results("192.168.1.1", fields=["state"])]
+                discoveries = [
+                    d async for d in repository.iter_dns_record_discoveries("example.com", fields=["record_type"])
+                ]
+                return [scan_results[0], discoveries[0]]
+
+        with ArangoStandIn() as stand_in:
+            scan_result, discovery = asyncio.run(stream(self._seeded_repository(stand_in)))
+
+        assert_that(scan_result.model_dump(exclude_unset=True)).is_equal_to({"state": PortState.OPEN})
+        assert_that(discovery.model_dump(exclude_unset=True)).is_equal_to({"record_type": DnsRecordType.A})
+
+    def test_should_return_only_requested_attributes_from_list_reads(self) -> None:
+        async def read(repository: AsyncArangoNetworkTopologyRepository) -> List[Any]:
+            async with repository:
+                scan_results = await repository.get_port_scan_results("192.168.1.1", fields=["port_number", "state"])
+                discoveries = await repository.get_dns_record_discoveries("example.com", fields=["values"])
+                return [scan_results, discoveries]
+
+        with ArangoStandIn() as stand_in:
+            scan_results, discoveries = asyncio.run(read(self._seeded_repository(stand_in)))
+
+        assert_that(scan_results).is_length(25)
+        assert_that(set(scan_results[0].model_dump(exclude_unset=True))).is_equal_to({"port_number", "state"})
+        assert_that(discoveries[0].model_dump(exclude_unset=True)).is_equal_to({"values": ["1.1.1.1"]})
+
+    def test_should_stream_dns_record_discoveries(self) -> None:
+        async def stream(repository: AsyncArangoNetworkTopologyRepository) -> List[DnsRecordDiscovery]:
+            async with repository:
+                return [discovery async for discovery in repository.iter_dns_record_discoveries("example.com")]
+
+        with ArangoStandIn() as stand_in:
+            discoveries = asyncio.run(stream(self._seeded_repository(stand_in)))
+
+        assert_that(discoveries[0].values).is_equal_to(["1.1.1.1"])
+
+    def test_should_request_streaming_cursor_with_ttl(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 201, {"result": [], "hasMore": False}))
+
+        async def stream() -> None:
+            async for _ in repository.iter_port_scan_results("192.168.1.1", batch_size=50, fields=["state"], ttl=120):
+                pass
+
+        asyncio.run(stream())
+
+        assert_that(json.loads(requests[0].content)).is_equal_to(
+            {
+                "query": 'FOR doc IN port_scan_results FILTER doc.target_ip == @target_ip RETURN { "state": doc.`state` }',
+                "bindVars": {"target_ip": "192.168.1.1"},
+                "batchSize": 50,
+                "ttl": 120,
+                "options": {"stream": True},
+            }
+        )
+
+
+class TestAsyncArangoNetworkTopologyRepositoryPagination:
+    def test_should_walk_every_collection_page_by_page(self) -> None:
+        async def walk(repository: AsyncArangoNetworkTopologyRepository) -> List[List[int]]:
+            async with repository:
+                await repository.bulk_upsert_port_scan_results(_port_scan_results(5))
+                first = await repository.list_port_scan_results(page_size=2)
+                second = await repository.list_port_scan_results(page_size=2, page_token=first.next_page_token)
+                third = await repository.list_port_scan_results(page_size=2, page_token=second.next_page_token)
+                return [[result.port_number for result in page.items] for page in (first, second, third)] + [
+                    [third.next_page_token is None]
+                ]
+
+        with ArangoStandIn() as stand_in:
+            pages = asyncio.run(
+                walk(
+                    AsyncArangoNetworkTopologyRepository(
+                        host=stand_in.host,
+                        port=stand_in.port,
+                        database="network_topology",
+                        username="root",
+                        password="",
+                    )
+                )
+            )
+
+        assert_that(pages).is_equal_to([[1, 2], [3, 4], [5], [True]])
+
+    def test_should_query_each_collection_by_key(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_recording_handler(requests, 201, {"result": [], "hasMore": False}))
+
+        async def list_all() -> None:
+            await repository.list_dns_records()
+            await repository.list_ports()
+            await repository.list_hosts()
+            await repository.list_dns_record_discoveries()
+            await repository.list_edges("dns_resolves_to_host", page_size=10)
+
+        asyncio.run(list_all())
+
+        assert_that([json.loads(request.content)["query"].split()[3] for request in requests]).is_equal_to(
+            ["dns_records", "ports", "hosts", "dns_discoveries", "dns_resolves_to_host_edges"]
+        )
+        assert_that(json.loads(requests[-1].content)["bindVars"]).is_equal_to({"limit": 11})
+
+
+class TestAsyncArangoNetworkTopologyRepositoryTraversal:
+    def test_should_return_neighbors_from_single_cursor_request(self) -> None:
+        requests: List[httpx.Request] = []
+        result = {"vertex": {"_id": "hosts/10.0.0.1", "_key": "10.0.0.1", "hostname": "web"}, "depth": 1}
+        repository = _repository(_recording_handler(requests, 201, {"result": [result], "hasMore": False}))
+
+        neighbors = asyncio.run(repository.neighbors(VertexReference.parse("dns_record:example.com"), depth=2))
+
+        body = json.loads(requests[0].content)
+        assert_that(requests).is_length(1)
+        assert_that(body["query"]).contains("IN 1..@depth OUTBOUND @start")
+        assert_that(body["bindVars"]["start"]).is_equal_to("dns_records/example.com")
+        assert_that(neighbors[0].attributes).is_equal_to({"hostname": "web"})
+
+    def test_should_return_shortest_path(self) -> None:
+        edge = {
+            "source_id": "example.com",
+            "target_id": "10.0.0.1",
+            "edge_type": "dns_resolves_to_host",
+            "metadata": {},
+            "created_at": NOW.isoformat(),
+        }
+        result = {"vertices": ["dns_records/example.com", "hosts/10.0.0.1"], "edges": [edge]}
+        repository = _repository(_recording_handler([], 201, {"result": [result], "hasMore": False}))
+
+        path = asyncio.run(
+            repository.shortest_path(
+                VertexReference.parse("dns_record:example.com"), VertexReference.parse("host:10.0.0.1")
+            )
+        )
+
+        assert_that(path.length).is_equal_to(1)  # type: ignore[union-attr]
+
+    def test_should_return_none_when_unreachable(self) -> None:
+        repository = _repository(_recording_handler([], 201, {"result": [], "hasMore": False}))
+
+        path = asyncio.run(
+            repository.shortest_path(VertexReference.parse("port:443_TCP"), VertexReference.parse("host:10.0.0.1"))
+        )
+
+        assert_that(path).is_none()
+
+
+class TestAsyncArangoNetworkTopologyRepositoryEdges:
+    def test_should_link_domain_ports_in_single_query(self) -> None:
+        requests: List[httpx.Request] = []
+        dns_record = DnsRecord(
+            domain_name="example.com", record_type="A", ip_addresses=["10.0.0.1"], created_at=NOW, updated_at=NOW
+        )
+        port = Port(port_number=443, protocol="TCP", service_name="https", created_at=NOW, updated_at=NOW)
+        link = DomainPortLink(dns_record=dns_record, port=port, edge=_edge("domain_to_port", "443_TCP"))
+        repository = _repository(_cursor_handler(requests, []))
+
+        edges = asyncio.run(repository.link_domain_ports([link]))
+
+        body = json.loads(requests[0].content)
+        assert_that(requests).is_length(1)
+        assert_that(body["query"]).is_equal_to(LINK_DOMAIN_PORTS_QUERY)
+        assert_that(body["bindVars"]["links"][0]["port"]["_key"]).is_equal_to("443_TCP")
+        assert_that(edges).is_equal_to([link.edge])
+
+    def test_should_not_query_without_links(self) -> None:
+        requests: List[httpx.Request] = []
+
+        assert_that(asyncio.run(_repository(_cursor_handler(requests, [])).link_domain_ports([]))).is_empty()
+        assert_that(requests).is_empty()
+
+    def test_should_create_edge_between_existing_vertices(self) -> None:
+        requests: List[httpx.Request] = []
+        edge = _edge("dns_resolves_to_host", "10.0.0.1")
+        repository = _repository(_cursor_handler(requests, [{"source_found": True, "target_found": True}]))
+
+        assert_that(asyncio.run(repository.create_edge_between_existing_vertices(edge))).is_equal_to(edge)
+        assert_that(json.loads(requests[0].content)["query"]).contains("IN dns_resolves_to_host_edges")
+
+    def test_should_reject_edge_to_missing_vertex(self) -> None:
+        edge = _edge("dns_resolves_to_host", "10.0.0.1")
+        repository = _repository(_cursor_handler([], [{"source_found": True, "target_found": False}]))
+
+        with pytest.raises(VertexNotFoundError):
+            asyncio.run(repository.create_edge_between_existing_vertices(edge))
+
+
+class TestAsyncArangoNetworkTopologyRepositoryScanHistory:
+    def test_should_read_history_of_target(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_cursor_handler(requests, [_observed(22, 0), _observed(22, 1)]))
+
+        history = asyncio.run(repository.get_port_scan_history("10.0.0.1"))
+
+        body = json.loads(requests[0].content)
+        assert_that(body["query"]).is_equal_to(PORT_SCAN_HISTORY_QUERY)
+        assert_that(body["bindVars"]).is_equal_to({"target_ip": "10.0.0.1"})
+        assert_that([observation.observations for observation in history]).is_equal_to([1, 1])
+
+    def test_should_read_state_at_time_by_epoch(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_cursor_handler(requests, [_observed(22, 1, PortState.CLOSED)]))
+
+        [state] = asyncio.run(repository.get_port_scan_state_at("10.0.0.1", NOW + timedelta(hours=2)))
+
+        body = json.loads(requests[0].content)
+        assert_that(body["query"]).is_equal_to(PORT_SCAN_STATE_AT_QUERY)
+        assert_that(body["bindVars"]["at"]).is_equal_to(epoch_microseconds(NOW + timedelta(hours=2)))
+        assert_that(state.state).is_equal_to(PortState.CLOSED)
+
+    def test_should_compact_history_series(self) -> None:
+        requests: List[httpx.Request] = []
+        documents = [_observed(22, 0), _observed(22, 1), _observed(22, 2, PortState.CLOSED), _observed(80, 0)]
+        repository = _repository(_cursor_handler(requests, documents))
+
+        result = asyncio.run(repository.compact_port_scan_history())
+
+        [query, replace, delete] = requests
+        [interval] = json.loads(replace.content)
+        assert_that(json.loads(query.content)["query"]).is_equal_to(PORT_SCAN_SERIES_QUERY)
+        assert_that((interval["_key"], interval["observations"])).is_equal_to((documents[0]["_key"], 2))
+        assert_that((delete.method, json.loads(delete.content))).is_equal_to(("DELETE", [documents[1]["_key"]]))
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult(rewritten=1, removed=1))
+
+    def test_should_rewrite_history_in_chunks(self) -> None:
+        requests: List[httpx.Request] = []
+        documents = [_observed(port_number, hours) for port_number in range(1, 6) for hours in (0, 1)]
+        repository = _repository(_cursor_handler(requests, documents), bulk_chunk_size=2)
+
+        result = asyncio.run(repository.compact_port_scan_history())
+
+        assert_that([request.method for request in requests[1:]]).is_equal_to(["POST", "DELETE"] * 3)
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult(rewritten=5, removed=5))
+
+    def test_should_not_rewrite_history_without_runs(self) -> None:
+        requests: List[httpx.Request] = []
+        repository = _repository(_cursor_handler(requests, [_observed(22, 0), _observed(80, 0)]))
+
+        result = asyncio.run(repository.compact_port_scan_history())
+
+        assert_that(requests).is_length(1)
+        assert_that(result).is_equal_to(ScanHistoryCompactionResult())
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime
+from contextlib import ExitStack
+from typing import Iterator, List
+
+import pytest
+from arango import ArangoClient
+from arango.database import StandardDatabase
+from assertpy import assert_that
+
+from via_node.domain.model.host import Host
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+from via_node.infrastructure.persistence.arango.pooled_http_client import PooledHttpClient
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+HOSTS = [
+    Host(ip_address=f"10.0.0.{number}", hostname=f"host-{number}", os_type="linux", created_at=NOW, updated_at=NOW)
+    for number in range(1, 31)
+]
+
+
+@pytest.fixture
+def coordinators() -> Iterator[List[ArangoStandIn]]:
+    with ExitStack() as stack:
+        stand_ins = [stack.enter_context(ArangoStandIn(latency=0.01)) for _ in range(3)]
+
+        for stand_in in stand_ins[1:]:
+            stand_in.collections = stand_ins[0].collections
+
+        yield stand_ins
+
+
+def _urls(stand_ins: List[ArangoStandIn]) -> List[str]:
+    return [f"http://{stand_in.host}:{stand_in.port}" for stand_in in stand_ins]
+
+
+def _database(resolver: CoordinatorHostResolver) -> StandardDatabase:
+    client = ArangoClient(
+        hosts=resolver.hosts,
+        host_resolver=resolver,
+        http_client=PooledHttpClient(retry_attempts=0, host_resolver=resolver),
+    )
+
+    return client.db("network_topology", username="root", password="", verify=False)
+
+
+def _insert_ports(db: StandardDatabase, count: int) -> None:
+    for key in range(count):
+        db.collection("ports").insert({"_key": f"{key}_tcp"}, overwrite_mode="replace")
+
+
+class TestCoordinatorFailover:
+    def test_should_spread_requests_across_coordinators(self, coordinators: List[ArangoStandIn]) -> None:
+        db = _database(CoordinatorHostResolver(_urls(coordinators)))
+
+        _insert_ports(db, 9)
+
+        assert_that([stand_in.request_count for stand_in in coordinators]).is_equal_to([3, 3, 3])
+        assert_that(coordinators[0].collections["ports"]).is_length(9)
+
+    def test_should_eject_unreachable_coordinator_and_keep_serving(self, coordinators: List[ArangoStandIn]) -> None:
+        now = [0.0]
+        urls = _urls(coordinators)
+        coordinators[1].__exit__(None, None, None)
+        resolver = CoordinatorHostResolver(urls, ejection_threshold=1, ejection_period=30.0, clock=lambda: now[0])
+        db = _database(resolver)
+
+        _insert_ports(db, 8)
+
+        assert_that(coordinators[0].collections["ports"]).is_length(8)
+        assert_that(coordinators[0].request_count + coordinators[2].request_count).is_equal_to(8)
+        assert_that([coordinator.admitted for coordinator in resolver.health()]).is_equal_to([True, False, True])
+
+        now[0] = 30.0
+        _insert_ports(db, 3)
+
+        assert_that(resolver.health()[1].failures).is_equal_to(2)
+
+    def test_should_readmit_recovered_coordinator(self, coordinators: List[ArangoStandIn]) -> None:
+        now = [0.0]
+        resolver = CoordinatorHostResolver(
+            _urls(coordinators), ejection_threshold=1, ejection_period=30.0, clock=lambda: now[0]
+        )
+        db = _database(resolver)
+        resolver.record_failure(resolver.hosts[2])
+        _insert_ports(db, 4)
+        now[0] = 30.0
+
+        _insert_ports(db, 3)
+
+        assert_that(coordinators[2].request_count).is_equal_to(1)
+        assert_that(resolver.health()[2].admitted).is_true()
+
+    def test_should_scale_async_bulk_writes_across_coordinators(self, coordinators: List[ArangoStandIn]) -> None:
+        async def write(repository: AsyncArangoNetworkTopologyRepository) -> int:
+            async with repository:
+                return (await repository.bulk_upsert_hosts(HOSTS)).written
+
+        repository = AsyncArangoNetworkTopologyRepository(
+            host=coordinators[0].host,
+            port=coordinators[0].port,
+            database="network_topology",
+            username="root",
+            password="",
+            bulk_chunk_size=5,
+            host_resolver=CoordinatorHostResolver(_urls(coordinators)),
+        )
+
+        assert_that(asyncio.run(write(repository))).is_equal_to(30)
+        assert_that([stand_in.request_count for stand_in in coordinators]).is_equal_to([2, 2, 2])
+        assert_that(coordinators[0].collections["hosts"]).is_length(30)
+
+    def test_should_fail_over_async_requests_from_unreachable_coordinator(
+        self, coordinators: List[ArangoStandIn]
+    ) -> None:
+        async def write(repository: AsyncArangoNetworkTopologyRepository) -> None:
+            async with repository:
+                for host in HOSTS[:6]:
+                    await repository.create_or_update_host(host)
+
+        coordinators[0].__exit__(None, None, None)
+        resolver = CoordinatorHostResolver(_urls(coordinators), ejection_threshold=1)
+        repository = AsyncArangoNetworkTopologyRepository(
+            host=coordinators[0].host,
+            port=coordinators[0].port,
+            database="network_topology",
+            username="root",
+            password="",
+            host_resolver=resolver,
+        )
+
+        asyncio.run(write(repository))
+
+        assert_that(coordinators[1].request_count + coordinators[2].request_count).is_equal_to(6)
+        assert_that(resolver.health()[0].admitted).is_false()
@@ -0,0 +1,119 @@
+from typing import List
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import (
+    CoordinatorHostResolver,
+    coordinator_urls,
+)
+
+HOSTS = ["http://coordinator-1:8529", "http://coordinator-2:8529", "http://coordinator-3:8529"]
+
+
+def _resolver(now: List[float], **kwargs: object) -> CoordinatorHostResolver:
+    return CoordinatorHostResolver(HOSTS, clock=lambda: now[0], **kwargs)  # type: ignore[arg-type]
+
+
+class TestCoordinatorUrls:
+    def test_should_fall_back_to_single_host_and_port(self) -> None:
+        assert_that(coordinator_urls("", "arango", "8529")).is_equal_to(["http://arango:8529"])
+
+    def test_should_split_endpoints_and_default_scheme(self) -> None:
+        urls = coordinator_urls("coordinator-1:8529, https://coordinator-2:8529/ ,", "arango", "8529")
+
+        assert_that(urls).is_equal_to(["http://coordinator-1:8529", "https://coordinator-2:8529"])
+
+
+class TestCoordinatorHostResolver:
+    def test_should_reject_unknown_selection(self) -> None:
+        assert_that(CoordinatorHostResolver).raises(ValueError).when_called_with(HOSTS, selection="random")
+
+    def test_should_reject_non_positive_ejection_threshold(self) -> None:
+        assert_that(CoordinatorHostResolver).raises(ValueError).when_called_with(
+            HOSTS, ejection_threshold=0
+        ).is_equal_to("Ejection threshold must be at least 1")
+
+    def test_should_rotate_through_coordinators(self) -> None:
+        resolver = _resolver([0.0])
+
+        assert_that([resolver.get_host_index() for _ in range(6)]).is_equal_to([0, 1, 2, 0, 1, 2])
+
+    def test_should_skip_filtered_coordinators(self) -> None:
+        resolver = _resolver([0.0])
+
+        assert_that(resolver.get_host_index({0, 1})).is_equal_to(2)
+
+    def test_should_prefer_lowest_latency_coordinator(self) -> None:
+        resolver = _resolver([0.0], selection="least-latency")
+        resolver.record_success(HOSTS[0], 0.030)
+        resolver.record_success(HOSTS[1], 0.005)
+        resolver.record_success(HOSTS[2], 0.020)
+
+        assert_that(resolver.get_host_index()).is_equal_to(1)
+
+    def test_should_smooth_latency_samples(self) -> None:
+        resolver = _resolver([0.0])
+        resolver.record_success(HOSTS[0], 0.010)
+        resolver.record_success(HOSTS[0], 0.060)
+
+        assert_that(resolver.health()[0].latency).is_close_to(0.020, 1e-9)
+
+    def test_should_eject_coordinator_after_consecutive_failures(self) -> None:
+        resolver = _resolver([0.0], ejection_threshold=2)
+        resolver.record_failure(HOSTS[1])
+        resolver.record_failure(HOSTS[1])
+
+        assert_that({resolver.get_host_index() for _ in range(6)}).is_equal_to({0, 2})
+        assert_that([coordinator.admitted for coordinator in resolver.health()]).is_equal_to([True, False, True])
+
+    def test_should_forget_failures_after_success(self) -> None:
+        resolver = _resolver([0.0], ejection_threshold=2)
+        resolver.record_failure(HOSTS[1])
+        resolver.record_success(HOSTS[1], 0.01)
+        resolver.record_failure(HOSTS[1])
+
+        assert_that(resolver.health()[1].admitted).is_true()
+
+    def test_should_readmit_coordinator_after_ejection_period(self) -> None:
+        now = [0.0]
+        resolver = _resolver(now, ejection_threshold=1, ejection_period=30.0)
+        resolver.record_failure(HOSTS[0])
+        now[0] = 30.0
+
+        assert_that({resolver.get_host_index() for _ in range(3)}).is_equal_to({0, 1, 2})
+
+    def test_should_eject_readmitted_coordinator_again_on_next_failure(self) -> None:
+        now = [0.0]
+        resolver = _resolver(now, ejection_threshold=2, ejection_period=30.0)
+        resolver.record_failure(HOSTS[0])
+        resolver.record_failure(HOSTS[0])
+        now[0] = 30.0
+
+        resolver.record_failure(HOSTS[0])
+
+        assert_that(resolver.health()[0].admitted).is_false()
+
+    def test_should_use_coordinator_readmitted_soonest_when_all_are_ejected(self) -> None:
+        now = [0.0]
+        resolver = _resolver(now, ejection_threshold=1, ejection_period=30.0)
+        resolver.record_failure(HOSTS[1])
+        now[0] = 1.0
+        resolver.record_failure(HOSTS[2])
+        resolver.record_failure(HOSTS[0])
+
+        assert_that(resolver.get_host_index()).is_equal_to(1)
+
+    def test_should_ignore_outcomes_for_unknown_hosts(self) -> None:
+        resolver = _resolver([0.0], ejection_threshold=1)
+        resolver.record_failure("http://elsewhere:8529")
+        resolver.record_success("http://elsewhere:8529", 0.01)
+
+        assert_that([coordinator.admitted for coordinator in resolver.health()]).is_equal_to([True, True, True])
+
+    def test_should_count_requests_per_coordinator(self) -> None:
+        resolver = _resolver([0.0])
+
+        for _ in range(7):
+            resolver.get_host_index()
+
+        assert_that([coordinator.requests for coordinator in resolver.health()]).is_equal_to([3, 2, 2])
@@ -0,0 +1,54 @@
+import asyncio
+from typing import Callable, List
+
+import httpx
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+from via_node.infrastructure.persistence.arango.coordinator_transport import CoordinatorTransport
+
+HOSTS = ["http://coordinator-1:8529", "http://coordinator-2:8529"]
+
+
+def _get(transport: CoordinatorTransport) -> httpx.Response:
+    async def get() -> httpx.Response:
+        async with httpx.AsyncClient(base_url="http://coordinator-1:8529/_db/test_db", transport=transport) as client:
+            return await client.get("/_api/version")
+
+    return asyncio.run(get())
+
+
+def _transport(
+    resolver: CoordinatorHostResolver, handler: Callable[[httpx.Request], httpx.Response]
+) -> CoordinatorTransport:
+    return CoordinatorTransport(resolver, httpx.MockTransport(handler))
+
+
+class TestCoordinatorTransport:
+    def test_should_route_request_to_selected_coordinator(self) -> None:
+        seen: List[httpx.Request] = []
+        resolver = CoordinatorHostResolver(HOSTS)
+        resolver.get_host_index()
+
+        _get(_transport(resolver, lambda request: seen.append(request) or httpx.Response(200, json={})))
+
+        assert_that(str(seen[0].url)).is_equal_to("http://coordinator-2:8529/_db/test_db/_api/version")
+        assert_that(seen[0].headers["Host"]).is_equal_to("coordinator-2:8529")
+        assert_that(resolver.health()[1].latency).is_not_none()
+
+    def test_should_count_unavailable_responses_as_failures(self) -> None:
+        resolver = CoordinatorHostResolver(HOSTS, ejection_threshold=1)
+
+        response = _get(_transport(resolver, lambda request: httpx.Response(503, json={})))
+
+        assert_that(response.status_code).is_equal_to(503)
+        assert_that(resolver.health()[0].admitted).is_false()
+
+    def test_should_raise_when_every_coordinator_is_unreachable(self) -> None:
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        resolver = CoordinatorHostResolver(HOSTS, ejection_threshold=1)
+
+        assert_that(_get).raises(httpx.ConnectError).when_called_with(_transport(resolver, refuse))
+        assert_that([coordinator.admitted for coordinator in resolver.health()]).is_equal_to([False, False])
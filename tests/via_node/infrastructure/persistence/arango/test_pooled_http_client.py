@@ -0,0 +1,80 @@
+import socket
+from typing import Iterator
+
+import pytest
+from arango import ArangoClient
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.pooled_http_client import KeepAliveHTTPAdapter, PooledHttpClient
+from tests.via_node.infrastructure.persistence.arango.arango_stand_in import ArangoStandIn
+
+
+@pytest.fixture(scope="module")
+def stand_in() -> Iterator[ArangoStandIn]:
+    with ArangoStandIn() as stand_in:
+        yield stand_in
+
+
+class TestPooledHttpClient:
+    def test_should_retry_reads_only_by_default(self) -> None:
+        retry = PooledHttpClient(retry_attempts=4, retry_backoff_factor=0.2)._retry_strategy()
+
+        assert_that(retry.total).is_equal_to(4)
+        assert_that(retry.backoff_factor).is_equal_to(0.2)
+        assert_that(list(retry.allowed_methods)).is_equal_to(["HEAD", "GET", "OPTIONS"])
+
+    def test_should_retry_writes_when_enabled(self) -> None:
+        retry = PooledHttpClient(retry_writes=True)._retry_strategy()
+
+        assert_that(list(retry.allowed_methods)).contains("POST", "PUT", "PATCH", "DELETE")
+
+    def test_should_retry_on_transient_statuses(self) -> None:
+        retry = PooledHttpClient()._retry_strategy()
+
+        assert_that(list(retry.status_forcelist)).is_equal_to([429, 500, 502, 503, 504])
+
+    def test_should_mount_pool_sized_adapter(self) -> None:
+        session = PooledHttpClient(pool_connections=2, pool_maxsize=16, pool_block=True).create_session("localhost")
+        adapter = session.get_adapter("http://localhost")
+
+        assert_that(adapter).is_instance_of(KeepAliveHTTPAdapter)
+        assert_that(adapter._pool_maxsize).is_equal_to(16)
+        assert_that(adapter._pool_block).is_true()
+
+    def test_should_request_keep_alive_connections(self) -> None:
+        session = PooledHttpClient().create_session("localhost")
+        adapter = session.get_adapter("http://localhost")
+
+        assert_that(session.headers["Connection"]).is_equal_to("keep-alive")
+        assert_that(adapter.poolmanager.connection_pool_kw["socket_options"]).contains(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        )
+
+    def test_should_close_connections_when_keep_alive_disabled(self) -> None:
+        session = PooledHttpClient(keep_alive=False).create_session("localhost")
+        adapter = session.get_adapter("http://localhost")
+
+        assert_that(session.headers["Connection"]).is_equal_to("close")
+        assert_that(adapter.poolmanager.connection_pool_kw).does_not_contain_key("socket_options")
+
+    def test_should_report_no_pool_stats_before_first_request(self) -> None:
+        http_client = PooledHttpClient()
+        http_client.create_session("localhost")
+
+        assert_that(http_client.pool_stats()).is_empty()
+
+    def test_should_reuse_pooled_connection_across_requests(self, stand_in: ArangoStandIn) -> None:
+        http_client = PooledHttpClient(pool_maxsize=4)
+        db = ArangoClient(hosts=f"http://{stand_in.host}:{stand_in.port}", http_client=http_client).db(
+            "network_topology", username="root", password="", verify=False
+        )
+
+        for key in range(5):
+            db.collection("ports").insert({"_key": f"{key}_tcp"}, overwrite_mode="replace")
+
+        stats = http_client.pool_stats()[0]
+        assert_that(stats["host"]).is_equal_to(f"http://{stand_in.host}:{stand_in.port}")
+        assert_that(stats["connections_opened"]).is_equal_to(1)
+        assert_that(stats["requests_sent"]).is_equal_to(5)
+        assert_that(stats["idle"]).is_equal_to(1)
+        assert_that(stats["in_use"]).is_equal_to(0)
@@ -0,0 +1,424 @@
+import threading
+from datetime import datetime
+from typing import Any, Iterator, List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.buffered_network_topology_repository import (
+    BufferedNetworkTopologyRepository,
+    WriteBufferFullError,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def dns_record(domain_name: str = "example.com", ip_address: str = "10.0.0.1") -> DnsRecord:
+    return DnsRecord(
+        domain_name=domain_name, record_type="A", ip_addresses=[ip_address], created_at=NOW, updated_at=NOW
+    )
+
+
+def port(port_number: int = 443) -> Port:
+    return Port(port_number=port_number, protocol="TCP", service_name="https", created_at=NOW, updated_at=NOW)
+
+
+def host(ip_address: str = "10.0.0.1", hostname: str = "web") -> Host:
+    return Host(ip_address=ip_address, hostname=hostname, os_type="linux", created_at=NOW, updated_at=NOW)
+
+
+def discovery(values: List[str]) -> DnsRecordDiscovery:
+    return DnsRecordDiscovery(domain_name="example.com", record_type=DnsRecordType.A, values=values, discovered_at=NOW)
+
+
+def scan_result(port_number: int = 443, state: PortState = PortState.OPEN) -> PortScanResult:
+    return PortScanResult(target_ip="10.0.0.1", port_number=port_number, protocol="tcp", state=state, scanned_at=NOW)
+
+
+def edge(metadata: Any = None) -> NetworkTopologyEdge:
+    return NetworkTopologyEdge(
+        source_id="example.com",
+        target_id="443_TCP",
+        edge_type="domain_to_port",
+        metadata=metadata or {},
+        created_at=NOW,
+    )
+
+
+@pytest.fixture
+def delegate() -> Mock:
+    delegate = Mock(spec=NetworkTopologyRepository)
+    delegate.bulk_upsert_dns_records.side_effect = lambda models: BulkWriteResult(written=len(models))
+    delegate.bulk_upsert_ports.side_effect = lambda models: BulkWriteResult(written=len(models))
+    delegate.bulk_upsert_hosts.side_effect = lambda models: BulkWriteResult(written=len(models))
+    delegate.bulk_upsert_dns_record_discoveries.side_effect = lambda models: BulkWriteResult(written=len(models))
+    delegate.bulk_upsert_port_scan_results.side_effect = lambda models: BulkWriteResult(written=len(models))
+    delegate.bulk_create_edges.side_effect = lambda models: BulkWriteResult(written=len(models))
+    return delegate
+
+
+@pytest.fixture
+def repository(delegate: Mock) -> Iterator[BufferedNetworkTopologyRepository]:
+    with patch("via_node.infrastructure.persistence.decorator.buffered_network_topology_repository.atexit"):
+        yield BufferedNetworkTopologyRepository(delegate, max_count=100, max_bytes=1_000_000, max_delay=0)
+
+
+class TestBufferedNetworkTopologyRepositoryQueueing:
+    def test_should_not_write_until_flushed(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_host(host())
+
+        delegate.bulk_upsert_hosts.assert_not_called()
+        assert_that(repository.pending_count).is_equal_to(1)
+
+    def test_should_return_queued_model(self, repository: BufferedNetworkTopologyRepository) -> None:
+        record = dns_record()
+
+        assert_that(repository.create_or_update_dns_record(record)).is_same_as(record)
+
+    def test_should_keep_last_write_for_same_key(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_port_scan_result(scan_result(state=PortState.OPEN))
+        repository.create_or_update_port_scan_result(scan_result(state=PortState.CLOSED))
+
+        repository.flush()
+
+        written = delegate.bulk_upsert_port_scan_results.call_args.args[0]
+        assert_that([result.state for result in written]).is_equal_to([PortState.CLOSED])
+
+    def test_should_keep_last_write_for_same_discovery(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_dns_record_discovery(discovery(["10.0.0.1"]))
+        repository.create_or_update_dns_record_discovery(discovery(["10.0.0.2"]))
+
+        repository.flush()
+
+        written = delegate.bulk_upsert_dns_record_discoveries.call_args.args[0]
+        assert_that([item.values for item in written]).is_equal_to([["10.0.0.2"]])
+
+    def test_should_coalesce_edges_between_same_vertices(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_edge(edge({"seen": 1}))
+        repository.create_edge(edge({"seen": 2}))
+
+        repository.flush()
+
+        written = delegate.bulk_create_edges.call_args.args[0]
+        assert_that([item.metadata for item in written]).is_equal_to([{"seen": 2}])
+
+    def test_should_track_bytes_of_latest_version_only(self, repository: BufferedNetworkTopologyRepository) -> None:
+        repository.create_or_update_host(host(hostname="a"))
+        size = repository.pending_bytes
+
+        repository.create_or_update_host(host(hostname="bbbb"))
+
+        assert_that(repository.pending_bytes).is_equal_to(size + 3)
+
+
+class TestBufferedNetworkTopologyRepositoryFlushing:
+    def test_should_write_vertices_before_edges(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_edge(edge())
+        repository.create_or_update_port(port())
+        repository.create_or_update_dns_record(dns_record())
+
+        repository.flush()
+
+        assert_that([call[0] for call in delegate.method_calls]).is_equal_to(
+            ["bulk_upsert_dns_records", "bulk_upsert_ports", "bulk_create_edges"]
+        )
+
+    def test_should_write_dns_records_and_ports_in_bulk(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_dns_record(dns_record("a.example.com"))
+        repository.create_or_update_dns_record(dns_record("b.example.com"))
+        repository.create_or_update_port(port(80))
+        repository.create_or_update_port(port(443))
+
+        assert_that(repository.flush().written).is_equal_to(4)
+        assert_that(delegate.bulk_upsert_dns_records.call_args.args[0]).is_length(2)
+        assert_that(delegate.bulk_upsert_ports.call_args.args[0]).is_length(2)
+        delegate.create_or_update_dns_record.assert_not_called()
+        delegate.create_or_update_port.assert_not_called()
+
+    def test_should_report_written_documents(self, repository: BufferedNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(dns_record())
+        repository.create_or_update_host(host())
+        repository.create_or_update_host(host("10.0.0.2"))
+
+        assert_that(repository.flush().written).is_equal_to(3)
+
+    def test_should_collect_bulk_errors(self, repository: BufferedNetworkTopologyRepository, delegate: Mock) -> None:
+        error = BulkWriteError(index=0, key="10.0.0.1", error_message="conflict")
+        delegate.bulk_upsert_hosts.side_effect = None
+        delegate.bulk_upsert_hosts.return_value = BulkWriteResult(errors=[error])
+        repository.create_or_update_host(host())
+
+        assert_that(repository.flush().errors).is_equal_to([error])
+
+    def test_should_empty_buffer_after_flush(self, repository: BufferedNetworkTopologyRepository) -> None:
+        repository.create_or_update_host(host())
+
+        repository.flush()
+
+        assert_that(repository.pending_count).is_zero()
+        assert_that(repository.pending_bytes).is_zero()
+
+    def test_should_flush_when_count_reached(self, delegate: Mock) -> None:
+        repository = BufferedNetworkTopologyRepository(delegate, max_count=2, max_delay=0, flush_at_exit=False)
+
+        repository.create_or_update_host(host("10.0.0.1"))
+        repository.create_or_update_host(host("10.0.0.2"))
+
+        assert_that(delegate.bulk_upsert_hosts.call_args.args[0]).is_length(2)
+        assert_that(repository.pending_count).is_zero()
+
+    def test_should_flush_when_bytes_reached(self, delegate: Mock) -> None:
+        repository = BufferedNetworkTopologyRepository(delegate, max_bytes=1, max_delay=0, flush_at_exit=False)
+
+        repository.create_or_update_host(host())
+
+        delegate.bulk_upsert_hosts.assert_called_once()
+
+    def test_should_flush_when_delay_elapsed(self, delegate: Mock) -> None:
+        flushed = threading.Event()
+        delegate.bulk_upsert_hosts.side_effect = lambda models: flushed.set() or BulkWriteResult(written=len(models))
+        repository = BufferedNetworkTopologyRepository(delegate, max_delay=0.01, flush_at_exit=False)
+
+        repository.create_or_update_host(host())
+
+        assert_that(flushed.wait(timeout=5)).is_true()
+
+    def test_should_report_errors_from_implicit_flushes(self, delegate: Mock) -> None:
+        error = BulkWriteError(index=0, key="10.0.0.1", error_message="conflict")
+        delegate.bulk_upsert_hosts.side_effect = None
+        delegate.bulk_upsert_hosts.return_value = BulkWriteResult(written=1, errors=[error])
+        repository = BufferedNetworkTopologyRepository(delegate, max_count=1, max_delay=0, flush_at_exit=False)
+
+        repository.create_or_update_host(host())
+
+        assert_that(repository.unreported_errors).is_equal_to([error])
+        assert_that(repository.flush()).is_equal_to(BulkWriteResult(written=1, errors=[error]))
+        assert_that(repository.unreported_errors).is_empty()
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_should_retry_timer_flush_after_failure(self, delegate: Mock) -> None:
+        flushed = threading.Event()
+        outcomes: List[Any] = [ConnectionError("down")]
+
+        def write(models: List[Host]) -> BulkWriteResult:
+            if outcomes:
+                raise outcomes.pop()
+            flushed.set()
+            return BulkWriteResult(written=len(models))
+
+        delegate.bulk_upsert_hosts.side_effect = write
+        repository = BufferedNetworkTopologyRepository(delegate, max_delay=0.01, flush_at_exit=False)
+
+        repository.create_or_update_host(host())
+
+        assert_that(flushed.wait(timeout=5)).is_true()
+        assert_that(repository.flush().written).is_equal_to(1)
+
+    def test_should_cancel_pending_timer_when_flushed(self, delegate: Mock) -> None:
+        repository = BufferedNetworkTopologyRepository(delegate, max_delay=60, flush_at_exit=False)
+        repository.create_or_update_host(host())
+        timer = repository._timer
+
+        repository.flush()
+
+        assert_that(timer.finished.is_set()).is_true()  # type: ignore[union-attr]
+
+    def test_should_requeue_unwritten_documents_when_flush_fails(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        delegate.bulk_upsert_hosts.side_effect = ConnectionError("down")
+        repository.create_or_update_dns_record(dns_record())
+        repository.create_or_update_host(host())
+        repository.create_edge(edge())
+
+        with pytest.raises(ConnectionError):
+            repository.flush()
+
+        assert_that(repository.pending_count).is_equal_to(2)
+        assert_that(repository.get_host("10.0.0.1")).is_equal_to(host())
+
+    def test_should_back_off_exponentially_after_failed_flushes(self, delegate: Mock) -> None:
+        delegate.bulk_upsert_hosts.side_effect = ConnectionError("down")
+        repository = BufferedNetworkTopologyRepository(delegate, max_delay=1, max_backoff=5, flush_at_exit=False)
+        repository.create_or_update_host(host())
+        delays = []
+
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                repository.flush()
+            delays.append(repository._timer.interval)  # type: ignore[union-attr]
+
+        repository._cancel_timer()
+        assert_that(delays).is_equal_to([2, 4, 5, 5])
+
+    def test_should_leave_size_flushes_to_retry_timer_after_failure(self, delegate: Mock) -> None:
+        delegate.bulk_upsert_hosts.side_effect = ConnectionError("down")
+        repository = BufferedNetworkTopologyRepository(delegate, max_count=1, max_delay=60, flush_at_exit=False)
+
+        with pytest.raises(ConnectionError):
+            repository.create_or_update_host(host("10.0.0.1"))
+        repository.create_or_update_host(host("10.0.0.2"))
+
+        repository._cancel_timer()
+        delegate.bulk_upsert_hosts.assert_called_once()
+        assert_that(repository.pending_count).is_equal_to(2)
+
+    def test_should_reset_backoff_after_successful_flush(self, delegate: Mock) -> None:
+        delegate.bulk_upsert_hosts.side_effect = [ConnectionError("down"), BulkWriteResult(written=1)]
+        repository = BufferedNetworkTopologyRepository(delegate, max_delay=60, flush_at_exit=False)
+        repository.create_or_update_host(host())
+
+        with pytest.raises(ConnectionError):
+            repository.flush()
+        repository.flush()
+
+        assert_that(repository._retry_delay()).is_equal_to(60)
+
+    def test_should_reject_writes_beyond_buffer_limit(self, delegate: Mock) -> None:
+        delegate.bulk_upsert_hosts.side_effect = ConnectionError("down")
+        repository = BufferedNetworkTopologyRepository(
+            delegate, max_delay=0, max_buffered_bytes=len(host().model_dump_json()), flush_at_exit=False
+        )
+        repository.create_or_update_host(host("10.0.0.1"))
+
+        with pytest.raises(WriteBufferFullError, match="limit is"):
+            repository.create_or_update_host(host("10.0.0.2"))
+
+        assert_that(repository.pending_count).is_equal_to(1)
+
+    def test_should_prefer_newer_write_over_requeued_document(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        newer = host(hostname="newer")
+
+        def fail_after_newer_write(models: List[Host]) -> BulkWriteResult:
+            repository.create_or_update_host(newer)
+            raise ConnectionError("down")
+
+        delegate.bulk_upsert_hosts.side_effect = fail_after_newer_write
+        repository.create_or_update_host(host(hostname="older"))
+
+        with pytest.raises(ConnectionError):
+            repository.flush()
+
+        assert_that(repository.get_host("10.0.0.1")).is_same_as(newer)
+
+
+class TestBufferedNetworkTopologyRepositoryReads:
+    @pytest.mark.parametrize(
+        "write,read",
+        [
+            (lambda r: r.create_or_update_dns_record(dns_record()), lambda r: r.get_dns_record("example.com")),
+            (lambda r: r.create_or_update_port(port()), lambda r: r.get_port(443, "TCP")),
+            (lambda r: r.create_or_update_host(host()), lambda r: r.get_host("10.0.0.1")),
+        ],
+    )
+    def test_should_read_own_queued_writes(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock, write: Any, read: Any
+    ) -> None:
+        model = write(repository)
+
+        assert_that(read(repository)).is_same_as(model)
+        assert_that(delegate.method_calls).is_empty()
+
+    def test_should_read_from_repository_when_not_queued(
+        self, repository: BufferedNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        assert_that(repository.get_port(80, "TCP")).is_same_as(delegate.get_port.return_value)
+        delegate.get_port.assert_called_once_with(80, "TCP")
+
+    @pytest.mark.parametrize(
+        "method_name,arguments",
+        [
+            ("link_domain_ports", ([],)),
+            ("create_edge_between_existing_vertices", ("edge",)),
+            ("get_dns_record_discoveries", ("example.com", ["values"])),
+            ("iter_dns_record_discoveries", ("example.com", 10, None, None)),
+            ("get_port_scan_results", ("10.0.0.1", ["state"])),
+            ("iter_port_scan_results", ("10.0.0.1", 10, None, None)),
+            ("get_port_scan_history", ("10.0.0.1",)),
+            ("get_port_scan_state_at", ("10.0.0.1", "at")),
+            ("compact_port_scan_history", ()),
+            ("open_ports_per_service", (5,)),
+            ("hosts_per_open_port", (5,)),
+            ("record_types_per_domain", (5,)),
+            ("bulk_upsert_port_scan_results", ([],)),
+            ("bulk_upsert_dns_record_discoveries", ([],)),
+            ("bulk_upsert_dns_records", ([],)),
+            ("bulk_upsert_ports", ([],)),
+            ("bulk_upsert_hosts", ([],)),
+            ("bulk_create_edges", ([],)),
+            ("list_dns_records", (10, None)),
+            ("list_ports", (10, None)),
+            ("list_hosts", (10, None)),
+            ("list_dns_record_discoveries", (10, None)),
+            ("list_port_scan_results", (10, None)),
+            ("list_edges", ("domain_to_port", 10, None)),
+            ("neighbors", ("vertex", 2, "direction", None, 10)),
+            ("shortest_path", ("source", "target", 3, "direction", None)),
+        ],
+    )
+    def test_should_flush_before_delegating(
+        self,
+        repository: BufferedNetworkTopologyRepository,
+        delegate: Mock,
+        method_name: str,
+        arguments: Tuple[Any, ...],
+    ) -> None:
+        repository.create_or_update_dns_record(dns_record())
+
+        getattr(repository, method_name)(*arguments)
+
+        assert_that(delegate.method_calls[0][0]).is_equal_to("bulk_upsert_dns_records")
+        assert_that(delegate.method_calls[-1]).is_equal_to((method_name, arguments, {}))
+
+
+class TestBufferedNetworkTopologyRepositoryLifecycle:
+    @patch("via_node.infrastructure.persistence.decorator.buffered_network_topology_repository.atexit")
+    def test_should_register_flush_at_exit(self, mock_atexit: Mock, delegate: Mock) -> None:
+        repository = BufferedNetworkTopologyRepository(delegate)
+
+        mock_atexit.register.assert_called_once_with(repository.close)
+
+    @patch("via_node.infrastructure.persistence.decorator.buffered_network_topology_repository.atexit")
+    def test_should_skip_exit_hook_when_disabled(self, mock_atexit: Mock, delegate: Mock) -> None:
+        BufferedNetworkTopologyRepository(delegate, flush_at_exit=False)
+
+        mock_atexit.register.assert_not_called()
+
+    @patch("via_node.infrastructure.persistence.decorator.buffered_network_topology_repository.atexit")
+    def test_should_flush_and_unregister_on_close(self, mock_atexit: Mock, delegate: Mock) -> None:
+        repository = BufferedNetworkTopologyRepository(delegate)
+        repository.create_or_update_host(host())
+
+        repository.close()
+
+        delegate.bulk_upsert_hosts.assert_called_once()
+        mock_atexit.unregister.assert_called_once_with(repository.close)
+
+    def test_should_flush_when_leaving_context(self, delegate: Mock) -> None:
+        with BufferedNetworkTopologyRepository(delegate, flush_at_exit=False) as repository:
+            repository.create_or_update_host(host())
+
+        delegate.bulk_upsert_hosts.assert_called_once()
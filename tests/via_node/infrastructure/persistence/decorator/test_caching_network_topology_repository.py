@@ -0,0 +1,186 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.caching_network_topology_repository import (
+    CachingNetworkTopologyRepository,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+DNS_RECORD = DnsRecord(
+    domain_name="example.com", record_type="A", ip_addresses=["10.0.0.1"], created_at=NOW, updated_at=NOW
+)
+PORT = Port(port_number=443, protocol="TCP", service_name="https", created_at=NOW, updated_at=NOW)
+HOST = Host(ip_address="10.0.0.1", hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+
+
+@pytest.fixture
+def delegate() -> Mock:
+    delegate = Mock(spec=NetworkTopologyRepository)
+    delegate.get_dns_record.return_value = DNS_RECORD
+    delegate.get_port.return_value = PORT
+    delegate.get_host.return_value = HOST
+    delegate.create_or_update_dns_record.side_effect = lambda record: record
+    delegate.create_or_update_port.side_effect = lambda port: port
+    delegate.create_or_update_host.side_effect = lambda host: host
+    return delegate
+
+
+@pytest.fixture
+def repository(delegate: Mock) -> CachingNetworkTopologyRepository:
+    return CachingNetworkTopologyRepository(delegate)
+
+
+class TestCachingNetworkTopologyRepository:
+    def test_should_fetch_dns_record_once(self, repository: CachingNetworkTopologyRepository, delegate: Mock) -> None:
+        repository.get_dns_record("example.com")
+
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(DNS_RECORD)
+        delegate.get_dns_record.assert_called_once_with("example.com")
+
+    def test_should_fetch_port_once(self, repository: CachingNetworkTopologyRepository, delegate: Mock) -> None:
+        repository.get_port(443, "TCP")
+
+        assert_that(repository.get_port(443, "TCP")).is_equal_to(PORT)
+        delegate.get_port.assert_called_once_with(443, "TCP")
+
+    def test_should_fetch_host_once(self, repository: CachingNetworkTopologyRepository, delegate: Mock) -> None:
+        repository.get_host("10.0.0.1")
+
+        assert_that(repository.get_host("10.0.0.1")).is_equal_to(HOST)
+        delegate.get_host.assert_called_once_with("10.0.0.1")
+
+    def test_should_cache_missing_documents(self, repository: CachingNetworkTopologyRepository, delegate: Mock) -> None:
+        delegate.get_port.return_value = None
+        repository.get_port(8443, "TCP")
+
+        assert_that(repository.get_port(8443, "TCP")).is_none()
+        delegate.get_port.assert_called_once()
+
+    def test_should_serve_written_dns_record_without_fetching(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        delegate.get_dns_record.return_value = None
+        repository.get_dns_record("example.com")
+
+        repository.create_or_update_dns_record(DNS_RECORD)
+
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(DNS_RECORD)
+        delegate.get_dns_record.assert_called_once()
+
+    def test_should_serve_written_port_without_fetching(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_port(PORT)
+
+        assert_that(repository.get_port(443, "TCP")).is_equal_to(PORT)
+        delegate.get_port.assert_not_called()
+
+    def test_should_serve_written_host_without_fetching(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.create_or_update_host(HOST)
+
+        assert_that(repository.get_host("10.0.0.1")).is_equal_to(HOST)
+        delegate.get_host.assert_not_called()
+
+    def test_should_not_share_cached_instances_with_callers(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.get_dns_record("example.com").ip_addresses.append("10.0.0.2")  # type: ignore[union-attr]
+        stored = repository.create_or_update_host(HOST.model_copy())
+        stored.hostname = "changed"
+
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(DNS_RECORD)
+        assert_that(repository.get_host("10.0.0.1")).is_equal_to(HOST)
+        assert_that(repository.get_port(443, "TCP")).is_not_same_as(repository.get_port(443, "TCP"))
+        delegate.get_dns_record.assert_called_once_with("example.com")
+
+    def test_should_drop_cached_entry_when_write_fails(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.get_host("10.0.0.1")
+        delegate.create_or_update_host.side_effect = ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            repository.create_or_update_host(HOST)
+
+        repository.get_host("10.0.0.1")
+        assert_that(delegate.get_host.call_count).is_equal_to(2)
+
+    def test_should_invalidate_dns_records_and_ports_on_bulk_upsert(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.get_dns_record("example.com")
+        repository.get_port(443, "TCP")
+
+        repository.bulk_upsert_dns_records([DNS_RECORD])
+        repository.bulk_upsert_ports([PORT])
+
+        repository.get_dns_record("example.com")
+        repository.get_port(443, "TCP")
+        assert_that(delegate.get_dns_record.call_count).is_equal_to(2)
+        assert_that(delegate.get_port.call_count).is_equal_to(2)
+
+    def test_should_invalidate_hosts_on_bulk_upsert(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.get_host("10.0.0.1")
+
+        result = repository.bulk_upsert_hosts([HOST])
+
+        repository.get_host("10.0.0.1")
+        assert_that(result).is_same_as(delegate.bulk_upsert_hosts.return_value)
+        assert_that(delegate.get_host.call_count).is_equal_to(2)
+
+    def test_should_report_statistics_per_entity(self, repository: CachingNetworkTopologyRepository) -> None:
+        repository.get_port(443, "TCP")
+        repository.get_port(443, "TCP")
+        repository.get_host("10.0.0.1")
+
+        statistics = repository.cache_statistics()
+
+        assert_that(statistics["ports"].hits).is_equal_to(1)
+        assert_that(statistics["ports"].misses).is_equal_to(1)
+        assert_that(statistics["hosts"].misses).is_equal_to(1)
+        assert_that(statistics["dns_records"].size).is_zero()
+
+    def test_should_refetch_after_cache_cleared(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        repository.get_dns_record("example.com")
+
+        repository.clear_cache()
+
+        repository.get_dns_record("example.com")
+        assert_that(delegate.get_dns_record.call_count).is_equal_to(2)
+
+    def test_should_delegate_uncached_reads(self, repository: CachingNetworkTopologyRepository, delegate: Mock) -> None:
+        assert_that(repository.get_port_scan_results("10.0.0.1")).is_same_as(
+            delegate.get_port_scan_results.return_value
+        )
+
+    def test_should_invalidate_vertices_when_linking_domain_ports(
+        self, repository: CachingNetworkTopologyRepository, delegate: Mock
+    ) -> None:
+        edge = NetworkTopologyEdge(
+            source_id="example.com", target_id="443_TCP", edge_type="domain_to_port", metadata={}, created_at=NOW
+        )
+        repository.get_dns_record("example.com")
+        repository.get_port(443, "TCP")
+
+        repository.link_domain_ports([DomainPortLink(dns_record=DNS_RECORD, port=PORT, edge=edge)])
+
+        repository.get_dns_record("example.com")
+        repository.get_port(443, "TCP")
+        assert_that(delegate.get_dns_record.call_count).is_equal_to(2)
+        assert_that(delegate.get_port.call_count).is_equal_to(2)
@@ -0,0 +1,174 @@
+from datetime import datetime
+from typing import Any, List
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.bulk_write_result import BulkWriteError, BulkWriteResult
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.topology_change import TopologyChange, TopologyChangeKind
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.domain.service.topology_change_feed import TopologyChangeSink
+from via_node.infrastructure.change_feed.topology_change_bus import TopologyChangeBus, TopologyChangeSubscription
+from via_node.infrastructure.persistence.decorator.change_feed_network_topology_repository import (
+    ChangeFeedNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def host(ip_address: str) -> Host:
+    return Host(ip_address=ip_address, hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+
+
+def scan_result(port_number: int) -> PortScanResult:
+    return PortScanResult(
+        target_ip="10.0.0.1", port_number=port_number, protocol="tcp", state=PortState.OPEN, scanned_at=NOW
+    )
+
+
+def drain(subscription: TopologyChangeSubscription) -> List[TopologyChange]:
+    return list(iter(lambda: subscription.get(timeout=0), None))
+
+
+@pytest.fixture
+def bus() -> TopologyChangeBus:
+    return TopologyChangeBus()
+
+
+@pytest.fixture
+def repository(bus: TopologyChangeBus) -> ChangeFeedNetworkTopologyRepository:
+    return ChangeFeedNetworkTopologyRepository(InMemoryNetworkTopologyRepository(), bus)
+
+
+DNS_RECORD = DnsRecord(domain_name="example.com", record_type="A", ip_addresses=[], created_at=NOW, updated_at=NOW)
+PORT = Port(port_number=443, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW)
+EDGE = NetworkTopologyEdge(
+    source_id="example.com", target_id="443_TCP", edge_type="domain_to_port", metadata={}, created_at=NOW
+)
+DISCOVERY = DnsRecordDiscovery(
+    domain_name="example.com", record_type=DnsRecordType.A, values=["10.0.0.1"], discovered_at=NOW
+)
+
+
+class TestChangeFeedNetworkTopologyRepository:
+    @pytest.mark.parametrize(
+        "method_name,model,kind",
+        [
+            ("create_or_update_dns_record", DNS_RECORD, TopologyChangeKind.DNS_RECORD),
+            ("create_or_update_port", PORT, TopologyChangeKind.PORT),
+            ("create_edge", EDGE, TopologyChangeKind.EDGE),
+            ("create_edge_between_existing_vertices", EDGE, TopologyChangeKind.EDGE),
+            ("create_or_update_dns_record_discovery", DISCOVERY, TopologyChangeKind.DNS_RECORD_DISCOVERY),
+        ],
+    )
+    def test_should_publish_stored_model(self, method_name: str, model: Any, kind: TopologyChangeKind) -> None:
+        delegate = Mock(spec=NetworkTopologyRepository)
+        getattr(delegate, method_name).return_value = model
+        sink = Mock(spec=TopologyChangeSink)
+
+        stored = getattr(ChangeFeedNetworkTopologyRepository(delegate, sink), method_name)(model)
+
+        [[published]] = sink.publish.call_args.args
+        assert_that(stored).is_same_as(model)
+        assert_that(published.kind).is_equal_to(kind)
+
+    @pytest.mark.parametrize(
+        "method_name,model,kind",
+        [
+            ("bulk_upsert_dns_record_discoveries", DISCOVERY, TopologyChangeKind.DNS_RECORD_DISCOVERY),
+            ("bulk_upsert_dns_records", DNS_RECORD, TopologyChangeKind.DNS_RECORD),
+            ("bulk_upsert_ports", PORT, TopologyChangeKind.PORT),
+            ("bulk_upsert_hosts", host("10.0.0.1"), TopologyChangeKind.HOST),
+            ("bulk_create_edges", EDGE, TopologyChangeKind.EDGE),
+        ],
+    )
+    def test_should_publish_bulk_writes(self, method_name: str, model: Any, kind: TopologyChangeKind) -> None:
+        delegate = Mock(spec=NetworkTopologyRepository)
+        getattr(delegate, method_name).return_value = BulkWriteResult(written=1)
+        sink = Mock(spec=TopologyChangeSink)
+
+        getattr(ChangeFeedNetworkTopologyRepository(delegate, sink), method_name)([model])
+
+        [[published]] = sink.publish.call_args.args
+        assert_that(published.kind).is_equal_to(kind)
+
+    def test_should_publish_each_stored_write_in_order(
+        self, repository: ChangeFeedNetworkTopologyRepository, bus: TopologyChangeBus
+    ) -> None:
+        subscription = bus.subscribe()
+
+        repository.create_or_update_host(host("10.0.0.1"))
+        repository.create_or_update_port_scan_result(scan_result(22))
+
+        changes = drain(subscription)
+        assert_that([(change.sequence, change.kind, change.key) for change in changes]).is_equal_to(
+            [(1, TopologyChangeKind.HOST, "10.0.0.1"), (2, TopologyChangeKind.PORT_SCAN_RESULT, "10.0.0.1_tcp_22")]
+        )
+
+    def test_should_publish_vertices_and_edge_of_each_link(
+        self, repository: ChangeFeedNetworkTopologyRepository, bus: TopologyChangeBus
+    ) -> None:
+        subscription = bus.subscribe()
+
+        repository.link_domain_ports([DomainPortLink(dns_record=DNS_RECORD, port=PORT, edge=EDGE)])
+
+        assert_that([change.kind for change in drain(subscription)]).is_equal_to(
+            [TopologyChangeKind.DNS_RECORD, TopologyChangeKind.PORT, TopologyChangeKind.EDGE]
+        )
+
+    def test_should_publish_only_written_documents_of_bulk_upsert(self) -> None:
+        delegate = Mock(spec=NetworkTopologyRepository)
+        delegate.bulk_upsert_port_scan_results.return_value = BulkWriteResult(
+            written=1, errors=[BulkWriteError(index=0, error_message="conflict")]
+        )
+        sink = Mock(spec=TopologyChangeSink)
+
+        result = ChangeFeedNetworkTopologyRepository(delegate, sink).bulk_upsert_port_scan_results(
+            [scan_result(22), scan_result(80)]
+        )
+
+        [published] = sink.publish.call_args.args
+        assert_that([change.key for change in published]).is_equal_to(["10.0.0.1_tcp_80"])
+        assert_that(result).is_same_as(delegate.bulk_upsert_port_scan_results.return_value)
+
+    def test_should_not_publish_when_nothing_was_written(self) -> None:
+        delegate = Mock(spec=NetworkTopologyRepository)
+        delegate.bulk_upsert_hosts.return_value = BulkWriteResult(
+            errors=[BulkWriteError(index=0, error_message="conflict")]
+        )
+        sink = Mock(spec=TopologyChangeSink)
+
+        ChangeFeedNetworkTopologyRepository(delegate, sink).bulk_upsert_hosts([host("10.0.0.1")])
+
+        sink.publish.assert_not_called()
+
+    def test_should_not_publish_failed_write(self) -> None:
+        delegate = Mock(spec=NetworkTopologyRepository)
+        delegate.create_or_update_host.side_effect = RuntimeError("unavailable")
+        sink = Mock(spec=TopologyChangeSink)
+
+        with pytest.raises(RuntimeError):
+            ChangeFeedNetworkTopologyRepository(delegate, sink).create_or_update_host(host("10.0.0.1"))
+
+        sink.publish.assert_not_called()
+
+    def test_should_not_publish_reads(
+        self, repository: ChangeFeedNetworkTopologyRepository, bus: TopologyChangeBus
+    ) -> None:
+        repository.create_or_update_host(host("10.0.0.1"))
+
+        repository.get_host("10.0.0.1")
+        repository.get_port_scan_results("10.0.0.1")
+
+        assert_that(bus.last_sequence).is_equal_to(1)
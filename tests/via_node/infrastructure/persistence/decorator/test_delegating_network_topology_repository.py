@@ -0,0 +1,65 @@
+from typing import Any, Tuple
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.delegating_network_topology_repository import (
+    DelegatingNetworkTopologyRepository,
+)
+
+CALLS = [
+    ("create_or_update_dns_record", ("record",)),
+    ("create_or_update_port", ("port",)),
+    ("create_edge", ("edge",)),
+    ("link_domain_ports", (["link"],)),
+    ("create_edge_between_existing_vertices", ("edge",)),
+    ("get_dns_record", ("example.com",)),
+    ("get_port", (443, "TCP")),
+    ("create_or_update_host", ("host",)),
+    ("get_host", ("10.0.0.1",)),
+    ("create_or_update_dns_record_discovery", ("discovery",)),
+    ("get_dns_record_discoveries", ("example.com", ["values"])),
+    ("iter_dns_record_discoveries", ("example.com", 10, ["values"], 30)),
+    ("create_or_update_port_scan_result", ("result",)),
+    ("get_port_scan_results", ("10.0.0.1", ["state"])),
+    ("iter_port_scan_results", ("10.0.0.1", 10, ["state"], 30)),
+    ("get_port_scan_history", ("10.0.0.1",)),
+    ("get_port_scan_state_at", ("10.0.0.1", "at")),
+    ("compact_port_scan_history", ()),
+    ("open_ports_per_service", (5,)),
+    ("hosts_per_open_port", (5,)),
+    ("record_types_per_domain", (5,)),
+    ("bulk_upsert_port_scan_results", (["result"],)),
+    ("bulk_upsert_dns_record_discoveries", (["discovery"],)),
+    ("bulk_upsert_dns_records", (["dns_record"],)),
+    ("bulk_upsert_ports", (["port"],)),
+    ("bulk_upsert_hosts", (["host"],)),
+    ("bulk_create_edges", (["edge"],)),
+    ("list_dns_records", (10, "token")),
+    ("list_ports", (10, "token")),
+    ("list_hosts", (10, "token")),
+    ("list_dns_record_discoveries", (10, "token")),
+    ("list_port_scan_results", (10, "token")),
+    ("list_edges", ("domain_to_port", 10, "token")),
+    ("neighbors", ("vertex", 2, "direction", ["domain_to_port"], 10)),
+    ("shortest_path", ("source", "target", 3, "direction", ["domain_to_port"])),
+]
+
+
+class TestDelegatingNetworkTopologyRepository:
+    def test_should_expose_wrapped_repository(self) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+
+        assert_that(DelegatingNetworkTopologyRepository(repository).repository).is_same_as(repository)
+
+    @pytest.mark.parametrize("method_name,arguments", CALLS)
+    def test_should_forward_call_to_wrapped_repository(self, method_name: str, arguments: Tuple[Any, ...]) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+        delegating = DelegatingNetworkTopologyRepository(repository)
+
+        result = getattr(delegating, method_name)(*arguments)
+
+        getattr(repository, method_name).assert_called_once_with(*arguments)
+        assert_that(result).is_same_as(getattr(repository, method_name).return_value)
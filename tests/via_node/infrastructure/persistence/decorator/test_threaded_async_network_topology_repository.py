@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Tuple
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.host import Host
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.decorator.threaded_async_network_topology_repository import (
+    ThreadedAsyncNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+
+CALLS = [
+    ("create_or_update_dns_record", ("record",)),
+    ("create_or_update_port", ("port",)),
+    ("create_edge", ("edge",)),
+    ("link_domain_ports", (["link"],)),
+    ("create_edge_between_existing_vertices", ("edge",)),
+    ("get_dns_record", ("example.com",)),
+    ("get_port", (443, "TCP")),
+    ("create_or_update_host", ("host",)),
+    ("get_host", ("10.0.0.1",)),
+    ("create_or_update_dns_record_discovery", ("discovery",)),
+    ("get_dns_record_discoveries", ("example.com", ["values"])),
+    ("create_or_update_port_scan_result", ("result",)),
+    ("get_port_scan_results", ("10.0.0.1", ["state"])),
+    ("get_port_scan_history", ("10.0.0.1",)),
+    ("get_port_scan_state_at", ("10.0.0.1", "at")),
+    ("compact_port_scan_history", ()),
+    ("open_ports_per_service", (5,)),
+    ("hosts_per_open_port", (5,)),
+    ("record_types_per_domain", (5,)),
+    ("bulk_upsert_port_scan_results", (["result"],)),
+    ("bulk_upsert_dns_record_discoveries", (["discovery"],)),
+    ("bulk_upsert_dns_records", (["dns_record"],)),
+    ("bulk_upsert_ports", (["port"],)),
+    ("bulk_upsert_hosts", (["host"],)),
+    ("bulk_create_edges", (["edge"],)),
+    ("list_dns_records", (10, "token")),
+    ("list_ports", (10, "token")),
+    ("list_hosts", (10, "token")),
+    ("list_dns_record_discoveries", (10, "token")),
+    ("list_port_scan_results", (10, "token")),
+    ("list_edges", ("domain_to_port", 10, "token")),
+    ("neighbors", ("vertex", 2, "direction", ["domain_to_port"], 10)),
+    ("shortest_path", ("source", "target", 3, "direction", ["domain_to_port"])),
+]
+
+STREAMS = [
+    ("iter_dns_record_discoveries", ("example.com", 2, ["values"], 30)),
+    ("iter_port_scan_results", ("10.0.0.1", 2, ["state"], 30)),
+]
+
+
+async def collect(items: AsyncIterator[Any]) -> List[Any]:
+    return [item async for item in items]
+
+
+class TestThreadedAsyncNetworkTopologyRepository:
+    def test_should_expose_wrapped_repository(self) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+
+        assert_that(ThreadedAsyncNetworkTopologyRepository(repository).repository).is_same_as(repository)
+
+    @pytest.mark.parametrize("method_name,arguments", CALLS)
+    def test_should_forward_call_to_wrapped_repository(self, method_name: str, arguments: Tuple[Any, ...]) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+        threaded = ThreadedAsyncNetworkTopologyRepository(repository)
+
+        result = asyncio.run(getattr(threaded, method_name)(*arguments))
+
+        getattr(repository, method_name).assert_called_once_with(*arguments)
+        assert_that(result).is_same_as(getattr(repository, method_name).return_value)
+
+    @pytest.mark.parametrize("method_name,arguments", STREAMS)
+    def test_should_stream_wrapped_iterator_in_batches(self, method_name: str, arguments: Tuple[Any, ...]) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+        getattr(repository, method_name).return_value = iter(["a", "b", "c"])
+        threaded = ThreadedAsyncNetworkTopologyRepository(repository)
+
+        result = asyncio.run(collect(getattr(threaded, method_name)(*arguments)))
+
+        getattr(repository, method_name).assert_called_once_with(*arguments)
+        assert_that(result).is_equal_to(["a", "b", "c"])
+
+    def test_should_run_calls_outside_event_loop_thread(self) -> None:
+        repository = Mock(spec=NetworkTopologyRepository)
+        repository.get_host.side_effect = lambda ip_address: threading.current_thread()
+        threaded = ThreadedAsyncNetworkTopologyRepository(repository)
+
+        thread = asyncio.run(threaded.get_host("10.0.0.1"))
+
+        assert_that(thread).is_not_same_as(threading.current_thread())
+
+    def test_should_serve_embedded_repository(self) -> None:
+        now = datetime(2024, 1, 1)
+        host = Host(ip_address="10.0.0.1", hostname="web", os_type="linux", created_at=now, updated_at=now)
+        threaded = ThreadedAsyncNetworkTopologyRepository(InMemoryNetworkTopologyRepository())
+
+        asyncio.run(threaded.create_or_update_host(host))
+
+        assert_that(asyncio.run(threaded.get_host("10.0.0.1"))).is_equal_to(host)
+
+    def test_should_close_wrapped_repository(self) -> None:
+        repository = Mock()
+
+        asyncio.run(ThreadedAsyncNetworkTopologyRepository(repository).aclose())
+
+        repository.close.assert_called_once_with()
+
+    def test_should_close_repository_without_resources(self) -> None:
+        asyncio.run(ThreadedAsyncNetworkTopologyRepository(InMemoryNetworkTopologyRepository()).aclose())
@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.decorator.ttl_lru_cache import CacheStatistics, TtlLruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_cache(clock: FakeClock, capacity: int = 2, negative_ttl: float = 5.0) -> TtlLruCache[str]:
+    return TtlLruCache(capacity=capacity, ttl=10.0, negative_ttl=negative_ttl, clock=clock)
+
+
+class TestTtlLruCache:
+    def test_should_load_value_on_first_lookup(self) -> None:
+        cache = create_cache(FakeClock())
+        load = Mock(return_value="value")
+
+        assert_that(cache.get_or_load("key", load)).is_equal_to("value")
+        load.assert_called_once()
+
+    def test_should_serve_cached_value_on_repeat_lookup(self) -> None:
+        cache = create_cache(FakeClock())
+        load = Mock(return_value="value")
+        cache.get_or_load("key", load)
+
+        cache.get_or_load("key", load)
+
+        load.assert_called_once()
+
+    def test_should_reload_after_ttl_expires(self) -> None:
+        clock = FakeClock()
+        cache = create_cache(clock)
+        load = Mock(side_effect=["old", "new"])
+        cache.get_or_load("key", load)
+        clock.now = 10.0
+
+        assert_that(cache.get_or_load("key", load)).is_equal_to("new")
+
+    def test_should_cache_misses_for_negative_ttl(self) -> None:
+        clock = FakeClock()
+        cache = create_cache(clock)
+        load = Mock(return_value=None)
+        cache.get_or_load("key", load)
+        clock.now = 4.0
+
+        assert_that(cache.get_or_load("key", load)).is_none()
+        load.assert_called_once()
+
+    def test_should_reload_misses_after_negative_ttl(self) -> None:
+        clock = FakeClock()
+        cache = create_cache(clock)
+        load = Mock(side_effect=[None, "found"])
+        cache.get_or_load("key", load)
+        clock.now = 5.0
+
+        assert_that(cache.get_or_load("key", load)).is_equal_to("found")
+
+    def test_should_not_cache_misses_when_negative_ttl_disabled(self) -> None:
+        cache = create_cache(FakeClock(), negative_ttl=0)
+        load = Mock(return_value=None)
+
+        cache.get_or_load("key", load)
+        cache.get_or_load("key", load)
+
+        assert_that(load.call_count).is_equal_to(2)
+
+    def test_should_not_cache_when_capacity_is_zero(self) -> None:
+        cache = create_cache(FakeClock(), capacity=0)
+        cache.put("key", "value")
+
+        assert_that(cache.statistics().size).is_zero()
+
+    def test_should_evict_least_recently_used_entry(self) -> None:
+        cache = create_cache(FakeClock())
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get_or_load("a", Mock())
+
+        cache.put("c", "3")
+
+        assert_that(cache.get_or_load("b", Mock(return_value="reloaded"))).is_equal_to("reloaded")
+
+    def test_should_forget_invalidated_entry(self) -> None:
+        cache = create_cache(FakeClock())
+        cache.put("key", "value")
+
+        cache.invalidate("key")
+
+        assert_that(cache.get_or_load("key", Mock(return_value=None))).is_none()
+
+    def test_should_forget_everything_when_cleared(self) -> None:
+        cache = create_cache(FakeClock())
+        cache.put("key", "value")
+
+        cache.clear()
+
+        assert_that(cache.statistics().size).is_zero()
+
+    def test_should_count_hits_and_misses(self) -> None:
+        cache = create_cache(FakeClock())
+        load = Mock(return_value="value")
+
+        for _ in range(4):
+            cache.get_or_load("key", load)
+
+        assert_that(cache.statistics()).is_equal_to(CacheStatistics(hits=3, misses=1, size=1))
+
+    def test_should_report_hit_ratio(self) -> None:
+        assert_that(CacheStatistics(hits=3, misses=1).hit_ratio).is_equal_to(0.75)
+
+    def test_should_report_zero_hit_ratio_without_lookups(self) -> None:
+        assert_that(CacheStatistics().hit_ratio).is_zero()
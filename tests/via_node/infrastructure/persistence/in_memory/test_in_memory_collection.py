@@ -0,0 +1,65 @@
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.page import InvalidPageTokenError
+from via_node.infrastructure.persistence.in_memory.in_memory_collection import InMemoryCollection
+
+
+def collection(*keys: str) -> InMemoryCollection[str]:
+    items: InMemoryCollection[str] = InMemoryCollection("items", indexed_by=lambda item: item[0])
+
+    for key in keys:
+        items.put(key, key.upper())
+
+    return items
+
+
+class TestInMemoryCollection:
+    def test_should_get_item_by_key(self) -> None:
+        assert_that(collection("a").get("a")).is_equal_to("A")
+
+    def test_should_return_none_for_missing_key(self) -> None:
+        assert_that(collection().get("a")).is_none()
+
+    def test_should_replace_item_without_duplicating_key(self) -> None:
+        items = collection("a")
+
+        items.put("a", "replaced")
+
+        assert_that(len(items)).is_equal_to(1)
+        assert_that(items.page(10, None).items).is_equal_to(["replaced"])
+
+    def test_should_look_up_items_by_secondary_index(self) -> None:
+        items = collection("ab", "ac", "bd")
+
+        assert_that(items.lookup("A")).is_equal_to(["AB", "AC"])
+        assert_that(items.lookup("Z")).is_empty()
+
+    def test_should_page_in_key_order(self) -> None:
+        items = collection("c", "a", "b")
+
+        first = items.page(2, None)
+        second = items.page(2, first.next_page_token)
+
+        assert_that(first.items).is_equal_to(["A", "B"])
+        assert_that(second.items).is_equal_to(["C"])
+        assert_that(second.has_next_page).is_false()
+
+    def test_should_continue_after_token_when_keys_are_added(self) -> None:
+        items = collection("a", "c")
+        first = items.page(1, None)
+
+        items.put("b", "B")
+
+        assert_that(items.page(10, first.next_page_token).items).is_equal_to(["B", "C"])
+
+    def test_should_reject_token_from_other_collection(self) -> None:
+        token = collection("a", "b").page(1, None).next_page_token
+        other: InMemoryCollection[str] = InMemoryCollection("other")
+
+        with pytest.raises(InvalidPageTokenError):
+            other.page(1, token)
+
+    def test_should_reject_non_positive_page_size(self) -> None:
+        with pytest.raises(ValueError):
+            collection().page(0, None)
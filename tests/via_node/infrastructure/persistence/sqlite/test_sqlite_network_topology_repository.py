@@ -0,0 +1,498 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.dns_record import DnsRecord
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.domain_port_link import DomainPortLink
+from via_node.domain.model.exposure_statistics import DomainRecordTypes, PortExposure, ServiceExposure
+from via_node.domain.model.host import Host
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge, VertexNotFoundError
+from via_node.domain.model.port import Port
+from via_node.domain.model.port_scan_observation import PortScanObservation
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.domain.model.timestamp import epoch_microseconds
+from via_node.domain.model.topology_traversal import TraversalDirection, VertexReference
+from via_node.infrastructure.persistence.sqlite.sqlite_network_topology_repository import (
+    SELECT_DNS_DISCOVERIES,
+    SELECT_PORT_SCAN_RESULTS,
+    SELECT_PORT_SCAN_STATE_AT,
+    SqliteNetworkTopologyRepository,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+LATER = NOW + timedelta(hours=1)
+
+
+def dns_record(domain_name: str, updated_at: datetime = NOW) -> DnsRecord:
+    return DnsRecord(
+        domain_name=domain_name, record_type="A", ip_addresses=["10.0.0.1"], created_at=NOW, updated_at=updated_at
+    )
+
+
+def port(port_number: int, updated_at: datetime = NOW) -> Port:
+    return Port(port_number=port_number, protocol="TCP", service_name=None, created_at=NOW, updated_at=updated_at)
+
+
+def host(ip_address: str) -> Host:
+    return Host(ip_address=ip_address, hostname="web", os_type="linux", created_at=NOW, updated_at=NOW)
+
+
+def port_edge(domain_name: str, port_number: int, last_seen_at: datetime = NOW) -> NetworkTopologyEdge:
+    return NetworkTopologyEdge(
+        source_id=domain_name,
+        target_id=f"{port_number}_TCP",
+        edge_type="domain_to_port",
+        metadata={"seen": last_seen_at.isoformat()},
+        created_at=NOW,
+        last_seen_at=last_seen_at,
+    )
+
+
+def host_edge(domain_name: str, ip_address: str) -> NetworkTopologyEdge:
+    return NetworkTopologyEdge(
+        source_id=domain_name, target_id=ip_address, edge_type="dns_resolves_to_host", metadata={}, created_at=NOW
+    )
+
+
+def discovery(domain_name: str, record_type: DnsRecordType) -> DnsRecordDiscovery:
+    return DnsRecordDiscovery(domain_name=domain_name, record_type=record_type, values=["10.0.0.1"], discovered_at=NOW)
+
+
+def scan_result(target_ip: str, port_number: int) -> PortScanResult:
+    return PortScanResult(
+        target_ip=target_ip, port_number=port_number, protocol="TCP", state=PortState.OPEN, scanned_at=NOW
+    )
+
+
+def rescan(port_number: int, hours: float, state: PortState = PortState.OPEN) -> PortScanResult:
+    return scan_result("10.0.0.1", port_number).model_copy(
+        update={"state": state, "scanned_at": NOW + timedelta(hours=hours)}
+    )
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> str:
+    return str(tmp_path / "topology.sqlite3")
+
+
+@pytest.fixture
+def repository(database: str) -> Iterator[SqliteNetworkTopologyRepository]:
+    repository = SqliteNetworkTopologyRepository(database)
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def topology(repository: SqliteNetworkTopologyRepository) -> SqliteNetworkTopologyRepository:
+    for domain_name in ("a.example.com", "b.example.com"):
+        repository.create_or_update_dns_record(dns_record(domain_name))
+
+    repository.create_or_update_host(host("10.0.0.1"))
+    repository.create_or_update_host(host("10.0.0.2"))
+    repository.create_or_update_port(port(443))
+    repository.create_edge(host_edge("a.example.com", "10.0.0.1"))
+    repository.create_edge(host_edge("b.example.com", "10.0.0.1"))
+    repository.create_edge(host_edge("b.example.com", "10.0.0.2"))
+    repository.create_edge(port_edge("a.example.com", 443))
+    return repository
+
+
+@pytest.fixture
+def scan_history(repository: SqliteNetworkTopologyRepository) -> SqliteNetworkTopologyRepository:
+    repository.bulk_upsert_port_scan_results([rescan(22, 0), rescan(22, 1), rescan(80, 1), scan_result("10.0.0.2", 22)])
+    repository.create_or_update_port_scan_result(rescan(22, 2, PortState.CLOSED))
+    repository.create_or_update_port_scan_result(rescan(22, 3))
+    repository.create_or_update_port_scan_result(rescan(22, 0))
+    return repository
+
+
+def vertex(reference: str) -> VertexReference:
+    return VertexReference.parse(reference)
+
+
+def query_plan(repository: SqliteNetworkTopologyRepository, statement: str, parameters: tuple = ("",)) -> str:
+    return " ".join(row[3] for row in repository._connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters))
+
+
+class TestSqliteNetworkTopologyRepository:
+    def test_should_use_write_ahead_log(self, repository: SqliteNetworkTopologyRepository) -> None:
+        assert_that(repository._connection.execute("PRAGMA journal_mode").fetchone()).is_equal_to(("wal",))
+
+    def test_should_persist_across_connections(
+        self, repository: SqliteNetworkTopologyRepository, database: str
+    ) -> None:
+        repository.create_or_update_dns_record(dns_record("example.com"))
+
+        reopened = SqliteNetworkTopologyRepository(database)
+
+        assert_that(reopened.get_dns_record("example.com")).is_equal_to(dns_record("example.com"))
+        reopened.close()
+
+    def test_should_serve_lookups_from_primary_key(self, repository: SqliteNetworkTopologyRepository) -> None:
+        assert_that(query_plan(repository, SELECT_DNS_DISCOVERIES)).contains("USING PRIMARY KEY (domain_name=?)")
+        assert_that(query_plan(repository, SELECT_PORT_SCAN_RESULTS)).contains("USING PRIMARY KEY (target_ip=?)")
+
+    def test_should_answer_state_at_time_from_primary_key(self, repository: SqliteNetworkTopologyRepository) -> None:
+        plan = query_plan(repository, SELECT_PORT_SCAN_STATE_AT, ("10.0.0.1", epoch_microseconds(NOW)))
+
+        assert_that(plan).contains("USING PRIMARY KEY (target_ip=?)")
+        assert_that(plan).does_not_contain("TEMP B-TREE")
+
+    def test_should_summarise_exposure(self, repository: SqliteNetworkTopologyRepository) -> None:
+        ssh = scan_result("10.0.0.1", 22).model_copy(update={"service_name": "ssh"})
+        repository.bulk_upsert_port_scan_results(
+            [ssh, ssh.model_copy(update={"target_ip": "10.0.0.2"}), rescan(80, 0, PortState.CLOSED)]
+        )
+        repository.bulk_upsert_dns_record_discoveries(
+            [discovery("example.com", DnsRecordType.MX), discovery("example.com", DnsRecordType.A)]
+        )
+
+        assert_that(repository.open_ports_per_service()).is_equal_to(
+            [ServiceExposure(service_name="ssh", open_ports=2, hosts=2)]
+        )
+        assert_that(repository.hosts_per_open_port(limit=1)).is_equal_to(
+            [PortExposure(port_number=22, protocol="tcp", hosts=2)]
+        )
+        assert_that(repository.record_types_per_domain()).is_equal_to(
+            [DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.A, DnsRecordType.MX])]
+        )
+
+    def test_should_stream_results_in_batches(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.bulk_upsert_port_scan_results(
+            [scan_result("10.0.0.1", port_number) for port_number in (22, 80, 443)]
+        )
+
+        results = list(repository.iter_port_scan_results("10.0.0.1", batch_size=2))
+
+        assert_that([result.port_number for result in results]).contains_only(22, 80, 443)
+
+    def test_should_stream_from_snapshot_while_writing(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.bulk_upsert_port_scan_results([scan_result("10.0.0.1", 22), scan_result("10.0.0.1", 80)])
+        results = repository.iter_port_scan_results("10.0.0.1", batch_size=1)
+
+        first = next(results)
+        repository.create_or_update_port_scan_result(scan_result("10.0.0.1", 443))
+
+        assert_that([first.port_number, *(result.port_number for result in results)]).contains_only(22, 80)
+        assert_that(repository.get_port_scan_results("10.0.0.1")).is_length(3)
+
+    def test_should_stream_on_another_thread(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_port_scan_result(scan_result("10.0.0.1", 22))
+        results: List[PortScanResult] = []
+
+        reader = threading.Thread(target=lambda: results.extend(repository.iter_port_scan_results("10.0.0.1")))
+        reader.start()
+        reader.join()
+
+        assert_that([result.port_number for result in results]).is_equal_to([22])
+
+    def test_should_store_and_get_vertices(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(dns_record("example.com"))
+        repository.create_or_update_port(port(443))
+        repository.create_or_update_host(host("10.0.0.1"))
+
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(dns_record("example.com"))
+        assert_that(repository.get_port(443, "TCP")).is_equal_to(port(443))
+        assert_that(repository.get_host("10.0.0.1")).is_equal_to(host("10.0.0.1"))
+        assert_that(repository.get_port(80, "TCP")).is_none()
+
+    def test_should_look_up_discoveries_by_domain(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.A))
+        repository.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.A))
+        repository.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.MX))
+        repository.create_or_update_dns_record_discovery(discovery("other.com", DnsRecordType.A))
+
+        assert_that(repository.get_dns_record_discoveries("example.com")).is_length(2)
+
+    def test_should_look_up_scan_results_by_target(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.bulk_upsert_port_scan_results([scan_result("10.0.0.1", 22), scan_result("10.0.0.2", 22)])
+
+        assert_that(repository.get_port_scan_results("10.0.0.1")).is_equal_to([scan_result("10.0.0.1", 22)])
+
+    def test_should_project_iterated_fields(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_port_scan_result(scan_result("10.0.0.1", 22))
+        repository.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.A))
+
+        [result] = list(repository.iter_port_scan_results("10.0.0.1", fields=["port_number"]))
+        discovered = list(repository.iter_dns_record_discoveries("example.com"))
+
+        assert_that(result.port_number).is_equal_to(22)
+        assert_that(result.model_fields_set).is_equal_to({"port_number"})
+        assert_that(discovered).is_equal_to([discovery("example.com", DnsRecordType.A)])
+
+    def test_should_project_listed_fields(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_port_scan_result(scan_result("10.0.0.1", 22))
+        repository.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.A))
+
+        [result] = repository.get_port_scan_results("10.0.0.1", fields=["port_number", "state"])
+        [discovered] = repository.get_dns_record_discoveries("example.com", fields=["record_type"])
+
+        assert_that(result.model_fields_set).is_equal_to({"port_number", "state"})
+        assert_that(discovered.model_fields_set).is_equal_to({"record_type"})
+
+    def test_should_reject_unknown_projected_fields(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_port_scan_result(scan_result("10.0.0.1", 22))
+
+        with pytest.raises(ValueError, match="Invalid projected field"):
+            repository.get_port_scan_results("10.0.0.1", fields=["port_number", "limit"])
+
+    def test_should_report_bulk_writes(self, repository: SqliteNetworkTopologyRepository) -> None:
+        hosts = repository.bulk_upsert_hosts([host("10.0.0.1"), host("10.0.0.2")])
+        discoveries = repository.bulk_upsert_dns_record_discoveries([discovery("example.com", DnsRecordType.A)])
+        edges = repository.bulk_create_edges([host_edge("example.com", "10.0.0.1")])
+
+        assert_that([hosts.written, discoveries.written, edges.written]).is_equal_to([2, 1, 1])
+
+    def test_should_bulk_upsert_dns_records_and_ports(self, repository: SqliteNetworkTopologyRepository) -> None:
+        records = repository.bulk_upsert_dns_records([dns_record("a.example.com"), dns_record("b.example.com")])
+        ports = repository.bulk_upsert_ports([port(80), port(443)])
+
+        assert_that([records.written, ports.written]).is_equal_to([2, 2])
+        assert_that(repository.get_dns_record("b.example.com")).is_equal_to(dns_record("b.example.com"))
+        assert_that(repository.get_port(443, "TCP")).is_equal_to(port(443))
+
+    def test_should_append_every_scan_to_history(self, scan_history: SqliteNetworkTopologyRepository) -> None:
+        history = scan_history.get_port_scan_history("10.0.0.1")
+
+        assert_that([(item.port_number, item.first_observed_at.hour, item.state) for item in history]).is_equal_to(
+            [
+                (22, 12, PortState.OPEN),
+                (22, 13, PortState.OPEN),
+                (22, 14, PortState.CLOSED),
+                (22, 15, PortState.OPEN),
+                (80, 13, PortState.OPEN),
+            ]
+        )
+        assert_that(scan_history.get_port_scan_results("10.0.0.1")).contains(rescan(22, 0))
+
+    def test_should_answer_state_at_time(self, scan_history: SqliteNetworkTopologyRepository) -> None:
+        at_half_past_one = scan_history.get_port_scan_state_at("10.0.0.1", NOW + timedelta(hours=1.5))
+        at_half_past_two = scan_history.get_port_scan_state_at("10.0.0.1", NOW + timedelta(hours=2.5))
+
+        assert_that([(item.port_number, item.state) for item in at_half_past_one]).is_equal_to(
+            [(22, PortState.OPEN), (80, PortState.OPEN)]
+        )
+        assert_that(at_half_past_two[0].state).is_equal_to(PortState.CLOSED)
+        assert_that(scan_history.get_port_scan_state_at("10.0.0.1", NOW - timedelta(hours=1))).is_empty()
+        assert_that(scan_history.get_port_scan_state_at("10.0.0.3", NOW)).is_empty()
+
+    def test_should_answer_state_at_time_by_instant(self, scan_history: SqliteNetworkTopologyRepository) -> None:
+        at_half_past_two = (NOW + timedelta(hours=2.5)).astimezone(timezone(timedelta(hours=-5)))
+
+        [closed, _] = scan_history.get_port_scan_state_at("10.0.0.1", at_half_past_two)
+
+        assert_that(closed.state).is_equal_to(PortState.CLOSED)
+
+    def test_should_add_epoch_to_existing_history(self, database: str) -> None:
+        observation = PortScanObservation.from_result(rescan(22, 0))
+        connection = sqlite3.connect(database)
+        connection.execute(
+            "CREATE TABLE port_scan_history (target_ip TEXT NOT NULL, port_number INTEGER NOT NULL, "
+            "protocol TEXT NOT NULL, first_observed_at TEXT NOT NULL, document TEXT NOT NULL, "
+            "PRIMARY KEY (target_ip, port_number, protocol, first_observed_at)) WITHOUT ROWID"
+        )
+        connection.execute(
+            "INSERT INTO port_scan_history VALUES (?, ?, ?, ?, ?)",
+            ("10.0.0.1", 22, "TCP", NOW.isoformat(), observation.model_dump_json()),
+        )
+        connection.commit()
+        connection.close()
+
+        repository = SqliteNetworkTopologyRepository(database)
+
+        assert_that(repository.get_port_scan_state_at("10.0.0.1", NOW)).is_equal_to([observation])
+        repository.close()
+
+    def test_should_compact_runs_of_identical_observations(self, scan_history: SqliteNetworkTopologyRepository) -> None:
+        result = scan_history.compact_port_scan_history()
+
+        [interval, *_] = scan_history.get_port_scan_state_at("10.0.0.1", NOW + timedelta(hours=1.5))
+        assert_that((result.rewritten, result.removed)).is_equal_to((1, 1))
+        assert_that(scan_history.get_port_scan_history("10.0.0.1")).is_length(4)
+        assert_that((interval.first_observed_at, interval.last_observed_at)).is_equal_to((NOW, LATER))
+        assert_that(interval.observations).is_equal_to(2)
+        assert_that(scan_history.compact_port_scan_history().removed).is_equal_to(0)
+
+    def test_should_replace_vertex_on_update(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(dns_record("example.com"))
+        repository.create_or_update_dns_record(dns_record("example.com", LATER))
+
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(dns_record("example.com", LATER))
+
+    def test_should_upsert_edge_by_key(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_edge(port_edge("example.com", 443))
+        repository.create_edge(port_edge("example.com", 443, last_seen_at=LATER))
+
+        edges = repository.list_edges("domain_to_port").items
+
+        assert_that(edges).is_length(1)
+        assert_that(edges[0].created_at).is_equal_to(NOW)
+        assert_that(edges[0].last_seen_at).is_equal_to(LATER)
+        assert_that(edges[0].metadata).is_equal_to({"seen": LATER.isoformat()})
+
+    def test_should_default_last_seen_to_created_at(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_edge(host_edge("example.com", "10.0.0.1"))
+
+        assert_that(repository.list_edges("dns_resolves_to_host").items[0].last_seen_at).is_equal_to(NOW)
+
+    def test_should_link_domain_ports_touching_existing_vertices(
+        self, repository: SqliteNetworkTopologyRepository
+    ) -> None:
+        repository.create_or_update_port(
+            Port(port_number=443, protocol="TCP", service_name="https", created_at=NOW, updated_at=NOW)
+        )
+        link = DomainPortLink(
+            dns_record=dns_record("example.com", LATER), port=port(443, LATER), edge=port_edge("example.com", 443)
+        )
+
+        edges = repository.link_domain_ports([link])
+
+        assert_that(edges).is_equal_to([link.edge])
+        assert_that(repository.get_dns_record("example.com")).is_equal_to(dns_record("example.com", LATER))
+        assert_that(repository.get_port(443, "TCP").service_name).is_equal_to("https")
+        assert_that(repository.get_port(443, "TCP").updated_at).is_equal_to(LATER)
+
+    def test_should_create_edge_between_existing_vertices(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(dns_record("example.com"))
+        repository.create_or_update_host(host("10.0.0.1"))
+
+        repository.create_edge_between_existing_vertices(host_edge("example.com", "10.0.0.1"))
+
+        assert_that(repository.list_edges("dns_resolves_to_host").items).is_length(1)
+
+    def test_should_reject_edge_from_missing_source(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_host(host("10.0.0.1"))
+
+        with pytest.raises(VertexNotFoundError, match="DNS record 'example.com' not found"):
+            repository.create_edge_between_existing_vertices(host_edge("example.com", "10.0.0.1"))
+
+    def test_should_reject_edge_to_missing_target(self, repository: SqliteNetworkTopologyRepository) -> None:
+        repository.create_or_update_dns_record(dns_record("example.com"))
+
+        with pytest.raises(VertexNotFoundError, match="Host with IP '10.0.0.1' not found"):
+            repository.create_edge_between_existing_vertices(host_edge("example.com", "10.0.0.1"))
+
+        assert_that(repository.list_edges("dns_resolves_to_host").items).is_empty()
+
+    def test_should_page_every_collection(self, topology: SqliteNetworkTopologyRepository) -> None:
+        topology.create_or_update_dns_record_discovery(discovery("example.com", DnsRecordType.A))
+        topology.create_or_update_port_scan_result(scan_result("10.0.0.1", 22))
+
+        first = topology.list_dns_records(page_size=1)
+        second = topology.list_dns_records(page_size=1, page_token=first.next_page_token)
+
+        assert_that([record.domain_name for record in first.items + second.items]).is_equal_to(
+            ["a.example.com", "b.example.com"]
+        )
+        assert_that(second.next_page_token).is_none()
+        assert_that(topology.list_ports().items).is_length(1)
+        assert_that(topology.list_hosts().items).is_length(2)
+        assert_that(topology.list_dns_record_discoveries().items).is_length(1)
+        assert_that(topology.list_port_scan_results().items).is_length(1)
+
+    def test_should_find_outbound_neighbors(self, topology: SqliteNetworkTopologyRepository) -> None:
+        neighbors = topology.neighbors(vertex("dns_record:a.example.com"))
+
+        assert_that([str(neighbor.vertex) for neighbor in neighbors]).contains_only("host:10.0.0.1", "port:443_TCP")
+        assert_that(neighbors[0].attributes).contains_key("created_at")
+
+    def test_should_find_neighbors_beyond_first_hop(self, topology: SqliteNetworkTopologyRepository) -> None:
+        neighbors = topology.neighbors(vertex("host:10.0.0.2"), depth=3, direction=TraversalDirection.ANY)
+
+        assert_that([(str(neighbor.vertex), neighbor.depth) for neighbor in neighbors]).is_equal_to(
+            [
+                ("dns_record:b.example.com", 1),
+                ("host:10.0.0.1", 2),
+                ("dns_record:a.example.com", 3),
+            ]
+        )
+
+    def test_should_filter_neighbors_by_edge_type_and_direction(
+        self, topology: SqliteNetworkTopologyRepository
+    ) -> None:
+        inbound = topology.neighbors(vertex("host:10.0.0.1"), direction=TraversalDirection.INBOUND)
+        ports_only = topology.neighbors(vertex("dns_record:a.example.com"), edge_types=["domain_to_port"])
+
+        assert_that([str(neighbor.vertex) for neighbor in inbound]).contains_only(
+            "dns_record:a.example.com", "dns_record:b.example.com"
+        )
+        assert_that([str(neighbor.vertex) for neighbor in ports_only]).is_equal_to(["port:443_TCP"])
+
+    def test_should_limit_neighbors(self, topology: SqliteNetworkTopologyRepository) -> None:
+        assert_that(topology.neighbors(vertex("dns_record:b.example.com"), limit=1)).is_length(1)
+
+    def test_should_skip_edges_to_missing_vertices(self, topology: SqliteNetworkTopologyRepository) -> None:
+        topology.create_edge(host_edge("a.example.com", "10.0.0.9"))
+
+        neighbors = topology.neighbors(vertex("dns_record:a.example.com"), edge_types=["dns_resolves_to_host"])
+
+        assert_that([str(neighbor.vertex) for neighbor in neighbors]).is_equal_to(["host:10.0.0.1"])
+
+    def test_should_return_no_neighbors_for_missing_vertex(self, topology: SqliteNetworkTopologyRepository) -> None:
+        assert_that(topology.neighbors(vertex("dns_record:missing.com"))).is_empty()
+
+    def test_should_reject_invalid_traversal_arguments(self, topology: SqliteNetworkTopologyRepository) -> None:
+        with pytest.raises(ValueError):
+            topology.neighbors(vertex("host:10.0.0.1"), depth=0)
+
+        with pytest.raises(ValueError):
+            topology.neighbors(vertex("host:10.0.0.1"), limit=0)
+
+        with pytest.raises(ValueError):
+            topology.neighbors(vertex("host:10.0.0.1"), edge_types=["unknown"])
+
+    def test_should_find_shortest_path(self, topology: SqliteNetworkTopologyRepository) -> None:
+        path = topology.shortest_path(vertex("port:443_TCP"), vertex("host:10.0.0.2"))
+
+        assert_that(path).is_not_none()
+        assert_that([str(reference) for reference in path.vertices]).is_equal_to(  # type: ignore[union-attr]
+            [
+                "port:443_TCP",
+                "dns_record:a.example.com",
+                "host:10.0.0.1",
+                "dns_record:b.example.com",
+                "host:10.0.0.2",
+            ]
+        )
+        assert_that(path.length).is_equal_to(4)  # type: ignore[union-attr]
+
+    def test_should_not_find_path_beyond_max_depth(self, topology: SqliteNetworkTopologyRepository) -> None:
+        assert_that(topology.shortest_path(vertex("port:443_TCP"), vertex("host:10.0.0.2"), max_depth=3)).is_none()
+
+    def test_should_not_find_path_against_edge_direction(self, topology: SqliteNetworkTopologyRepository) -> None:
+        path = topology.shortest_path(
+            vertex("host:10.0.0.1"), vertex("dns_record:a.example.com"), direction=TraversalDirection.OUTBOUND
+        )
+
+        assert_that(path).is_none()
+
+    def test_should_return_single_vertex_path_to_itself(self, topology: SqliteNetworkTopologyRepository) -> None:
+        path = topology.shortest_path(vertex("host:10.0.0.1"), vertex("host:10.0.0.1"))
+
+        assert_that(path.vertices).is_equal_to([vertex("host:10.0.0.1")])  # type: ignore[union-attr]
+        assert_that(path.edges).is_empty()  # type: ignore[union-attr]
+
+    def test_should_not_find_path_from_missing_vertex(self, topology: SqliteNetworkTopologyRepository) -> None:
+        assert_that(topology.shortest_path(vertex("host:10.0.0.9"), vertex("host:10.0.0.9"))).is_none()
+
+    def test_should_accept_concurrent_writes(self, repository: SqliteNetworkTopologyRepository) -> None:
+        def write(offset: int) -> None:
+            for port_number in range(offset, offset + 100):
+                repository.create_or_update_port(port(port_number))
+
+        threads = [threading.Thread(target=write, args=(offset,)) for offset in range(1, 801, 100)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert_that(repository.list_ports(page_size=1000).items).is_length(800)
@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+from assertpy import assert_that
+
+from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+    ArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.sqlite.sqlite_network_topology_repository import (
+    SqliteNetworkTopologyRepository,
+)
+
+ListEdges = Callable[[str], Any]
+
+
+def in_memory(tmp_path: Path) -> Iterator[ListEdges]:
+    yield InMemoryNetworkTopologyRepository().list_edges
+
+
+def sqlite(tmp_path: Path) -> Iterator[ListEdges]:
+    repository = SqliteNetworkTopologyRepository(str(tmp_path / "topology.sqlite3"))
+    yield repository.list_edges
+    repository.close()
+
+
+def arango(tmp_path: Path) -> Iterator[ListEdges]:
+    with patch(
+        "via_node.infrastructure.persistence.arango.arango_network_topology_repository.ArangoClient"
+    ) as mock_client_class:
+        repository = ArangoNetworkTopologyRepository(
+            host="localhost", port="8083", database="test_db", username="root", password="", graph_name="test_graph"
+        )
+        yield repository.list_edges
+
+    assert_that(mock_client_class.return_value.db.return_value.aql.execute.called).is_false()
+
+
+def async_arango(tmp_path: Path) -> Iterator[ListEdges]:
+    repository = AsyncArangoNetworkTopologyRepository(
+        host="localhost",
+        port="8083",
+        database="test_db",
+        username="root",
+        password="",
+        transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+    )
+    yield lambda edge_type: asyncio.run(repository.list_edges(edge_type))
+
+
+@pytest.fixture(params=[in_memory, sqlite, arango, async_arango])
+def list_edges(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[ListEdges]:
+    yield from request.param(tmp_path)
+
+
+class TestEdgeTypeValidation:
+    def test_should_reject_unknown_edge_type_before_reading(self, list_edges: ListEdges) -> None:
+        with pytest.raises(ValueError, match="Edge type must be one of"):
+            list_edges("peers_with")
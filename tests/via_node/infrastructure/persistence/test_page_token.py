@@ -0,0 +1,39 @@
+import base64
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.page import InvalidPageTokenError
+from via_node.infrastructure.persistence.page_token import decode_page_token, encode_page_token, validate_page_size
+
+
+class TestPageToken:
+    def test_should_round_trip_last_key(self) -> None:
+        token = encode_page_token("ports", "443_TCP")
+
+        assert_that(decode_page_token("ports", token)).is_equal_to("443_TCP")
+
+    def test_should_produce_url_safe_token(self) -> None:
+        token = encode_page_token("hosts", "fe80::1/??>>")
+
+        assert_that(token).matches(r"^[A-Za-z0-9_-]+$")
+
+    def test_should_reject_token_from_another_collection(self) -> None:
+        token = encode_page_token("ports", "443_TCP")
+
+        with pytest.raises(InvalidPageTokenError, match="does not belong to hosts"):
+            decode_page_token("hosts", token)
+
+    def test_should_reject_malformed_token(self) -> None:
+        with pytest.raises(InvalidPageTokenError, match="malformed"):
+            decode_page_token("ports", "not a token")
+
+    def test_should_reject_token_without_key(self) -> None:
+        token = base64.urlsafe_b64encode(b'{"c":"ports"}').decode("ascii")
+
+        with pytest.raises(InvalidPageTokenError):
+            decode_page_token("ports", token)
+
+    def test_should_reject_page_size_below_one(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            validate_page_size(0)
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import pytest
+from assertpy import assert_that
+
+from via_node.domain.model.port import Port
+from via_node.infrastructure.persistence.projection import project, projected_fields
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def port() -> Port:
+    return Port(port_number=22, protocol="TCP", service_name=None, created_at=NOW, updated_at=NOW)
+
+
+class TestProjection:
+    def test_should_keep_only_requested_fields(self) -> None:
+        model = port()
+
+        assert_that(project(model, ["port_number"]).model_dump(exclude_unset=True)).is_equal_to({"port_number": 22})
+
+    def test_should_return_model_when_no_fields_are_requested(self) -> None:
+        model = port()
+
+        assert_that(project(model, None)).is_same_as(model)
+
+    def test_should_accept_model_fields(self) -> None:
+        assert_that(projected_fields(Port, ["protocol"])).is_equal_to(["protocol"])
+
+    def test_should_reject_unknown_fields(self) -> None:
+        with pytest.raises(ValueError, match=r"Invalid projected field\(s\) \['limit'\]"):
+            project(port(), ["port_number", "limit"])
@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from assertpy import assert_that
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from via_node.application.use_case.exposure_statistics_use_case import AsyncExposureStatisticsUseCase
+from via_node.domain.model.dns_record_discovery import DnsRecordType
+from via_node.domain.model.exposure_statistics import (
+    DomainRecordTypes,
+    ExposureStatistics,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.interface.api.controller.exposure_statistics_controller import (
+    ExposureStatisticsController,
+    create_exposure_statistics_controller,
+)
+
+
+class TestExposureStatisticsController:
+    @pytest.fixture
+    def use_case(self) -> AsyncMock:
+        return AsyncMock(spec=AsyncExposureStatisticsUseCase)
+
+    @pytest.fixture
+    def client(self, use_case: AsyncMock) -> TestClient:
+        app = FastAPI()
+        app.include_router(ExposureStatisticsController(statistics_use_case=use_case).router)
+        return TestClient(app)
+
+    def test_should_return_compact_exposure_summaries(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.statistics.return_value = ExposureStatistics(
+            services=[ServiceExposure(service_name="ssh", open_ports=2, hosts=2)],
+            ports=[PortExposure(port_number=22, protocol="tcp", hosts=2)],
+            domains=[DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.A])],
+        )
+
+        response = client.get("/topology/statistics", params={"limit": 5})
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()).is_equal_to(
+            {
+                "services": [{"service_name": "ssh", "open_ports": 2, "hosts": 2}],
+                "ports": [{"port_number": 22, "protocol": "tcp", "hosts": 2}],
+                "domains": [{"domain_name": "example.com", "record_types": ["A"]}],
+            }
+        )
+        use_case.statistics.assert_awaited_once_with(5)
+
+    def test_should_use_default_limit(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.statistics.return_value = ExposureStatistics()
+
+        client.get("/topology/statistics")
+
+        use_case.statistics.assert_awaited_once_with(100)
+
+    def test_should_reject_invalid_limit(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.statistics.side_effect = ValueError("Statistics limit must be at least 1")
+
+        response = client.get("/topology/statistics", params={"limit": 0})
+
+        assert_that(response.status_code).is_equal_to(400)
+        assert_that(response.json()["detail"]).is_equal_to("Statistics limit must be at least 1")
+
+    def test_should_resolve_use_case_from_container(self) -> None:
+        container = MagicMock()
+
+        controller = create_exposure_statistics_controller(container)
+
+        assert_that(controller.statistics_use_case).is_same_as(container.__getitem__.return_value)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import AsyncIterator, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from assertpy import assert_that
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from via_node.application.use_case.topology_change_feed_use_case import AsyncTopologyChangeFeedUseCase
+from via_node.domain.model.topology_change import TopologyChange, TopologyChangeKind
+from via_node.interface.api.controller.topology_change_controller import (
+    HEARTBEAT,
+    TopologyChangeController,
+    create_topology_change_controller,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def change(sequence: int) -> TopologyChange:
+    return TopologyChange(
+        sequence=sequence,
+        kind=TopologyChangeKind.PORT_SCAN_RESULT,
+        key=f"10.0.0.1_tcp_{sequence}",
+        occurred_at=NOW,
+        document={"state": "open"},
+    )
+
+
+def pages(*batches: List[TopologyChange]) -> AsyncMock:
+    return AsyncMock(side_effect=[*batches, *([[]] * 10)])
+
+
+async def take(events: AsyncIterator[str], count: int) -> List[str]:
+    return [await events.__anext__() for _ in range(count)]
+
+
+class TestTopologyChangeController:
+    @pytest.fixture
+    def use_case(self) -> AsyncMock:
+        return AsyncMock(spec=AsyncTopologyChangeFeedUseCase)
+
+    @pytest.fixture
+    def client(self, use_case: AsyncMock) -> TestClient:
+        app = FastAPI()
+        app.include_router(TopologyChangeController(change_feed_use_case=use_case).router)
+        return TestClient(app)
+
+    def test_should_stream_changes_as_server_sent_events(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.changes_after = pages([change(6), change(7)])
+
+        response = client.get("/topology/changes", params={"after": 5, "follow": False})
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.headers["content-type"]).starts_with("text/event-stream")
+        first, second = response.text.strip().split("\n\n")
+        assert_that(first.splitlines()[:2]).is_equal_to(["id: 6", "event: port_scan_result"])
+        assert_that(json.loads(second.splitlines()[2][len("data: ") :])["sequence"]).is_equal_to(7)
+        assert_that(use_case.changes_after.await_args_list[1].args).is_equal_to((7, 1000))
+
+    def test_should_resume_from_last_event_id(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.changes_after = pages()
+
+        client.get("/topology/changes", params={"follow": False}, headers={"Last-Event-ID": "12"})
+
+        use_case.changes_after.assert_awaited_once_with(12, 1000)
+
+    def test_should_start_at_latest_sequence_by_default(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.latest_sequence.return_value = 30
+        use_case.changes_after = pages()
+
+        client.get("/topology/changes", params={"follow": False})
+
+        use_case.changes_after.assert_awaited_once_with(30, 1000)
+
+    def test_should_reject_invalid_position(self, client: TestClient) -> None:
+        assert_that(client.get("/topology/changes", params={"after": -1}).status_code).is_equal_to(400)
+        assert_that(client.get("/topology/changes", headers={"Last-Event-ID": "not-a-number"}).status_code).is_equal_to(
+            400
+        )
+
+    def test_should_poll_and_send_heartbeats_while_following(self, use_case: AsyncMock) -> None:
+        use_case.changes_after = pages([], [], [change(1)])
+        controller = TopologyChangeController(use_case, poll_interval=0.001, heartbeat_interval=0.002)
+
+        events = asyncio.run(take(controller.events(0, follow=True), 2))
+
+        assert_that(events[0]).is_equal_to(HEARTBEAT)
+        assert_that(events[1]).starts_with("id: 1\n")
+
+    def test_should_resolve_use_case_from_container(self) -> None:
+        container = MagicMock()
+
+        controller = create_topology_change_controller(container, poll_interval=2.0, heartbeat_interval=10.0)
+
+        assert_that(controller.change_feed_use_case).is_same_as(container.__getitem__.return_value)
+        assert_that(controller.heartbeat_polls).is_equal_to(5)
@@ -0,0 +1,104 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from assertpy import assert_that
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from via_node.application.use_case.traverse_network_topology_use_case import AsyncTraverseNetworkTopologyUseCase
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.topology_traversal import TraversalPath, TraversalVertex, VertexReference
+from via_node.interface.api.controller.topology_controller import TopologyController, create_topology_controller
+
+PATH = TraversalPath(
+    vertices=[VertexReference.parse("dns_record:example.com"), VertexReference.parse("host:10.0.0.1")],
+    edges=[
+        NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="10.0.0.1",
+            edge_type="dns_resolves_to_host",
+            metadata={},
+            created_at=datetime(2024, 1, 1),
+        )
+    ],
+)
+
+
+class TestTopologyController:
+    @pytest.fixture
+    def use_case(self) -> AsyncMock:
+        return AsyncMock(spec=AsyncTraverseNetworkTopologyUseCase)
+
+    @pytest.fixture
+    def client(self, use_case: AsyncMock) -> TestClient:
+        app = FastAPI()
+        app.include_router(TopologyController(traverse_use_case=use_case).router)
+        return TestClient(app)
+
+    def test_should_return_neighbors(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.neighbors.return_value = [
+            TraversalVertex(vertex=VertexReference.parse("port:443_TCP"), depth=1, attributes={"port_number": 443})
+        ]
+
+        response = client.get("/topology/neighbors", params={"vertex": "dns_record:example.com", "depth": 2})
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()).is_equal_to(
+            {
+                "vertex": "dns_record:example.com",
+                "neighbors": [{"vertex": "port:443_TCP", "depth": 1, "attributes": {"port_number": 443}}],
+            }
+        )
+
+    def test_should_pass_repeated_edge_types(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.neighbors.return_value = []
+
+        client.get(
+            "/topology/neighbors",
+            params={"vertex": "host:10.0.0.1", "direction": "inbound", "edge_type": ["dns_resolves_to_host"]},
+        )
+
+        use_case.neighbors.assert_awaited_once_with("host:10.0.0.1", 1, "inbound", ["dns_resolves_to_host"], 1000)
+
+    def test_should_reject_invalid_neighbors_request(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.neighbors.side_effect = ValueError("Traversal depth must be between 1 and 10")
+
+        response = client.get("/topology/neighbors", params={"vertex": "dns_record:example.com", "depth": 50})
+
+        assert_that(response.status_code).is_equal_to(400)
+        assert_that(response.json()["detail"]).contains("Traversal depth")
+
+    def test_should_return_path(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.shortest_path.return_value = PATH
+
+        response = client.get("/topology/path", params={"source": "dns_record:example.com", "target": "host:10.0.0.1"})
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()["length"]).is_equal_to(1)
+        assert_that(response.json()["vertices"]).is_equal_to(["dns_record:example.com", "host:10.0.0.1"])
+        assert_that(response.json()["edges"][0]["edge_type"]).is_equal_to("dns_resolves_to_host")
+
+    def test_should_return_not_found_when_unreachable(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.shortest_path.return_value = None
+
+        response = client.get(
+            "/topology/path", params={"source": "port:443_TCP", "target": "host:10.0.0.1", "max_depth": 2}
+        )
+
+        assert_that(response.status_code).is_equal_to(404)
+        assert_that(response.json()["detail"]).contains("within 2 hops")
+
+    def test_should_reject_invalid_path_request(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.shortest_path.side_effect = ValueError("Vertex kind must be one of")
+
+        response = client.get("/topology/path", params={"source": "router:a", "target": "host:10.0.0.1"})
+
+        assert_that(response.status_code).is_equal_to(400)
+
+    def test_should_resolve_use_case_from_container(self) -> None:
+        container = MagicMock()
+
+        controller = create_topology_controller(container)
+
+        assert_that(controller.traverse_use_case).is_same_as(container.__getitem__.return_value)
@@ -0,0 +1,78 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from assertpy import assert_that
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from via_node.application.use_case.query_network_topology_use_case import AsyncQueryNetworkTopologyUseCase
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.interface.api.controller.topology_query_controller import (
+    TopologyQueryController,
+    create_topology_query_controller,
+)
+
+SCANNED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class TestTopologyQueryController:
+    @pytest.fixture
+    def use_case(self) -> AsyncMock:
+        return AsyncMock(spec=AsyncQueryNetworkTopologyUseCase)
+
+    @pytest.fixture
+    def client(self, use_case: AsyncMock) -> TestClient:
+        app = FastAPI()
+        app.include_router(TopologyQueryController(query_use_case=use_case).router)
+        return TestClient(app)
+
+    def test_should_return_only_requested_port_scan_result_fields(
+        self, client: TestClient, use_case: AsyncMock
+    ) -> None:
+        use_case.port_scan_results.return_value = [PortScanResult.model_construct(port_number=22, state=PortState.OPEN)]
+
+        response = client.get(
+            "/topology/port-scan-results", params={"target_ip": "10.0.0.1", "fields": ["port_number", "state"]}
+        )
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()).is_equal_to({"count": 1, "items": [{"port_number": 22, "state": "open"}]})
+        use_case.port_scan_results.assert_awaited_once_with("10.0.0.1", ["port_number", "state"])
+
+    def test_should_return_whole_dns_discoveries_without_fields(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.dns_record_discoveries.return_value = [
+            DnsRecordDiscovery(
+                domain_name="example.com", record_type=DnsRecordType.A, values=["10.0.0.1"], discovered_at=SCANNED_AT
+            )
+        ]
+
+        response = client.get("/topology/dns-discoveries", params={"domain_name": "example.com"})
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()["items"][0]).contains_entry(
+            {"record_type": "A"}, {"values": ["10.0.0.1"]}, {"discovered_at": "2024-01-01T12:00:00"}
+        )
+
+    def test_should_reject_unknown_fields(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.port_scan_results.side_effect = ValueError("Unknown field(s) ['_rev']")
+
+        response = client.get("/topology/port-scan-results", params={"target_ip": "10.0.0.1", "fields": ["_rev"]})
+
+        assert_that(response.status_code).is_equal_to(400)
+        assert_that(response.json()["detail"]).contains("Unknown field(s)")
+
+    def test_should_reject_invalid_dns_discoveries_request(self, client: TestClient, use_case: AsyncMock) -> None:
+        use_case.dns_record_discoveries.side_effect = ValueError("Domain name cannot be empty")
+
+        response = client.get("/topology/dns-discoveries", params={"domain_name": " "})
+
+        assert_that(response.status_code).is_equal_to(400)
+
+    def test_should_resolve_use_case_from_container(self) -> None:
+        container = MagicMock()
+
+        controller = create_topology_query_controller(container)
+
+        assert_that(controller.query_use_case).is_same_as(container.__getitem__.return_value)
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import os
 import json
@@ -6,7 +7,25 @@ from assertpy import assert_that
 from fastapi.openapi.utils import get_openapi
 from unittest.mock import patch, Mock
 
+from via_node.domain.repository.async_network_topology_repository import AsyncNetworkTopologyRepository
+from via_node.infrastructure.persistence.arango.async_arango_network_topology_repository import (
+    AsyncArangoNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.arango.coordinator_transport import CoordinatorTransport
+from via_node.infrastructure.persistence.decorator.threaded_async_network_topology_repository import (
+    ThreadedAsyncNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.sqlite.sqlite_network_topology_repository import (
+    SqliteNetworkTopologyRepository,
+)
+from via_node.domain.service.topology_change_feed import TopologyChangeReader
+from via_node.infrastructure.change_feed.jsonl_change_log import JsonlChangeLog
 from via_node.interface.api.main import app, get_container, global_container, get_global_container, main, run
+from via_node.interface.api.main import create_async_network_topology_repository, lifespan
+from via_node.shared.configuration import ApplicationSettings
 
 OPENAPI_JSON_FILE_PATH = "build/openapi.json"
 OPENAPI_JSON_FILE_PATH_OPEN_FLAG = "w"
@@ -68,6 +87,74 @@ class TestMainApp:
 
         assert_that(paths.get("/coconut/{id}", {})).contains("get")
 
+    def test_should_have_topology_changes_route(self):
+        paths = app.openapi().get("paths", {})
+
+        assert_that(paths.get("/topology/changes", {})).contains("get")
+
+    def test_should_register_change_log_reader(self):
+        container = get_container()
+
+        assert_that(container[TopologyChangeReader]).is_instance_of(JsonlChangeLog)
+
+    def test_should_register_async_network_topology_repository(self):
+        container = get_container()
+
+        assert_that(container[AsyncNetworkTopologyRepository]).is_instance_of(AsyncArangoNetworkTopologyRepository)
+
+    def test_should_serve_in_memory_repository_when_selected(self):
+        repository = create_async_network_topology_repository(ApplicationSettings(repository_backend="memory"))
+
+        assert_that(repository).is_instance_of(ThreadedAsyncNetworkTopologyRepository)
+        assert_that(repository.repository).is_instance_of(InMemoryNetworkTopologyRepository)
+
+    def test_should_serve_sqlite_repository_when_selected(self, tmp_path):
+        settings = ApplicationSettings(repository_backend="sqlite", sqlite_path=str(tmp_path / "topology.sqlite3"))
+
+        repository = create_async_network_topology_repository(settings)
+
+        assert_that(repository.repository).is_instance_of(SqliteNetworkTopologyRepository)
+        asyncio.run(repository.aclose())
+
+    def test_should_configure_async_repository_connection_limits_from_settings(self):
+        settings = ApplicationSettings(arango_async_max_connections=250, arango_async_max_keepalive_connections=50)
+
+        repository = create_async_network_topology_repository(settings)
+
+        pool = repository._client._transport._pool
+        assert_that(pool._max_connections).is_equal_to(250)
+        assert_that(pool._max_keepalive_connections).is_equal_to(50)
+
+    def test_should_configure_async_repository_discovery_expiry_from_settings(self):
+        settings = ApplicationSettings(arango_discovery_ttl_multiplier=3.0, arango_hide_expired_discoveries=True)
+
+        repository = create_async_network_topology_repository(settings)
+
+        assert_that(repository._discovery_ttl_multiplier).is_equal_to(3.0)
+        assert_that(repository._live_discovery_filter).contains("doc.expires_at")
+
+    def test_should_balance_async_repository_across_configured_coordinators(self):
+        settings = ApplicationSettings(arango_endpoints="coordinator-1:8529,coordinator-2:8529")
+
+        repository = create_async_network_topology_repository(settings)
+
+        assert_that(repository._client._transport).is_instance_of(CoordinatorTransport)
+        assert_that(repository._client._transport._hosts).is_equal_to(
+            ["http://coordinator-1:8529", "http://coordinator-2:8529"]
+        )
+
+    def test_should_close_async_repository_on_shutdown(self):
+        repository = Mock(spec=AsyncNetworkTopologyRepository)
+
+        async def run_lifespan():
+            async with lifespan(app):
+                pass
+
+        with patch("via_node.interface.api.main.global_container", {AsyncNetworkTopologyRepository: repository}):
+            asyncio.run(run_lifespan())
+
+        repository.aclose.assert_awaited_once()
+
     def test_should_get_global_container(self):
         container = get_global_container()
 
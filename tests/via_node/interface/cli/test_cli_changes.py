@@ -0,0 +1,54 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.domain.model.topology_change import TopologyChange, TopologyChangeKind
+from via_node.interface.cli.main import cli
+
+
+def use_case(mock_create_container: MagicMock) -> MagicMock:
+    mock_use_case = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_use_case
+    return mock_use_case
+
+
+class TestCliChanges:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_changes_after_sequence(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.changes_after.return_value = [
+            TopologyChange(
+                sequence=43,
+                kind=TopologyChangeKind.PORT_SCAN_RESULT,
+                key="10.0.0.1_tcp_22",
+                occurred_at=datetime(2024, 1, 1),
+                document={},
+            )
+        ]
+
+        result = CliRunner().invoke(cli, ["changes", "--after", "42", "--limit", "10"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Found 1 change(s) after sequence 42")
+        assert_that(result.output).contains("  [43] created port_scan_result 10.0.0.1_tcp_22")
+        mock_use_case.changes_after.assert_called_once_with(42, 10)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_invalid_sequence(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).changes_after.side_effect = ValueError("Sequence must not be negative")
+
+        result = CliRunner().invoke(cli, ["changes", "--after", "-1"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Sequence must not be negative")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unexpected_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).changes_after.side_effect = Exception("Permission denied")
+
+        result = CliRunner().invoke(cli, ["changes"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Error: Permission denied")
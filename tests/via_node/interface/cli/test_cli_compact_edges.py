@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.infrastructure.persistence.arango.arango_edge_compactor import EdgeCompactionResult
+from via_node.interface.cli.main import cli
+
+
+class TestCliCompactEdges:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_compaction_per_collection(self, mock_create_container: MagicMock) -> None:
+        mock_repository = MagicMock()
+        mock_repository.compact_edges.return_value = [
+            EdgeCompactionResult(collection_name="domain_port_edges", rewritten=3, removed=5),
+            EdgeCompactionResult(collection_name="dns_resolves_to_host_edges"),
+        ]
+        mock_create_container.return_value.__getitem__.return_value = mock_repository
+
+        result = CliRunner().invoke(cli, ["compact-edges"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("domain_port_edges: rewrote 3 edge(s), removed 5 duplicate(s)")
+        assert_that(result.output).contains("dns_resolves_to_host_edges: rewrote 0 edge(s), removed 0 duplicate(s)")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_compaction_fails(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["compact-edges"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("connection refused")
@@ -5,6 +5,7 @@ from click.testing import CliRunner
 from assertpy import assert_that
 
 from via_node.interface.cli.main import cli
+from via_node.domain.model.bulk_write_result import BulkWriteFailedError
 from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
 
 
@@ -362,6 +363,18 @@ class TestScanPortsCommand:
 
             assert_that(result.exit_code).is_equal_to(0)
 
+    def test_scan_ports_exits_non_zero_when_results_fail_to_store(self) -> None:
+        runner = CliRunner()
+
+        with patch("via_node.interface.cli.main.create_container") as mock_container_factory:
+            mock_use_case = mock_container_factory.return_value.__getitem__.return_value
+            mock_use_case.execute.side_effect = BulkWriteFailedError("Stored 0 of 1 document(s), failed 1: conflict")
+
+            result = runner.invoke(cli, ["scan-ports", "-t", "192.168.1.1"])
+
+            assert_that(result.exit_code).is_not_equal_to(0)
+            assert_that(result.output).contains("✗ Error: Stored 0 of 1 document(s), failed 1: conflict")
+
     def test_scan_ports_with_ports_option(self) -> None:
         runner = CliRunner()
 
@@ -0,0 +1,83 @@
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.infrastructure.persistence.arango.arango_graph_dump import (
+    DumpedCollection,
+    GraphDumpManifest,
+    RestoreResult,
+)
+from via_node.interface.cli.main import cli
+
+MANIFEST = GraphDumpManifest(
+    graph_name="network_graph",
+    compression="gzip",
+    created_at=datetime(2024, 1, 1),
+    collections=[
+        DumpedCollection(name="ports", edge=False, file="ports.jsonl.gz", count=3, sha256="a" * 64),
+        DumpedCollection(name="hosts", edge=False, file="hosts.jsonl.gz", count=2, sha256="b" * 64),
+    ],
+)
+
+
+def repository(mock_create_container: MagicMock) -> MagicMock:
+    mock_repository = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_repository
+    return mock_repository
+
+
+class TestCliDump:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_dump_manifest(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        mock_repository = repository(mock_create_container)
+        mock_repository.dump_graph.return_value = MANIFEST
+
+        result = CliRunner().invoke(cli, ["dump", "--output", str(tmp_path), "--compression", "ZSTD"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains(f"✓ Dumped 5 document(s) from 2 collection(s) to {tmp_path}")
+        assert_that(result.output).contains("ports: 3 (sha256 aaaaaaaaaaaa)")
+        mock_repository.dump_graph.assert_called_once_with(str(tmp_path), "zstd")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_dump_fails(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        repository(mock_create_container).dump_graph.side_effect = ValueError("requires the 'zstandard' package")
+
+        result = CliRunner().invoke(cli, ["dump", "-o", str(tmp_path)])
+
+        assert_that(result.exit_code).is_equal_to(1)
+        assert_that(result.output).contains("✗ Error: requires the 'zstandard' package")
+
+
+class TestCliRestore:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_restore_results(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        mock_repository = repository(mock_create_container)
+        mock_repository.restore_graph.return_value = [
+            RestoreResult(collection_name="ports", expected=3, imported=3),
+            RestoreResult(collection_name="hosts", expected=2, imported=1, errors=1),
+        ]
+
+        result = CliRunner().invoke(cli, ["restore", "--input", str(tmp_path), "--parallelism", "2"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains(f"✓ Restored 4 document(s) from {tmp_path}")
+        assert_that(result.output).contains("ports: 3/3\n", "hosts: 1/2, 1 error(s)")
+        mock_repository.restore_graph.assert_called_once_with(str(tmp_path), 2)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_restore_fails(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        repository(mock_create_container).restore_graph.side_effect = ValueError("Checksum mismatch")
+
+        result = CliRunner().invoke(cli, ["restore", "-i", str(tmp_path)])
+
+        assert_that(result.exit_code).is_equal_to(1)
+        assert_that(result.output).contains("✗ Error: Checksum mismatch")
+
+    def test_should_require_existing_input_directory(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["restore", "-i", str(tmp_path / "missing")])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
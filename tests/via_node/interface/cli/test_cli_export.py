@@ -0,0 +1,62 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.infrastructure.export.columnar_snapshot_writer import ColumnarSnapshotWriter
+from via_node.interface.cli.main import cli
+
+
+def use_case(mock_create_container: MagicMock) -> MagicMock:
+    mock_use_case = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_use_case
+    return mock_use_case
+
+
+class TestCliExport:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_export_columnar_snapshot(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.execute.return_value = {"ports": 2, "hosts": 1}
+
+        result = CliRunner().invoke(cli, ["export", "--format", "columnar", "--output", str(tmp_path)])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains(f"✓ Exported 3 document(s) to {tmp_path}")
+        assert_that(result.output).contains("ports: 2")
+        writer, page_size = mock_use_case.execute.call_args.args
+        assert_that(writer).is_instance_of(ColumnarSnapshotWriter)
+        assert_that(page_size).is_equal_to(1000)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_pass_page_size(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.execute.return_value = {}
+
+        CliRunner().invoke(cli, ["export", "-o", str(tmp_path), "--page-size", "50"])
+
+        assert_that(mock_use_case.execute.call_args.args[1]).is_equal_to(50)
+
+    def test_should_reject_unknown_format(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["export", "--format", "xml", "-o", str(tmp_path)])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_validation_error(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        use_case(mock_create_container).execute.side_effect = ValueError("Page size must be at least 1")
+
+        result = CliRunner().invoke(cli, ["export", "-o", str(tmp_path), "--page-size", "0"])
+
+        assert_that(result.exit_code).is_equal_to(1)
+        assert_that(result.output).contains("✗ Validation error: Page size must be at least 1")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_error(self, mock_create_container: MagicMock, tmp_path: Path) -> None:
+        use_case(mock_create_container).execute.side_effect = RuntimeError("Connection refused")
+
+        result = CliRunner().invoke(cli, ["export", "-o", str(tmp_path)])
+
+        assert_that(result.exit_code).is_equal_to(1)
+        assert_that(result.output).contains("✗ Error: Connection refused")
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.interface.cli.main import cli
+
+
+class TestCliMigrate:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_applied_migrations(self, mock_create_container: MagicMock) -> None:
+        mock_repository = MagicMock()
+        mock_repository.migrate_schema.return_value = [1, 2]
+        mock_repository.schema_version.return_value = 2
+        mock_create_container.return_value.__getitem__.return_value = mock_repository
+
+        result = CliRunner().invoke(cli, ["migrate"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Applied migration(s) 1, 2; schema is at version 2")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_up_to_date_schema(self, mock_create_container: MagicMock) -> None:
+        mock_repository = MagicMock()
+        mock_repository.migrate_schema.return_value = []
+        mock_repository.schema_version.return_value = 1
+        mock_create_container.return_value.__getitem__.return_value = mock_repository
+
+        result = CliRunner().invoke(cli, ["migrate"])
+
+        assert_that(result.output).contains("Schema is up to date at version 1")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_migration_fails(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["migrate"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("connection refused")
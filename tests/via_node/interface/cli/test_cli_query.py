@@ -0,0 +1,98 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.domain.model.dns_record_discovery import DnsRecordDiscovery, DnsRecordType
+from via_node.domain.model.port_scan_result import PortScanResult, PortState
+from via_node.interface.cli.main import cli
+
+
+def use_case(mock_create_container: MagicMock) -> MagicMock:
+    mock_use_case = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_use_case
+    return mock_use_case
+
+
+class TestCliQueryPorts:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_only_selected_fields(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.port_scan_results.return_value = [
+            PortScanResult.model_construct(port_number=22, state=PortState.OPEN)
+        ]
+
+        result = CliRunner().invoke(cli, ["query", "ports", "10.0.0.1", "--fields", "port_number, state"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Found 1 port scan result(s) for 10.0.0.1")
+        assert_that(result.output).contains("  port_number=22 state=open")
+        mock_use_case.port_scan_results.assert_called_once_with("10.0.0.1", ["port_number", "state"])
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_every_field_by_default(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).port_scan_results.return_value = [
+            PortScanResult(
+                target_ip="10.0.0.1",
+                port_number=443,
+                protocol="tcp",
+                state=PortState.OPEN,
+                scanned_at=datetime(2024, 1, 1),
+            )
+        ]
+
+        result = CliRunner().invoke(cli, ["query", "ports", "10.0.0.1"])
+
+        assert_that(result.output).contains("target_ip=10.0.0.1 port_number=443 protocol=tcp state=open")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unknown_fields(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).port_scan_results.side_effect = ValueError("Unknown field(s) ['_rev']")
+
+        result = CliRunner().invoke(cli, ["query", "ports", "10.0.0.1", "-f", "_rev"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Unknown field(s)")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unexpected_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).port_scan_results.side_effect = Exception("Database unavailable")
+
+        result = CliRunner().invoke(cli, ["query", "ports", "10.0.0.1"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Error: Database unavailable")
+
+
+class TestCliQueryDns:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_selected_discovery_fields(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.dns_record_discoveries.return_value = [
+            DnsRecordDiscovery.model_construct(record_type=DnsRecordType.MX, values=["mx.example.com"])
+        ]
+
+        result = CliRunner().invoke(cli, ["query", "dns", "example.com", "-f", "record_type,values"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Found 1 DNS discovery(ies) for example.com")
+        assert_that(result.output).contains("record_type=MX values=['mx.example.com']")
+        mock_use_case.dns_record_discoveries.assert_called_once_with("example.com", ["record_type", "values"])
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_validation_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).dns_record_discoveries.side_effect = ValueError("Domain name cannot be empty")
+
+        result = CliRunner().invoke(cli, ["query", "dns", " "])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Domain name cannot be empty")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unexpected_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).dns_record_discoveries.side_effect = Exception("Database unavailable")
+
+        result = CliRunner().invoke(cli, ["query", "dns", "example.com"])
+
+        assert_that(result.output).contains("Error: Database unavailable")
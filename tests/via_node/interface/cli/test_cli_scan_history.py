@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.domain.model.port_scan_observation import PortScanObservation, ScanHistoryCompactionResult
+from via_node.domain.model.port_scan_result import PortState
+from via_node.interface.cli.main import cli
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+OBSERVATION = PortScanObservation(
+    target_ip="10.0.0.1",
+    port_number=22,
+    protocol="tcp",
+    state=PortState.OPEN,
+    service_name="ssh",
+    first_observed_at=NOW,
+    last_observed_at=NOW + timedelta(hours=1),
+    observations=2,
+)
+
+
+class TestCliScanHistory:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_history(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = MagicMock()
+        mock_use_case.history.return_value = [OBSERVATION]
+        mock_create_container.return_value.__getitem__.return_value = mock_use_case
+
+        result = CliRunner().invoke(cli, ["scan-history", "show", "10.0.0.1"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("1 observation(s) in the history of 10.0.0.1")
+        assert_that(result.output).contains("TCP/22: OPEN (ssh) from 2024-01-01T12:00:00 to 2024-01-01T13:00:00 x2")
+        mock_use_case.history.assert_called_once_with("10.0.0.1", None)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_state_at_time(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = MagicMock()
+        mock_use_case.history.return_value = [OBSERVATION.model_copy(update={"service_name": None})]
+        mock_create_container.return_value.__getitem__.return_value = mock_use_case
+
+        result = CliRunner().invoke(cli, ["scan-history", "show", "10.0.0.1", "--at", "2024-01-01T12:30:00"])
+
+        assert_that(result.output).contains("state of 10.0.0.1 at 2024-01-01T12:30:00")
+        assert_that(result.output).contains("TCP/22: OPEN from")
+        mock_use_case.history.assert_called_once_with("10.0.0.1", datetime(2024, 1, 1, 12, 30))
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_validation_error(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.return_value.__getitem__.return_value.history.side_effect = ValueError("bad target")
+
+        result = CliRunner().invoke(cli, ["scan-history", "show", " "])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("✗ Validation error: bad target")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_show_error(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["scan-history", "show", "10.0.0.1"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("✗ Error: connection refused")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_compaction(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = MagicMock()
+        mock_use_case.compact.return_value = ScanHistoryCompactionResult(rewritten=3, removed=7)
+        mock_create_container.return_value.__getitem__.return_value = mock_use_case
+
+        result = CliRunner().invoke(cli, ["scan-history", "compact"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("✓ Rewrote 3 interval(s), removed 7 observation(s)")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_compaction_fails(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["scan-history", "compact"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("connection refused")
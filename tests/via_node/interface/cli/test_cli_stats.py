@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.domain.model.dns_record_discovery import DnsRecordType
+from via_node.domain.model.exposure_statistics import (
+    DomainRecordTypes,
+    ExposureStatistics,
+    PortExposure,
+    ServiceExposure,
+)
+from via_node.interface.cli.main import cli
+
+
+def use_case(mock_create_container: MagicMock) -> MagicMock:
+    mock_use_case = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_use_case
+    return mock_use_case
+
+
+class TestCliStats:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_exposure_summaries(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.statistics.return_value = ExposureStatistics(
+            services=[
+                ServiceExposure(service_name="http", open_ports=3, hosts=2),
+                ServiceExposure(service_name=None, open_ports=1, hosts=1),
+            ],
+            ports=[PortExposure(port_number=443, protocol="tcp", hosts=2)],
+            domains=[DomainRecordTypes(domain_name="example.com", record_types=[DnsRecordType.A, DnsRecordType.MX])],
+        )
+
+        result = CliRunner().invoke(cli, ["stats", "--limit", "10"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Found 2 service(s) with open ports")
+        assert_that(result.output).contains("  http: 3 open port(s) on 2 host(s)")
+        assert_that(result.output).contains("  unknown: 1 open port(s) on 1 host(s)")
+        assert_that(result.output).contains("  443/tcp: 2 host(s)")
+        assert_that(result.output).contains("  example.com: A, MX")
+        mock_use_case.statistics.assert_called_once_with(10)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_invalid_limit(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).statistics.side_effect = ValueError("Statistics limit must be at least 1")
+
+        result = CliRunner().invoke(cli, ["stats", "--limit", "0"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Statistics limit must be at least 1")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unexpected_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).statistics.side_effect = Exception("Database unavailable")
+
+        result = CliRunner().invoke(cli, ["stats"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Error: Database unavailable")
@@ -0,0 +1,110 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from assertpy import assert_that
+from click.testing import CliRunner
+
+from via_node.domain.model.network_topology_edge import NetworkTopologyEdge
+from via_node.domain.model.topology_traversal import TraversalPath, TraversalVertex, VertexReference
+from via_node.interface.cli.main import cli
+
+PATH = TraversalPath(
+    vertices=[VertexReference.parse("dns_record:example.com"), VertexReference.parse("host:10.0.0.1")],
+    edges=[
+        NetworkTopologyEdge(
+            source_id="example.com",
+            target_id="10.0.0.1",
+            edge_type="dns_resolves_to_host",
+            metadata={},
+            created_at=datetime(2024, 1, 1),
+        )
+    ],
+)
+
+
+def use_case(mock_create_container: MagicMock) -> MagicMock:
+    mock_use_case = MagicMock()
+    mock_create_container.return_value.__getitem__.return_value = mock_use_case
+    return mock_use_case
+
+
+class TestCliTraverseNeighbors:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_neighbors_with_depth(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).neighbors.return_value = [
+            TraversalVertex(vertex=VertexReference.parse("port:443_TCP"), depth=1, attributes={})
+        ]
+
+        result = CliRunner().invoke(cli, ["traverse", "neighbors", "dns_record:example.com", "--depth", "2"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Found 1 vertex(es) reachable from dns_record:example.com")
+        assert_that(result.output).contains("[1] port:443_TCP")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_pass_options_to_use_case(self, mock_create_container: MagicMock) -> None:
+        mock_use_case = use_case(mock_create_container)
+        mock_use_case.neighbors.return_value = []
+
+        CliRunner().invoke(
+            cli,
+            ["traverse", "neighbors", "host:10.0.0.1", "--direction", "inbound", "-e", "dns_resolves_to_host"],
+        )
+
+        mock_use_case.neighbors.assert_called_once_with("host:10.0.0.1", 1, "inbound", ["dns_resolves_to_host"], 1000)
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_validation_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).neighbors.side_effect = ValueError("Traversal depth must be between 1 and 10")
+
+        result = CliRunner().invoke(cli, ["traverse", "neighbors", "dns_record:example.com", "--depth", "11"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Traversal depth must be between 1 and 10")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_traversal_fails(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["traverse", "neighbors", "dns_record:example.com"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("connection refused")
+
+
+class TestCliTraversePath:
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_display_path(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).shortest_path.return_value = PATH
+
+        result = CliRunner().invoke(cli, ["traverse", "path", "dns_record:example.com", "host:10.0.0.1"])
+
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.output).contains("Path (1 hop(s)): dns_record:example.com -> host:10.0.0.1")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_unreachable_target(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).shortest_path.return_value = None
+
+        result = CliRunner().invoke(
+            cli, ["traverse", "path", "port:443_TCP", "host:10.0.0.1", "--max-depth", "2", "--direction", "outbound"]
+        )
+
+        assert_that(result.output).contains("No path from port:443_TCP to host:10.0.0.1 within 2 hop(s)")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_report_validation_error(self, mock_create_container: MagicMock) -> None:
+        use_case(mock_create_container).shortest_path.side_effect = ValueError("Vertex kind must be one of")
+
+        result = CliRunner().invoke(cli, ["traverse", "path", "router:a", "host:10.0.0.1"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
+        assert_that(result.output).contains("Validation error: Vertex kind must be one of")
+
+    @patch("via_node.interface.cli.main.create_container")
+    def test_should_abort_when_traversal_fails(self, mock_create_container: MagicMock) -> None:
+        mock_create_container.side_effect = Exception("connection refused")
+
+        result = CliRunner().invoke(cli, ["traverse", "path", "dns_record:example.com", "host:10.0.0.1"])
+
+        assert_that(result.exit_code).is_not_equal_to(0)
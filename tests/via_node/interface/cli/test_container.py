@@ -1,14 +1,38 @@
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import ANY, patch
+
+import pytest
+
+from arango.http import DeflateRequestCompression
 
 from lagom import Container
 
+from via_node.domain.repository.network_topology_repository import NetworkTopologyRepository
+from via_node.infrastructure.persistence.arango.arango_schema_marker import ArangoSchemaMarker
+from via_node.infrastructure.persistence.arango.coordinator_host_resolver import CoordinatorHostResolver
+from via_node.infrastructure.persistence.arango.pooled_http_client import PooledHttpClient
+from via_node.infrastructure.persistence.decorator.buffered_network_topology_repository import (
+    BufferedNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.decorator.change_feed_network_topology_repository import (
+    ChangeFeedNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.in_memory.in_memory_network_topology_repository import (
+    InMemoryNetworkTopologyRepository,
+)
+from via_node.infrastructure.persistence.sqlite.sqlite_network_topology_repository import (
+    SqliteNetworkTopologyRepository,
+)
 from via_node.interface.cli.container import create_container
+from via_node.shared.configuration import ApplicationSettings
 
 
 class TestContainer:
     @patch("via_node.interface.cli.container.ApplicationSettings")
     @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
     def test_should_create_container(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings()
+
         container = create_container()
 
         assert isinstance(container, Container)
@@ -16,6 +40,8 @@ class TestContainer:
     @patch("via_node.interface.cli.container.ApplicationSettings")
     @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
     def test_should_call_application_settings(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings()
+
         create_container()
 
         mock_settings.assert_called_once()
@@ -33,6 +59,10 @@ class TestContainer:
         mock_settings_instance.arango_password = "testpass"
         mock_settings_instance.arango_graph_name = "testgraph"
         mock_settings_instance.arango_auto_create_database = True
+        mock_settings_instance.arango_request_compression_threshold = 0
+        mock_settings_instance.arango_response_compression = ""
+        mock_settings_instance.write_buffer_enabled = False
+        mock_settings_instance.change_feed_enabled = False
 
         create_container()
 
@@ -53,6 +83,17 @@ class TestContainer:
         mock_settings_instance.arango_password = "testpass"
         mock_settings_instance.arango_graph_name = "testgraph"
         mock_settings_instance.arango_auto_create_database = True
+        mock_settings_instance.arango_bulk_chunk_size = 500
+        mock_settings_instance.arango_auto_migrate = True
+        mock_settings_instance.arango_request_compression_threshold = 0
+        mock_settings_instance.arango_response_compression = ""
+        mock_settings_instance.arango_discovery_ttl_multiplier = 3.0
+        mock_settings_instance.arango_hide_expired_discoveries = True
+        mock_settings_instance.arango_schema_marker_directory = "/tmp/via-node"
+        mock_settings_instance.arango_schema_marker_ttl = 60.0
+        mock_settings_instance.arango_endpoints = ""
+        mock_settings_instance.write_buffer_enabled = False
+        mock_settings_instance.change_feed_enabled = False
 
         container = create_container()
         container[NetworkTopologyRepository]
@@ -65,4 +106,175 @@ class TestContainer:
             password="testpass",
             graph_name="testgraph",
             auto_create_database=True,
+            bulk_chunk_size=500,
+            auto_migrate=True,
+            http_client=ANY,
+            request_compression=None,
+            response_compression=None,
+            discovery_ttl_multiplier=3.0,
+            hide_expired_discoveries=True,
+            schema_marker=ANY,
+            hosts=None,
+            host_resolver=None,
+        )
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_configure_pooled_http_client_from_settings(
+        self, mock_arango_repo: type, mock_settings: type
+    ) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            arango_http_pool_maxsize=32, arango_retry_attempts=5, arango_retry_writes=True
+        )
+
+        create_container()
+
+        http_client = mock_arango_repo.call_args.kwargs["http_client"]
+        assert isinstance(http_client, PooledHttpClient)
+        assert http_client._pool_maxsize == 32
+        assert http_client._retry_strategy().total == 5
+        assert "POST" in http_client._retry_strategy().allowed_methods
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_configure_schema_marker_from_settings(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            arango_schema_marker_directory="/tmp/via-node", arango_schema_marker_ttl=60.0
+        )
+
+        create_container()
+
+        schema_marker = mock_arango_repo.call_args.kwargs["schema_marker"]
+        assert isinstance(schema_marker, ArangoSchemaMarker)
+        assert schema_marker._directory == Path("/tmp/via-node")
+        assert schema_marker._ttl == 60.0
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_balance_across_configured_coordinators(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            arango_endpoints="coordinator-1:8529,coordinator-2:8529", arango_host_selection="least-latency"
+        )
+
+        create_container()
+
+        host_resolver = mock_arango_repo.call_args.kwargs["host_resolver"]
+        assert isinstance(host_resolver, CoordinatorHostResolver)
+        assert host_resolver._selection == "least-latency"
+        assert mock_arango_repo.call_args.kwargs["hosts"] == ["http://coordinator-1:8529", "http://coordinator-2:8529"]
+        assert mock_arango_repo.call_args.kwargs["http_client"]._host_resolver is host_resolver
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_enable_compression_when_configured(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            arango_request_compression_threshold=1024, arango_response_compression="gzip"
+        )
+
+        create_container()
+
+        assert isinstance(mock_arango_repo.call_args.kwargs["request_compression"], DeflateRequestCompression)
+        assert mock_arango_repo.call_args.kwargs["response_compression"] == "gzip"
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_not_buffer_writes_by_default(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings()
+
+        container = create_container()
+
+        assert container[NetworkTopologyRepository] is mock_arango_repo.return_value  # type: ignore[type-abstract]
+
+    @patch("via_node.infrastructure.persistence.decorator.buffered_network_topology_repository.atexit")
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_buffer_writes_when_enabled(
+        self, mock_arango_repo: type, mock_settings: type, mock_atexit: type
+    ) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            write_buffer_enabled=True, write_buffer_max_count=50, write_buffer_max_buffered_bytes=4096
+        )
+
+        container = create_container()
+
+        repository = container[NetworkTopologyRepository]  # type: ignore[type-abstract]
+        assert isinstance(repository, BufferedNetworkTopologyRepository)
+        assert repository.repository is mock_arango_repo.return_value
+        assert repository._max_count == 50
+        assert repository._max_buffered_bytes == 4096
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    def test_should_publish_changes_when_enabled(self, mock_settings: type, tmp_path: Path) -> None:
+        log_path = tmp_path / "changes.jsonl"
+        log_path.write_text(
+            '{"sequence":41,"kind":"host","key":"k","occurred_at":"2024-01-01T00:00:00","document":{}}\n'
+        )
+        mock_settings.return_value = ApplicationSettings(
+            repository_backend="memory",
+            change_feed_enabled=True,
+            change_feed_path=str(log_path),
         )
+
+        container = create_container()
+
+        repository = container[NetworkTopologyRepository]  # type: ignore[type-abstract]
+        assert isinstance(repository, ChangeFeedNetworkTopologyRepository)
+        assert isinstance(repository.repository, InMemoryNetworkTopologyRepository)
+        assert repository._sink.last_sequence == 41  # type: ignore[attr-defined]
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    def test_should_stream_changes_to_socket_when_configured(self, mock_settings: type, tmp_path: Path) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            repository_backend="memory",
+            change_feed_enabled=True,
+            change_feed_path=str(tmp_path / "changes.jsonl"),
+            change_feed_socket_path=str(tmp_path / "changes.sock"),
+            change_feed_max_bytes=4096,
+        )
+
+        container = create_container()
+
+        repository = container[NetworkTopologyRepository]  # type: ignore[type-abstract]
+        sinks = repository._sink._sinks  # type: ignore[attr-defined]
+        assert [type(sink).__name__ for sink in sinks] == ["UnixSocketChangeSink"]
+        assert type(repository._sink._journal).__name__ == "JsonlChangeLog"  # type: ignore[attr-defined]
+        assert repository._sink._journal._max_bytes == 4096  # type: ignore[attr-defined]
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_use_in_memory_repository_when_selected(self, mock_arango_repo: type, mock_settings: type) -> None:
+        mock_settings.return_value = ApplicationSettings(repository_backend="memory")
+
+        container = create_container()
+
+        repository = container[NetworkTopologyRepository]  # type: ignore[type-abstract]
+        assert isinstance(repository, InMemoryNetworkTopologyRepository)
+        mock_arango_repo.assert_not_called()
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    def test_should_reject_arango_only_commands_for_in_memory_repository(self, mock_settings: type) -> None:
+        from via_node.infrastructure.persistence.arango.arango_network_topology_repository import (
+            ArangoNetworkTopologyRepository,
+        )
+
+        mock_settings.return_value = ApplicationSettings(repository_backend="memory")
+
+        container = create_container()
+
+        with pytest.raises(ValueError, match="APP_REPOSITORY_BACKEND=arango"):
+            container[ArangoNetworkTopologyRepository]
+
+    @patch("via_node.interface.cli.container.ApplicationSettings")
+    @patch("via_node.interface.cli.container.ArangoNetworkTopologyRepository")
+    def test_should_use_sqlite_repository_when_selected(
+        self, mock_arango_repo: type, mock_settings: type, tmp_path: Path
+    ) -> None:
+        mock_settings.return_value = ApplicationSettings(
+            repository_backend="sqlite", sqlite_path=str(tmp_path / "topology.sqlite3")
+        )
+
+        container = create_container()
+
+        repository = container[NetworkTopologyRepository]  # type: ignore[type-abstract]
+        assert isinstance(repository, SqliteNetworkTopologyRepository)
+        mock_arango_repo.assert_not_called()
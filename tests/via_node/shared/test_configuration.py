@@ -135,6 +135,23 @@ class TestApplicationSettings:
 
         assert_that(settings.reload).is_true()
 
+    @patch("via_node.shared.configuration.get_resource_path")
+    def test_should_select_repository_backend_from_environment(self, mock_get_resource_path):
+        mock_get_resource_path.side_effect = FileNotFoundError
+
+        with patch.dict(os.environ, {"APP_REPOSITORY_BACKEND": "memory"}, clear=True):
+            settings = ApplicationSettings()
+
+        assert_that(settings.repository_backend).is_equal_to("memory")
+
+    @patch("via_node.shared.configuration.get_resource_path")
+    def test_should_reject_unknown_repository_backend(self, mock_get_resource_path):
+        mock_get_resource_path.side_effect = FileNotFoundError
+
+        with patch.dict(os.environ, {"APP_REPOSITORY_BACKEND": "postgres"}, clear=True):
+            with pytest.raises(ValueError):
+                ApplicationSettings()
+
 
 class TestApplicationSettingProvider:
     @patch("via_node.shared.configuration.ApplicationSettings")